@@ -0,0 +1,53 @@
+"""Add publication title token postings for incremental near-duplicate detection.
+
+Revision ID: 20261019_0025
+Revises: 20260226_0024
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0025"
+down_revision: str | Sequence[str] | None = "20260226_0024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("publications", sa.Column("near_dup_indexed_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        op.f("ix_publications_near_dup_indexed_at"),
+        "publications",
+        ["near_dup_indexed_at"],
+        unique=False,
+    )
+    op.create_table(
+        "publication_title_tokens",
+        sa.Column("publication_id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(length=128), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["publication_id"],
+            ["publications.id"],
+            name=op.f("fk_publication_title_tokens_publication_id_publications"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("publication_id", "token", name=op.f("pk_publication_title_tokens")),
+    )
+    op.create_index(
+        "ix_publication_title_tokens_token",
+        "publication_title_tokens",
+        ["token"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publication_title_tokens_token", table_name="publication_title_tokens")
+    op.drop_table("publication_title_tokens")
+    op.drop_index(op.f("ix_publications_near_dup_indexed_at"), table_name="publications")
+    op.drop_column("publications", "near_dup_indexed_at")
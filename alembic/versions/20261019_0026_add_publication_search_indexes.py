@@ -0,0 +1,76 @@
+"""Add a generated full-text search vector and trigram indexes for publication search.
+
+Revision ID: 20261019_0026
+Revises: 20261019_0025
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0026"
+down_revision: str | Sequence[str] | None = "20261019_0025"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title_raw, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(venue_text, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "publications",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_publications_search_vector",
+        "publications",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_publications_title_raw_trgm",
+        "publications",
+        ["title_raw"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title_raw": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_publications_venue_text_trgm",
+        "publications",
+        ["venue_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"venue_text": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_scholar_profiles_display_name_trgm",
+        "scholar_profiles",
+        ["display_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"display_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scholar_profiles_display_name_trgm", table_name="scholar_profiles")
+    op.drop_index("ix_publications_venue_text_trgm", table_name="publications")
+    op.drop_index("ix_publications_title_raw_trgm", table_name="publications")
+    op.drop_index("ix_publications_search_vector", table_name="publications")
+    op.drop_column("publications", "search_vector")
@@ -0,0 +1,261 @@
+"""Add trigger-maintained per-user and per-scholar publication counters.
+
+Revision ID: 20261019_0027
+Revises: 20261019_0026
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0027"
+down_revision: str | Sequence[str] | None = "20261019_0026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Applies a batch of link changes (+1 for a new row state, -1 for an old one) to both counter tables,
+# user row first, then scholar rows (the reconciliation job locks in the same order). Per-scholar
+# counters are link counts. Per-user counters count distinct publications, so each touched
+# (user, publication) compares "any link matches" after the statement with the state before it
+# (current links minus the net change).
+APPLY_FUNCTION_SQL = """
+CREATE FUNCTION publication_counters_apply(
+    scholar_ids integer[],
+    publication_ids integer[],
+    signs integer[],
+    read_flags boolean[],
+    favorite_flags boolean[]
+) RETURNS void LANGUAGE sql AS $$
+    WITH changes AS (
+        SELECT c.publication_id, c.sign, c.is_read, c.is_favorite, s.user_id
+        FROM unnest(scholar_ids, publication_ids, signs, read_flags, favorite_flags)
+            AS c(scholar_profile_id, publication_id, sign, is_read, is_favorite)
+        JOIN scholar_profiles s ON s.id = c.scholar_profile_id
+        JOIN users u ON u.id = s.user_id
+    ),
+    net AS (
+        SELECT
+            user_id,
+            publication_id,
+            sum(sign) AS total_net,
+            coalesce(sum(sign) FILTER (WHERE NOT is_read), 0) AS unread_net,
+            coalesce(sum(sign) FILTER (WHERE is_favorite), 0) AS favorite_net,
+            coalesce(sum(sign) FILTER (WHERE is_favorite AND NOT is_read), 0) AS favorite_unread_net
+        FROM changes
+        GROUP BY user_id, publication_id
+    ),
+    after_state AS (
+        SELECT
+            n.user_id,
+            n.total_net,
+            n.unread_net,
+            n.favorite_net,
+            n.favorite_unread_net,
+            count(sp.publication_id) AS total_after,
+            count(sp.publication_id) FILTER (WHERE NOT sp.is_read) AS unread_after,
+            count(sp.publication_id) FILTER (WHERE sp.is_favorite) AS favorite_after,
+            count(sp.publication_id) FILTER (WHERE sp.is_favorite AND NOT sp.is_read) AS favorite_unread_after
+        FROM net n
+        JOIN scholar_profiles s ON s.user_id = n.user_id
+        LEFT JOIN scholar_publications sp
+            ON sp.scholar_profile_id = s.id AND sp.publication_id = n.publication_id
+        GROUP BY
+            n.user_id, n.publication_id, n.total_net, n.unread_net, n.favorite_net, n.favorite_unread_net
+    ),
+    user_deltas AS (
+        SELECT
+            user_id,
+            sum((total_after > 0)::int - (total_after - total_net > 0)::int) AS total_count,
+            sum((unread_after > 0)::int - (unread_after - unread_net > 0)::int) AS unread_count,
+            sum((favorite_after > 0)::int - (favorite_after - favorite_net > 0)::int) AS favorite_count,
+            sum(
+                (favorite_unread_after > 0)::int - (favorite_unread_after - favorite_unread_net > 0)::int
+            ) AS favorite_unread_count
+        FROM after_state
+        GROUP BY user_id
+    )
+    INSERT INTO user_publication_counters (user_id, total_count, unread_count, favorite_count, favorite_unread_count)
+    SELECT user_id, total_count, unread_count, favorite_count, favorite_unread_count
+    FROM user_deltas
+    WHERE (total_count, unread_count, favorite_count, favorite_unread_count) <> (0, 0, 0, 0)
+    ORDER BY user_id
+    ON CONFLICT (user_id) DO UPDATE SET
+        total_count = user_publication_counters.total_count + EXCLUDED.total_count,
+        unread_count = user_publication_counters.unread_count + EXCLUDED.unread_count,
+        favorite_count = user_publication_counters.favorite_count + EXCLUDED.favorite_count,
+        favorite_unread_count = user_publication_counters.favorite_unread_count + EXCLUDED.favorite_unread_count,
+        updated_at = now();
+
+    WITH scholar_deltas AS (
+        SELECT
+            c.scholar_profile_id,
+            sum(c.sign) AS total_count,
+            coalesce(sum(c.sign) FILTER (WHERE NOT c.is_read), 0) AS unread_count,
+            coalesce(sum(c.sign) FILTER (WHERE c.is_favorite), 0) AS favorite_count,
+            coalesce(sum(c.sign) FILTER (WHERE c.is_favorite AND NOT c.is_read), 0) AS favorite_unread_count
+        FROM unnest(scholar_ids, publication_ids, signs, read_flags, favorite_flags)
+            AS c(scholar_profile_id, publication_id, sign, is_read, is_favorite)
+        JOIN scholar_profiles s ON s.id = c.scholar_profile_id
+        GROUP BY c.scholar_profile_id
+    )
+    INSERT INTO scholar_publication_counters (
+        scholar_profile_id, total_count, unread_count, favorite_count, favorite_unread_count
+    )
+    SELECT scholar_profile_id, total_count, unread_count, favorite_count, favorite_unread_count
+    FROM scholar_deltas
+    WHERE (total_count, unread_count, favorite_count, favorite_unread_count) <> (0, 0, 0, 0)
+    ORDER BY scholar_profile_id
+    ON CONFLICT (scholar_profile_id) DO UPDATE SET
+        total_count = scholar_publication_counters.total_count + EXCLUDED.total_count,
+        unread_count = scholar_publication_counters.unread_count + EXCLUDED.unread_count,
+        favorite_count = scholar_publication_counters.favorite_count + EXCLUDED.favorite_count,
+        favorite_unread_count = scholar_publication_counters.favorite_unread_count + EXCLUDED.favorite_unread_count,
+        updated_at = now();
+$$
+"""
+
+LINK_TRIGGER_FUNCTION_SQL = """
+CREATE FUNCTION scholar_publications_counters_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM publication_counters_apply(
+            array_agg(scholar_profile_id), array_agg(publication_id), array_agg(1),
+            array_agg(is_read), array_agg(is_favorite)
+        ) FROM new_links;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM publication_counters_apply(
+            array_agg(scholar_profile_id), array_agg(publication_id), array_agg(-1),
+            array_agg(is_read), array_agg(is_favorite)
+        ) FROM old_links;
+    ELSE
+        PERFORM publication_counters_apply(
+            array_agg(scholar_profile_id), array_agg(publication_id), array_agg(sign),
+            array_agg(is_read), array_agg(is_favorite)
+        ) FROM (
+            SELECT scholar_profile_id, publication_id, -1 AS sign, is_read, is_favorite FROM old_links
+            UNION ALL
+            SELECT scholar_profile_id, publication_id, 1 AS sign, is_read, is_favorite FROM new_links
+        ) AS changes;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# Delete a profile's links before the profile row goes, so the link trigger can still resolve
+# the owning user and decrement the per-user distinct counts.
+PROFILE_TRIGGER_FUNCTION_SQL = """
+CREATE FUNCTION scholar_profiles_delete_links_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM scholar_publications WHERE scholar_profile_id = OLD.id;
+    RETURN OLD;
+END;
+$$
+"""
+
+BACKFILL_USER_COUNTERS_SQL = """
+INSERT INTO user_publication_counters (user_id, total_count, unread_count, favorite_count, favorite_unread_count)
+SELECT
+    s.user_id,
+    count(DISTINCT sp.publication_id),
+    count(DISTINCT sp.publication_id) FILTER (WHERE NOT sp.is_read),
+    count(DISTINCT sp.publication_id) FILTER (WHERE sp.is_favorite),
+    count(DISTINCT sp.publication_id) FILTER (WHERE sp.is_favorite AND NOT sp.is_read)
+FROM scholar_profiles s
+JOIN scholar_publications sp ON sp.scholar_profile_id = s.id
+GROUP BY s.user_id
+"""
+
+BACKFILL_SCHOLAR_COUNTERS_SQL = """
+INSERT INTO scholar_publication_counters (
+    scholar_profile_id, total_count, unread_count, favorite_count, favorite_unread_count
+)
+SELECT
+    sp.scholar_profile_id,
+    count(*),
+    count(*) FILTER (WHERE NOT sp.is_read),
+    count(*) FILTER (WHERE sp.is_favorite),
+    count(*) FILTER (WHERE sp.is_favorite AND NOT sp.is_read)
+FROM scholar_publications sp
+GROUP BY sp.scholar_profile_id
+"""
+
+
+def _counter_columns() -> list[sa.Column]:
+    return [
+        sa.Column("total_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("unread_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("favorite_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("favorite_unread_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_publication_counters",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        *_counter_columns(),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_user_publication_counters_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", name=op.f("pk_user_publication_counters")),
+    )
+    op.create_table(
+        "scholar_publication_counters",
+        sa.Column("scholar_profile_id", sa.Integer(), nullable=False),
+        *_counter_columns(),
+        sa.ForeignKeyConstraint(
+            ["scholar_profile_id"],
+            ["scholar_profiles.id"],
+            name=op.f("fk_scholar_publication_counters_scholar_profile_id_scholar_profiles"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("scholar_profile_id", name=op.f("pk_scholar_publication_counters")),
+    )
+    op.create_index(
+        "ix_scholar_publications_first_seen_run_id",
+        "scholar_publications",
+        ["first_seen_run_id"],
+        unique=False,
+    )
+    op.execute(APPLY_FUNCTION_SQL)
+    op.execute(LINK_TRIGGER_FUNCTION_SQL)
+    op.execute(PROFILE_TRIGGER_FUNCTION_SQL)
+    for event, table_clause in (
+        ("INSERT", "NEW TABLE AS new_links"),
+        ("UPDATE", "OLD TABLE AS old_links NEW TABLE AS new_links"),
+        ("DELETE", "OLD TABLE AS old_links"),
+    ):
+        op.execute(
+            f"CREATE TRIGGER scholar_publications_counters_{event.lower()} "
+            f"AFTER {event} ON scholar_publications REFERENCING {table_clause} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION scholar_publications_counters_trigger()"
+        )
+    op.execute(
+        "CREATE TRIGGER scholar_profiles_delete_links BEFORE DELETE ON scholar_profiles "
+        "FOR EACH ROW EXECUTE FUNCTION scholar_profiles_delete_links_trigger()"
+    )
+    op.execute(BACKFILL_USER_COUNTERS_SQL)
+    op.execute(BACKFILL_SCHOLAR_COUNTERS_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS scholar_profiles_delete_links ON scholar_profiles")
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS scholar_publications_counters_{event} ON scholar_publications")
+    op.execute("DROP FUNCTION IF EXISTS scholar_profiles_delete_links_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS scholar_publications_counters_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS publication_counters_apply(integer[], integer[], integer[], boolean[], boolean[])"
+    )
+    op.drop_index("ix_scholar_publications_first_seen_run_id", table_name="scholar_publications")
+    op.drop_table("scholar_publication_counters")
+    op.drop_table("user_publication_counters")
@@ -0,0 +1,98 @@
+"""Store the best display identifier on publications, maintained by a trigger.
+
+Revision ID: 20261019_0028
+Revises: 20261019_0027
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0028"
+down_revision: str | Sequence[str] | None = "20261019_0027"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same ranking as publication_identifiers.application._display_sort_key: kind priority
+# (doi > arxiv > pmcid > pmid), then confidence; the lowest row id breaks remaining ties.
+REFRESH_FUNCTION_SQL = """
+CREATE FUNCTION publication_display_identifier_refresh(publication_ids integer[]) RETURNS void LANGUAGE sql AS $$
+    UPDATE publications p
+    SET
+        display_identifier_kind = best.kind,
+        display_identifier_value = best.value_normalized,
+        display_identifier_confidence = best.confidence_score
+    FROM (
+        SELECT ids.publication_id, ranked.kind, ranked.value_normalized, ranked.confidence_score
+        FROM (SELECT DISTINCT unnest(publication_ids) AS publication_id) AS ids
+        LEFT JOIN LATERAL (
+            SELECT pi.kind, pi.value_normalized, pi.confidence_score
+            FROM publication_identifiers pi
+            WHERE pi.publication_id = ids.publication_id
+            ORDER BY
+                CASE pi.kind WHEN 'doi' THEN 400 WHEN 'arxiv' THEN 300 WHEN 'pmcid' THEN 200 ELSE 100 END DESC,
+                pi.confidence_score DESC,
+                pi.id
+            LIMIT 1
+        ) AS ranked ON true
+    ) AS best
+    WHERE p.id = best.publication_id
+        AND (p.display_identifier_kind, p.display_identifier_value, p.display_identifier_confidence)
+            IS DISTINCT FROM (best.kind, best.value_normalized, best.confidence_score);
+$$
+"""
+
+TRIGGER_FUNCTION_SQL = """
+CREATE FUNCTION publication_identifiers_display_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM publication_display_identifier_refresh(array_agg(publication_id)) FROM new_identifiers;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM publication_display_identifier_refresh(array_agg(publication_id)) FROM old_identifiers;
+    ELSE
+        PERFORM publication_display_identifier_refresh(array_agg(publication_id)) FROM (
+            SELECT publication_id FROM old_identifiers
+            UNION
+            SELECT publication_id FROM new_identifiers
+        ) AS changed;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    op.add_column("publications", sa.Column("display_identifier_kind", sa.String(length=32), nullable=True))
+    op.add_column("publications", sa.Column("display_identifier_value", sa.Text(), nullable=True))
+    op.add_column("publications", sa.Column("display_identifier_confidence", sa.Float(), nullable=True))
+    op.execute(REFRESH_FUNCTION_SQL)
+    op.execute(TRIGGER_FUNCTION_SQL)
+    for event, table_clause in (
+        ("INSERT", "NEW TABLE AS new_identifiers"),
+        ("UPDATE", "OLD TABLE AS old_identifiers NEW TABLE AS new_identifiers"),
+        ("DELETE", "OLD TABLE AS old_identifiers"),
+    ):
+        op.execute(
+            f"CREATE TRIGGER publication_identifiers_display_{event.lower()} "
+            f"AFTER {event} ON publication_identifiers REFERENCING {table_clause} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION publication_identifiers_display_trigger()"
+        )
+    op.execute(
+        "SELECT publication_display_identifier_refresh(array_agg(DISTINCT publication_id)) "
+        "FROM publication_identifiers"
+    )
+
+
+def downgrade() -> None:
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS publication_identifiers_display_{event} ON publication_identifiers")
+    op.execute("DROP FUNCTION IF EXISTS publication_identifiers_display_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS publication_display_identifier_refresh(integer[])")
+    op.drop_column("publications", "display_identifier_confidence")
+    op.drop_column("publications", "display_identifier_value")
+    op.drop_column("publications", "display_identifier_kind")
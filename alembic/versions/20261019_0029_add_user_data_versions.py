@@ -0,0 +1,126 @@
+"""Add per-user data versions bumped by triggers for conditional GETs.
+
+Revision ID: 20261019_0029
+Revises: 20261019_0028
+Create Date: 2026-10-19 19:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0029"
+down_revision: str | Sequence[str] | None = "20261019_0028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose rows feed the publications, runs and queue responses. Trigger names sort
+# before scholar_publications_counters_* so both triggers take row locks in the same order
+# (data version first, then counters) whichever statement starts the transaction.
+USER_SCOPED_TABLES = ("crawl_runs", "ingestion_queue_items", "scholar_profiles")
+LINKED_TABLES = ("scholar_publications", "publication_pdf_jobs")
+
+BUMP_FUNCTION_SQL = """
+CREATE FUNCTION user_data_versions_bump(user_ids integer[]) RETURNS void LANGUAGE sql AS $$
+    INSERT INTO user_data_versions AS v (user_id, version, updated_at)
+    SELECT u.id, 1, now()
+    FROM users u
+    WHERE u.id = ANY(user_ids)
+    ORDER BY u.id
+    ON CONFLICT (user_id) DO UPDATE SET version = v.version + 1, updated_at = now();
+$$
+"""
+
+TRIGGER_FUNCTION_SQL = """
+CREATE FUNCTION user_data_versions_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'scholar_publications' THEN
+        PERFORM user_data_versions_bump(array_agg(DISTINCT sp.user_id))
+        FROM changed_rows c
+        JOIN scholar_profiles sp ON sp.id = c.scholar_profile_id;
+    ELSIF TG_TABLE_NAME = 'publication_pdf_jobs' THEN
+        PERFORM user_data_versions_bump(array_agg(DISTINCT sp.user_id))
+        FROM changed_rows c
+        JOIN scholar_publications l ON l.publication_id = c.publication_id
+        JOIN scholar_profiles sp ON sp.id = l.scholar_profile_id;
+    ELSE
+        PERFORM user_data_versions_bump(array_agg(DISTINCT user_id)) FROM changed_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# Only columns rendered in publication responses count; bookkeeping updates such as
+# near_dup_indexed_at must not invalidate every linked user's cached lists.
+PUBLICATIONS_TRIGGER_FUNCTION_SQL = """
+CREATE FUNCTION publications_data_version_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM user_data_versions_bump(array_agg(DISTINCT sp.user_id))
+    FROM new_rows n
+    JOIN old_rows o ON o.id = n.id
+    JOIN scholar_publications l ON l.publication_id = n.id
+    JOIN scholar_profiles sp ON sp.id = l.scholar_profile_id
+    WHERE (
+        n.title_raw, n.year, n.citation_count, n.venue_text, n.pub_url, n.pdf_url,
+        n.display_identifier_kind, n.display_identifier_value, n.display_identifier_confidence
+    ) IS DISTINCT FROM (
+        o.title_raw, o.year, o.citation_count, o.venue_text, o.pub_url, o.pdf_url,
+        o.display_identifier_kind, o.display_identifier_value, o.display_identifier_confidence
+    );
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_data_versions",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index(
+        "ix_scholar_publications_publication_id",
+        "scholar_publications",
+        ["publication_id"],
+        unique=False,
+    )
+    op.execute(BUMP_FUNCTION_SQL)
+    op.execute(TRIGGER_FUNCTION_SQL)
+    op.execute(PUBLICATIONS_TRIGGER_FUNCTION_SQL)
+    for table_name in (*USER_SCOPED_TABLES, *LINKED_TABLES):
+        for event, table_clause in (
+            ("INSERT", "NEW TABLE AS changed_rows"),
+            ("UPDATE", "NEW TABLE AS changed_rows"),
+            ("DELETE", "OLD TABLE AS changed_rows"),
+        ):
+            op.execute(
+                f"CREATE TRIGGER {table_name}_bump_data_version_{event.lower()} "
+                f"AFTER {event} ON {table_name} REFERENCING {table_clause} "
+                "FOR EACH STATEMENT EXECUTE FUNCTION user_data_versions_trigger()"
+            )
+    op.execute(
+        "CREATE TRIGGER publications_bump_data_version_update "
+        "AFTER UPDATE ON publications REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION publications_data_version_trigger()"
+    )
+    op.execute("INSERT INTO user_data_versions (user_id, version) SELECT id, 1 FROM users")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS publications_bump_data_version_update ON publications")
+    for table_name in (*USER_SCOPED_TABLES, *LINKED_TABLES):
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table_name}_bump_data_version_{event} ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS publications_data_version_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS user_data_versions_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS user_data_versions_bump(integer[])")
+    op.drop_index("ix_scholar_publications_publication_id", table_name="scholar_publications")
+    op.drop_table("user_data_versions")
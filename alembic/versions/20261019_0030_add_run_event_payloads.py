@@ -0,0 +1,38 @@
+"""Add run_event_payloads for run events relayed by reference over NOTIFY.
+
+Revision ID: 20261019_0030
+Revises: 20261019_0029
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0030"
+down_revision: str | Sequence[str] | None = "20261019_0029"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_event_payloads",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["crawl_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_run_event_payloads_created_at", "run_event_payloads", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_event_payloads_created_at", table_name="run_event_payloads")
+    op.drop_table("run_event_payloads")
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from importlib.metadata import version as pkg_version
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import Request
+from starlette.responses import Response
+
+# A release can change response shapes without touching user data, so it is part of every tag.
+_APP_VERSION = pkg_version("scholarr")
+_CACHE_CONTROL = "private, no-cache"
+
+
+def data_version_etag(
+    request: Request,
+    *,
+    user_id: int,
+    data_version: int,
+    extra: Any = None,
+) -> str:
+    """Weak ETag for a user-scoped list response.
+
+    The tag covers the path, every query parameter, the user's data version and ``extra``
+    (response inputs that change without a data version bump, e.g. cooldown timers).
+    """
+    payload = {
+        "app": _APP_VERSION,
+        "path": request.url.path,
+        "query": sorted(request.query_params.multi_items()),
+        "user_id": int(user_id),
+        "version": int(data_version),
+        "extra": jsonable_encoder(extra),
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+    return f'W/"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    expected = _opaque_tag(etag)
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque_tag(candidate) == expected:
+            return True
+    return False
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+
+
+def _opaque_tag(value: str) -> str:
+    # If-None-Match uses weak comparison (RFC 9110 §13.1.2).
+    return value[2:] if value.startswith("W/") else value
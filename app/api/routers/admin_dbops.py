@@ -367,6 +367,7 @@ async def trigger_publication_near_duplicate_repair(
             max_clusters=int(payload.max_clusters),
             selected_cluster_keys=list(payload.selected_cluster_keys),
             requested_by=_requested_by_value(payload=payload, admin_user=admin_user),
+            scan_scope=payload.scope,
         )
     except ValueError as exc:
         raise ApiException(
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Request
+
+from app.api.deps import get_api_admin_user
+from app.api.responses import success_payload
+from app.api.schemas import AdminProviderRatesEnvelope
+from app.db.models import User
+from app.logging_utils import structured_log
+from app.services.rate_control import provider_rate_snapshots
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin/providers", tags=["api-admin-providers"])
+
+
+@router.get(
+    "/rate-control",
+    response_model=AdminProviderRatesEnvelope,
+)
+async def get_provider_rate_control_state(
+    request: Request,
+    admin_user: User = Depends(get_api_admin_user),
+):
+    providers = [asdict(snapshot) for snapshot in provider_rate_snapshots()]
+    structured_log(
+        logger,
+        "info",
+        "api.admin.providers.rate_control_read",
+        admin_user_id=int(admin_user.id),
+        open_circuits=sum(1 for provider in providers if provider["circuit_state"] != "closed"),
+    )
+    return success_payload(request, data={"providers": providers})
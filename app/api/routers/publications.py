@@ -4,9 +4,10 @@ import logging
 from datetime import UTC, datetime
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi import APIRouter, Depends, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import data_version_etag, etag_matches, not_modified_response, set_etag_headers
 from app.api.deps import get_api_current_user
 from app.api.errors import ApiException
 from app.api.responses import success_payload
@@ -23,9 +24,9 @@ from app.api.schemas import (
 from app.db.models import User
 from app.db.session import get_db_session
 from app.logging_utils import structured_log
-from app.services.publication_identifiers import application as identifier_service
 from app.services.publications import application as publication_service
 from app.services.scholars import application as scholar_service
+from app.services.users import application as user_service
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,17 @@ async def _publication_counts(
     favorite_only: bool,
     search: str | None,
     snapshot_before: datetime | None,
+    live: bool,
 ) -> tuple[int, int, int, int]:
+    if live:
+        return await _maintained_publication_counts(
+            db_session,
+            user_id=user_id,
+            selected_scholar_id=selected_scholar_id,
+            favorite_only=favorite_only,
+            search=search,
+            snapshot_before=snapshot_before,
+        )
     unread_count = await publication_service.count_unread_for_user(
         db_session,
         user_id=user_id,
@@ -130,6 +141,45 @@ async def _publication_counts(
     return unread_count, favorites_count, latest_count, total_count
 
 
+async def _maintained_publication_counts(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    selected_scholar_id: int | None,
+    favorite_only: bool,
+    search: str | None,
+    snapshot_before: datetime | None,
+) -> tuple[int, int, int, int]:
+    # A request without a snapshot counts everything committed so far, which is what the
+    # trigger-maintained counters hold. Latest stays a query: it is bounded by one run's links.
+    counters = await publication_service.get_publication_counters(
+        db_session,
+        user_id=user_id,
+        scholar_profile_id=selected_scholar_id,
+    )
+    latest_count = await publication_service.count_latest_for_user(
+        db_session,
+        user_id=user_id,
+        scholar_profile_id=selected_scholar_id,
+        favorite_only=favorite_only,
+        snapshot_before=snapshot_before,
+    )
+    if search:
+        total_count = await publication_service.count_for_user(
+            db_session,
+            user_id=user_id,
+            mode=publication_service.MODE_ALL,
+            scholar_profile_id=selected_scholar_id,
+            favorite_only=favorite_only,
+            search=search,
+            snapshot_before=snapshot_before,
+        )
+    else:
+        total_count = counters.favorite_count if favorite_only else counters.total_count
+    unread_count = counters.favorite_unread_count if favorite_only else counters.unread_count
+    return unread_count, counters.favorite_count, latest_count, total_count
+
+
 async def _list_publications_for_request(
     db_session: AsyncSession,
     *,
@@ -143,7 +193,8 @@ async def _list_publications_for_request(
     limit: int,
     offset: int,
     snapshot_before: datetime | None,
-) -> tuple[str, int | None, list]:
+    cursor: publication_service.PublicationCursor | None,
+) -> tuple[str, int | None, list, str | None]:
     resolved_mode = publication_service.resolve_publication_view_mode(mode)
     selected_scholar_id = scholar_profile_id
     await _require_selected_profile(
@@ -151,7 +202,7 @@ async def _list_publications_for_request(
         user_id=current_user.id,
         selected_scholar_id=selected_scholar_id,
     )
-    publications = await publication_service.list_for_user(
+    page = await publication_service.list_page_for_user(
         db_session,
         user_id=current_user.id,
         mode=resolved_mode,
@@ -163,7 +214,9 @@ async def _list_publications_for_request(
         limit=limit,
         offset=offset,
         snapshot_before=snapshot_before,
+        cursor=cursor,
     )
+    publications = page.items
     await publication_service.schedule_missing_pdf_enrichment_for_user(
         db_session,
         user_id=current_user.id,
@@ -175,7 +228,25 @@ async def _list_publications_for_request(
         db_session,
         items=publications,
     )
-    return resolved_mode, selected_scholar_id, hydrated
+    return resolved_mode, selected_scholar_id, hydrated, page.next_cursor
+
+
+def _resolve_publications_cursor(
+    *,
+    cursor: str | None,
+    sort_by: str,
+    sort_dir: str,
+) -> publication_service.PublicationCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return publication_service.decode_publication_cursor(cursor, sort_by=sort_by, sort_dir=sort_dir)
+    except publication_service.InvalidPublicationCursorError as exc:
+        raise ApiException(
+            status_code=400,
+            code="invalid_cursor",
+            message=str(exc),
+        ) from exc
 
 
 def _resolve_publications_snapshot(
@@ -226,6 +297,8 @@ def _publications_list_data(
     page_size: int,
     offset: int,
     snapshot: str,
+    cursor_mode: bool,
+    next_cursor: str | None,
 ) -> dict[str, object]:
     return {
         "mode": mode,
@@ -239,8 +312,9 @@ def _publications_list_data(
         "page": int(page),
         "page_size": int(page_size),
         "snapshot": snapshot,
-        "has_prev": int(offset) > 0,
-        "has_next": int(offset) + int(page_size) < int(total_count),
+        "has_prev": cursor_mode or int(offset) > 0,
+        "has_next": next_cursor is not None if cursor_mode else int(offset) + int(page_size) < int(total_count),
+        "next_cursor": next_cursor,
         "publications": [_serialize_publication_item(item) for item in publications],
     }
 
@@ -333,12 +407,7 @@ async def _favorite_publication_state(
         db_session,
         items=[publication],
     )
-    current = hydrated[0] if hydrated else publication
-    identifiers = await identifier_service.overlay_publication_items_with_display_identifiers(
-        db_session,
-        items=[current],
-    )
-    return identifiers[0] if identifiers else current
+    return hydrated[0] if hydrated else publication
 
 
 @router.get(
@@ -347,17 +416,21 @@ async def _favorite_publication_state(
 )
 async def list_publications(
     request: Request,
+    response: Response,
     mode: Literal["all", "unread", "latest", "new"] | None = Query(default=None),
     favorite_only: bool = Query(default=False),
     scholar_profile_id: int | None = Query(default=None, ge=1),
     search: str | None = Query(default=None, min_length=1, max_length=200),
-    sort_by: Literal["first_seen", "title", "year", "citations", "scholar", "pdf_status"] = Query(default="first_seen"),
+    sort_by: Literal["first_seen", "title", "year", "citations", "scholar", "pdf_status", "relevance"] = Query(
+        default="first_seen"
+    ),
     sort_dir: Literal["asc", "desc"] = Query(default="desc"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
     limit: int | None = Query(default=None, ge=1, le=1000),
     offset: int | None = Query(default=None, ge=0),
     snapshot: str | None = Query(default=None, min_length=1, max_length=64),
+    cursor: str | None = Query(default=None, min_length=1, max_length=1024),
     db_session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_api_current_user),
 ):
@@ -369,18 +442,37 @@ async def list_publications(
     )
     snapshot_before, snapshot_cursor = _resolve_publications_snapshot(snapshot=snapshot)
     normalized_search = (search or "").strip() or None
-    resolved_mode, selected_scholar_id, publications = await _list_publications_for_request(
+    resolved_sort_by = publication_service.resolve_publication_sort(sort_by, search=normalized_search)
+    keyset_cursor = _resolve_publications_cursor(cursor=cursor, sort_by=resolved_sort_by, sort_dir=sort_dir)
+    # Read the version before the data: a concurrent write then yields a newer body under an
+    # older tag, which only costs the next poll a full response.
+    data_version = await user_service.get_user_data_version(db_session, user_id=current_user.id)
+    # Failed PDF jobs become due for auto-retry without a version bump; the count changes the
+    # tag so the next poll runs the enqueue step in _list_publications_for_request.
+    retry_due_count = await publication_service.count_auto_retry_due_pdf_jobs_for_user(
+        db_session, user_id=current_user.id
+    )
+    etag = data_version_etag(
+        request,
+        user_id=current_user.id,
+        data_version=data_version,
+        extra={"pdf_retry_due": retry_due_count},
+    )
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    resolved_mode, selected_scholar_id, publications, next_cursor = await _list_publications_for_request(
         db_session,
         current_user=current_user,
         mode=mode,
         favorite_only=favorite_only,
         scholar_profile_id=scholar_profile_id,
         search=normalized_search,
-        sort_by=sort_by,
+        sort_by=resolved_sort_by,
         sort_dir=sort_dir,
         limit=resolved_limit,
         offset=resolved_offset,
         snapshot_before=snapshot_before,
+        cursor=keyset_cursor,
     )
     unread_count, favorites_count, latest_count, total_count = await _publication_counts(
         db_session,
@@ -389,6 +481,7 @@ async def list_publications(
         favorite_only=favorite_only,
         search=normalized_search,
         snapshot_before=snapshot_before,
+        live=snapshot is None,
     )
     data = _publications_list_data(
         mode=resolved_mode,
@@ -403,7 +496,10 @@ async def list_publications(
         page_size=resolved_limit,
         offset=resolved_offset,
         snapshot=snapshot_cursor,
+        cursor_mode=keyset_cursor is not None,
+        next_cursor=next_cursor,
     )
+    set_etag_headers(response, etag)
     return success_payload(request, data=data)
 
 
@@ -4,11 +4,12 @@ import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import data_version_etag, etag_matches, not_modified_response, set_etag_headers
 from app.api.deps import get_api_current_user
 from app.api.errors import ApiException
 from app.api.responses import success_payload
@@ -43,6 +44,7 @@ from app.services.ingestion import application as ingestion_service
 from app.services.runs import application as run_service
 from app.services.runs.events import event_generator
 from app.services.settings import application as user_settings_service
+from app.services.users import application as user_service
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -67,21 +69,28 @@ ACTIVE_RUN_STATUSES = {RunStatus.RUNNING, RunStatus.RESOLVING}
 )
 async def list_runs(
     request: Request,
+    response: Response,
     failed_only: bool = Query(default=False),
     limit: int = Query(default=100, ge=1, le=500),
     db_session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_api_current_user),
 ):
-    runs = await run_service.list_runs_for_user(
+    data_version = await user_service.get_user_data_version(db_session, user_id=current_user.id)
+    safety_state = await load_safety_state(
         db_session,
         user_id=current_user.id,
-        limit=limit,
-        failed_only=failed_only,
     )
-    safety_state = await load_safety_state(
+    # The safety state carries a countdown, so it is part of the tag rather than the version.
+    etag = data_version_etag(request, user_id=current_user.id, data_version=data_version, extra=safety_state)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    runs = await run_service.list_runs_for_user(
         db_session,
         user_id=current_user.id,
+        limit=limit,
+        failed_only=failed_only,
     )
+    set_etag_headers(response, etag)
     return success_payload(
         request,
         data={
@@ -335,15 +344,21 @@ async def run_manual(
 )
 async def list_queue_items(
     request: Request,
+    response: Response,
     limit: int = Query(default=200, ge=1, le=500),
     db_session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_api_current_user),
 ):
+    data_version = await user_service.get_user_data_version(db_session, user_id=current_user.id)
+    etag = data_version_etag(request, user_id=current_user.id, data_version=data_version)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
     items = await run_service.list_queue_items_for_user(
         db_session,
         user_id=current_user.id,
         limit=limit,
     )
+    set_etag_headers(response, etag)
     return success_payload(
         request,
         data={
@@ -465,6 +480,7 @@ async def clear_queue_item(
 @router.get("/{run_id}/stream")
 async def stream_run_events(
     run_id: int,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
     current_user: User = Depends(get_api_current_user),
 ):
     session_factory = get_session_factory()
@@ -480,4 +496,4 @@ async def stream_run_events(
             code="run_not_found",
             message="Run not found.",
         )
-    return StreamingResponse(event_generator(run_id), media_type="text/event-stream")
+    return StreamingResponse(event_generator(run_id, last_event_id=last_event_id), media_type="text/event-stream")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_api_current_user
@@ -33,7 +37,7 @@ from app.api.schemas import (
     ScholarsListEnvelope,
 )
 from app.db.models import User
-from app.db.session import get_db_session
+from app.db.session import get_db_session, get_session_factory
 from app.logging_utils import structured_log
 from app.services.portability import application as import_export_service
 from app.services.scholar.source import ScholarSource
@@ -101,6 +105,65 @@ async def export_scholars_and_publications(
     return success_payload(request, data=data)
 
 
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
+
+
+async def _export_stream_body(
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None,
+    export_format: str,
+    compress: bool,
+) -> AsyncIterator[bytes]:
+    # The request-scoped session is closed before a streamed body runs, so the export owns its own.
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        stream_export = (
+            import_export_service.stream_user_data_ndjson
+            if export_format == "ndjson"
+            else import_export_service.stream_user_data_json
+        )
+        chunks = stream_export(db_session, user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+        if compress:
+            chunks = import_export_service.gzip_chunks(chunks)
+        async for chunk in chunks:
+            yield chunk
+
+
+@router.get("/export/stream")
+async def stream_scholars_and_publications_export(
+    ids: str | None = Query(None, description="Comma-separated scholar profile IDs to export"),
+    format: Literal["ndjson", "json"] = Query(default="ndjson"),
+    compress: bool = Query(default=False),
+    current_user: User = Depends(get_api_current_user),
+):
+    scholar_profile_ids = _parse_ids_param(ids)
+    filename = f"scholarr-export-{datetime.now(UTC).date().isoformat()}.{format}"
+    media_type = _EXPORT_MEDIA_TYPES[format]
+    if compress:
+        filename = f"{filename}.gz"
+        media_type = "application/gzip"
+    structured_log(
+        logger,
+        "info",
+        "api.scholars.export_stream_started",
+        user_id=current_user.id,
+        export_format=format,
+        compress=compress,
+        scholar_filter_count=len(scholar_profile_ids or []),
+    )
+    return StreamingResponse(
+        _export_stream_body(
+            user_id=current_user.id,
+            scholar_profile_ids=scholar_profile_ids,
+            export_format=format,
+            compress=compress,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.post(
     "/bulk-delete",
     response_model=ScholarBulkCountEnvelope,
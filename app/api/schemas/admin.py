@@ -277,6 +277,7 @@ class AdminRepairPublicationNearDuplicatesRequest(BaseModel):
     max_year_delta: int = Field(default=1, ge=0, le=5)
     max_clusters: int = Field(default=25, ge=1, le=200)
     selected_cluster_keys: list[str] = Field(default_factory=list, max_length=200)
+    scope: Literal["incremental", "full"] = "incremental"
     requested_by: str | None = None
     confirmation_text: str | None = None
 
@@ -312,3 +313,36 @@ class AdminRepairPublicationNearDuplicatesEnvelope(BaseModel):
     meta: ApiMeta
 
     model_config = ConfigDict(extra="forbid")
+
+
+class AdminProviderRateData(BaseModel):
+    provider: str
+    circuit_state: Literal["closed", "open", "half_open"]
+    interval_seconds: float
+    min_interval_seconds: float
+    max_interval_seconds: float
+    concurrency_limit: int
+    max_concurrency: int
+    in_flight: int
+    consecutive_failures: int
+    circuit_retry_after_seconds: float
+    latency_ewma_seconds: float | None = None
+    request_count: int
+    success_count: int
+    rate_limited_count: int
+    error_count: int
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdminProviderRatesData(BaseModel):
+    providers: list[AdminProviderRateData]
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdminProviderRatesEnvelope(BaseModel):
+    data: AdminProviderRatesData
+    meta: ApiMeta
+
+    model_config = ConfigDict(extra="forbid")
@@ -54,6 +54,7 @@ class PublicationsListData(BaseModel):
     snapshot: str
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: str | None = None
     publications: list[PublicationItemData]
 
     model_config = ConfigDict(extra="forbid")
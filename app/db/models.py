@@ -4,8 +4,10 @@ from datetime import datetime
 from enum import StrEnum
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
+    Computed,
     DateTime,
     Enum,
     Float,
@@ -18,7 +20,7 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -113,6 +115,12 @@ class ScholarProfile(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "scholar_id", name="uq_scholar_profiles_user_scholar"),
         Index("ix_scholar_profiles_user_enabled", "user_id", "is_enabled"),
+        Index(
+            "ix_scholar_profiles_display_name_trgm",
+            "display_name",
+            postgresql_using="gin",
+            postgresql_ops={"display_name": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -167,6 +175,19 @@ class CrawlRun(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
+# Run events too large for a NOTIFY payload; the notification carries the row id instead.
+# Rows are short-lived and pruned by the transport when it stores new ones.
+class RunEventPayload(Base):
+    __tablename__ = "run_event_payloads"
+    __table_args__ = (Index("ix_run_event_payloads_created_at", "created_at"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("crawl_runs.id", ondelete="CASCADE"), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class Publication(Base):
     __tablename__ = "publications"
     __table_args__ = (
@@ -177,6 +198,19 @@ class Publication(Base):
             unique=True,
             postgresql_where=text("cluster_id IS NOT NULL"),
         ),
+        Index("ix_publications_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_publications_title_raw_trgm",
+            "title_raw",
+            postgresql_using="gin",
+            postgresql_ops={"title_raw": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_publications_venue_text_trgm",
+            "venue_text",
+            postgresql_using="gin",
+            postgresql_ops={"venue_text": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -193,10 +227,37 @@ class Publication(Base):
     canonical_title_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     openalex_enriched: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
     openalex_last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # NULL until the title tokens are (re)indexed for near-duplicate detection; reset when title or year change.
+    near_dup_indexed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    # Best-ranked row of publication_identifiers, kept current by a trigger on that table.
+    display_identifier_kind: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    display_identifier_value: Mapped[str | None] = mapped_column(Text, nullable=True)
+    display_identifier_confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Generated by Postgres from title (weight A) and venue (weight C); backs ranked publication search.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english'::regconfig, coalesce(title_raw, '')), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(venue_text, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
+class PublicationTitleToken(Base):
+    __tablename__ = "publication_title_tokens"
+    __table_args__ = (Index("ix_publication_title_tokens_token", "token"),)
+
+    publication_id: Mapped[int] = mapped_column(
+        ForeignKey("publications.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    token: Mapped[str] = mapped_column(String(128), primary_key=True)
+
+
 class PublicationIdentifier(Base):
     __tablename__ = "publication_identifiers"
     __table_args__ = (
@@ -308,6 +369,8 @@ class ScholarPublication(Base):
     __table_args__ = (
         Index("ix_scholar_publications_is_read", "is_read"),
         Index("ix_scholar_publications_is_favorite", "is_favorite"),
+        Index("ix_scholar_publications_first_seen_run_id", "first_seen_run_id"),
+        Index("ix_scholar_publications_publication_id", "publication_id"),
     )
 
     scholar_profile_id: Mapped[int] = mapped_column(
@@ -324,6 +387,44 @@ class ScholarPublication(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
+# Distinct publication counts across a user's scholars. Maintained by statement triggers on
+# scholar_publications (revision 20261019_0027); drift is corrected by the reconciliation job.
+class UserPublicationCounter(Base):
+    __tablename__ = "user_publication_counters"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    favorite_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    favorite_unread_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+# Link counts for one scholar profile, maintained the same way as UserPublicationCounter.
+class ScholarPublicationCounter(Base):
+    __tablename__ = "scholar_publication_counters"
+
+    scholar_profile_id: Mapped[int] = mapped_column(
+        ForeignKey("scholar_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    favorite_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    favorite_unread_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+# Bumped by statement triggers (revision 20261019_0029) whenever data shown in the user's
+# publications, runs or queue lists changes; list endpoints derive their ETags from it.
+class UserDataVersion(Base):
+    __tablename__ = "user_data_versions"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class IngestionQueueItem(Base):
     __tablename__ = "ingestion_queue_items"
     __table_args__ = (
@@ -21,7 +21,9 @@ from app.http.middleware import (
 from app.logging_config import configure_logging, parse_redact_fields
 from app.logging_utils import structured_log
 from app.security.csrf import CSRFMiddleware
+from app.services.crossref.client import close_shared_crossref_client
 from app.services.ingestion.scheduler import SchedulerService
+from app.services.runs.event_transport import start_run_event_transport, stop_run_event_transport
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -101,9 +103,12 @@ async def lifespan(_: FastAPI):
             error=str(exc),
         )
 
+    await start_run_event_transport()
     await scheduler_service.start()
     yield
     await scheduler_service.stop()
+    await stop_run_event_transport()
+    await close_shared_crossref_client()
     await close_engine()
 
 
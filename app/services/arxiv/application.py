@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING
 
 from app.services.arxiv.gateway import (
     build_arxiv_query,
     get_arxiv_gateway,
 )
+from app.services.arxiv.types import ArxivBatchDiscovery
 
 if TYPE_CHECKING:
     from app.services.publications.types import PublicationListItem, UnreadPublicationItem
@@ -27,3 +29,19 @@ async def discover_arxiv_id_for_publication(
         request_email=request_email,
         timeout_seconds=timeout_seconds,
     )
+
+
+async def discover_arxiv_ids_for_publications(
+    *,
+    items: Sequence[PublicationListItem | UnreadPublicationItem],
+    request_email: str | None = None,
+    timeout_seconds: float | None = None,
+    should_stop: Callable[[], Awaitable[bool]] | None = None,
+) -> ArxivBatchDiscovery:
+    gateway = get_arxiv_gateway()
+    return await gateway.discover_arxiv_ids_for_publications(
+        items=items,
+        request_email=request_email,
+        timeout_seconds=timeout_seconds,
+        should_stop=should_stop,
+    )
@@ -14,11 +14,18 @@ from app.db.models import ArxivQueryCacheEntry
 from app.db.session import get_session_factory
 from app.services.arxiv.constants import ARXIV_CACHE_FINGERPRINT_VERSION
 from app.services.arxiv.types import ArxivEntry, ArxivFeed, ArxivOpenSearchMeta
+from app.settings import settings
+from app.ttl_cache import TtlLruCache
 
 _INFLIGHT_LOCK = asyncio.Lock()
 _INFLIGHT_FEEDS: dict[str, asyncio.Future[ArxivFeed]] = {}
 
 
+# In-process tier in front of ``arxiv_query_cache_entries``. Entries expire at the DB row's
+# ``expires_at`` (on the wall clock, so callers' ``now_utc`` applies) so both tiers expire together.
+_MEMORY_ENTRIES: TtlLruCache[str, ArxivFeed] = TtlLruCache()
+
+
 def build_query_fingerprint(*, params: Mapping[str, object]) -> str:
     canonical = _canonical_cache_payload(params=params)
     encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
@@ -32,13 +39,19 @@ async def get_cached_feed(
     now_utc: datetime | None = None,
 ) -> ArxivFeed | None:
     timestamp = _as_utc(now_utc)
+    remembered = _get_memory_feed(query_fingerprint, now_utc=timestamp)
+    if remembered is not None:
+        return remembered
     session_factory = get_session_factory()
     async with session_factory() as db_session, db_session.begin():
         result = await db_session.execute(
             select(ArxivQueryCacheEntry).where(ArxivQueryCacheEntry.query_fingerprint == query_fingerprint)
         )
         entry = result.scalar_one_or_none()
-        return await _validate_cached_entry(db_session, entry=entry, now_utc=timestamp)
+        feed = await _validate_cached_entry(db_session, entry=entry, now_utc=timestamp)
+    if feed is not None and entry is not None:
+        _remember_feed(query_fingerprint, feed=feed, expires_at=_as_utc(entry.expires_at), now_utc=timestamp)
+    return feed
 
 
 async def set_cached_feed(
@@ -46,7 +59,6 @@ async def set_cached_feed(
     query_fingerprint: str,
     feed: ArxivFeed,
     ttl_seconds: float,
-    max_entries: int,
     now_utc: datetime | None = None,
 ) -> None:
     timestamp = _as_utc(now_utc)
@@ -57,9 +69,39 @@ async def set_cached_feed(
             query_fingerprint=query_fingerprint,
             feed=feed,
             ttl_seconds=ttl_seconds,
-            max_entries=max_entries,
             now_utc=timestamp,
         )
+    ttl = max(float(ttl_seconds), 0.0)
+    _remember_feed(query_fingerprint, feed=feed, expires_at=timestamp + timedelta(seconds=ttl), now_utc=timestamp)
+
+
+async def prune_cache_entries(*, max_entries: int, now_utc: datetime | None = None) -> int:
+    """Delete expired rows and trim the table to ``max_entries``; returns the deleted count.
+
+    Runs from the scheduler on ``ARXIV_CACHE_PRUNE_INTERVAL_SECONDS`` instead of on every write.
+    """
+    timestamp = _as_utc(now_utc)
+    session_factory = get_session_factory()
+    async with session_factory() as db_session, db_session.begin():
+        return await _prune_cache_entries(db_session, now_utc=timestamp, max_entries=max_entries)
+
+
+def clear_memory_cache() -> None:
+    _MEMORY_ENTRIES.clear()
+
+
+def _get_memory_feed(query_fingerprint: str, *, now_utc: datetime) -> ArxivFeed | None:
+    return _MEMORY_ENTRIES.get(query_fingerprint, now=now_utc.timestamp())
+
+
+def _remember_feed(query_fingerprint: str, *, feed: ArxivFeed, expires_at: datetime, now_utc: datetime) -> None:
+    _MEMORY_ENTRIES.set(
+        query_fingerprint,
+        feed,
+        ttl_seconds=(expires_at - now_utc).total_seconds(),
+        max_entries=max(int(settings.arxiv_memory_cache_max_entries), 0),
+        now=now_utc.timestamp(),
+    )
 
 
 async def run_with_inflight_dedupe(
@@ -133,7 +175,6 @@ async def _write_cached_entry(
     query_fingerprint: str,
     feed: ArxivFeed,
     ttl_seconds: float,
-    max_entries: int,
     now_utc: datetime,
 ) -> None:
     ttl = max(float(ttl_seconds), 0.0)
@@ -162,7 +203,6 @@ async def _write_cached_entry(
         existing.expires_at = expires_at
         existing.cached_at = now_utc
         existing.updated_at = now_utc
-    await _prune_cache_entries(db_session, now_utc=now_utc, max_entries=max_entries)
 
 
 async def _prune_cache_entries(
@@ -170,16 +210,19 @@ async def _prune_cache_entries(
     *,
     now_utc: datetime,
     max_entries: int,
-) -> None:
-    await db_session.execute(delete(ArxivQueryCacheEntry).where(ArxivQueryCacheEntry.expires_at <= now_utc))
+) -> int:
+    expired_result = await db_session.execute(
+        delete(ArxivQueryCacheEntry).where(ArxivQueryCacheEntry.expires_at <= now_utc)
+    )
+    deleted = int(expired_result.rowcount or 0)
     bounded_max_entries = int(max_entries)
     if bounded_max_entries <= 0:
-        return
+        return deleted
     count_result = await db_session.execute(select(func.count()).select_from(ArxivQueryCacheEntry))
     entry_count = int(count_result.scalar_one() or 0)
     overflow = max(0, entry_count - bounded_max_entries)
     if overflow <= 0:
-        return
+        return deleted
     stale_result = await db_session.execute(
         select(ArxivQueryCacheEntry.query_fingerprint).order_by(ArxivQueryCacheEntry.cached_at.asc()).limit(overflow)
     )
@@ -188,6 +231,7 @@ async def _prune_cache_entries(
         await db_session.execute(
             delete(ArxivQueryCacheEntry).where(ArxivQueryCacheEntry.query_fingerprint.in_(stale_keys))
         )
+    return deleted + len(stale_keys)
 
 
 def _serialize_feed(feed: ArxivFeed) -> dict[str, Any]:
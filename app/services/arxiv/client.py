@@ -47,7 +47,6 @@ class ArxivClient:
             request_fn=request_fn,
         )
         self._cache_ttl_seconds = _cache_ttl_seconds()
-        self._cache_max_entries = _cache_max_entries()
 
     async def search(
         self,
@@ -140,7 +139,6 @@ class ArxivClient:
                 query_fingerprint=query_fingerprint,
                 feed=feed,
                 ttl_seconds=self._cache_ttl_seconds,
-                max_entries=self._cache_max_entries,
             )
         return feed
 
@@ -266,10 +264,6 @@ def _cache_ttl_seconds() -> float:
     return max(float(settings.arxiv_cache_ttl_seconds), 0.0)
 
 
-def _cache_max_entries() -> int:
-    return max(int(settings.arxiv_cache_max_entries), 0)
-
-
 def _source_path_from_params(params: dict[str, object]) -> str:
     if "search_query" in params:
         return ARXIV_SOURCE_PATH_SEARCH
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 ARXIV_RUNTIME_STATE_KEY = "global"
-ARXIV_RATE_LIMIT_LOCK_NAMESPACE = 91_100
-ARXIV_RATE_LIMIT_LOCK_KEY = 1
 ARXIV_SOURCE_PATH_SEARCH = "search"
 ARXIV_SOURCE_PATH_LOOKUP_IDS = "lookup_ids"
 ARXIV_SOURCE_PATH_UNKNOWN = "unknown"
@@ -11,3 +9,4 @@ ARXIV_TITLE_TOKEN_MIN_LENGTH = 3
 ARXIV_TITLE_MIN_TOKENS = 3
 ARXIV_TITLE_MIN_ALPHA_TOKENS = 2
 ARXIV_STRONG_IDENTIFIER_CONFIDENCE = 0.9
+ARXIV_BATCH_TITLE_MATCH_MIN_SCORE = 90.0
@@ -3,12 +3,18 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
+from rapidfuzz import fuzz
+
 from app.logging_utils import structured_log
 from app.services.arxiv.client import ArxivClient
+from app.services.arxiv.constants import ARXIV_BATCH_TITLE_MATCH_MIN_SCORE
 from app.services.arxiv.errors import ArxivRateLimitError
-from app.services.arxiv.types import ArxivFeed
+from app.services.arxiv.guards import title_passes_quality_guard
+from app.services.arxiv.types import ArxivBatchDiscovery, ArxivEntry, ArxivFeed
 from app.settings import settings
 
 if TYPE_CHECKING:
@@ -32,6 +38,23 @@ class ArxivGateway(Protocol):
         max_results: int | None = None,
     ) -> str | None: ...
 
+    async def discover_arxiv_ids_for_publications(
+        self,
+        *,
+        items: Sequence[PublicationListItem | UnreadPublicationItem],
+        request_email: str | None = None,
+        timeout_seconds: float | None = None,
+        should_stop: Callable[[], Awaitable[bool]] | None = None,
+    ) -> ArxivBatchDiscovery: ...
+
+
+@dataclass(frozen=True)
+class _BatchClause:
+    query: str
+    title_key: str
+    author_surname: str | None
+    publication_ids: tuple[int, ...]
+
 
 def build_arxiv_query(title: str, author_surname: str | None) -> str | None:
     parts: list[str] = []
@@ -116,6 +139,59 @@ class HttpArxivGateway:
             structured_log(logger, "debug", "arxiv.query_failed", error=str(exc))
             return None
 
+    async def discover_arxiv_ids_for_publications(
+        self,
+        *,
+        items: Sequence[PublicationListItem | UnreadPublicationItem],
+        request_email: str | None = None,
+        timeout_seconds: float | None = None,
+        should_stop: Callable[[], Awaitable[bool]] | None = None,
+    ) -> ArxivBatchDiscovery:
+        """Discover arXiv IDs for many publications with OR-combined title searches.
+
+        Each request carries up to ``ARXIV_BATCH_MAX_PUBLICATIONS`` title/author
+        clauses, and entries are mapped back to publications by fuzzy title match.
+        Titles failing the quality guard are not searched and map to ``None``.
+        ``should_stop`` is awaited between requests; once it returns true, or arXiv
+        rate-limits a request, the matches found so far are returned.
+        """
+        results: dict[int, str | None] = {int(item.publication_id): None for item in items}
+        if not settings.arxiv_enabled:
+            return ArxivBatchDiscovery(arxiv_ids=results)
+        batches = _plan_clause_batches(
+            _batch_clauses(items),
+            max_publications=settings.arxiv_batch_max_publications,
+            max_query_chars=settings.arxiv_batch_max_query_chars,
+        )
+        for index, batch in enumerate(batches):
+            if index > 0 and should_stop is not None and await should_stop():
+                structured_log(logger, "debug", "arxiv.batch_discovery_stopped", remaining_batches=len(batches) - index)
+                break
+            try:
+                feed = await self._client.search(
+                    query=combined_arxiv_query(batch),
+                    start=0,
+                    request_email=request_email,
+                    timeout_seconds=timeout_seconds,
+                    max_results=len(batch) * max(int(settings.arxiv_default_max_results), 1),
+                )
+            except ArxivRateLimitError:
+                return ArxivBatchDiscovery(arxiv_ids=results, rate_limited=True)
+            except Exception as exc:
+                structured_log(logger, "debug", "arxiv.batch_query_failed", clause_count=len(batch), error=str(exc))
+                continue
+            matched = _match_entries_to_clauses(batch, feed.entries)
+            results.update(matched)
+            structured_log(
+                logger,
+                "debug",
+                "arxiv.batch_query_completed",
+                clause_count=len(batch),
+                entry_count=len(feed.entries),
+                matched_count=len(matched),
+            )
+        return ArxivBatchDiscovery(arxiv_ids=results)
+
 
 def _query_for_item(item: PublicationListItem | UnreadPublicationItem) -> str | None:
     title = (item.title or "").strip()
@@ -125,6 +201,95 @@ def _query_for_item(item: PublicationListItem | UnreadPublicationItem) -> str |
     return build_arxiv_query(title, author_surname)
 
 
+def combined_arxiv_query(clauses: Sequence[_BatchClause]) -> str:
+    if len(clauses) == 1:
+        return clauses[0].query
+    return " OR ".join(f"({clause.query})" for clause in clauses)
+
+
+def _batch_clauses(items: Sequence[PublicationListItem | UnreadPublicationItem]) -> list[_BatchClause]:
+    # Publications sharing a title and author share one clause and therefore one match.
+    grouped: dict[str, tuple[str, str | None, list[int]]] = {}
+    for item in items:
+        if not title_passes_quality_guard(item.title):
+            continue
+        query = _query_for_item(item)
+        if query is None:
+            continue
+        title_key = _title_key(item.title or "")
+        _, _, publication_ids = grouped.setdefault(query, (title_key, _author_surname(item.scholar_label), []))
+        publication_ids.append(int(item.publication_id))
+    return [
+        _BatchClause(
+            query=query,
+            title_key=title_key,
+            author_surname=author_surname,
+            publication_ids=tuple(publication_ids),
+        )
+        for query, (title_key, author_surname, publication_ids) in grouped.items()
+    ]
+
+
+def _plan_clause_batches(
+    clauses: Sequence[_BatchClause],
+    *,
+    max_publications: int,
+    max_query_chars: int,
+) -> list[list[_BatchClause]]:
+    max_clauses = max(int(max_publications), 1)
+    batches: list[list[_BatchClause]] = []
+    current: list[_BatchClause] = []
+    current_chars = 0
+    for clause in clauses:
+        # "(" + query + ")" plus the " OR " separator once the batch is non-empty.
+        clause_chars = len(clause.query) + 2 + (4 if current else 0)
+        if current and (len(current) >= max_clauses or current_chars + clause_chars > max_query_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+            clause_chars = len(clause.query) + 2
+        current.append(clause)
+        current_chars += clause_chars
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _match_entries_to_clauses(
+    clauses: Sequence[_BatchClause],
+    entries: Sequence[ArxivEntry],
+) -> dict[int, str]:
+    best: dict[int, tuple[float, str]] = {}
+    for entry in entries:
+        if not entry.arxiv_id:
+            continue
+        entry_title_key = _title_key(entry.title)
+        for index, clause in enumerate(clauses):
+            score = fuzz.token_sort_ratio(clause.title_key, entry_title_key)
+            if score < ARXIV_BATCH_TITLE_MATCH_MIN_SCORE:
+                continue
+            if clause.author_surname and not _entry_has_author(entry, clause.author_surname):
+                continue
+            current = best.get(index)
+            if current is None or score > current[0]:
+                best[index] = (score, entry.arxiv_id)
+    matched: dict[int, str] = {}
+    for index, (_, arxiv_id) in best.items():
+        for publication_id in clauses[index].publication_ids:
+            matched[publication_id] = arxiv_id
+    return matched
+
+
+def _title_key(title: str) -> str:
+    return _normalize_query_title(title).lower()
+
+
+def _entry_has_author(entry: ArxivEntry, author_surname: str) -> bool:
+    surname = _normalize_query_title(author_surname).lower()
+    if not entry.authors:
+        return True
+    return any(surname in _normalize_query_title(author).lower().split() for author in entry.authors)
+
+
 def _author_surname(scholar_label: str | None) -> str | None:
     if not scholar_label:
         return None
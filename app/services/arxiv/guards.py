@@ -28,7 +28,7 @@ def arxiv_skip_reason_for_item(
         return "arxiv_identifier_present"
     if has_strong_doi or _has_strong_doi_evidence(item):
         return "strong_doi_present"
-    if not _title_passes_quality_guard(item.title):
+    if not title_passes_quality_guard(item.title):
         return "title_quality_below_threshold"
     return None
 
@@ -68,7 +68,7 @@ def _has_normalized_identifier(
     return normalizer(item.pdf_url) is not None
 
 
-def _title_passes_quality_guard(title: str | None) -> bool:
+def title_passes_quality_guard(title: str | None) -> bool:
     tokens = _normalized_tokens(title or "")
     if len(tokens) < ARXIV_TITLE_MIN_TOKENS:
         return False
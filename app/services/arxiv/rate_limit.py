@@ -8,18 +8,17 @@ from datetime import UTC, datetime, timedelta
 
 import httpx
 from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ArxivRuntimeState
 from app.db.session import get_session_factory
 from app.logging_utils import structured_log
 from app.services.arxiv.constants import (
-    ARXIV_RATE_LIMIT_LOCK_KEY,
-    ARXIV_RATE_LIMIT_LOCK_NAMESPACE,
     ARXIV_RUNTIME_STATE_KEY,
     ARXIV_SOURCE_PATH_UNKNOWN,
 )
 from app.services.arxiv.errors import ArxivRateLimitError
+from app.services.rate_control import PROVIDER_ARXIV, ProviderCircuitOpenError, get_provider_controller
+from app.services.rate_control.controller import ProviderCall
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -37,11 +36,17 @@ async def run_with_global_arxiv_limit(
     fetch: Callable[[], Awaitable[httpx.Response]],
     source_path: str = ARXIV_SOURCE_PATH_UNKNOWN,
 ) -> httpx.Response:
-    response, hit_rate_limit = await _run_serialized_fetch(
-        fetch=fetch,
-        source_path=source_path,
-    )
-    if hit_rate_limit:
+    # The shared controller paces this process adaptively and sheds requests while its circuit
+    # is open; inside it, the DB-backed slot keeps every process at least the base interval apart.
+    try:
+        async with get_provider_controller(PROVIDER_ARXIV).request() as call:
+            response = await _run_serialized_fetch(fetch=fetch, call=call, source_path=source_path)
+    except ProviderCircuitOpenError as exc:
+        raise ArxivRateLimitError(f"arXiv requests paused ({exc.retry_after_seconds:.0f}s remaining)") from exc
+    if response is None:
+        remaining_seconds = call.retry_after_seconds or 0.0
+        raise ArxivRateLimitError(f"arXiv global cooldown active ({remaining_seconds:.0f}s remaining)")
+    if int(response.status_code) == 429:
         raise ArxivRateLimitError("arXiv rate limit hit (429) — stopping batch")
     return response
 
@@ -62,100 +67,96 @@ async def get_arxiv_cooldown_status(*, now_utc: datetime | None = None) -> Arxiv
     )
 
 
+# Reserves the next pacing slot in one statement. Slots are spaced ``interval_seconds`` apart
+# by start time; the row lock lasts only for this statement, never across the HTTP call.
+_RESERVE_SLOT_SQL = text(
+    """
+    INSERT INTO arxiv_runtime_state (state_key, next_allowed_at)
+    VALUES (:state_key, clock_timestamp() + make_interval(secs => CAST(:interval_seconds AS double precision)))
+    ON CONFLICT (state_key) DO UPDATE
+    SET next_allowed_at = GREATEST(arxiv_runtime_state.next_allowed_at, clock_timestamp())
+            + make_interval(secs => CAST(:interval_seconds AS double precision)),
+        updated_at = now()
+    WHERE arxiv_runtime_state.cooldown_until IS NULL
+       OR arxiv_runtime_state.cooldown_until <= clock_timestamp()
+    RETURNING next_allowed_at, clock_timestamp() AS reserved_at
+    """
+)
+
+_RECORD_COOLDOWN_SQL = text(
+    """
+    UPDATE arxiv_runtime_state
+    SET cooldown_until = GREATEST(
+            cooldown_until,
+            clock_timestamp() + make_interval(secs => CAST(:cooldown_seconds AS double precision))
+        ),
+        next_allowed_at = GREATEST(
+            next_allowed_at,
+            clock_timestamp() + make_interval(secs => CAST(:interval_seconds AS double precision))
+        ),
+        updated_at = now()
+    WHERE state_key = :state_key
+    RETURNING cooldown_until, clock_timestamp() AS recorded_at
+    """
+)
+
+
 async def _run_serialized_fetch(
     *,
     fetch: Callable[[], Awaitable[httpx.Response]],
+    call: ProviderCall,
     source_path: str,
-) -> tuple[httpx.Response, bool]:
-    session_factory = get_session_factory()
-    async with session_factory() as lock_session:
-        await _acquire_arxiv_lock(lock_session)
-        try:
-            async with session_factory() as db_session, db_session.begin():
-                runtime_state = await _load_runtime_state_for_update(db_session)
-                wait_seconds = await _wait_for_allowed_slot_or_raise(
-                    runtime_state,
-                    source_path=source_path,
-                )
-                runtime_state.next_allowed_at = datetime.now(UTC) + timedelta(seconds=_min_interval_seconds())
-
-            if wait_seconds > 0:
-                await asyncio.sleep(wait_seconds)
-            response = await fetch()
-
-            async with session_factory() as db_session, db_session.begin():
-                runtime_state = await _load_runtime_state_for_update(db_session)
-                hit_rate_limit = _record_post_response_state(
-                    runtime_state,
-                    response_status=int(response.status_code),
-                    source_path=source_path,
-                )
-                cooldown_until_value = runtime_state.cooldown_until
-        finally:
-            await _release_arxiv_lock(lock_session)
+) -> httpx.Response | None:
+    wait_seconds = await _reserve_arxiv_slot(source_path=source_path)
+    if wait_seconds is None:
+        # Another process hit a 429; report it so this process pauses until the cooldown ends.
+        cooldown_status = await get_arxiv_cooldown_status()
+        structured_log(
+            logger,
+            "info",
+            "arxiv.request_scheduled",
+            wait_seconds=0.0,
+            source_path=source_path,
+            cooldown_remaining_seconds=cooldown_status.remaining_seconds,
+        )
+        call.observe_status(429, retry_after_seconds=cooldown_status.remaining_seconds)
+        return None
+    if wait_seconds > 0:
+        await asyncio.sleep(wait_seconds)
+    response = await fetch()
+    call.observe_response(response)
+    cooldown_remaining_seconds = 0.0
+    if int(response.status_code) == 429:
+        cooldown_remaining_seconds = await _record_arxiv_cooldown(
+            source_path=source_path,
+            retry_after_seconds=call.retry_after_seconds,
+        )
     structured_log(
         logger,
         "info",
         "arxiv.request_completed",
         status_code=int(response.status_code),
         wait_seconds=wait_seconds,
-        cooldown_remaining_seconds=_cooldown_remaining_seconds(cooldown_until_value, now_utc=datetime.now(UTC)),
+        cooldown_remaining_seconds=cooldown_remaining_seconds,
         source_path=source_path,
     )
-    return response, hit_rate_limit
-
-
-async def _acquire_arxiv_lock(db_session: AsyncSession) -> None:
-    await db_session.execute(
-        text("SELECT pg_advisory_lock(:namespace, :lock_key)"),
-        {
-            "namespace": ARXIV_RATE_LIMIT_LOCK_NAMESPACE,
-            "lock_key": ARXIV_RATE_LIMIT_LOCK_KEY,
-        },
-    )
-
-
-async def _release_arxiv_lock(db_session: AsyncSession) -> None:
-    await db_session.execute(
-        text("SELECT pg_advisory_unlock(:namespace, :lock_key)"),
-        {
-            "namespace": ARXIV_RATE_LIMIT_LOCK_NAMESPACE,
-            "lock_key": ARXIV_RATE_LIMIT_LOCK_KEY,
-        },
-    )
-
-
-async def _load_runtime_state_for_update(db_session: AsyncSession) -> ArxivRuntimeState:
-    result = await db_session.execute(
-        select(ArxivRuntimeState).where(ArxivRuntimeState.state_key == ARXIV_RUNTIME_STATE_KEY).with_for_update()
-    )
-    state = result.scalar_one_or_none()
-    if state is not None:
-        return state
-    state = ArxivRuntimeState(state_key=ARXIV_RUNTIME_STATE_KEY)
-    db_session.add(state)
-    await db_session.flush()
-    return state
+    return response
 
 
-async def _wait_for_allowed_slot_or_raise(
-    runtime_state: ArxivRuntimeState,
-    *,
-    source_path: str,
-) -> float:
-    now_utc = datetime.now(UTC)
-    cooldown_seconds = _cooldown_remaining_seconds(runtime_state.cooldown_until, now_utc=now_utc)
-    if cooldown_seconds > 0:
-        structured_log(
-            logger,
-            "info",
-            "arxiv.request_scheduled",
-            wait_seconds=0.0,
-            source_path=source_path,
-            cooldown_remaining_seconds=cooldown_seconds,
+async def _reserve_arxiv_slot(*, source_path: str) -> float | None:
+    """Reserve the next global slot and return the wait before it, or ``None`` during a cooldown."""
+    interval_seconds = _min_interval_seconds()
+    session_factory = get_session_factory()
+    async with session_factory() as db_session, db_session.begin():
+        result = await db_session.execute(
+            _RESERVE_SLOT_SQL,
+            {"state_key": ARXIV_RUNTIME_STATE_KEY, "interval_seconds": interval_seconds},
         )
-        raise ArxivRateLimitError(f"arXiv global cooldown active ({cooldown_seconds:.0f}s remaining)")
-    wait_seconds = _next_allowed_wait_seconds(runtime_state.next_allowed_at, now_utc=now_utc)
+        row = result.one_or_none()
+    if row is None:
+        return None
+    slot_start = _as_utc(row.next_allowed_at) - timedelta(seconds=interval_seconds)
+    wait_seconds = _next_allowed_wait_seconds(slot_start, now_utc=_as_utc(row.reserved_at))
     structured_log(
         logger,
         "info",
@@ -167,28 +168,32 @@ async def _wait_for_allowed_slot_or_raise(
     return wait_seconds
 
 
-def _record_post_response_state(
-    runtime_state: ArxivRuntimeState,
-    *,
-    response_status: int,
-    source_path: str,
-) -> bool:
-    now_utc = datetime.now(UTC)
-    runtime_state.next_allowed_at = now_utc + timedelta(seconds=_min_interval_seconds())
-    if response_status == 429:
-        cooldown_seconds = _cooldown_seconds()
-        runtime_state.cooldown_until = now_utc + timedelta(seconds=cooldown_seconds)
-        structured_log(
-            logger,
-            "warning",
-            "arxiv.cooldown_activated",
-            cooldown_remaining_seconds=cooldown_seconds,
-            source_path=source_path,
+async def _record_arxiv_cooldown(*, source_path: str, retry_after_seconds: float | None = None) -> float:
+    cooldown_seconds = max(_cooldown_seconds(), retry_after_seconds or 0.0)
+    session_factory = get_session_factory()
+    async with session_factory() as db_session, db_session.begin():
+        result = await db_session.execute(
+            _RECORD_COOLDOWN_SQL,
+            {
+                "state_key": ARXIV_RUNTIME_STATE_KEY,
+                "cooldown_seconds": cooldown_seconds,
+                "interval_seconds": _min_interval_seconds(),
+            },
         )
-        return True
-    if _cooldown_remaining_seconds(runtime_state.cooldown_until, now_utc=now_utc) <= 0:
-        runtime_state.cooldown_until = None
-    return False
+        row = result.one_or_none()
+    remaining_seconds = (
+        _cooldown_remaining_seconds(row.cooldown_until, now_utc=_as_utc(row.recorded_at))
+        if row is not None
+        else cooldown_seconds
+    )
+    structured_log(
+        logger,
+        "warning",
+        "arxiv.cooldown_activated",
+        cooldown_remaining_seconds=remaining_seconds,
+        source_path=source_path,
+    )
+    return remaining_seconds
 
 
 def _cooldown_remaining_seconds(cooldown_until: datetime | None, *, now_utc: datetime) -> float:
@@ -208,6 +213,10 @@ def _next_allowed_wait_seconds(next_allowed_at: datetime | None, *, now_utc: dat
 def _normalize_datetime(value: datetime | None) -> datetime | None:
     if value is None:
         return None
+    return _as_utc(value)
+
+
+def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value.replace(tzinfo=UTC)
     return value
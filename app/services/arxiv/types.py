@@ -32,3 +32,15 @@ class ArxivEntry:
 class ArxivFeed:
     entries: list[ArxivEntry] = field(default_factory=list)
     opensearch: ArxivOpenSearchMeta = field(default_factory=ArxivOpenSearchMeta)
+
+
+@dataclass(frozen=True)
+class ArxivBatchDiscovery:
+    """arXiv IDs found by a batched discovery call, keyed by publication id.
+
+    ``rate_limited`` is set when arXiv refused a later request; ``arxiv_ids`` then holds
+    the matches from the requests that completed before it.
+    """
+
+    arxiv_ids: dict[int, str | None] = field(default_factory=dict)
+    rate_limited: bool = False
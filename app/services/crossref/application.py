@@ -1,46 +1,26 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
-import threading
-import time
-from importlib.metadata import version as pkg_version
 from typing import TYPE_CHECKING
 
-from crossref.restful import Etiquette, Works
-
 from app.logging_utils import structured_log
+from app.services.crossref.cache import build_query_key, get_cached_items, set_cached_items
+from app.services.crossref.client import CrossrefClient
 from app.services.doi.normalize import normalize_doi
 from app.settings import settings
 
-_APP_VERSION = pkg_version("scholarr")
-
 if TYPE_CHECKING:
     from app.services.publications.types import PublicationListItem, UnreadPublicationItem
 
 TOKEN_RE = re.compile(r"[a-z0-9]+")
 NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]+")
 STOP_WORDS = {"the", "and", "for", "with", "from", "method", "study", "analysis"}
-_RATE_LOCK = threading.Lock()
-_LAST_REQUEST_AT = 0.0
 logger = logging.getLogger(__name__)
 STRICT_TITLE_MATCH_THRESHOLD = 0.75
 RELAXED_TITLE_MATCH_THRESHOLD = 0.85
 
 
-def _rate_limit_wait(min_interval_seconds: float) -> None:
-    global _LAST_REQUEST_AT
-    interval = max(float(min_interval_seconds), 0.0)
-    with _RATE_LOCK:
-        elapsed = time.monotonic() - _LAST_REQUEST_AT
-        remaining = interval - elapsed
-    if remaining > 0:
-        time.sleep(remaining)
-    with _RATE_LOCK:
-        _LAST_REQUEST_AT = time.monotonic()
-
-
 def _normalized_tokens(value: str) -> list[str]:
     lowered = value.lower().replace("’", "'").replace("“", '"').replace("”", '"')
     lowered = NON_ALNUM_RE.sub(" ", lowered)
@@ -294,41 +274,6 @@ def _best_candidate_doi(
     )
 
 
-def _works_client(email: str | None) -> Works:
-    if email:
-        etiquette = Etiquette(settings.app_name, _APP_VERSION, "https://scholarr.local", email)
-        return Works(etiquette=etiquette)
-    return Works()
-
-
-def _fetch_items_sync(
-    *,
-    query: str,
-    author: str | None,
-    date_range: tuple[str, str] | None,
-    max_rows: int,
-    email: str | None,
-    min_interval_seconds: float,
-) -> list[dict]:
-    _rate_limit_wait(min_interval_seconds)
-    works = _works_client(email)
-    params = {"bibliographic": query}
-    if author:
-        params["author"] = author
-    request = works.query(**params)
-    if date_range is not None:
-        from_date, until_date = date_range
-        request = request.filter(from_pub_date=from_date, until_pub_date=until_date)
-    request = request.select(["DOI", "title", "issued", "score", "author"])
-    items: list[dict] = []
-    for entry in request:
-        if isinstance(entry, dict):
-            items.append(entry)
-        if len(items) >= max(max_rows, 1):
-            break
-    return items
-
-
 async def _fetch_items(
     *,
     query: str,
@@ -337,23 +282,29 @@ async def _fetch_items(
     max_rows: int,
     email: str | None,
 ) -> list[dict]:
-    timeout = max(float(settings.crossref_timeout_seconds), 0.5)
+    cache_key = build_query_key(query=query, author=author, date_range=date_range, rows=max_rows)
+    cached = get_cached_items(cache_key)
+    if cached is not None:
+        structured_log(logger, "debug", "crossref.cache_hit")
+        return cached
     try:
-        return await asyncio.wait_for(
-            asyncio.to_thread(
-                _fetch_items_sync,
-                query=query,
-                author=author,
-                date_range=date_range,
-                max_rows=max_rows,
-                email=email,
-                min_interval_seconds=settings.crossref_min_interval_seconds,
-            ),
-            timeout=timeout,
+        items = await CrossrefClient().search_works(
+            query=query,
+            author=author,
+            date_range=date_range,
+            rows=max_rows,
+            email=email,
         )
     except Exception as exc:
         structured_log(logger, "warning", "crossref.fetch_failed", error=str(exc))
         return []
+    set_cached_items(
+        cache_key,
+        items,
+        ttl_seconds=max(float(settings.crossref_cache_ttl_seconds), 0.0),
+        max_entries=max(int(settings.crossref_cache_max_entries), 0),
+    )
+    return items
 
 
 async def discover_doi_for_publication(
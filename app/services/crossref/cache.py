@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from app.ttl_cache import TtlLruCache
+
+# Query, author, date range and row cap: everything that shapes a /works search response.
+CrossrefQueryKey = tuple[str, str | None, tuple[str, str] | None, int]
+
+_ENTRIES: TtlLruCache[CrossrefQueryKey, tuple[dict, ...]] = TtlLruCache()
+
+
+def build_query_key(
+    *,
+    query: str,
+    author: str | None,
+    date_range: tuple[str, str] | None,
+    rows: int,
+) -> CrossrefQueryKey:
+    normalized_query = " ".join(query.lower().split())
+    normalized_author = " ".join(author.lower().split()) if author else None
+    return normalized_query, normalized_author or None, date_range, int(rows)
+
+
+def get_cached_items(key: CrossrefQueryKey) -> list[dict] | None:
+    items = _ENTRIES.get(key)
+    return None if items is None else list(items)
+
+
+def set_cached_items(
+    key: CrossrefQueryKey,
+    items: list[dict],
+    *,
+    ttl_seconds: float,
+    max_entries: int,
+) -> None:
+    _ENTRIES.set(key, tuple(items), ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+
+def clear_crossref_cache() -> None:
+    _ENTRIES.clear()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from importlib.metadata import version as pkg_version
+
+import httpx
+
+from app.logging_utils import structured_log
+from app.services.rate_control import PROVIDER_CROSSREF, get_provider_controller
+from app.settings import settings
+
+_APP_VERSION = pkg_version("scholarr")
+_CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+_CROSSREF_MAX_ROWS_LIMIT = 1000
+_CROSSREF_SELECT_FIELDS = ("DOI", "title", "issued", "score", "author")
+_POOL_MAX_CONNECTIONS = 10
+_POOL_MAX_KEEPALIVE_CONNECTIONS = 5
+
+logger = logging.getLogger(__name__)
+
+_shared_http_client: httpx.AsyncClient | None = None
+_shared_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+class CrossrefClientError(Exception):
+    pass
+
+
+class CrossrefClient:
+    """Async client for the Crossref ``/works`` search endpoint.
+
+    Requests go through one pooled ``httpx.AsyncClient`` per event loop and are
+    paced by the shared adaptive Crossref rate controller.
+    """
+
+    def __init__(self, *, http_client: httpx.AsyncClient | None = None) -> None:
+        self._http_client = http_client
+
+    async def search_works(
+        self,
+        *,
+        query: str,
+        author: str | None,
+        date_range: tuple[str, str] | None,
+        rows: int,
+        email: str | None,
+        timeout_seconds: float | None = None,
+    ) -> list[dict]:
+        params = _search_params(query=query, author=author, date_range=date_range, rows=rows, email=email)
+        client = self._http_client or _get_shared_http_client()
+        timeout = _timeout_seconds(timeout_seconds)
+        try:
+            # The deadline covers controller pacing and backoff as well as the HTTP request.
+            async with asyncio.timeout(timeout), get_provider_controller(PROVIDER_CROSSREF).request() as call:
+                response = await client.get(
+                    _CROSSREF_WORKS_URL,
+                    params=params,
+                    headers={"User-Agent": _user_agent(email)},
+                    timeout=timeout,
+                )
+                call.observe_response(response)
+        except TimeoutError as exc:
+            raise CrossrefClientError(f"Crossref lookup timed out after {timeout:.1f}s") from exc
+        if response.status_code >= 400:
+            structured_log(
+                logger,
+                "warning",
+                "crossref.api_error",
+                status_code=response.status_code,
+                response_preview=response.text[:500],
+            )
+            raise CrossrefClientError(f"API Error {response.status_code}")
+        message = response.json().get("message") or {}
+        items = message.get("items") or []
+        return [item for item in items if isinstance(item, dict)][: int(params["rows"])]
+
+
+def _search_params(
+    *,
+    query: str,
+    author: str | None,
+    date_range: tuple[str, str] | None,
+    rows: int,
+    email: str | None,
+) -> dict[str, str | int]:
+    params: dict[str, str | int] = {
+        "query.bibliographic": query,
+        "select": ",".join(_CROSSREF_SELECT_FIELDS),
+        "rows": min(max(int(rows), 1), _CROSSREF_MAX_ROWS_LIMIT),
+    }
+    if author:
+        params["query.author"] = author
+    if date_range is not None:
+        from_date, until_date = date_range
+        params["filter"] = f"from-pub-date:{from_date},until-pub-date:{until_date}"
+    if email:
+        params["mailto"] = email
+    return params
+
+
+def _user_agent(email: str | None) -> str:
+    if email:
+        return f"{settings.app_name}/{_APP_VERSION} (https://scholarr.local; mailto:{email})"
+    return f"{settings.app_name}/{_APP_VERSION} (https://scholarr.local)"
+
+
+def _timeout_seconds(timeout_seconds: float | None) -> float:
+    if timeout_seconds is not None:
+        return max(float(timeout_seconds), 0.5)
+    return max(float(settings.crossref_timeout_seconds), 0.5)
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    # Pooled connections are bound to the loop that opened them, so a new loop gets a new client.
+    global _shared_http_client, _shared_http_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_http_client is None or _shared_http_client.is_closed or _shared_http_client_loop is not loop:
+        _shared_http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=_POOL_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _shared_http_client_loop = loop
+    return _shared_http_client
+
+
+async def close_shared_crossref_client() -> None:
+    global _shared_http_client, _shared_http_client_loop
+    client = _shared_http_client
+    _shared_http_client = None
+    _shared_http_client_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
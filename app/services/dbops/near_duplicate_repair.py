@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import DataRepairJob
@@ -13,9 +14,12 @@ from app.services.dbops.application import (
     REPAIR_STATUS_RUNNING,
 )
 from app.services.publications import dedup as dedup_service
+from app.services.publications import near_dup_index
 
 NEAR_DUP_JOB_NAME = "repair_publication_near_duplicates"
 NEAR_DUP_DEFAULT_MAX_CLUSTERS = 25
+NEAR_DUP_SCOPE_INCREMENTAL = "incremental"
+NEAR_DUP_SCOPE_FULL = "full"
 
 
 def _utcnow() -> datetime:
@@ -40,8 +44,23 @@ def _normalized_max_clusters(value: int) -> int:
     return max(1, min(int(value), 200))
 
 
+async def _last_applied_sweep_at(db_session: AsyncSession) -> datetime | None:
+    # Only applied sweeps advance the watermark, so a dry-run preview and its apply see the same scope.
+    # Clusters an apply leaves unmerged are re-dirtied by ``_requeue_unmerged_clusters`` so they stay in scope.
+    result = await db_session.execute(
+        select(func.max(DataRepairJob.finished_at)).where(
+            DataRepairJob.job_name == NEAR_DUP_JOB_NAME,
+            DataRepairJob.status == REPAIR_STATUS_COMPLETED,
+            DataRepairJob.dry_run.is_(False),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
 def _scope_payload(
     *,
+    scan_scope: str,
+    changed_since: datetime | None,
     similarity_threshold: float,
     min_shared_tokens: int,
     max_year_delta: int,
@@ -49,6 +68,8 @@ def _scope_payload(
     selected_cluster_keys: list[str],
 ) -> dict[str, Any]:
     return {
+        "scope": scan_scope,
+        "changed_since": changed_since.isoformat() if changed_since is not None else None,
         "similarity_threshold": float(similarity_threshold),
         "min_shared_tokens": int(min_shared_tokens),
         "max_year_delta": int(max_year_delta),
@@ -98,18 +119,20 @@ def _selected_clusters(
     return selected, missing
 
 
-async def _merge_selected_clusters(
+async def _requeue_unmerged_clusters(
     db_session: AsyncSession,
     *,
+    clusters: list[dedup_service.NearDuplicateCluster],
     selected_clusters: list[dedup_service.NearDuplicateCluster],
 ) -> int:
-    merged_publications = 0
-    for cluster in selected_clusters:
-        merged_publications += await dedup_service.merge_near_duplicate_cluster(
-            db_session,
-            cluster=cluster,
-        )
-    return merged_publications
+    selected_keys = {cluster.cluster_key for cluster in selected_clusters}
+    publication_ids = [
+        int(member.publication_id)
+        for cluster in clusters
+        if cluster.cluster_key not in selected_keys
+        for member in cluster.members
+    ]
+    return await near_dup_index.mark_for_reindex(db_session, publication_ids=publication_ids)
 
 
 def _clusters_payload(
@@ -183,10 +206,16 @@ async def run_publication_near_duplicate_repair(
     max_clusters: int = NEAR_DUP_DEFAULT_MAX_CLUSTERS,
     selected_cluster_keys: list[str] | None = None,
     requested_by: str | None = None,
+    scan_scope: str = NEAR_DUP_SCOPE_INCREMENTAL,
 ) -> dict[str, Any]:
     normalized_keys = _normalized_cluster_keys(selected_cluster_keys)
     bounded_clusters = _normalized_max_clusters(max_clusters)
+    changed_since = None
+    if scan_scope == NEAR_DUP_SCOPE_INCREMENTAL:
+        changed_since = await _last_applied_sweep_at(db_session)
     scope = _scope_payload(
+        scan_scope=NEAR_DUP_SCOPE_FULL if changed_since is None else NEAR_DUP_SCOPE_INCREMENTAL,
+        changed_since=changed_since,
         similarity_threshold=similarity_threshold,
         min_shared_tokens=min_shared_tokens,
         max_year_delta=max_year_delta,
@@ -200,13 +229,15 @@ async def run_publication_near_duplicate_repair(
             similarity_threshold=similarity_threshold,
             min_shared_tokens=min_shared_tokens,
             max_year_delta=max_year_delta,
+            changed_since=changed_since,
         )
         selected, missing = _selected_clusters(clusters=clusters, selected_cluster_keys=normalized_keys)
         merged_publications = 0
         if not dry_run:
             if not selected:
                 raise ValueError("No selected near-duplicate clusters matched current data.")
-            merged_publications = await _merge_selected_clusters(db_session, selected_clusters=selected)
+            merged_publications = await dedup_service.merge_near_duplicate_clusters(db_session, clusters=selected)
+            await _requeue_unmerged_clusters(db_session, clusters=clusters, selected_clusters=selected)
         preview = _clusters_payload(clusters=clusters, max_clusters=bounded_clusters)
         summary = _summary_payload(
             dry_run=dry_run,
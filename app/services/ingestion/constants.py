@@ -23,6 +23,7 @@ FAILURE_BUCKET_INGESTION = "ingestion_error"
 FAILURE_BUCKET_OTHER = "other_failure"
 
 RUN_LOCK_NAMESPACE = 8217
+MAINTENANCE_LOCK_NAMESPACE = 8218
 RESUMABLE_PARTIAL_REASONS = {
     "max_pages_reached",
     "pagination_cursor_stalled",
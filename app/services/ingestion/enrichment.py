@@ -4,6 +4,7 @@ import asyncio
 import logging
 import re
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,12 +19,20 @@ from app.db.models import (
 from app.logging_utils import structured_log
 from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.publication_identifiers import application as identifier_service
+from app.services.rate_control import PROVIDER_OPENALEX, get_provider_controller
 from app.services.runs.events import run_events
 from app.services.scholar.parser import PublicationCandidate
 from app.settings import settings
 
+if TYPE_CHECKING:
+    from app.services.openalex.client import OpenAlexClient
+
 logger = logging.getLogger(__name__)
 
+# Rate-limited chunk fetches are retried before the chunk is skipped; the OpenAlex rate
+# controller holds every retry until its 429 pause has passed.
+_OPENALEX_RATE_LIMIT_RETRIES = 3
+
 
 def _sanitize_titles(publications: list) -> list[str]:
     titles = []
@@ -126,25 +135,26 @@ class EnrichmentRunner:
         now: datetime,
         arxiv_lookup_allowed: bool,
     ) -> tuple[bool, bool]:
-        from app.services.openalex.matching import find_best_match
+        from app.services.openalex.matching import find_best_matches
+        from app.services.openalex.types import OpenAlexMatchTarget
 
+        matches = find_best_matches(
+            [OpenAlexMatchTarget(title=p.title_raw, year=p.year, authors=p.author_text or "") for p in batch],
+            openalex_works,
+        )
         for p in batch:
-            if await self.run_is_canceled(db_session, run_id=run_id):
-                structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
-                return False, arxiv_lookup_allowed
             p.openalex_last_attempt_at = now
-            arxiv_lookup_allowed = await self._discover_identifiers_for_enrichment(
-                db_session,
-                publication=p,
-                run_id=run_id,
-                allow_arxiv_lookup=arxiv_lookup_allowed,
-            )
-            match = find_best_match(
-                target_title=p.title_raw,
-                target_year=p.year,
-                target_authors=p.author_text or "",
-                candidates=openalex_works,
-            )
+        # Identifiers are discovered for the whole batch before OpenAlex fields are applied,
+        # so arXiv searches for the batch can share OR-combined requests.
+        should_continue, arxiv_lookup_allowed = await self._discover_identifiers_for_enrichment(
+            db_session,
+            publications=batch,
+            run_id=run_id,
+            allow_arxiv_lookup=arxiv_lookup_allowed,
+        )
+        if not should_continue:
+            return False, arxiv_lookup_allowed
+        for p, match in zip(batch, matches, strict=True):
             if match:
                 p.year = match.publication_year if match.publication_year is not None else p.year
                 p.citation_count = match.cited_by_count if match.cited_by_count is not None else p.citation_count
@@ -157,11 +167,16 @@ class EnrichmentRunner:
         db_session: AsyncSession,
         *,
         run_id: int,
+        publication_ids: set[int],
     ) -> None:
+        # Only identifiers of publications enriched in this pass are checked; the scheduler's
+        # maintenance sweep covers the whole table.
         await db_session.flush()
+        if not publication_ids:
+            return
         from app.services.publications.dedup import sweep_identifier_duplicates
 
-        merge_count = await sweep_identifier_duplicates(db_session)
+        merge_count = await sweep_identifier_duplicates(db_session, publication_ids=publication_ids)
         if merge_count:
             structured_log(
                 logger,
@@ -169,8 +184,38 @@ class EnrichmentRunner:
                 "ingestion.identifier_dedup_sweep",
                 merged_count=merge_count,
                 run_id=run_id,
+                scoped_publication_count=len(publication_ids),
             )
 
+    async def _fetch_chunk_works(
+        self,
+        client: OpenAlexClient,
+        *,
+        title_chunk: list[str],
+        run_id: int,
+    ) -> list:
+        from app.services.openalex.client import OpenAlexCircuitOpenError, OpenAlexRateLimitError
+
+        attempt = 0
+        while True:
+            try:
+                return await client.get_works_by_filter(
+                    {"title.search": "|".join(title_chunk)}, limit=len(title_chunk) * 3
+                )
+            except OpenAlexCircuitOpenError:
+                raise
+            except OpenAlexRateLimitError:
+                attempt += 1
+                structured_log(
+                    logger,
+                    "warning",
+                    "ingestion.openalex_rate_limited",
+                    run_id=run_id,
+                    attempt=attempt,
+                )
+                if attempt > _OPENALEX_RATE_LIMIT_RETRIES:
+                    raise
+
     async def enrich_pending_publications(
         self,
         db_session: AsyncSession,
@@ -187,6 +232,9 @@ class EnrichmentRunner:
         _, publications = await self._load_unenriched_publications(db_session, run_id=run_id)
         if not publications:
             return
+        if get_provider_controller(PROVIDER_OPENALEX).is_suspended():
+            structured_log(logger, "warning", "ingestion.openalex_budget_cooldown_active", run_id=run_id)
+            return
 
         resolved_key = openalex_api_key or settings.openalex_api_key
         client = OpenAlexClient(api_key=resolved_key, mailto=settings.crossref_api_mailto)
@@ -206,94 +254,128 @@ class EnrichmentRunner:
             if safe:
                 title_to_pubs.setdefault(safe, []).append(p)
 
+        chunk_batches: list[tuple[list[str], list[Publication]]] = []
         for title_chunk in title_chunks:
-            if await self.run_is_canceled(db_session, run_id=run_id):
-                structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
-                return
             batch = []
             for t in title_chunk:
                 batch.extend(title_to_pubs.get(t, []))
-            if not batch:
-                continue
-            try:
-                openalex_works = await client.get_works_by_filter(
-                    {"title.search": "|".join(title_chunk)}, limit=len(title_chunk) * 3
-                )
-            except OpenAlexBudgetExhaustedError:
-                structured_log(logger, "warning", "ingestion.openalex_budget_exhausted", run_id=run_id)
-                break
-            except OpenAlexRateLimitError:
-                structured_log(logger, "warning", "ingestion.openalex_rate_limited", run_id=run_id)
-                await asyncio.sleep(60)
-                continue
-            except Exception as e:
-                structured_log(logger, "warning", "ingestion.openalex_enrichment_failed", error=str(e), run_id=run_id)
-                for p in batch:
-                    p.openalex_last_attempt_at = now
-                continue
-            should_continue, arxiv_lookup_allowed = await self._enrich_batch(
-                db_session,
-                batch=batch,
-                run_id=run_id,
-                openalex_works=openalex_works,
-                now=now,
-                arxiv_lookup_allowed=arxiv_lookup_allowed,
-            )
-            if not should_continue:
-                return
+            if batch:
+                chunk_batches.append((title_chunk, batch))
 
-        await self._flush_and_sweep_duplicates(db_session, run_id=run_id)
+        # Fetches run up to ``prefetch`` chunks ahead of the chunk being matched; matching and
+        # identifier discovery share ``db_session`` and therefore still run strictly in chunk order.
+        prefetch = max(settings.openalex_enrichment_prefetch_chunks, 0)
+        fetch_tasks: dict[int, asyncio.Task[list]] = {}
+        next_fetch_index = 0
+        enriched_publication_ids: set[int] = set()
+
+        try:
+            for index, (_, batch) in enumerate(chunk_batches):
+                if await self.run_is_canceled(db_session, run_id=run_id):
+                    structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
+                    return
+                while next_fetch_index < len(chunk_batches) and next_fetch_index <= index + prefetch:
+                    fetch_tasks[next_fetch_index] = asyncio.create_task(
+                        self._fetch_chunk_works(
+                            client,
+                            title_chunk=chunk_batches[next_fetch_index][0],
+                            run_id=run_id,
+                        )
+                    )
+                    next_fetch_index += 1
+                try:
+                    openalex_works = await fetch_tasks.pop(index)
+                except OpenAlexBudgetExhaustedError:
+                    structured_log(logger, "warning", "ingestion.openalex_budget_exhausted", run_id=run_id)
+                    break
+                except OpenAlexRateLimitError:
+                    structured_log(logger, "warning", "ingestion.openalex_chunk_skipped", run_id=run_id)
+                    continue
+                except Exception as e:
+                    structured_log(
+                        logger, "warning", "ingestion.openalex_enrichment_failed", error=str(e), run_id=run_id
+                    )
+                    for p in batch:
+                        p.openalex_last_attempt_at = now
+                    continue
+                should_continue, arxiv_lookup_allowed = await self._enrich_batch(
+                    db_session,
+                    batch=batch,
+                    run_id=run_id,
+                    openalex_works=openalex_works,
+                    now=now,
+                    arxiv_lookup_allowed=arxiv_lookup_allowed,
+                )
+                if not should_continue:
+                    return
+                enriched_publication_ids.update(int(p.id) for p in batch)
+        finally:
+            for task in fetch_tasks.values():
+                task.cancel()
+            await asyncio.gather(*fetch_tasks.values(), return_exceptions=True)
+
+        await self._flush_and_sweep_duplicates(
+            db_session,
+            run_id=run_id,
+            publication_ids=enriched_publication_ids,
+        )
 
     async def _discover_identifiers_for_enrichment(
         self,
         db_session: AsyncSession,
         *,
-        publication: Publication,
+        publications: list[Publication],
         run_id: int,
         allow_arxiv_lookup: bool,
-    ) -> bool:
-        if not allow_arxiv_lookup:
-            await identifier_service.sync_identifiers_for_publication_fields(
-                db_session,
-                publication=publication,
-            )
-            await self._publish_identifier_update_event(
-                db_session,
-                run_id=run_id,
-                publication_id=int(publication.id),
-            )
-            return False
-        try:
-            await identifier_service.discover_and_sync_identifiers_for_publication(
+    ) -> tuple[bool, bool]:
+        """Discover identifiers for ``publications``; returns ``(should_continue, allow_arxiv_lookup)``.
+
+        Cancellation is checked before each publication and between batched arXiv requests.
+        """
+
+        async def _canceled() -> bool:
+            return await self.run_is_canceled(db_session, run_id=run_id)
+
+        arxiv_items = []
+        for publication in publications:
+            if await _canceled():
+                structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
+                return False, allow_arxiv_lookup
+            if not allow_arxiv_lookup:
+                await identifier_service.sync_identifiers_for_publication_fields(
+                    db_session,
+                    publication=publication,
+                )
+                continue
+            item = await identifier_service.prepare_identifier_discovery(
                 db_session,
                 publication=publication,
                 scholar_label=publication.author_text or "",
             )
-            await self._publish_identifier_update_event(
-                db_session,
-                run_id=run_id,
-                publication_id=int(publication.id),
-            )
-            return True
+            if item is not None:
+                arxiv_items.append(item)
+        try:
+            await identifier_service.discover_arxiv_identifiers(db_session, items=arxiv_items, should_stop=_canceled)
         except ArxivRateLimitError:
             structured_log(
                 logger,
                 "warning",
                 "ingestion.arxiv_rate_limited",
                 run_id=run_id,
-                publication_id=int(publication.id),
+                publication_count=len(arxiv_items),
                 detail="arXiv temporarily disabled for remaining enrichment pass",
             )
-            await identifier_service.sync_identifiers_for_publication_fields(
-                db_session,
-                publication=publication,
-            )
+            allow_arxiv_lookup = False
+        if arxiv_items and await _canceled():
+            structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
+            return False, allow_arxiv_lookup
+        for publication in publications:
             await self._publish_identifier_update_event(
                 db_session,
                 run_id=run_id,
                 publication_id=int(publication.id),
             )
-            return False
+        return True, allow_arxiv_lookup
 
     async def _publish_identifier_update_event(
         self,
@@ -332,7 +414,8 @@ class EnrichmentRunner:
             return publications
 
         from app.services.openalex.client import OpenAlexClient
-        from app.services.openalex.matching import find_best_match
+        from app.services.openalex.matching import find_best_matches
+        from app.services.openalex.types import OpenAlexMatchTarget
 
         client = OpenAlexClient(api_key=settings.openalex_api_key, mailto=settings.crossref_api_mailto)
 
@@ -379,13 +462,18 @@ class EnrichmentRunner:
                 )
                 openalex_works = []
 
-            for p in batch:
-                match = find_best_match(
-                    target_title=p.title,
-                    target_year=p.year,
-                    target_authors=p.authors_text or (scholar.display_name or scholar.scholar_id),
-                    candidates=openalex_works,
-                )
+            matches = find_best_matches(
+                [
+                    OpenAlexMatchTarget(
+                        title=p.title,
+                        year=p.year,
+                        authors=p.authors_text or (scholar.display_name or scholar.scholar_id),
+                    )
+                    for p in batch
+                ],
+                openalex_works,
+            )
+            for p, match in zip(batch, matches, strict=True):
                 if match:
                     new_p = PublicationCandidate(
                         title=p.title,
@@ -108,7 +108,10 @@ def update_existing_publication(
     if not publication.title_raw:
         publication.title_raw = candidate.title
         publication.title_normalized = normalize_title(candidate.title)
+        publication.near_dup_indexed_at = None
     if candidate.year is not None:
+        if publication.year != candidate.year:
+            publication.near_dup_indexed_at = None
         publication.year = candidate.year
     if candidate.citation_count is not None:
         publication.citation_count = int(candidate.citation_count)
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from app.db.background_session import background_session
 from app.db.models import (
@@ -15,12 +18,14 @@ from app.db.models import (
     User,
     UserSetting,
 )
+from app.db.session import get_session_factory
 from app.logging_utils import structured_log
 from app.services.ingestion.application import (
     RunAlreadyInProgressError,
     RunBlockedBySafetyPolicyError,
     ScholarIngestionService,
 )
+from app.services.ingestion.constants import MAINTENANCE_LOCK_NAMESPACE
 from app.services.ingestion.queue_runner import QueueJobRunner, effective_request_delay_seconds
 from app.services.scholar.source import LiveScholarSource
 from app.services.settings import application as user_settings_service
@@ -28,6 +33,31 @@ from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Library-wide maintenance jobs; each name doubles as its advisory-lock key and log-event prefix.
+_JOB_ARXIV_CACHE_PRUNE = "arxiv_cache_prune"
+_JOB_IDENTIFIER_DEDUP = "identifier_dedup"
+_JOB_PUBLICATION_COUNTERS_RECONCILE = "publication_counters_reconcile"
+_MAINTENANCE_LOCK_KEYS = {
+    _JOB_ARXIV_CACHE_PRUNE: 1,
+    _JOB_IDENTIFIER_DEDUP: 2,
+    _JOB_PUBLICATION_COUNTERS_RECONCILE: 3,
+}
+
+
+@asynccontextmanager
+async def _maintenance_lock(job: str) -> AsyncIterator[bool]:
+    """Try to take ``job``'s advisory lock on a dedicated connection and hold it until exit.
+
+    Only the replica that wins the lock runs the job; the others skip until their next interval.
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as lock_session, lock_session.begin():
+        result = await lock_session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:namespace, :job_key)"),
+            {"namespace": MAINTENANCE_LOCK_NAMESPACE, "job_key": _MAINTENANCE_LOCK_KEYS[job]},
+        )
+        yield bool(result.scalar_one())
+
 
 @dataclass(frozen=True)
 class _AutoRunCandidate:
@@ -69,6 +99,7 @@ class SchedulerService:
         self._continuation_max_attempts = max(1, int(continuation_max_attempts))
         self._queue_batch_size = max(1, int(queue_batch_size))
         self._task: asyncio.Task[None] | None = None
+        self._next_maintenance_at: dict[str, float] = {}
         self._source = LiveScholarSource()
         self._queue_runner = QueueJobRunner(
             tick_seconds=self._tick_seconds,
@@ -137,6 +168,9 @@ class SchedulerService:
             await self._queue_runner.drain_continuation_queue()
 
         await self._drain_pdf_queue()
+        await self._prune_arxiv_cache()
+        await self._sweep_identifier_duplicates()
+        await self._reconcile_publication_counters()
 
         candidates = await self._load_candidates()
         if not candidates:
@@ -286,9 +320,9 @@ class SchedulerService:
 
     async def _drain_pdf_queue(self) -> None:
         from app.services.publications.pdf_queue import drain_ready_jobs
-        from app.services.publications.pdf_queue_resolution import is_budget_cooldown_active
+        from app.services.rate_control import PROVIDER_OPENALEX, get_provider_controller
 
-        if is_budget_cooldown_active():
+        if get_provider_controller(PROVIDER_OPENALEX).is_suspended():
             return
 
         async with background_session() as session:
@@ -311,3 +345,77 @@ class SchedulerService:
                     "exception",
                     "scheduler.pdf_queue_drain_failed",
                 )
+
+    def _maintenance_due(self, job: str, *, interval_seconds: float) -> bool:
+        bounded_interval = max(float(interval_seconds), 0.0)
+        if bounded_interval <= 0:
+            return False
+        now = time.monotonic()
+        # The first run waits one full interval, so restarts and new replicas do not all fire at once.
+        next_run_at = self._next_maintenance_at.setdefault(job, now + bounded_interval)
+        if now < next_run_at:
+            return False
+        self._next_maintenance_at[job] = now + bounded_interval
+        return True
+
+    async def _run_maintenance_job(
+        self,
+        job: str,
+        *,
+        interval_seconds: float,
+        run: Callable[[], Awaitable[int]],
+    ) -> int:
+        if not self._maintenance_due(job, interval_seconds=interval_seconds):
+            return 0
+        try:
+            async with _maintenance_lock(job) as acquired:
+                if not acquired:
+                    structured_log(logger, "debug", "scheduler.maintenance_skipped", job=job, reason="locked")
+                    return 0
+                return await run()
+        except Exception:
+            structured_log(logger, "exception", f"scheduler.{job}_failed")
+            return 0
+
+    async def _prune_arxiv_cache(self) -> None:
+        from app.services.arxiv.cache import prune_cache_entries
+
+        deleted = await self._run_maintenance_job(
+            _JOB_ARXIV_CACHE_PRUNE,
+            interval_seconds=settings.arxiv_cache_prune_interval_seconds,
+            run=lambda: prune_cache_entries(max_entries=settings.arxiv_cache_max_entries),
+        )
+        if deleted > 0:
+            structured_log(logger, "info", "scheduler.arxiv_cache_pruned", deleted_count=deleted)
+
+    async def _sweep_identifier_duplicates(self) -> None:
+        from app.services.publications.dedup import sweep_identifier_duplicates
+
+        async def _sweep() -> int:
+            async with background_session() as session:
+                merged = await sweep_identifier_duplicates(session)
+                await session.commit()
+            return merged
+
+        merged = await self._run_maintenance_job(
+            _JOB_IDENTIFIER_DEDUP,
+            interval_seconds=settings.scheduler_identifier_dedup_interval_seconds,
+            run=_sweep,
+        )
+        if merged > 0:
+            structured_log(logger, "info", "scheduler.identifier_dedup_swept", merged_count=merged)
+
+    async def _reconcile_publication_counters(self) -> None:
+        from app.services.publications.counters import reconcile_all_publication_counters
+
+        async def _reconcile() -> int:
+            async with background_session() as session:
+                return await reconcile_all_publication_counters(session)
+
+        drifted = await self._run_maintenance_job(
+            _JOB_PUBLICATION_COUNTERS_RECONCILE,
+            interval_seconds=settings.scheduler_publication_counters_reconcile_interval_seconds,
+            run=_reconcile,
+        )
+        if drifted > 0:
+            structured_log(logger, "warning", "scheduler.publication_counters_drift_corrected", drifted_count=drifted)
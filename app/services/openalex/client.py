@@ -10,10 +10,13 @@ from tenacity import (
 
 from app.logging_utils import structured_log
 from app.services.openalex.types import OpenAlexWork
+from app.services.rate_control import PROVIDER_OPENALEX, ProviderCircuitOpenError, get_provider_controller
 
 logger = logging.getLogger(__name__)
 
 OPENALEX_BASE_URL = "https://api.openalex.org"
+# The daily budget resets at midnight UTC; requests stay suspended for this long before a probe.
+OPENALEX_BUDGET_COOLDOWN_SECONDS = 15 * 60
 
 
 class OpenAlexClientError(Exception):
@@ -26,12 +29,31 @@ class OpenAlexRateLimitError(OpenAlexClientError):
     pass
 
 
+class OpenAlexCircuitOpenError(OpenAlexRateLimitError):
+    """The OpenAlex rate controller is shedding requests; no request was sent."""
+
+    pass
+
+
 class OpenAlexBudgetExhaustedError(OpenAlexClientError):
     """Daily API budget exhausted — retrying is futile until midnight UTC."""
 
     pass
 
 
+def _raise_for_rate_limit(response: httpx.Response, *, message: str) -> None:
+    if response.status_code != 429:
+        return
+    remaining = response.headers.get("X-RateLimit-Remaining-USD", "")
+    if remaining == "0" or remaining.startswith("-"):
+        get_provider_controller(PROVIDER_OPENALEX).suspend(
+            OPENALEX_BUDGET_COOLDOWN_SECONDS,
+            reason="budget_exhausted",
+        )
+        raise OpenAlexBudgetExhaustedError("Daily API budget exhausted; retrying won't help until midnight UTC")
+    raise OpenAlexRateLimitError(message)
+
+
 class OpenAlexClient:
     def __init__(
         self,
@@ -52,6 +74,18 @@ class OpenAlexClient:
             params["api_key"] = self.api_key
         return params
 
+    async def _get(self, url: str, *, params: dict[str, str], headers: dict[str, str]) -> httpx.Response:
+        try:
+            async with (
+                get_provider_controller(PROVIDER_OPENALEX).request() as call,
+                httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client,
+            ):
+                response = await client.get(url, params=params)
+                call.observe_response(response)
+        except ProviderCircuitOpenError as exc:
+            raise OpenAlexCircuitOpenError(str(exc)) from exc
+        return response
+
     @retry(
         retry=retry_if_exception_type((httpx.NetworkError, httpx.TimeoutException)),
         stop=stop_after_attempt(3),
@@ -72,16 +106,11 @@ class OpenAlexClient:
         else:
             headers["User-Agent"] = "scholar-scraper/1.0"
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client:
-            response = await client.get(url, params=self._base_params)
+        response = await self._get(url, params=self._base_params, headers=headers)
 
         if response.status_code == 404:
             return None
-        if response.status_code == 429:
-            remaining = response.headers.get("X-RateLimit-Remaining-USD", "")
-            if remaining == "0" or remaining.startswith("-"):
-                raise OpenAlexBudgetExhaustedError("Daily API budget exhausted; retrying won't help until midnight UTC")
-            raise OpenAlexRateLimitError("Rate limit exceeded fetching OpenAlex work by DOI")
+        _raise_for_rate_limit(response, message="Rate limit exceeded fetching OpenAlex work by DOI")
         if response.status_code >= 400:
             structured_log(
                 logger,
@@ -128,14 +157,9 @@ class OpenAlexClient:
         else:
             headers["User-Agent"] = "scholar-scraper/1.0"
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client:
-            response = await client.get(url, params=params)
+        response = await self._get(url, params=params, headers=headers)
 
-        if response.status_code == 429:
-            remaining = response.headers.get("X-RateLimit-Remaining-USD", "")
-            if remaining == "0" or remaining.startswith("-"):
-                raise OpenAlexBudgetExhaustedError("Daily API budget exhausted; retrying won't help until midnight UTC")
-            raise OpenAlexRateLimitError("Rate limit exceeded fetching OpenAlex works list")
+        _raise_for_rate_limit(response, message="Rate limit exceeded fetching OpenAlex works list")
         if response.status_code >= 400:
             structured_log(
                 logger,
@@ -1,9 +1,11 @@
 import logging
 import re
+from collections.abc import Sequence
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
-from app.services.openalex.types import OpenAlexWork
+from app.services.openalex.types import OpenAlexMatchTarget, OpenAlexWork
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,14 @@ def find_best_match(
     if len(top_scored_candidates) == 1:
         return top_scored_candidates[0][1]
 
+    return _break_tie(target_year, target_authors, top_scored_candidates)
+
+
+def _break_tie(
+    target_year: int | None,
+    target_authors: str | None,
+    top_scored_candidates: list[tuple[float, OpenAlexWork]],
+) -> OpenAlexWork:
     # We have a tie or near-tie. Use year and author overlap to break the tie.
     # Score candidates: +1 for year match (within 1 year), +1 for author overlap
     tiebreaker_scores: list[tuple[int, float, OpenAlexWork]] = []
@@ -108,3 +118,54 @@ def find_best_match(
 
     tiebreaker_scores.sort(key=lambda x: (x[0], x[1]), reverse=True)
     return tiebreaker_scores[0][2]
+
+
+def find_best_matches(
+    targets: Sequence[OpenAlexMatchTarget],
+    candidates: list[OpenAlexWork],
+) -> list[OpenAlexWork | None]:
+    """
+    Batched equivalent of ``find_best_match``: returns one match (or None) per target, in order.
+
+    All strings are cleaned once and the full title similarity matrix is computed with
+    ``rapidfuzz.process.cdist``; thresholding and margin selection run over the whole matrix,
+    so only targets with several near-tied candidates fall back to the Python tiebreaker.
+    """
+    matches: list[OpenAlexWork | None] = [None] * len(targets)
+    titled_candidates = [cand for cand in candidates if cand.title]
+    if not targets or not titled_candidates:
+        return matches
+
+    clean_targets = [_clean_string(target.title) for target in targets]
+    clean_candidates = [_clean_string(cand.title) for cand in titled_candidates]
+
+    # float64 keeps scores bit-identical to fuzz.ratio for the threshold and margin comparisons.
+    scores = process.cdist(
+        clean_targets,
+        clean_candidates,
+        scorer=fuzz.ratio,
+        processor=None,
+        score_cutoff=TITLE_MATCH_THRESHOLD,
+        dtype=np.float64,
+        workers=-1,
+    )
+    eligible = scores >= TITLE_MATCH_THRESHOLD
+    eligible[[not clean for clean in clean_targets], :] = False
+
+    best_scores = np.where(eligible, scores, -np.inf).max(axis=1)
+    within_margin = eligible & ((best_scores[:, np.newaxis] - scores) <= TIEBREAKER_MARGIN)
+    margin_counts = within_margin.sum(axis=1)
+
+    for row in np.flatnonzero(margin_counts == 1):
+        matches[row] = titled_candidates[int(np.argmax(within_margin[row]))]
+
+    for row in np.flatnonzero(margin_counts > 1):
+        target = targets[int(row)]
+        # Column order preserves candidate order, which is how find_best_match resolves exact ties.
+        top_scored_candidates = [
+            (float(scores[row, col]), titled_candidates[col]) for col in np.flatnonzero(within_margin[row])
+        ]
+        top_scored_candidates.sort(key=lambda x: x[0], reverse=True)
+        matches[row] = _break_tie(target.year, target.authors, top_scored_candidates)
+
+    return matches
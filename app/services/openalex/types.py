@@ -69,3 +69,10 @@ class OpenAlexWork:
             authors=authors,
             raw_data=dict(data),
         )
+
+
+@dataclass(frozen=True)
+class OpenAlexMatchTarget:
+    title: str | None
+    year: int | None
+    authors: str | None
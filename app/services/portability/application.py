@@ -4,18 +4,22 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Publication
+from app.services.portability.bulk_import import import_publications_in_bulk
 from app.services.portability.constants import (
     EXPORT_SCHEMA_VERSION,
     MAX_IMPORT_PUBLICATIONS,
     MAX_IMPORT_SCHOLARS,
 )
-from app.services.portability.exporting import export_user_data
+from app.services.portability.exporting import (
+    export_user_data,
+    gzip_chunks,
+    stream_user_data_json,
+    stream_user_data_ndjson,
+)
 from app.services.portability.normalize import _validate_import_sizes
 from app.services.portability.publication_import import (
     _build_imported_publication_input,
     _initialize_import_counters,
-    _upsert_imported_publication,
 )
 from app.services.portability.scholar_import import _upsert_imported_scholars
 from app.services.portability.types import ImportedPublicationInput, ImportExportError
@@ -34,9 +38,8 @@ async def import_user_data(
         user_id=user_id,
         scholars=scholars,
     )
-    cluster_cache: dict[str, Publication | None] = {}
-    fingerprint_cache: dict[str, Publication | None] = {}
     _initialize_import_counters(counters)
+    payloads: list[ImportedPublicationInput] = []
     for item in publications:
         parsed_item = _build_imported_publication_input(
             item=item,
@@ -45,13 +48,8 @@ async def import_user_data(
         if parsed_item is None:
             counters["skipped_records"] += 1
             continue
-        await _upsert_imported_publication(
-            db_session,
-            payload=parsed_item,
-            cluster_cache=cluster_cache,
-            fingerprint_cache=fingerprint_cache,
-            counters=counters,
-        )
+        payloads.append(parsed_item)
+    await import_publications_in_bulk(db_session, payloads=payloads, counters=counters)
     await db_session.commit()
     return counters
 
@@ -63,5 +61,8 @@ __all__ = [
     "ImportExportError",
     "ImportedPublicationInput",
     "export_user_data",
+    "gzip_chunks",
     "import_user_data",
+    "stream_user_data_json",
+    "stream_user_data_ndjson",
 ]
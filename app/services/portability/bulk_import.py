@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.logging_utils import structured_log
+from app.services.ingestion.fingerprints import normalize_title
+from app.services.portability.publication_import import ImportResolver
+from app.services.portability.types import ImportedPublicationInput, StagedPublication
+
+logger = logging.getLogger(__name__)
+
+_KEY_COLUMNS = ("scholar_profile_id", "cluster_id", "fingerprint_sha256", "title_normalized")
+_PUBLICATION_WRITE_COLUMNS = (
+    "slot",
+    "publication_id",
+    "is_new",
+    "is_dirty",
+    "reindex",
+    "cluster_id",
+    "fingerprint_sha256",
+    "title_raw",
+    "title_normalized",
+    "year",
+    "citation_count",
+    "author_text",
+    "venue_text",
+    "pub_url",
+    "pdf_url",
+)
+_LINK_WRITE_COLUMNS = ("scholar_profile_id", "slot", "is_read")
+
+_CREATE_KEYS_SQL = text(
+    """
+    CREATE TEMP TABLE import_publication_keys (
+        scholar_profile_id INTEGER NOT NULL,
+        cluster_id TEXT,
+        fingerprint_sha256 TEXT NOT NULL,
+        title_normalized TEXT NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+_ANALYZE_KEYS_SQL = text("ANALYZE import_publication_keys")
+
+# Every publication a row could resolve to under the import precedence: same cluster id,
+# same fingerprint, or linked to the row's scholar under the same normalized title.
+_CREATE_CANDIDATES_SQL = text(
+    """
+    CREATE TEMP TABLE import_publication_candidates ON COMMIT DROP AS
+    SELECT p.id
+    FROM import_publication_keys k
+    JOIN publications p ON p.cluster_id = k.cluster_id
+    UNION
+    SELECT p.id
+    FROM import_publication_keys k
+    JOIN publications p ON p.fingerprint_sha256 = k.fingerprint_sha256
+    UNION
+    SELECT sp.publication_id
+    FROM import_publication_keys k
+    JOIN scholar_publications sp ON sp.scholar_profile_id = k.scholar_profile_id
+    JOIN publications p ON p.id = sp.publication_id AND p.title_normalized = k.title_normalized
+    """
+)
+
+_LOAD_CANDIDATES_SQL = text(
+    """
+    SELECT
+        p.id, p.cluster_id, p.fingerprint_sha256, p.title_raw, p.title_normalized, p.year,
+        p.citation_count, p.author_text, p.venue_text, p.pub_url, p.pdf_url
+    FROM publications p
+    JOIN import_publication_candidates c ON c.id = p.id
+    """
+)
+
+_LOAD_LINKS_SQL = text(
+    """
+    SELECT sp.scholar_profile_id, sp.publication_id, sp.is_read
+    FROM scholar_publications sp
+    JOIN import_publication_candidates c ON c.id = sp.publication_id
+    WHERE sp.scholar_profile_id IN (SELECT DISTINCT scholar_profile_id FROM import_publication_keys)
+    """
+)
+
+_CREATE_PUBLICATION_WRITES_SQL = text(
+    """
+    CREATE TEMP TABLE import_publication_writes (
+        slot INTEGER PRIMARY KEY,
+        publication_id INTEGER,
+        is_new BOOLEAN NOT NULL,
+        is_dirty BOOLEAN NOT NULL,
+        reindex BOOLEAN NOT NULL,
+        cluster_id TEXT,
+        fingerprint_sha256 TEXT NOT NULL,
+        title_raw TEXT NOT NULL,
+        title_normalized TEXT NOT NULL,
+        year INTEGER,
+        citation_count INTEGER NOT NULL,
+        author_text TEXT,
+        venue_text TEXT,
+        pub_url TEXT,
+        pdf_url TEXT
+    ) ON COMMIT DROP
+    """
+)
+
+_CREATE_LINK_WRITES_SQL = text(
+    """
+    CREATE TEMP TABLE import_link_writes (
+        scholar_profile_id INTEGER NOT NULL,
+        slot INTEGER NOT NULL,
+        is_read BOOLEAN NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+_UPDATE_PUBLICATIONS_SQL = text(
+    """
+    UPDATE publications p
+    SET
+        cluster_id = w.cluster_id,
+        title_raw = w.title_raw,
+        title_normalized = w.title_normalized,
+        year = w.year,
+        citation_count = w.citation_count,
+        author_text = w.author_text,
+        venue_text = w.venue_text,
+        pub_url = w.pub_url,
+        pdf_url = w.pdf_url,
+        near_dup_indexed_at = CASE WHEN w.reindex THEN NULL ELSE p.near_dup_indexed_at END
+    FROM import_publication_writes w
+    WHERE p.id = w.publication_id AND w.is_dirty
+    """
+)
+
+# New slots are negative creation indexes, so slot DESC inserts in creation order.
+_INSERT_PUBLICATIONS_SQL = text(
+    """
+    WITH inserted AS (
+        INSERT INTO publications (
+            cluster_id, fingerprint_sha256, title_raw, title_normalized, year,
+            citation_count, author_text, venue_text, pub_url, pdf_url
+        )
+        SELECT
+            cluster_id, fingerprint_sha256, title_raw, title_normalized, year,
+            citation_count, author_text, venue_text, pub_url, pdf_url
+        FROM import_publication_writes
+        WHERE is_new
+        ORDER BY slot DESC
+        RETURNING id, fingerprint_sha256
+    )
+    UPDATE import_publication_writes w
+    SET publication_id = inserted.id
+    FROM inserted
+    WHERE w.is_new AND w.fingerprint_sha256 = inserted.fingerprint_sha256
+    """
+)
+
+_UPSERT_LINKS_SQL = text(
+    """
+    INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+    SELECT l.scholar_profile_id, w.publication_id, l.is_read
+    FROM import_link_writes l
+    JOIN import_publication_writes w ON w.slot = l.slot
+    ORDER BY l.scholar_profile_id, w.publication_id
+    ON CONFLICT (scholar_profile_id, publication_id) DO UPDATE SET is_read = EXCLUDED.is_read
+    """
+)
+
+_DROP_TEMP_TABLES_SQL = text(
+    "DROP TABLE import_link_writes, import_publication_writes, import_publication_candidates, import_publication_keys"
+)
+
+
+async def _copy_records(
+    db_session: AsyncSession,
+    *,
+    table_name: str,
+    columns: Sequence[str],
+    records: list[tuple[Any, ...]],
+) -> None:
+    if not records:
+        return
+    # COPY runs on the session's own connection, inside the import transaction.
+    connection = await db_session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+    await driver_connection.copy_records_to_table(table_name, records=records, columns=list(columns))
+
+
+async def _load_resolver(db_session: AsyncSession, *, payloads: list[ImportedPublicationInput]) -> ImportResolver:
+    await db_session.execute(_CREATE_KEYS_SQL)
+    await _copy_records(
+        db_session,
+        table_name="import_publication_keys",
+        columns=_KEY_COLUMNS,
+        records=[
+            (int(payload.profile.id), payload.cluster_id, payload.fingerprint, normalize_title(payload.title))
+            for payload in payloads
+        ],
+    )
+    await db_session.execute(_ANALYZE_KEYS_SQL)
+    await db_session.execute(_CREATE_CANDIDATES_SQL)
+    candidate_rows = (await db_session.execute(_LOAD_CANDIDATES_SQL)).all()
+    link_rows = (await db_session.execute(_LOAD_LINKS_SQL)).all()
+    candidates = [
+        StagedPublication(
+            slot=int(row[0]),
+            publication_id=int(row[0]),
+            cluster_id=row[1],
+            fingerprint_sha256=str(row[2]),
+            title_raw=str(row[3]),
+            title_normalized=str(row[4]),
+            year=row[5],
+            citation_count=int(row[6] or 0),
+            author_text=row[7],
+            venue_text=row[8],
+            pub_url=row[9],
+            pdf_url=row[10],
+        )
+        for row in candidate_rows
+    ]
+    links = {
+        (int(scholar_profile_id), int(publication_id)): bool(is_read)
+        for scholar_profile_id, publication_id, is_read in link_rows
+    }
+    return ImportResolver(candidates=candidates, links=links)
+
+
+def _publication_write_records(resolver: ImportResolver) -> list[tuple[Any, ...]]:
+    linked_slots = {slot for _, slot in resolver.link_writes}
+    return [
+        (
+            item.slot,
+            item.publication_id,
+            item.publication_id is None,
+            item.dirty and item.publication_id is not None,
+            item.reindex,
+            item.cluster_id,
+            item.fingerprint_sha256,
+            item.title_raw,
+            item.title_normalized,
+            item.year,
+            item.citation_count,
+            item.author_text,
+            item.venue_text,
+            item.pub_url,
+            item.pdf_url,
+        )
+        for item in resolver.publications.values()
+        if item.publication_id is None or item.dirty or item.slot in linked_slots
+    ]
+
+
+async def _apply_writes(db_session: AsyncSession, *, resolver: ImportResolver) -> None:
+    await db_session.execute(_CREATE_PUBLICATION_WRITES_SQL)
+    await db_session.execute(_CREATE_LINK_WRITES_SQL)
+    await _copy_records(
+        db_session,
+        table_name="import_publication_writes",
+        columns=_PUBLICATION_WRITE_COLUMNS,
+        records=_publication_write_records(resolver),
+    )
+    await _copy_records(
+        db_session,
+        table_name="import_link_writes",
+        columns=_LINK_WRITE_COLUMNS,
+        records=[
+            (scholar_profile_id, slot, is_read)
+            for (scholar_profile_id, slot), is_read in sorted(resolver.link_writes.items())
+        ],
+    )
+    await db_session.execute(_UPDATE_PUBLICATIONS_SQL)
+    await db_session.execute(_INSERT_PUBLICATIONS_SQL)
+    await db_session.execute(_UPSERT_LINKS_SQL)
+
+
+async def import_publications_in_bulk(
+    db_session: AsyncSession,
+    *,
+    payloads: list[ImportedPublicationInput],
+    counters: dict[str, int],
+) -> None:
+    """Import publication rows with a fixed number of statements.
+
+    Row keys are COPY'd into a temp table and joined against publications and links to load
+    every candidate match; the per-row precedence is replayed in memory over those rows, and
+    the resulting inserts, updates and link upserts are COPY'd back and applied set-based.
+    Counters match the row-by-row import.
+    """
+    if not payloads:
+        return
+    await db_session.flush()
+    resolver = await _load_resolver(db_session, payloads=payloads)
+    for payload in payloads:
+        resolver.apply(payload, counters=counters)
+    await _apply_writes(db_session, resolver=resolver)
+    await db_session.execute(_DROP_TEMP_TABLES_SQL)
+    structured_log(
+        logger,
+        "info",
+        "portability.bulk_import",
+        row_count=len(payloads),
+        publications_created=counters["publications_created"],
+        publications_updated=counters["publications_updated"],
+        links_written=len(resolver.link_writes),
+    )
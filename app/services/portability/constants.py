@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 
 EXPORT_SCHEMA_VERSION = 1
+EXPORT_STREAM_BATCH_SIZE = 500
 MAX_IMPORT_SCHOLARS = 10_000
 MAX_IMPORT_PUBLICATIONS = 100_000
 WORD_RE = re.compile(r"[a-z0-9]+")
@@ -1,25 +1,29 @@
 from __future__ import annotations
 
+import json
+import zlib
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Publication, ScholarProfile, ScholarPublication
-from app.services.portability.constants import EXPORT_SCHEMA_VERSION
+from app.services.portability.constants import EXPORT_SCHEMA_VERSION, EXPORT_STREAM_BATCH_SIZE
 
 
 def _exported_at_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat()
 
 
-def _serialize_export_scholar(profile: ScholarProfile) -> dict[str, Any]:
+def _serialize_export_scholar(row: Any) -> dict[str, Any]:
+    scholar_id, display_name, is_enabled, profile_image_override_url = row
     return {
-        "scholar_id": profile.scholar_id,
-        "display_name": profile.display_name,
-        "is_enabled": bool(profile.is_enabled),
-        "profile_image_override_url": profile.profile_image_override_url,
+        "scholar_id": scholar_id,
+        "display_name": display_name,
+        "is_enabled": bool(is_enabled),
+        "profile_image_override_url": profile_image_override_url,
     }
 
 
@@ -52,18 +56,20 @@ def _serialize_export_publication(row: Any) -> dict[str, Any]:
     }
 
 
-async def export_user_data(
-    db_session: AsyncSession,
-    *,
-    user_id: int,
-    scholar_profile_ids: list[int] | None = None,
-) -> dict[str, Any]:
-    scholar_query = select(ScholarProfile).where(ScholarProfile.user_id == user_id)
+def _export_scholar_query(*, user_id: int, scholar_profile_ids: list[int] | None) -> Select:
+    query = select(
+        ScholarProfile.scholar_id,
+        ScholarProfile.display_name,
+        ScholarProfile.is_enabled,
+        ScholarProfile.profile_image_override_url,
+    ).where(ScholarProfile.user_id == user_id)
     if scholar_profile_ids:
-        scholar_query = scholar_query.where(ScholarProfile.id.in_(scholar_profile_ids))
-    scholars_result = await db_session.execute(scholar_query.order_by(ScholarProfile.id.asc()))
+        query = query.where(ScholarProfile.id.in_(scholar_profile_ids))
+    return query.order_by(ScholarProfile.id.asc())
+
 
-    pub_query = (
+def _export_publication_query(*, user_id: int, scholar_profile_ids: list[int] | None) -> Select:
+    query = (
         select(
             ScholarProfile.scholar_id,
             Publication.cluster_id,
@@ -82,12 +88,23 @@ async def export_user_data(
         .where(ScholarProfile.user_id == user_id)
     )
     if scholar_profile_ids:
-        pub_query = pub_query.where(ScholarProfile.id.in_(scholar_profile_ids))
+        query = query.where(ScholarProfile.id.in_(scholar_profile_ids))
+    return query.order_by(ScholarPublication.created_at.desc(), Publication.id.desc())
+
+
+async def export_user_data(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+) -> dict[str, Any]:
+    scholars_result = await db_session.execute(
+        _export_scholar_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+    )
     publication_result = await db_session.execute(
-        pub_query.order_by(ScholarPublication.created_at.desc(), Publication.id.desc())
+        _export_publication_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
     )
-
-    scholars = [_serialize_export_scholar(profile) for profile in scholars_result.scalars().all()]
+    scholars = [_serialize_export_scholar(row) for row in scholars_result.all()]
     publications = [_serialize_export_publication(row) for row in publication_result.all()]
     return {
         "schema_version": EXPORT_SCHEMA_VERSION,
@@ -95,3 +112,79 @@ async def export_user_data(
         "scholars": scholars,
         "publications": publications,
     }
+
+
+async def _streamed_batches(
+    db_session: AsyncSession,
+    query: Select,
+    *,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    # Server-side cursor: only one batch of rows is held in memory at a time.
+    result = await db_session.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+def _json_line(value: dict[str, Any]) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+async def stream_user_data_ndjson(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+    batch_size: int = EXPORT_STREAM_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the export as NDJSON: a header line, then one line per scholar and per publication.
+
+    Every line carries a ``type`` of ``header``, ``scholar`` or ``publication``.
+    """
+    bounded_batch = max(int(batch_size), 1)
+    header = {"type": "header", "schema_version": EXPORT_SCHEMA_VERSION, "exported_at": _exported_at_iso()}
+    yield (_json_line(header) + "\n").encode("utf-8")
+    scholar_query = _export_scholar_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+    async for rows in _streamed_batches(db_session, scholar_query, batch_size=bounded_batch):
+        lines = [_json_line({"type": "scholar", **_serialize_export_scholar(row)}) for row in rows]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+    publication_query = _export_publication_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+    async for rows in _streamed_batches(db_session, publication_query, batch_size=bounded_batch):
+        lines = [_json_line({"type": "publication", **_serialize_export_publication(row)}) for row in rows]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def stream_user_data_json(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+    batch_size: int = EXPORT_STREAM_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the same document as ``export_user_data`` (and the import payload) chunk by chunk."""
+    bounded_batch = max(int(batch_size), 1)
+    opening = f'{{"schema_version":{EXPORT_SCHEMA_VERSION},"exported_at":{json.dumps(_exported_at_iso())},'
+    yield opening.encode("utf-8")
+    sections = (
+        ("scholars", _export_scholar_query, _serialize_export_scholar),
+        ("publications", _export_publication_query, _serialize_export_publication),
+    )
+    for index, (key, build_query, serialize) in enumerate(sections):
+        yield f'{"," if index else ""}"{key}":['.encode()
+        first = True
+        query = build_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+        async for rows in _streamed_batches(db_session, query, batch_size=bounded_batch):
+            chunk = ",".join(_json_line(serialize(row)) for row in rows)
+            yield (chunk if first else "," + chunk).encode("utf-8")
+            first = False
+        yield b"]"
+    yield b"}"
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], *, level: int = 6) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
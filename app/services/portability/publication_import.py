@@ -2,10 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.models import Publication, ScholarProfile, ScholarPublication
+from app.db.models import ScholarProfile
 from app.services.doi.normalize import normalize_doi
 from app.services.ingestion.fingerprints import build_publication_url, normalize_title
 from app.services.portability.normalize import (
@@ -14,53 +11,12 @@ from app.services.portability.normalize import (
     _normalize_optional_year,
     _resolve_fingerprint,
 )
-from app.services.portability.types import ImportedPublicationInput
-
-
-async def _find_publication_by_cluster(
-    db_session: AsyncSession,
-    *,
-    cluster_id: str,
-) -> Publication | None:
-    result = await db_session.execute(select(Publication).where(Publication.cluster_id == cluster_id))
-    return result.scalar_one_or_none()
-
-
-async def _find_publication_by_fingerprint(
-    db_session: AsyncSession,
-    *,
-    fingerprint_sha256: str,
-) -> Publication | None:
-    result = await db_session.execute(select(Publication).where(Publication.fingerprint_sha256 == fingerprint_sha256))
-    return result.scalar_one_or_none()
-
-
-async def _find_linked_publication_by_title(
-    db_session: AsyncSession,
-    *,
-    scholar_profile_id: int,
-    title: str,
-) -> Publication | None:
-    normalized_title = normalize_title(title)
-    result = await db_session.execute(
-        select(Publication)
-        .join(
-            ScholarPublication,
-            ScholarPublication.publication_id == Publication.id,
-        )
-        .where(
-            ScholarPublication.scholar_profile_id == scholar_profile_id,
-            Publication.title_normalized == normalized_title,
-        )
-        .order_by(Publication.id.asc())
-        .limit(1)
-    )
-    return result.scalar_one_or_none()
+from app.services.portability.types import ImportedPublicationInput, StagedPublication
 
 
 def _apply_imported_publication_values(
     *,
-    publication: Publication,
+    publication: StagedPublication,
     title: str,
     year: int | None,
     citation_count: int,
@@ -77,9 +33,11 @@ def _apply_imported_publication_values(
     if publication.title_raw != title:
         publication.title_raw = title
         publication.title_normalized = normalize_title(title)
+        publication.reindex = True
         updated = True
     if publication.year != year:
         publication.year = year
+        publication.reindex = True
         updated = True
     if int(publication.citation_count or 0) != citation_count:
         publication.citation_count = citation_count
@@ -96,96 +54,11 @@ def _apply_imported_publication_values(
     if pdf_url and publication.pdf_url != pdf_url:
         publication.pdf_url = pdf_url
         updated = True
+    if updated:
+        publication.dirty = True
     return updated
 
 
-def _new_publication(
-    *,
-    cluster_id: str | None,
-    fingerprint_sha256: str,
-    title: str,
-    year: int | None,
-    citation_count: int,
-    author_text: str | None,
-    venue_text: str | None,
-    pub_url: str | None,
-    pdf_url: str | None,
-) -> Publication:
-    return Publication(
-        cluster_id=cluster_id,
-        fingerprint_sha256=fingerprint_sha256,
-        title_raw=title,
-        title_normalized=normalize_title(title),
-        year=year,
-        citation_count=citation_count,
-        author_text=author_text,
-        venue_text=venue_text,
-        pub_url=pub_url,
-        pdf_url=pdf_url,
-    )
-
-
-async def _resolve_publication_for_import(
-    db_session: AsyncSession,
-    *,
-    scholar_profile_id: int,
-    title: str,
-    cluster_id: str | None,
-    fingerprint_sha256: str,
-    cluster_cache: dict[str, Publication | None],
-    fingerprint_cache: dict[str, Publication | None],
-) -> Publication | None:
-    if cluster_id:
-        if cluster_id not in cluster_cache:
-            cluster_cache[cluster_id] = await _find_publication_by_cluster(
-                db_session,
-                cluster_id=cluster_id,
-            )
-        if cluster_cache[cluster_id] is not None:
-            return cluster_cache[cluster_id]
-    if fingerprint_sha256 not in fingerprint_cache:
-        fingerprint_cache[fingerprint_sha256] = await _find_publication_by_fingerprint(
-            db_session,
-            fingerprint_sha256=fingerprint_sha256,
-        )
-    if fingerprint_cache[fingerprint_sha256] is not None:
-        return fingerprint_cache[fingerprint_sha256]
-    return await _find_linked_publication_by_title(
-        db_session,
-        scholar_profile_id=scholar_profile_id,
-        title=title,
-    )
-
-
-async def _upsert_scholar_publication_link(
-    db_session: AsyncSession,
-    *,
-    scholar_profile_id: int,
-    publication_id: int,
-    is_read: bool,
-) -> tuple[bool, bool]:
-    result = await db_session.execute(
-        select(ScholarPublication).where(
-            ScholarPublication.scholar_profile_id == scholar_profile_id,
-            ScholarPublication.publication_id == publication_id,
-        )
-    )
-    link = result.scalar_one_or_none()
-    if link is None:
-        db_session.add(
-            ScholarPublication(
-                scholar_profile_id=scholar_profile_id,
-                publication_id=publication_id,
-                is_read=bool(is_read),
-            )
-        )
-        return True, False
-    if bool(link.is_read) == bool(is_read):
-        return False, False
-    link.is_read = bool(is_read)
-    return False, True
-
-
 def _initialize_import_counters(counters: dict[str, int]) -> None:
     counters.update(
         {
@@ -248,119 +121,140 @@ def _update_link_counters(
         counters["links_updated"] += 1
 
 
-def _cache_resolved_publication(
-    *,
-    publication: Publication,
-    cluster_id: str | None,
-    fingerprint_sha256: str,
-    cluster_cache: dict[str, Publication | None],
-    fingerprint_cache: dict[str, Publication | None],
-) -> None:
-    if cluster_id:
-        cluster_cache[cluster_id] = publication
-    fingerprint_cache[fingerprint_sha256] = publication
-
-
-async def _create_import_publication(
-    db_session: AsyncSession,
-    *,
-    payload: ImportedPublicationInput,
-) -> Publication:
-    publication = _new_publication(
-        cluster_id=payload.cluster_id,
-        fingerprint_sha256=payload.fingerprint,
-        title=payload.title,
-        year=payload.year,
-        citation_count=payload.citation_count,
-        author_text=payload.author_text,
-        venue_text=payload.venue_text,
-        pub_url=payload.pub_url,
-        pdf_url=payload.pdf_url,
-    )
-    db_session.add(publication)
-    await db_session.flush()
-    return publication
-
-
-def _update_import_publication(
-    *,
-    publication: Publication,
-    payload: ImportedPublicationInput,
-) -> bool:
-    return _apply_imported_publication_values(
-        publication=publication,
-        title=payload.title,
-        year=payload.year,
-        citation_count=payload.citation_count,
-        author_text=payload.author_text,
-        venue_text=payload.venue_text,
-        pub_url=payload.pub_url,
-        pdf_url=payload.pdf_url,
-        cluster_id=payload.cluster_id,
-    )
-
-
-async def _upsert_publication_entity(
-    db_session: AsyncSession,
-    *,
-    payload: ImportedPublicationInput,
-    cluster_cache: dict[str, Publication | None],
-    fingerprint_cache: dict[str, Publication | None],
-) -> tuple[Publication, bool, bool]:
-    publication = await _resolve_publication_for_import(
-        db_session,
-        scholar_profile_id=int(payload.profile.id),
-        title=payload.title,
-        cluster_id=payload.cluster_id,
-        fingerprint_sha256=payload.fingerprint,
-        cluster_cache=cluster_cache,
-        fingerprint_cache=fingerprint_cache,
-    )
-    created = False
-    updated = False
-    if publication is None:
-        publication = await _create_import_publication(db_session, payload=payload)
-        created = True
-    else:
-        updated = _update_import_publication(publication=publication, payload=payload)
-
-    _cache_resolved_publication(
-        publication=publication,
-        cluster_id=payload.cluster_id,
-        fingerprint_sha256=payload.fingerprint,
-        cluster_cache=cluster_cache,
-        fingerprint_cache=fingerprint_cache,
-    )
-    return publication, created, updated
-
-
-async def _upsert_imported_publication(
-    db_session: AsyncSession,
-    *,
-    payload: ImportedPublicationInput,
-    cluster_cache: dict[str, Publication | None],
-    fingerprint_cache: dict[str, Publication | None],
-    counters: dict[str, int],
-) -> None:
-    publication, created, updated = await _upsert_publication_entity(
-        db_session,
-        payload=payload,
-        cluster_cache=cluster_cache,
-        fingerprint_cache=fingerprint_cache,
-    )
-    if created:
-        counters["publications_created"] += 1
-    if updated:
-        counters["publications_updated"] += 1
-
-    link_created, link_updated = await _upsert_scholar_publication_link(
-        db_session,
-        scholar_profile_id=int(payload.profile.id),
-        publication_id=int(publication.id),
-        is_read=payload.is_read,
-    )
-    _update_link_counters(
-        counters=counters,
-        link_created=link_created,
-        link_updated=link_updated,
-    )
+def _creation_order(publication: StagedPublication) -> tuple[bool, int]:
+    # Existing rows sort by id; rows created by the import get later ids in creation order.
+    return publication.slot < 0, abs(publication.slot)
+
+
+class ImportResolver:
+    """Replays the row-by-row import rules over candidate rows loaded in bulk.
+
+    Each row resolves to the publication with its cluster id, else its fingerprint (both
+    remembered for the rest of the import), else the lowest-id publication already linked
+    to the scholar under the same normalized title; otherwise a new publication is staged.
+    Lookups see every earlier row's effects, exactly as the per-row queries did after autoflush.
+    """
+
+    def __init__(
+        self,
+        *,
+        candidates: list[StagedPublication],
+        links: dict[tuple[int, int], bool],
+    ) -> None:
+        self.publications: dict[int, StagedPublication] = {item.slot: item for item in candidates}
+        self.links = dict(links)
+        self.link_writes: dict[tuple[int, int], bool] = {}
+        self._cluster_cache: dict[str, StagedPublication | None] = {}
+        self._fingerprint_cache: dict[str, StagedPublication | None] = {}
+        self._slot_by_cluster = {item.cluster_id: item.slot for item in candidates if item.cluster_id}
+        self._slot_by_fingerprint = {item.fingerprint_sha256: item.slot for item in candidates}
+        self._scholars_by_slot: dict[int, set[int]] = {}
+        self._slots_by_title: dict[tuple[int, str], set[int]] = {}
+        self._next_new_slot = -1
+        for scholar_profile_id, slot in links:
+            self._index_link(scholar_profile_id=scholar_profile_id, slot=slot)
+
+    def apply(self, payload: ImportedPublicationInput, *, counters: dict[str, int]) -> None:
+        scholar_profile_id = int(payload.profile.id)
+        publication = self._resolve(payload, scholar_profile_id=scholar_profile_id)
+        if publication is None:
+            publication = self._stage_new(payload)
+            counters["publications_created"] += 1
+        elif self._update(publication, payload):
+            counters["publications_updated"] += 1
+        if payload.cluster_id:
+            self._cluster_cache[payload.cluster_id] = publication
+        self._fingerprint_cache[payload.fingerprint] = publication
+        link_created, link_updated = self._upsert_link(
+            scholar_profile_id=scholar_profile_id,
+            slot=publication.slot,
+            is_read=payload.is_read,
+        )
+        _update_link_counters(counters=counters, link_created=link_created, link_updated=link_updated)
+
+    def _resolve(self, payload: ImportedPublicationInput, *, scholar_profile_id: int) -> StagedPublication | None:
+        if payload.cluster_id:
+            if payload.cluster_id not in self._cluster_cache:
+                self._cluster_cache[payload.cluster_id] = self._by_slot(self._slot_by_cluster.get(payload.cluster_id))
+            if self._cluster_cache[payload.cluster_id] is not None:
+                return self._cluster_cache[payload.cluster_id]
+        if payload.fingerprint not in self._fingerprint_cache:
+            self._fingerprint_cache[payload.fingerprint] = self._by_slot(
+                self._slot_by_fingerprint.get(payload.fingerprint)
+            )
+        if self._fingerprint_cache[payload.fingerprint] is not None:
+            return self._fingerprint_cache[payload.fingerprint]
+        slots = self._slots_by_title.get((scholar_profile_id, normalize_title(payload.title)))
+        if not slots:
+            return None
+        return min((self.publications[slot] for slot in slots), key=_creation_order)
+
+    def _by_slot(self, slot: int | None) -> StagedPublication | None:
+        return None if slot is None else self.publications[slot]
+
+    def _stage_new(self, payload: ImportedPublicationInput) -> StagedPublication:
+        publication = StagedPublication(
+            slot=self._next_new_slot,
+            publication_id=None,
+            cluster_id=payload.cluster_id,
+            fingerprint_sha256=payload.fingerprint,
+            title_raw=payload.title,
+            title_normalized=normalize_title(payload.title),
+            year=payload.year,
+            citation_count=payload.citation_count,
+            author_text=payload.author_text,
+            venue_text=payload.venue_text,
+            pub_url=payload.pub_url,
+            pdf_url=payload.pdf_url,
+        )
+        self._next_new_slot -= 1
+        self.publications[publication.slot] = publication
+        if publication.cluster_id:
+            self._slot_by_cluster[publication.cluster_id] = publication.slot
+        self._slot_by_fingerprint[publication.fingerprint_sha256] = publication.slot
+        return publication
+
+    def _update(self, publication: StagedPublication, payload: ImportedPublicationInput) -> bool:
+        previous_cluster = publication.cluster_id
+        previous_title = publication.title_normalized
+        updated = _apply_imported_publication_values(
+            publication=publication,
+            title=payload.title,
+            year=payload.year,
+            citation_count=payload.citation_count,
+            author_text=payload.author_text,
+            venue_text=payload.venue_text,
+            pub_url=payload.pub_url,
+            pdf_url=payload.pdf_url,
+            cluster_id=payload.cluster_id,
+        )
+        if publication.cluster_id != previous_cluster:
+            if previous_cluster and self._slot_by_cluster.get(previous_cluster) == publication.slot:
+                del self._slot_by_cluster[previous_cluster]
+            self._slot_by_cluster[str(publication.cluster_id)] = publication.slot
+        if publication.title_normalized != previous_title:
+            for scholar_profile_id in self._scholars_by_slot.get(publication.slot, ()):
+                self._slots_by_title[(scholar_profile_id, previous_title)].discard(publication.slot)
+                self._slots_by_title.setdefault((scholar_profile_id, publication.title_normalized), set()).add(
+                    publication.slot
+                )
+        return updated
+
+    def _upsert_link(self, *, scholar_profile_id: int, slot: int, is_read: bool) -> tuple[bool, bool]:
+        key = (scholar_profile_id, slot)
+        current = self.links.get(key)
+        if current is None:
+            self.links[key] = bool(is_read)
+            self.link_writes[key] = bool(is_read)
+            self._index_link(scholar_profile_id=scholar_profile_id, slot=slot)
+            return True, False
+        if current == bool(is_read):
+            return False, False
+        self.links[key] = bool(is_read)
+        self.link_writes[key] = bool(is_read)
+        return False, True
+
+    def _index_link(self, *, scholar_profile_id: int, slot: int) -> None:
+        self._scholars_by_slot.setdefault(slot, set()).add(scholar_profile_id)
+        title = self.publications[slot].title_normalized
+        self._slots_by_title.setdefault((scholar_profile_id, title), set()).add(slot)
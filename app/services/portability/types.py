@@ -23,3 +23,27 @@ class ImportedPublicationInput:
     pdf_url: str | None
     fingerprint: str
     is_read: bool
+
+
+@dataclass
+class StagedPublication:
+    """In-memory state of one publication touched by a bulk import.
+
+    ``slot`` is the publication id for existing rows and a negative creation index for
+    rows the import will insert (``publication_id`` is then ``None``).
+    """
+
+    slot: int
+    publication_id: int | None
+    cluster_id: str | None
+    fingerprint_sha256: str
+    title_raw: str
+    title_normalized: str
+    year: int | None
+    citation_count: int
+    author_text: str | None
+    venue_text: str | None
+    pub_url: str | None
+    pdf_url: str | None
+    dirty: bool = False
+    reindex: bool = False
@@ -2,8 +2,7 @@ from app.services.publication_identifiers.application import (
     DisplayIdentifier,
     derive_display_identifier_from_values,
     display_identifier_for_publication_id,
-    overlay_pdf_queue_items_with_display_identifiers,
-    overlay_publication_items_with_display_identifiers,
+    display_identifier_from_stored,
     sync_identifiers_for_publication_fields,
     sync_identifiers_for_publication_resolution,
 )
@@ -12,8 +11,7 @@ __all__ = [
     "DisplayIdentifier",
     "derive_display_identifier_from_values",
     "display_identifier_for_publication_id",
-    "overlay_pdf_queue_items_with_display_identifiers",
-    "overlay_publication_items_with_display_identifiers",
+    "display_identifier_from_stored",
     "sync_identifiers_for_publication_fields",
     "sync_identifiers_for_publication_resolution",
 ]
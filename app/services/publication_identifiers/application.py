@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import replace
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Publication, PublicationIdentifier
+from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.arxiv.guards import arxiv_skip_reason_for_item
 from app.services.doi.normalize import normalize_doi
 from app.services.publication_identifiers.normalize import (
@@ -21,8 +22,7 @@ from app.services.publication_identifiers.types import (
 )
 
 if TYPE_CHECKING:
-    from app.services.publications.pdf_queue_queries import PdfQueueListItem
-    from app.services.publications.types import PublicationListItem, UnreadPublicationItem
+    from app.services.publications.types import UnreadPublicationItem
 
 CONFIDENCE_HIGH = 0.98
 CONFIDENCE_MEDIUM = 0.9
@@ -126,6 +126,23 @@ async def discover_and_sync_identifiers_for_publication(
     publication: Publication,
     scholar_label: str,
 ) -> None:
+    item = await prepare_identifier_discovery(db_session, publication=publication, scholar_label=scholar_label)
+    if item is None:
+        return
+    await _discover_arxiv_identifier(db_session, publication_id=int(publication.id), item=item)
+
+
+async def prepare_identifier_discovery(
+    db_session: AsyncSession,
+    *,
+    publication: Publication,
+    scholar_label: str,
+) -> UnreadPublicationItem | None:
+    """Sync field identifiers and run Crossref discovery for one publication.
+
+    Returns the lookup item when the publication still needs an arXiv search,
+    so callers can batch those searches with ``discover_arxiv_identifiers``.
+    """
     await sync_identifiers_for_publication_fields(db_session, publication=publication)
 
     publication_id = int(publication.id)
@@ -135,7 +152,7 @@ async def discover_and_sync_identifiers_for_publication(
         kind=IdentifierKind.DOI.value,
         confidence_floor=0.0,
     ):
-        return
+        return None
 
     item = _identifier_lookup_item(publication=publication, scholar_label=scholar_label)
     has_strong_doi = await _discover_crossref_doi(
@@ -154,8 +171,30 @@ async def discover_and_sync_identifiers_for_publication(
         has_existing_arxiv=existing_arxiv is not None,
     )
     if skip_reason is not None:
+        return None
+    return item
+
+
+async def discover_arxiv_identifiers(
+    db_session: AsyncSession,
+    *,
+    items: list[UnreadPublicationItem],
+    should_stop: Callable[[], Awaitable[bool]] | None = None,
+) -> None:
+    """Search arXiv for ``items`` in batches and store the IDs found.
+
+    Raises ``ArxivRateLimitError`` when arXiv rate-limits a batch, after storing the IDs
+    matched by the batches that completed before it.
+    """
+    if not items:
         return
-    await _discover_arxiv_identifier(db_session, publication_id=publication_id, item=item)
+    from app.services.arxiv import application as arxiv_service
+
+    discovered = await arxiv_service.discover_arxiv_ids_for_publications(items=items, should_stop=should_stop)
+    for publication_id, discovered_arxiv in discovered.arxiv_ids.items():
+        await _upsert_discovered_arxiv(db_session, publication_id=publication_id, discovered_arxiv=discovered_arxiv)
+    if discovered.rate_limited:
+        raise ArxivRateLimitError("arXiv rate limit hit during batched discovery")
 
 
 def _identifier_lookup_item(
@@ -215,6 +254,15 @@ async def _discover_arxiv_identifier(
     from app.services.arxiv import application as arxiv_service
 
     discovered_arxiv = await arxiv_service.discover_arxiv_id_for_publication(item=item)
+    await _upsert_discovered_arxiv(db_session, publication_id=publication_id, discovered_arxiv=discovered_arxiv)
+
+
+async def _upsert_discovered_arxiv(
+    db_session: AsyncSession,
+    *,
+    publication_id: int,
+    discovered_arxiv: str | None,
+) -> None:
     normalized_arxiv = normalize_arxiv_id(discovered_arxiv)
     if discovered_arxiv is None or normalized_arxiv is None:
         return
@@ -370,44 +418,32 @@ def _merge_identifier_row(existing: PublicationIdentifier, *, candidate: Identif
             existing.evidence_url = candidate.evidence_url
 
 
-async def overlay_publication_items_with_display_identifiers(
-    db_session: AsyncSession,
+def display_identifier_from_stored(
     *,
-    items: list[PublicationListItem],
-) -> list[PublicationListItem]:
-    if not items:
-        return []
-    mapping = await _display_identifier_map(db_session, publication_ids=[item.publication_id for item in items])
-    return [_overlay_publication_item(item, mapping.get(item.publication_id)) for item in items]
-
-
-def _overlay_publication_item(
-    item: PublicationListItem,
-    display_identifier: DisplayIdentifier | None,
-) -> PublicationListItem:
-    fallback = display_identifier or derive_display_identifier_from_values(
-        doi=None, pub_url=item.pub_url, pdf_url=item.pdf_url
-    )
-    return replace(item, display_identifier=fallback)
-
-
-async def overlay_pdf_queue_items_with_display_identifiers(
-    db_session: AsyncSession,
-    *,
-    items: list[PdfQueueListItem],
-) -> list[PdfQueueListItem]:
-    if not items:
-        return []
-    mapping = await _display_identifier_map(db_session, publication_ids=[item.publication_id for item in items])
-    return [_overlay_queue_item(item, mapping.get(item.publication_id)) for item in items]
-
-
-def _overlay_queue_item(
-    item: PdfQueueListItem,
-    display_identifier: DisplayIdentifier | None,
-) -> PdfQueueListItem:
-    fallback = display_identifier or derive_display_identifier_from_values(doi=None, pdf_url=item.pdf_url)
-    return replace(item, display_identifier=fallback)
+    kind: str | None,
+    value: str | None,
+    confidence_score: float | None,
+    pub_url: str | None = None,
+    pdf_url: str | None = None,
+) -> DisplayIdentifier | None:
+    """Build the display identifier from the ``publications.display_identifier_*`` columns.
+
+    Publications without identifier rows fall back to identifiers derived from their URLs.
+    """
+    if kind and value:
+        try:
+            identifier_kind = IdentifierKind(str(kind))
+        except ValueError:
+            identifier_kind = None
+        if identifier_kind is not None:
+            return DisplayIdentifier(
+                kind=identifier_kind.value,
+                value=value,
+                label=_display_label(identifier_kind, value),
+                url=_identifier_url(identifier_kind, value),
+                confidence_score=float(confidence_score or 0.0),
+            )
+    return derive_display_identifier_from_values(doi=None, pub_url=pub_url, pdf_url=pdf_url)
 
 
 async def display_identifier_for_publication_id(
@@ -418,56 +454,25 @@ async def display_identifier_for_publication_id(
     normalized_id = int(publication_id)
     if normalized_id <= 0:
         raise ValueError("publication_id must be positive.")
-    mapping = await _display_identifier_map(db_session, publication_ids=[normalized_id])
-    display = mapping.get(normalized_id)
-    if display is not None:
-        return display
-    publication = await db_session.get(Publication, normalized_id)
-    if publication is None:
-        return None
-    return derive_display_identifier_from_values(
-        doi=None,
-        pub_url=publication.pub_url,
-        pdf_url=publication.pdf_url,
-    )
-
-
-async def _display_identifier_map(
-    db_session: AsyncSession,
-    *,
-    publication_ids: list[int],
-) -> dict[int, DisplayIdentifier]:
-    normalized_ids = sorted({int(value) for value in publication_ids if int(value) > 0})
-    if not normalized_ids:
-        return {}
     result = await db_session.execute(
-        select(PublicationIdentifier).where(PublicationIdentifier.publication_id.in_(normalized_ids))
+        select(
+            Publication.display_identifier_kind,
+            Publication.display_identifier_value,
+            Publication.display_identifier_confidence,
+            Publication.pub_url,
+            Publication.pdf_url,
+        ).where(Publication.id == normalized_id)
     )
-    rows = list(result.scalars().all())
-    return _best_display_identifier_map(rows)
-
-
-def _best_display_identifier_map(rows: list[PublicationIdentifier]) -> dict[int, DisplayIdentifier]:
-    grouped: dict[int, list[IdentifierCandidate]] = {}
-    for row in rows:
-        grouped.setdefault(int(row.publication_id), []).append(_candidate_from_row(row))
-    return {
-        publication_id: display
-        for publication_id, display in (
-            (publication_id, _best_display_identifier(candidates)) for publication_id, candidates in grouped.items()
-        )
-        if display is not None
-    }
-
-
-def _candidate_from_row(row: PublicationIdentifier) -> IdentifierCandidate:
-    return IdentifierCandidate(
-        kind=IdentifierKind(str(row.kind)),
-        value_raw=str(row.value_raw),
-        value_normalized=str(row.value_normalized),
-        source=str(row.source),
-        confidence_score=float(row.confidence_score),
-        evidence_url=row.evidence_url,
+    row = result.one_or_none()
+    if row is None:
+        return None
+    kind, value, confidence_score, pub_url, pdf_url = row
+    return display_identifier_from_stored(
+        kind=kind,
+        value=value,
+        confidence_score=confidence_score,
+        pub_url=pub_url,
+        pdf_url=pdf_url,
     )
 
 
@@ -10,12 +10,27 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     MODE_UNREAD as MODE_UNREAD,
 )
+from app.services.publications.application import (
+    InvalidPublicationCursorError as InvalidPublicationCursorError,
+)
+from app.services.publications.application import (
+    PublicationCounters as PublicationCounters,
+)
+from app.services.publications.application import (
+    PublicationCursor as PublicationCursor,
+)
 from app.services.publications.application import (
     PublicationListItem as PublicationListItem,
 )
+from app.services.publications.application import (
+    PublicationListPage as PublicationListPage,
+)
 from app.services.publications.application import (
     UnreadPublicationItem as UnreadPublicationItem,
 )
+from app.services.publications.application import (
+    count_auto_retry_due_pdf_jobs_for_user as count_auto_retry_due_pdf_jobs_for_user,
+)
 from app.services.publications.application import (
     count_favorite_for_user as count_favorite_for_user,
 )
@@ -31,6 +46,9 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     count_unread_for_user as count_unread_for_user,
 )
+from app.services.publications.application import (
+    decode_publication_cursor as decode_publication_cursor,
+)
 from app.services.publications.application import (
     enqueue_all_missing_pdf_jobs as enqueue_all_missing_pdf_jobs,
 )
@@ -40,6 +58,9 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     get_latest_run_id_for_user as get_latest_run_id_for_user,
 )
+from app.services.publications.application import (
+    get_publication_counters as get_publication_counters,
+)
 from app.services.publications.application import (
     get_publication_item_for_user as get_publication_item_for_user,
 )
@@ -49,6 +70,9 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     list_for_user as list_for_user,
 )
+from app.services.publications.application import (
+    list_page_for_user as list_page_for_user,
+)
 from app.services.publications.application import (
     list_pdf_queue_items as list_pdf_queue_items,
 )
@@ -67,6 +91,15 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     publications_query as publications_query,
 )
+from app.services.publications.application import (
+    reconcile_all_publication_counters as reconcile_all_publication_counters,
+)
+from app.services.publications.application import (
+    reconcile_publication_counters as reconcile_publication_counters,
+)
+from app.services.publications.application import (
+    resolve_publication_sort as resolve_publication_sort,
+)
 from app.services.publications.application import (
     resolve_publication_view_mode as resolve_publication_view_mode,
 )
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from app.services.publications.counters import (
+    get_publication_counters,
+    reconcile_all_publication_counters,
+    reconcile_publication_counters,
+)
 from app.services.publications.counts import (
     count_favorite_for_user,
     count_for_user,
     count_latest_for_user,
     count_unread_for_user,
 )
+from app.services.publications.cursors import (
+    InvalidPublicationCursorError,
+    PublicationCursor,
+    decode_publication_cursor,
+)
 from app.services.publications.enrichment import (
     hydrate_pdf_enrichment_state,
     schedule_missing_pdf_enrichment_for_user,
@@ -13,6 +23,7 @@ from app.services.publications.enrichment import (
 )
 from app.services.publications.listing import (
     list_for_user,
+    list_page_for_user,
     list_unread_for_user,
     retry_pdf_for_user,
 )
@@ -24,6 +35,7 @@ from app.services.publications.modes import (
     resolve_publication_view_mode,
 )
 from app.services.publications.pdf_queue import (
+    count_auto_retry_due_pdf_jobs_for_user,
     enqueue_all_missing_pdf_jobs,
     enqueue_retry_pdf_job_for_publication_id,
 )
@@ -42,32 +54,49 @@ from app.services.publications.read_state import (
     mark_selected_as_read_for_user,
     set_publication_favorite_for_user,
 )
-from app.services.publications.types import PublicationListItem, UnreadPublicationItem
+from app.services.publications.search import resolve_publication_sort
+from app.services.publications.types import (
+    PublicationCounters,
+    PublicationListItem,
+    PublicationListPage,
+    UnreadPublicationItem,
+)
 
 __all__ = [
     "MODE_ALL",
     "MODE_LATEST",
     "MODE_NEW",
     "MODE_UNREAD",
+    "InvalidPublicationCursorError",
+    "PublicationCounters",
+    "PublicationCursor",
     "PublicationListItem",
+    "PublicationListPage",
     "UnreadPublicationItem",
+    "count_auto_retry_due_pdf_jobs_for_user",
     "count_favorite_for_user",
     "count_for_user",
     "count_latest_for_user",
     "count_pdf_queue_items",
     "count_unread_for_user",
+    "decode_publication_cursor",
     "enqueue_all_missing_pdf_jobs",
     "enqueue_retry_pdf_job_for_publication_id",
     "get_latest_run_id_for_user",
+    "get_publication_counters",
     "get_publication_item_for_user",
     "hydrate_pdf_enrichment_state",
     "list_for_user",
+    "list_page_for_user",
     "list_pdf_queue_items",
     "list_pdf_queue_page",
     "list_unread_for_user",
     "mark_all_unread_as_read_for_user",
     "mark_selected_as_read_for_user",
     "publications_query",
+    "reconcile_all_publication_counters",
+    "reconcile_publication_counters",
+    "resolve_publication_sort",
     "resolve_publication_view_mode",
     "retry_pdf_for_user",
     "schedule_missing_pdf_enrichment_for_user",
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import instance_state
+
+from app.db.models import Publication
+from app.logging_utils import structured_log
+from app.services.ingestion.fingerprints import normalize_title
+from app.services.publications.dedup_titles import preferred_title_text
+
+logger = logging.getLogger(__name__)
+
+_CREATE_MAP_SQL = text(
+    """
+    CREATE TEMP TABLE publication_merge_map (
+        dup_id BIGINT PRIMARY KEY,
+        winner_id BIGINT NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+_FILL_MAP_SQL = text(
+    """
+    INSERT INTO publication_merge_map (dup_id, winner_id)
+    SELECT dup_id, winner_id
+    FROM unnest(CAST(:dup_ids AS BIGINT[]), CAST(:winner_ids AS BIGINT[])) AS pairs (dup_id, winner_id)
+    """
+)
+
+# Duplicate metadata is captured before the duplicates are deleted: the winner can only take a
+# duplicate's cluster_id once that row is gone (uq_publications_cluster_id_not_null).
+_SNAPSHOT_METADATA_SQL = text(
+    """
+    CREATE TEMP TABLE publication_merge_metadata ON COMMIT DROP AS
+    SELECT
+        m.winner_id,
+        (array_agg(d.year ORDER BY m.dup_id) FILTER (WHERE d.year IS NOT NULL))[1] AS year,
+        MAX(d.citation_count) AS citation_count,
+        (array_agg(d.author_text ORDER BY m.dup_id) FILTER (WHERE d.author_text <> ''))[1] AS author_text,
+        (array_agg(d.venue_text ORDER BY m.dup_id) FILTER (WHERE d.venue_text <> ''))[1] AS venue_text,
+        (array_agg(d.pub_url ORDER BY m.dup_id) FILTER (WHERE d.pub_url <> ''))[1] AS pub_url,
+        (array_agg(d.pdf_url ORDER BY m.dup_id) FILTER (WHERE d.pdf_url <> ''))[1] AS pdf_url,
+        (array_agg(d.cluster_id ORDER BY m.dup_id) FILTER (WHERE d.cluster_id <> ''))[1] AS cluster_id,
+        (array_agg(d.canonical_title_hash ORDER BY m.dup_id)
+            FILTER (WHERE d.canonical_title_hash <> ''))[1] AS canonical_title_hash
+    FROM publication_merge_map m
+    JOIN publications d ON d.id = m.dup_id
+    GROUP BY m.winner_id
+    """
+)
+
+# A duplicate's link is dropped when the winner, or an earlier duplicate of the same winner,
+# is already linked to that scholar.
+_DROP_CONFLICTING_LINKS_SQL = text(
+    """
+    DELETE FROM scholar_publications sp
+    USING publication_merge_map m
+    WHERE sp.publication_id = m.dup_id
+      AND (
+        EXISTS (
+            SELECT 1 FROM scholar_publications w
+            WHERE w.publication_id = m.winner_id
+              AND w.scholar_profile_id = sp.scholar_profile_id
+        )
+        OR EXISTS (
+            SELECT 1
+            FROM scholar_publications o
+            JOIN publication_merge_map om ON om.dup_id = o.publication_id
+            WHERE om.winner_id = m.winner_id
+              AND om.dup_id < m.dup_id
+              AND o.scholar_profile_id = sp.scholar_profile_id
+        )
+      )
+    """
+)
+
+_REPOINT_LINKS_SQL = text(
+    """
+    UPDATE scholar_publications sp
+    SET publication_id = m.winner_id
+    FROM publication_merge_map m
+    WHERE sp.publication_id = m.dup_id
+    """
+)
+
+# Rank 1 in each (winner, kind, value) group survives: the winner's own row if it has one,
+# otherwise the row of the lowest duplicate id.
+_RANK_IDENTIFIERS_SQL = text(
+    """
+    CREATE TEMP TABLE publication_merge_identifiers ON COMMIT DROP AS
+    SELECT
+        i.id,
+        COALESCE(m.winner_id, i.publication_id) AS winner_id,
+        i.kind,
+        i.value_normalized,
+        row_number() OVER (
+            PARTITION BY COALESCE(m.winner_id, i.publication_id), i.kind, i.value_normalized
+            ORDER BY (m.dup_id IS NOT NULL), m.dup_id, i.id
+        ) AS rank
+    FROM publication_identifiers i
+    LEFT JOIN publication_merge_map m ON m.dup_id = i.publication_id
+    WHERE i.publication_id IN (SELECT dup_id FROM publication_merge_map)
+       OR i.publication_id IN (SELECT winner_id FROM publication_merge_map)
+    """
+)
+
+_MERGE_IDENTIFIER_FIELDS_SQL = text(
+    """
+    UPDATE publication_identifiers s
+    SET
+        confidence_score = g.confidence_score,
+        evidence_url = COALESCE(NULLIF(s.evidence_url, ''), g.evidence_url),
+        value_raw = COALESCE(NULLIF(s.value_raw, ''), g.value_raw, s.value_raw),
+        updated_at = now()
+    FROM (
+        SELECT
+            r.winner_id,
+            r.kind,
+            r.value_normalized,
+            MAX(i.confidence_score) AS confidence_score,
+            (array_agg(i.evidence_url ORDER BY r.rank) FILTER (WHERE i.evidence_url <> ''))[1] AS evidence_url,
+            (array_agg(i.value_raw ORDER BY r.rank) FILTER (WHERE i.value_raw <> ''))[1] AS value_raw
+        FROM publication_merge_identifiers r
+        JOIN publication_identifiers i ON i.id = r.id
+        GROUP BY r.winner_id, r.kind, r.value_normalized
+        HAVING COUNT(*) > 1
+    ) g
+    JOIN publication_merge_identifiers survivor
+      ON survivor.winner_id = g.winner_id
+     AND survivor.kind = g.kind
+     AND survivor.value_normalized = g.value_normalized
+     AND survivor.rank = 1
+    WHERE s.id = survivor.id
+    """
+)
+
+_DELETE_MERGED_IDENTIFIERS_SQL = text(
+    """
+    DELETE FROM publication_identifiers i
+    USING publication_merge_identifiers r
+    WHERE i.id = r.id AND r.rank > 1
+    """
+)
+
+_REPOINT_IDENTIFIERS_SQL = text(
+    """
+    UPDATE publication_identifiers i
+    SET publication_id = m.winner_id, updated_at = now()
+    FROM publication_merge_map m
+    WHERE i.publication_id = m.dup_id
+    """
+)
+
+_DELETE_DUPLICATES_SQL = text(
+    """
+    DELETE FROM publications p
+    USING publication_merge_map m
+    WHERE p.id = m.dup_id
+    """
+)
+
+# near_dup_indexed_at is cleared because the winner's title or year may change.
+_COALESCE_WINNERS_SQL = text(
+    """
+    UPDATE publications w
+    SET
+        year = COALESCE(w.year, md.year),
+        citation_count = GREATEST(w.citation_count, COALESCE(md.citation_count, 0)),
+        author_text = COALESCE(NULLIF(w.author_text, ''), md.author_text, w.author_text),
+        venue_text = COALESCE(NULLIF(w.venue_text, ''), md.venue_text, w.venue_text),
+        pub_url = COALESCE(NULLIF(w.pub_url, ''), md.pub_url, w.pub_url),
+        pdf_url = COALESCE(NULLIF(w.pdf_url, ''), md.pdf_url, w.pdf_url),
+        cluster_id = COALESCE(NULLIF(w.cluster_id, ''), md.cluster_id, w.cluster_id),
+        canonical_title_hash = COALESCE(NULLIF(w.canonical_title_hash, ''), md.canonical_title_hash, w.canonical_title_hash),
+        near_dup_indexed_at = NULL,
+        updated_at = now()
+    FROM publication_merge_metadata md
+    WHERE w.id = md.winner_id
+    """
+)
+
+_UPDATE_WINNER_TITLE_SQL = text(
+    """
+    UPDATE publications
+    SET title_raw = :title_raw, title_normalized = :title_normalized
+    WHERE id = :winner_id
+    """
+)
+
+_DROP_TEMP_TABLES_SQL = text(
+    "DROP TABLE publication_merge_identifiers, publication_merge_metadata, publication_merge_map"
+)
+
+
+async def merge_publications(
+    db_session: AsyncSession,
+    *,
+    merges: Mapping[int, int],
+) -> int:
+    """Merge every ``dup_id`` in ``merges`` into its ``winner_id`` with a fixed number of set-based statements.
+
+    Chains (a winner that is itself merged away) resolve to the final winner.
+    Metadata is coalesced, scholar links are re-pointed with conflicts dropped,
+    identifiers are moved or folded into the winner's matching row, and the
+    duplicates are deleted. Returns the number of merged duplicates.
+    """
+    resolved = resolve_merge_mapping(merges)
+    if not resolved:
+        return 0
+    titles = await _load_titles(db_session, publication_ids={*resolved, *resolved.values()})
+    missing = sorted({*resolved, *resolved.values()} - set(titles))
+    if missing:
+        raise ValueError(f"Publications to merge do not exist: {missing}.")
+    dup_ids = sorted(resolved)
+    await db_session.execute(_CREATE_MAP_SQL)
+    await db_session.execute(
+        _FILL_MAP_SQL,
+        {"dup_ids": dup_ids, "winner_ids": [resolved[dup_id] for dup_id in dup_ids]},
+    )
+    await db_session.execute(_SNAPSHOT_METADATA_SQL)
+    await db_session.execute(_DROP_CONFLICTING_LINKS_SQL)
+    await db_session.execute(_REPOINT_LINKS_SQL)
+    await db_session.execute(_RANK_IDENTIFIERS_SQL)
+    await db_session.execute(_MERGE_IDENTIFIER_FIELDS_SQL)
+    await db_session.execute(_DELETE_MERGED_IDENTIFIERS_SQL)
+    await db_session.execute(_REPOINT_IDENTIFIERS_SQL)
+    await db_session.execute(_DELETE_DUPLICATES_SQL)
+    await db_session.execute(_COALESCE_WINNERS_SQL)
+    title_updates = _winner_title_updates(resolved=resolved, titles=titles)
+    if title_updates:
+        await db_session.execute(_UPDATE_WINNER_TITLE_SQL, title_updates)
+    await db_session.execute(_DROP_TEMP_TABLES_SQL)
+    _detach_merged_instances(db_session, publication_ids={*resolved, *resolved.values()})
+    structured_log(
+        logger,
+        "info",
+        "publications.bulk_merge",
+        merged_count=len(resolved),
+        winner_count=len(set(resolved.values())),
+    )
+    return len(resolved)
+
+
+def resolve_merge_mapping(merges: Mapping[int, int]) -> dict[int, int]:
+    """Return ``{dup_id: final_winner_id}``, following chains and rejecting self-merges and cycles."""
+    resolved: dict[int, int] = {}
+    for dup_id in merges:
+        winner_id = int(merges[dup_id])
+        if winner_id == int(dup_id):
+            raise ValueError("winner_id and dup_id must differ.")
+        visited = {int(dup_id)}
+        while winner_id in merges:
+            if winner_id in visited:
+                raise ValueError(f"Merge mapping contains a cycle through publication {winner_id}.")
+            visited.add(winner_id)
+            winner_id = int(merges[winner_id])
+        resolved[int(dup_id)] = winner_id
+    return resolved
+
+
+async def _load_titles(db_session: AsyncSession, *, publication_ids: set[int]) -> dict[int, str]:
+    result = await db_session.execute(
+        select(Publication.id, Publication.title_raw).where(Publication.id.in_(sorted(publication_ids)))
+    )
+    return {int(publication_id): str(title_raw or "") for publication_id, title_raw in result.all()}
+
+
+def _winner_title_updates(*, resolved: dict[int, int], titles: dict[int, str]) -> list[dict[str, object]]:
+    preferred: dict[int, str] = {}
+    for dup_id in sorted(resolved):
+        winner_id = resolved[dup_id]
+        current = preferred.get(winner_id, titles[winner_id])
+        preferred[winner_id] = preferred_title_text(winner=current, dup=titles[dup_id])
+    return [
+        {"winner_id": winner_id, "title_raw": title, "title_normalized": normalize_title(title)}
+        for winner_id, title in sorted(preferred.items())
+        if title != titles[winner_id]
+    ]
+
+
+def _detach_merged_instances(db_session: AsyncSession, *, publication_ids: set[int]) -> None:
+    # Loaded rows for merged publications no longer match the database; detach them so a later
+    # flush cannot write stale values back over the merge.
+    for instance in list(db_session.identity_map.values()):
+        state = instance_state(instance)
+        if isinstance(instance, Publication):
+            publication_id = state.identity[0] if state.identity else None
+        else:
+            publication_id = state.dict.get("publication_id")
+        if publication_id in publication_ids:
+            db_session.expunge(instance)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from sqlalchemy import distinct, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import (
+    ScholarProfile,
+    ScholarPublication,
+    ScholarPublicationCounter,
+    User,
+    UserPublicationCounter,
+)
+from app.services.publications.types import PublicationCounters
+
+_COUNTER_FIELDS = ("total_count", "unread_count", "favorite_count", "favorite_unread_count")
+
+
+async def get_publication_counters(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_id: int | None = None,
+) -> PublicationCounters:
+    """Read the maintained counters; a missing row means no links have been recorded yet."""
+    if scholar_profile_id is None:
+        result = await db_session.execute(
+            select(
+                UserPublicationCounter.total_count,
+                UserPublicationCounter.unread_count,
+                UserPublicationCounter.favorite_count,
+                UserPublicationCounter.favorite_unread_count,
+            ).where(UserPublicationCounter.user_id == user_id)
+        )
+    else:
+        result = await db_session.execute(
+            select(
+                ScholarPublicationCounter.total_count,
+                ScholarPublicationCounter.unread_count,
+                ScholarPublicationCounter.favorite_count,
+                ScholarPublicationCounter.favorite_unread_count,
+            )
+            .join(ScholarProfile, ScholarProfile.id == ScholarPublicationCounter.scholar_profile_id)
+            .where(
+                ScholarPublicationCounter.scholar_profile_id == scholar_profile_id,
+                ScholarProfile.user_id == user_id,
+            )
+        )
+    row = result.one_or_none()
+    if row is None:
+        return PublicationCounters()
+    return _counters_from_row(row)
+
+
+async def reconcile_publication_counters(db_session: AsyncSession, *, user_id: int) -> int:
+    """Recompute one user's counters from ``scholar_publications`` and return how many rows drifted.
+
+    Counter rows are locked (user first, then scholars, matching the trigger) before the
+    recount, so link changes that commit meanwhile apply their deltas on top of the result.
+    """
+    await db_session.execute(
+        pg_insert(UserPublicationCounter).values(user_id=user_id).on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    scholar_ids = list(
+        (
+            await db_session.execute(
+                select(ScholarProfile.id).where(ScholarProfile.user_id == user_id).order_by(ScholarProfile.id)
+            )
+        ).scalars()
+    )
+    if scholar_ids:
+        await db_session.execute(
+            pg_insert(ScholarPublicationCounter)
+            .values([{"scholar_profile_id": scholar_id} for scholar_id in scholar_ids])
+            .on_conflict_do_nothing(index_elements=["scholar_profile_id"])
+        )
+    stored_user = await db_session.get(UserPublicationCounter, user_id, with_for_update=True, populate_existing=True)
+    stored_scholars = (
+        (
+            await db_session.execute(
+                select(ScholarPublicationCounter)
+                .where(ScholarPublicationCounter.scholar_profile_id.in_(scholar_ids))
+                .order_by(ScholarPublicationCounter.scholar_profile_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    drifted = 0
+    if stored_user is not None and _apply_counts(stored_user, await _user_counts(db_session, user_id=user_id)):
+        drifted += 1
+    scholar_counts = await _scholar_counts(db_session, scholar_ids=scholar_ids)
+    for stored in stored_scholars:
+        if _apply_counts(stored, scholar_counts.get(stored.scholar_profile_id, PublicationCounters())):
+            drifted += 1
+    if drifted:
+        await db_session.flush()
+    return drifted
+
+
+async def reconcile_all_publication_counters(db_session: AsyncSession) -> int:
+    """Reconcile every user's counters, committing per user to keep row locks short."""
+    user_ids = list((await db_session.execute(select(User.id).order_by(User.id))).scalars())
+    drifted = 0
+    for user_id in user_ids:
+        drifted += await reconcile_publication_counters(db_session, user_id=user_id)
+        await db_session.commit()
+    return drifted
+
+
+async def _user_counts(db_session: AsyncSession, *, user_id: int) -> PublicationCounters:
+    publication_id = ScholarPublication.publication_id
+    result = await db_session.execute(
+        select(
+            func.count(distinct(publication_id)),
+            func.count(distinct(publication_id)).filter(ScholarPublication.is_read.is_(False)),
+            func.count(distinct(publication_id)).filter(ScholarPublication.is_favorite.is_(True)),
+            func.count(distinct(publication_id)).filter(
+                ScholarPublication.is_favorite.is_(True),
+                ScholarPublication.is_read.is_(False),
+            ),
+        )
+        .select_from(ScholarPublication)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .where(ScholarProfile.user_id == user_id)
+    )
+    return _counters_from_row(result.one())
+
+
+async def _scholar_counts(db_session: AsyncSession, *, scholar_ids: list[int]) -> dict[int, PublicationCounters]:
+    if not scholar_ids:
+        return {}
+    result = await db_session.execute(
+        select(
+            ScholarPublication.scholar_profile_id,
+            func.count(),
+            func.count().filter(ScholarPublication.is_read.is_(False)),
+            func.count().filter(ScholarPublication.is_favorite.is_(True)),
+            func.count().filter(
+                ScholarPublication.is_favorite.is_(True),
+                ScholarPublication.is_read.is_(False),
+            ),
+        )
+        .where(ScholarPublication.scholar_profile_id.in_(scholar_ids))
+        .group_by(ScholarPublication.scholar_profile_id)
+    )
+    return {int(row[0]): _counters_from_row(row[1:]) for row in result.all()}
+
+
+def _counters_from_row(row) -> PublicationCounters:
+    total_count, unread_count, favorite_count, favorite_unread_count = row
+    return PublicationCounters(
+        total_count=int(total_count or 0),
+        unread_count=int(unread_count or 0),
+        favorite_count=int(favorite_count or 0),
+        favorite_unread_count=int(favorite_unread_count or 0),
+    )
+
+
+def _apply_counts(stored: UserPublicationCounter | ScholarPublicationCounter, fresh: PublicationCounters) -> bool:
+    changed = False
+    for field in _COUNTER_FIELDS:
+        value = getattr(fresh, field)
+        if getattr(stored, field) != value:
+            setattr(stored, field, value)
+            changed = True
+    if changed:
+        stored.updated_at = func.now()
+    return changed
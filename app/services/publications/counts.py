@@ -13,6 +13,7 @@ from app.services.publications.modes import (
     resolve_publication_view_mode,
 )
 from app.services.publications.queries import get_latest_run_id_for_user
+from app.services.publications.search import publication_search_filter
 
 
 async def count_for_user(
@@ -54,13 +55,7 @@ async def count_for_user(
 def _apply_search_filter(stmt, *, search: str | None):
     if not search:
         return stmt
-    safe_search = search.replace("%", r"\%").replace("_", r"\_")
-    pattern = f"%{safe_search}%"
-    return stmt.where(
-        Publication.title_raw.ilike(pattern)
-        | ScholarProfile.display_name.ilike(pattern)
-        | Publication.venue_text.ilike(pattern)
-    )
+    return stmt.where(publication_search_filter(search))
 
 
 async def count_unread_for_user(
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+_TEXT_SORTS = {"title", "scholar"}
+_INT_SORTS = {"year", "citations", "pdf_status"}
+_DATETIME_SORTS = {"first_seen"}
+_FLOAT_SORTS = {"relevance"}
+_SORT_DIRECTIONS = {"asc", "desc"}
+
+
+class InvalidPublicationCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PublicationCursor:
+    """Keyset position after one row of the publications list.
+
+    ``sort_value`` is the row's value for ``sort_by``; ``publication_id`` and
+    ``scholar_profile_id`` break ties in the same order as the list query.
+    """
+
+    sort_by: str
+    sort_dir: str
+    sort_value: Any
+    publication_id: int
+    scholar_profile_id: int
+
+
+def encode_publication_cursor(cursor: PublicationCursor) -> str:
+    value = cursor.sort_value
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {
+        "s": cursor.sort_by,
+        "d": cursor.sort_dir,
+        "v": value,
+        "p": int(cursor.publication_id),
+        "sp": int(cursor.scholar_profile_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_publication_cursor(token: str, *, sort_by: str, sort_dir: str) -> PublicationCursor:
+    """Decode a cursor issued for the same ``sort_by``/``sort_dir``, or raise ``InvalidPublicationCursorError``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeEncodeError, binascii.Error, ValueError) as exc:
+        raise InvalidPublicationCursorError("Invalid publications cursor.") from exc
+    if not isinstance(payload, dict):
+        raise InvalidPublicationCursorError("Invalid publications cursor.")
+    if payload.get("s") != sort_by or payload.get("d") != sort_dir or sort_dir not in _SORT_DIRECTIONS:
+        raise InvalidPublicationCursorError("Publications cursor does not match the requested sort.")
+    publication_id = payload.get("p")
+    scholar_profile_id = payload.get("sp")
+    if not isinstance(publication_id, int) or not isinstance(scholar_profile_id, int):
+        raise InvalidPublicationCursorError("Invalid publications cursor.")
+    return PublicationCursor(
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        sort_value=_decoded_sort_value(sort_by, payload.get("v")),
+        publication_id=publication_id,
+        scholar_profile_id=scholar_profile_id,
+    )
+
+
+def _decoded_sort_value(sort_by: str, value: object) -> Any:
+    if value is None:
+        return None
+    if sort_by in _DATETIME_SORTS and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise InvalidPublicationCursorError("Invalid publications cursor.") from exc
+    if sort_by in _INT_SORTS and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if sort_by in _TEXT_SORTS and isinstance(value, str):
+        return value
+    if sort_by in _FLOAT_SORTS and isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    raise InvalidPublicationCursorError("Invalid publications cursor.")
@@ -2,20 +2,18 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from collections.abc import Iterable
+import math
+from collections.abc import Collection, Iterable, Iterator
 from dataclasses import dataclass
+from datetime import datetime
 
-from sqlalchemy import delete, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
-from app.db.models import Publication, PublicationIdentifier, ScholarPublication
-from app.logging_utils import structured_log
-from app.services.ingestion.fingerprints import (
-    canonical_title_text_for_dedup,
-    canonical_title_tokens_for_dedup,
-    normalize_title,
-)
+from app.db.models import Publication, PublicationIdentifier
+from app.services.publications import bulk_merge, near_dup_index
+from app.services.publications.dedup_titles import NearDuplicateCandidate, near_duplicate_candidate
 
 logger = logging.getLogger(__name__)
 
@@ -23,24 +21,8 @@ NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD = 0.78
 NEAR_DUP_DEFAULT_CONTAINMENT_THRESHOLD = 0.92
 NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS = 3
 NEAR_DUP_DEFAULT_MAX_YEAR_DELTA = 1
-NEAR_DUP_MIN_TOKEN_LENGTH = 3
 NEAR_DUP_CLUSTER_KEY_LENGTH = 16
-NEAR_DUP_STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "approach",
-    "for",
-    "in",
-    "method",
-    "of",
-    "on",
-    "the",
-    "to",
-    "using",
-    "via",
-    "with",
-}
+NEAR_DUP_FLOAT_TOLERANCE = 1e-9
 
 
 @dataclass(frozen=True)
@@ -59,33 +41,48 @@ class NearDuplicateCluster:
     members: tuple[NearDuplicateMember, ...]
 
 
-@dataclass(frozen=True)
-class _NearDuplicateCandidate:
-    publication_id: int
-    title: str
-    year: int | None
-    citation_count: int
-    canonical_text: str
-    tokens: frozenset[str]
-
-
 async def find_identifier_duplicate_pairs(
     db_session: AsyncSession,
+    *,
+    publication_ids: Collection[int] | None = None,
 ) -> list[tuple[int, int]]:
-    """Return (winner_id, dup_id) pairs where two publications share the same identifier."""
+    """Return (winner_id, dup_id) pairs where two publications share the same identifier.
+
+    With ``publication_ids`` only identifiers of those publications are probed, each
+    through ``ix_publication_identifiers_kind_value``, instead of self-joining the table.
+    """
     pi1 = aliased(PublicationIdentifier, name="pi1")
     pi2 = aliased(PublicationIdentifier, name="pi2")
+    if publication_ids is None:
+        rows = await db_session.execute(
+            select(pi1.publication_id, pi2.publication_id)
+            .join(
+                pi2,
+                (pi1.kind == pi2.kind)
+                & (pi1.value_normalized == pi2.value_normalized)
+                & (pi1.publication_id < pi2.publication_id),
+            )
+            .distinct()
+        )
+        return [(winner_id, dup_id) for winner_id, dup_id in rows]
+    scoped_ids = sorted({int(publication_id) for publication_id in publication_ids})
+    if not scoped_ids:
+        return []
     rows = await db_session.execute(
-        select(pi1.publication_id, pi2.publication_id)
+        select(
+            func.least(pi1.publication_id, pi2.publication_id),
+            func.greatest(pi1.publication_id, pi2.publication_id),
+        )
         .join(
             pi2,
             (pi1.kind == pi2.kind)
             & (pi1.value_normalized == pi2.value_normalized)
-            & (pi1.publication_id < pi2.publication_id),
+            & (pi1.publication_id != pi2.publication_id),
         )
+        .where(pi1.publication_id.in_(scoped_ids))
         .distinct()
     )
-    return [(winner_id, dup_id) for winner_id, dup_id in rows]
+    return [(int(winner_id), int(dup_id)) for winner_id, dup_id in rows]
 
 
 async def merge_duplicate_publication(
@@ -95,147 +92,50 @@ async def merge_duplicate_publication(
     dup_id: int,
 ) -> None:
     """Merge dup_id into winner_id: migrate metadata/links/identifiers, then delete dup."""
-    if winner_id == dup_id:
-        raise ValueError("winner_id and dup_id must differ.")
-    winner = await _load_publication(db_session, publication_id=winner_id)
-    dup = await _load_publication(db_session, publication_id=dup_id)
-    if winner is None or dup is None:
-        raise ValueError("winner_id and dup_id must both exist.")
-    _merge_publication_metadata(winner=winner, dup=dup)
-    await _migrate_scholar_links(db_session, winner_id=winner_id, dup_id=dup_id)
-    await _migrate_identifiers(db_session, winner_id=winner_id, dup_id=dup_id)
-    await db_session.execute(delete(Publication).where(Publication.id == dup_id))
-    structured_log(logger, "info", "publications.identifier_merge", winner_id=winner_id, dup_id=dup_id)
-
-
-async def _load_publication(
-    db_session: AsyncSession,
-    *,
-    publication_id: int,
-) -> Publication | None:
-    result = await db_session.execute(select(Publication).where(Publication.id == publication_id))
-    return result.scalar_one_or_none()
-
-
-def _merge_publication_metadata(*, winner: Publication, dup: Publication) -> None:
-    if winner.year is None and dup.year is not None:
-        winner.year = dup.year
-    winner.citation_count = max(int(winner.citation_count or 0), int(dup.citation_count or 0))
-    if not winner.author_text and dup.author_text:
-        winner.author_text = dup.author_text
-    if not winner.venue_text and dup.venue_text:
-        winner.venue_text = dup.venue_text
-    if not winner.pub_url and dup.pub_url:
-        winner.pub_url = dup.pub_url
-    if not winner.pdf_url and dup.pdf_url:
-        winner.pdf_url = dup.pdf_url
-    if not winner.cluster_id and dup.cluster_id:
-        winner.cluster_id = dup.cluster_id
-    if not winner.canonical_title_hash and dup.canonical_title_hash:
-        winner.canonical_title_hash = dup.canonical_title_hash
-    winner.title_raw = _preferred_title_text(winner=winner.title_raw, dup=dup.title_raw)
-    winner.title_normalized = normalize_title(winner.title_raw)
-
-
-def _preferred_title_text(*, winner: str, dup: str) -> str:
-    winner_score = len(canonical_title_text_for_dedup(winner))
-    dup_score = len(canonical_title_text_for_dedup(dup))
-    if dup_score > winner_score:
-        return dup
-    return winner
-
-
-async def _migrate_scholar_links(
-    db_session: AsyncSession,
-    *,
-    winner_id: int,
-    dup_id: int,
-) -> None:
-    """Move ScholarPublication links from dup to winner, dropping conflicts."""
-    dup_links_result = await db_session.execute(
-        select(ScholarPublication).where(ScholarPublication.publication_id == dup_id)
-    )
-    dup_links = dup_links_result.scalars().all()
-
-    winner_profiles_result = await db_session.execute(
-        select(ScholarPublication.scholar_profile_id).where(ScholarPublication.publication_id == winner_id)
-    )
-    winner_profiles: set[int] = {row for (row,) in winner_profiles_result}
-
-    for link in dup_links:
-        if link.scholar_profile_id in winner_profiles:
-            await db_session.delete(link)
-        else:
-            link.publication_id = winner_id
+    await merge_duplicate_publications(db_session, merges={dup_id: winner_id})
 
 
-async def _migrate_identifiers(
+async def merge_duplicate_publications(
     db_session: AsyncSession,
     *,
-    winner_id: int,
-    dup_id: int,
-) -> None:
-    result = await db_session.execute(
-        select(PublicationIdentifier).where(PublicationIdentifier.publication_id == dup_id)
-    )
-    dup_identifiers = result.scalars().all()
-    for identifier in dup_identifiers:
-        existing = await _find_identifier(
-            db_session,
-            publication_id=winner_id,
-            kind=identifier.kind,
-            value_normalized=identifier.value_normalized,
-        )
-        if existing is None:
-            identifier.publication_id = winner_id
-            continue
-        _merge_identifier(existing=existing, dup=identifier)
-        await db_session.delete(identifier)
+    merges: dict[int, int],
+) -> int:
+    """Merge each ``dup_id`` into its ``winner_id`` in one set-based pass; see ``bulk_merge.merge_publications``."""
+    return await bulk_merge.merge_publications(db_session, merges=merges)
 
 
-async def _find_identifier(
+async def sweep_identifier_duplicates(
     db_session: AsyncSession,
     *,
-    publication_id: int,
-    kind: str,
-    value_normalized: str,
-) -> PublicationIdentifier | None:
-    result = await db_session.execute(
-        select(PublicationIdentifier).where(
-            PublicationIdentifier.publication_id == publication_id,
-            PublicationIdentifier.kind == kind,
-            PublicationIdentifier.value_normalized == value_normalized,
-        )
-    )
-    return result.scalar_one_or_none()
-
-
-def _merge_identifier(*, existing: PublicationIdentifier, dup: PublicationIdentifier) -> None:
-    existing.confidence_score = max(
-        float(existing.confidence_score),
-        float(dup.confidence_score),
-    )
-    if not existing.evidence_url and dup.evidence_url:
-        existing.evidence_url = dup.evidence_url
-    if not existing.value_raw and dup.value_raw:
-        existing.value_raw = dup.value_raw
-
+    publication_ids: Collection[int] | None = None,
+) -> int:
+    """Find publications sharing an identifier and merge duplicates into the winner.
 
-async def sweep_identifier_duplicates(db_session: AsyncSession) -> int:
-    """Find publications sharing an identifier and merge duplicates into the winner."""
-    pairs = await find_identifier_duplicate_pairs(db_session)
+    ``publication_ids`` limits the sweep to identifiers of those publications; ``None``
+    sweeps the whole table.
+    """
+    pairs = await find_identifier_duplicate_pairs(db_session, publication_ids=publication_ids)
     if not pairs:
         return 0
+    merges = _identifier_merge_mapping(pairs)
+    merged = await merge_duplicate_publications(db_session, merges=merges)
+    await db_session.flush()
+    return merged
 
-    processed_dups: set[int] = set()
-    for winner_id, dup_id in pairs:
-        if dup_id in processed_dups:
-            continue
-        processed_dups.add(dup_id)
-        await merge_duplicate_publication(db_session, winner_id=winner_id, dup_id=dup_id)
 
-    await db_session.flush()
-    return len(processed_dups)
+def _identifier_merge_mapping(pairs: list[tuple[int, int]]) -> dict[int, int]:
+    # Publications linked through any chain of shared identifiers merge into the lowest id.
+    parent: dict[int, int] = {}
+    for winner_id, dup_id in pairs:
+        parent.setdefault(winner_id, winner_id)
+        parent.setdefault(dup_id, dup_id)
+        _union(parent, winner_id, dup_id)
+    mapping: dict[int, int] = {}
+    for publication_id in parent:
+        root = _find_root(parent, publication_id)
+        if root != publication_id:
+            mapping[publication_id] = root
+    return mapping
 
 
 async def find_near_duplicate_clusters(
@@ -244,8 +144,22 @@ async def find_near_duplicate_clusters(
     similarity_threshold: float = NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD,
     min_shared_tokens: int = NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS,
     max_year_delta: int = NEAR_DUP_DEFAULT_MAX_YEAR_DELTA,
+    changed_since: datetime | None = None,
 ) -> list[NearDuplicateCluster]:
-    candidates = await _load_near_duplicate_candidates(db_session)
+    """Cluster near-duplicate titles, optionally only around publications changed since ``changed_since``.
+
+    With ``changed_since`` set, only publications (re)indexed after it and the
+    publications sharing a title token with them are compared, and only groups
+    containing a changed publication are returned.
+    """
+    await near_dup_index.refresh_title_token_index(db_session)
+    changed_ids: set[int] | None = None
+    if changed_since is None:
+        candidates = await _load_near_duplicate_candidates(db_session)
+    else:
+        candidates, changed_ids = await near_dup_index.load_changed_neighbourhood(
+            db_session, changed_since=changed_since
+        )
     if len(candidates) < 2:
         return []
     groups = _cluster_candidate_groups(
@@ -254,27 +168,27 @@ async def find_near_duplicate_clusters(
         min_shared_tokens=min_shared_tokens,
         max_year_delta=max_year_delta,
     )
+    if changed_ids is not None:
+        groups = [group for group in groups if any(member.publication_id in changed_ids for member in group)]
     clusters = [_near_duplicate_cluster(group) for group in groups]
     return sorted(clusters, key=lambda item: (-len(item.members), item.winner_publication_id))
 
 
-async def merge_near_duplicate_cluster(
+async def merge_near_duplicate_clusters(
     db_session: AsyncSession,
     *,
-    cluster: NearDuplicateCluster,
+    clusters: Iterable[NearDuplicateCluster],
 ) -> int:
-    winner_id = int(cluster.winner_publication_id)
-    merged = 0
-    for member in cluster.members:
-        if int(member.publication_id) == winner_id:
-            continue
-        await merge_duplicate_publication(
-            db_session,
-            winner_id=winner_id,
-            dup_id=int(member.publication_id),
-        )
-        merged += 1
-    return merged
+    """Merge every non-winner member of ``clusters`` into its cluster winner in one pass."""
+    merges: dict[int, int] = {}
+    for cluster in clusters:
+        winner_id = int(cluster.winner_publication_id)
+        for member in cluster.members:
+            if int(member.publication_id) != winner_id:
+                merges[int(member.publication_id)] = winner_id
+    if not merges:
+        return 0
+    return await merge_duplicate_publications(db_session, merges=merges)
 
 
 def near_duplicate_cluster_payload(cluster: NearDuplicateCluster) -> dict[str, object]:
@@ -298,7 +212,7 @@ def near_duplicate_cluster_payload(cluster: NearDuplicateCluster) -> dict[str, o
 
 async def _load_near_duplicate_candidates(
     db_session: AsyncSession,
-) -> list[_NearDuplicateCandidate]:
+) -> list[NearDuplicateCandidate]:
     result = await db_session.execute(
         select(
             Publication.id,
@@ -308,7 +222,7 @@ async def _load_near_duplicate_candidates(
         )
     )
     records = [
-        _candidate_from_row(
+        near_duplicate_candidate(
             publication_id=int(publication_id),
             title=str(title_raw or ""),
             year=year,
@@ -319,61 +233,97 @@ async def _load_near_duplicate_candidates(
     return [record for record in records if record is not None]
 
 
-def _candidate_from_row(
-    *,
-    publication_id: int,
-    title: str,
-    year: int | None,
-    citation_count: int,
-) -> _NearDuplicateCandidate | None:
-    canonical = canonical_title_text_for_dedup(title)
-    raw_tokens = canonical_title_tokens_for_dedup(title)
-    tokens = _normalized_tokens(raw_tokens)
-    if not canonical or not tokens:
-        return None
-    return _NearDuplicateCandidate(
-        publication_id=publication_id,
-        title=title,
-        year=year,
-        citation_count=citation_count,
-        canonical_text=canonical,
-        tokens=frozenset(tokens),
-    )
-
-
-def _normalized_tokens(tokens: Iterable[str]) -> set[str]:
-    return {token for token in tokens if len(token) >= NEAR_DUP_MIN_TOKEN_LENGTH and token not in NEAR_DUP_STOPWORDS}
-
-
 def _cluster_candidate_groups(
-    candidates: list[_NearDuplicateCandidate],
+    candidates: list[NearDuplicateCandidate],
     *,
     similarity_threshold: float,
     min_shared_tokens: int,
     max_year_delta: int,
-) -> list[list[_NearDuplicateCandidate]]:
-    by_id = {candidate.publication_id: candidate for candidate in candidates}
-    token_index = _candidate_token_index(candidates)
+) -> list[list[NearDuplicateCandidate]]:
     parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
-    for candidate in candidates:
-        peers = _candidate_peer_ids(candidate=candidate, token_index=token_index)
-        for peer_id in sorted(peers):
-            if peer_id <= candidate.publication_id:
-                continue
-            peer = by_id[peer_id]
-            if _is_near_duplicate_pair(
-                candidate,
-                peer,
-                similarity_threshold=similarity_threshold,
-                min_shared_tokens=min_shared_tokens,
-                max_year_delta=max_year_delta,
-            ):
-                _union(parent, candidate.publication_id, peer_id)
+    for left, right in _candidate_pairs(
+        candidates,
+        similarity_threshold=similarity_threshold,
+        min_shared_tokens=min_shared_tokens,
+    ):
+        if _is_near_duplicate_pair(
+            left,
+            right,
+            similarity_threshold=similarity_threshold,
+            min_shared_tokens=min_shared_tokens,
+            max_year_delta=max_year_delta,
+        ):
+            _union(parent, left.publication_id, right.publication_id)
     return _grouped_candidates(candidates, parent)
 
 
+def _candidate_pairs(
+    candidates: list[NearDuplicateCandidate],
+    *,
+    similarity_threshold: float,
+    min_shared_tokens: int,
+) -> Iterator[tuple[NearDuplicateCandidate, NearDuplicateCandidate]]:
+    """Yield every pair that can pass ``_is_near_duplicate_pair``, using prefix and length filtering.
+
+    Each pair is generated from its shorter member (ties by id). A pair passes
+    only if it shares at least ``_required_overlap`` tokens of that member, so
+    one of them lies in its rarest-first prefix. Prefix tokens inside the
+    containment prefix accept peers of any greater length; the remaining
+    prefix tokens can only match through Jaccard, which caps peer length at
+    ``len / similarity_threshold``. Identical canonical titles always pair.
+    """
+    yield from _canonical_text_pairs(candidates)
+    ordered = sorted(candidates, key=_size_order_key)
+    postings = _candidate_token_index(ordered)
+    rank = {token: (len(members), token) for token, members in postings.items()}
+    positions = {candidate.publication_id: index for index, candidate in enumerate(ordered)}
+    for index, candidate in enumerate(ordered):
+        size = len(candidate.tokens)
+        jaccard_prefix = size - _required_overlap(size, similarity_threshold, min_shared_tokens) + 1
+        containment_prefix = (
+            size - _required_overlap(size, NEAR_DUP_DEFAULT_CONTAINMENT_THRESHOLD, min_shared_tokens) + 1
+        )
+        prefix_length = max(jaccard_prefix, containment_prefix)
+        if prefix_length <= 0:
+            continue
+        max_jaccard_size = size / similarity_threshold if similarity_threshold > 0 else float("inf")
+        prefix = sorted(candidate.tokens, key=rank.__getitem__)[:prefix_length]
+        seen: set[int] = set()
+        for position, token in enumerate(prefix):
+            jaccard_only = position >= containment_prefix
+            for peer_id in postings[token]:
+                peer_index = positions[peer_id]
+                if peer_index <= index or peer_id in seen:
+                    continue
+                peer = ordered[peer_index]
+                if jaccard_only and len(peer.tokens) > max_jaccard_size + NEAR_DUP_FLOAT_TOLERANCE:
+                    continue
+                seen.add(peer_id)
+                yield candidate, peer
+
+
+def _canonical_text_pairs(
+    candidates: list[NearDuplicateCandidate],
+) -> Iterator[tuple[NearDuplicateCandidate, NearDuplicateCandidate]]:
+    by_text: dict[str, NearDuplicateCandidate] = {}
+    for candidate in candidates:
+        first = by_text.setdefault(candidate.canonical_text, candidate)
+        if first is not candidate:
+            yield first, candidate
+
+
+def _size_order_key(candidate: NearDuplicateCandidate) -> tuple[int, int]:
+    return len(candidate.tokens), candidate.publication_id
+
+
+def _required_overlap(size: int, threshold: float, min_shared_tokens: int) -> int:
+    # Lower bound on shared tokens for a pair whose shorter member has ``size`` tokens.
+    scaled = math.ceil(size * threshold - NEAR_DUP_FLOAT_TOLERANCE)
+    return max(int(min_shared_tokens), scaled, 1)
+
+
 def _candidate_token_index(
-    candidates: list[_NearDuplicateCandidate],
+    candidates: list[NearDuplicateCandidate],
 ) -> dict[str, set[int]]:
     index: dict[str, set[int]] = {}
     for candidate in candidates:
@@ -382,21 +332,9 @@ def _candidate_token_index(
     return index
 
 
-def _candidate_peer_ids(
-    *,
-    candidate: _NearDuplicateCandidate,
-    token_index: dict[str, set[int]],
-) -> set[int]:
-    peers: set[int] = set()
-    for token in candidate.tokens:
-        peers.update(token_index.get(token, set()))
-    peers.discard(candidate.publication_id)
-    return peers
-
-
 def _is_near_duplicate_pair(
-    left: _NearDuplicateCandidate,
-    right: _NearDuplicateCandidate,
+    left: NearDuplicateCandidate,
+    right: NearDuplicateCandidate,
     *,
     similarity_threshold: float,
     min_shared_tokens: int,
@@ -449,10 +387,10 @@ def _union(parent: dict[int, int], left: int, right: int) -> None:
 
 
 def _grouped_candidates(
-    candidates: list[_NearDuplicateCandidate],
+    candidates: list[NearDuplicateCandidate],
     parent: dict[int, int],
-) -> list[list[_NearDuplicateCandidate]]:
-    groups: dict[int, list[_NearDuplicateCandidate]] = {}
+) -> list[list[NearDuplicateCandidate]]:
+    groups: dict[int, list[NearDuplicateCandidate]] = {}
     for candidate in candidates:
         root = _find_root(parent, candidate.publication_id)
         groups.setdefault(root, []).append(candidate)
@@ -462,7 +400,7 @@ def _grouped_candidates(
     return clustered
 
 
-def _near_duplicate_cluster(members: list[_NearDuplicateCandidate]) -> NearDuplicateCluster:
+def _near_duplicate_cluster(members: list[NearDuplicateCandidate]) -> NearDuplicateCluster:
     winner = _winner_candidate(members)
     member_ids = [member.publication_id for member in members]
     joined = ",".join(str(publication_id) for publication_id in member_ids)
@@ -484,14 +422,14 @@ def _near_duplicate_cluster(members: list[_NearDuplicateCandidate]) -> NearDupli
     )
 
 
-def _winner_candidate(members: list[_NearDuplicateCandidate]) -> _NearDuplicateCandidate:
+def _winner_candidate(members: list[NearDuplicateCandidate]) -> NearDuplicateCandidate:
     return min(
         members,
         key=lambda member: (-int(member.citation_count), member.publication_id),
     )
 
 
-def _cluster_similarity_score(members: list[_NearDuplicateCandidate]) -> float:
+def _cluster_similarity_score(members: list[NearDuplicateCandidate]) -> float:
     best = 0.0
     for index, left in enumerate(members):
         for right in members[index + 1 :]:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.services.ingestion.fingerprints import (
+    canonical_title_text_for_dedup,
+    canonical_title_tokens_for_dedup,
+)
+
+NEAR_DUP_MIN_TOKEN_LENGTH = 3
+NEAR_DUP_STOPWORDS = {
+    "a",
+    "an",
+    "and",
+    "approach",
+    "for",
+    "in",
+    "method",
+    "of",
+    "on",
+    "the",
+    "to",
+    "using",
+    "via",
+    "with",
+}
+
+
+@dataclass(frozen=True)
+class NearDuplicateCandidate:
+    publication_id: int
+    title: str
+    year: int | None
+    citation_count: int
+    canonical_text: str
+    tokens: frozenset[str]
+
+
+def near_duplicate_candidate(
+    *,
+    publication_id: int,
+    title: str,
+    year: int | None,
+    citation_count: int,
+) -> NearDuplicateCandidate | None:
+    """Build the canonical text and token set the near-duplicate search and its index compare on."""
+    canonical = canonical_title_text_for_dedup(title)
+    tokens = _normalized_tokens(canonical_title_tokens_for_dedup(title))
+    if not canonical or not tokens:
+        return None
+    return NearDuplicateCandidate(
+        publication_id=publication_id,
+        title=title,
+        year=year,
+        citation_count=citation_count,
+        canonical_text=canonical,
+        tokens=frozenset(tokens),
+    )
+
+
+def preferred_title_text(*, winner: str, dup: str) -> str:
+    """Keep the winner's title unless the duplicate's canonical title is longer."""
+    winner_score = len(canonical_title_text_for_dedup(winner))
+    dup_score = len(canonical_title_text_for_dedup(dup))
+    if dup_score > winner_score:
+        return dup
+    return winner
+
+
+def _normalized_tokens(tokens: Iterable[str]) -> set[str]:
+    return {token for token in tokens if len(token) >= NEAR_DUP_MIN_TOKEN_LENGTH and token not in NEAR_DUP_STOPWORDS}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.publication_identifiers import application as identifier_service
+from app.services.publications.cursors import PublicationCursor, encode_publication_cursor
 from app.services.publications.modes import (
     MODE_ALL,
     MODE_UNREAD,
@@ -17,7 +18,7 @@ from app.services.publications.queries import (
     publications_query,
     unread_item_from_row,
 )
-from app.services.publications.types import PublicationListItem, UnreadPublicationItem
+from app.services.publications.types import PublicationListItem, PublicationListPage, UnreadPublicationItem
 
 
 async def list_for_user(
@@ -34,8 +35,41 @@ async def list_for_user(
     offset: int = 0,
     snapshot_before: datetime | None = None,
 ) -> list[PublicationListItem]:
+    page = await list_page_for_user(
+        db_session,
+        user_id=user_id,
+        mode=mode,
+        scholar_profile_id=scholar_profile_id,
+        favorite_only=favorite_only,
+        search=search,
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        limit=limit,
+        offset=offset,
+        snapshot_before=snapshot_before,
+    )
+    return page.items
+
+
+async def list_page_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    mode: str = MODE_ALL,
+    scholar_profile_id: int | None = None,
+    favorite_only: bool = False,
+    search: str | None = None,
+    sort_by: str = "first_seen",
+    sort_dir: str = "desc",
+    limit: int = 100,
+    offset: int = 0,
+    snapshot_before: datetime | None = None,
+    cursor: PublicationCursor | None = None,
+) -> PublicationListPage:
+    """List one page of publications; ``next_cursor`` continues after its last row when more rows exist."""
     resolved_mode = resolve_publication_view_mode(mode)
     latest_run_id = await get_latest_run_id_for_user(db_session, user_id=user_id)
+    bounded_limit = max(int(limit), 1)
     result = await db_session.execute(
         publications_query(
             user_id=user_id,
@@ -46,15 +80,30 @@ async def list_for_user(
             search=search,
             sort_by=sort_by,
             sort_dir=sort_dir,
-            limit=limit,
+            limit=bounded_limit + 1,
             offset=offset,
             snapshot_before=snapshot_before,
+            cursor=cursor,
         )
     )
-    rows = [publication_list_item_from_row(row, latest_run_id=latest_run_id) for row in result.all()]
-    return await identifier_service.overlay_publication_items_with_display_identifiers(
-        db_session,
-        items=rows,
+    rows = result.all()
+    page_rows = rows[:bounded_limit]
+    next_cursor = None
+    if len(rows) > bounded_limit and page_rows:
+        next_cursor = _next_cursor(page_rows[-1], sort_by=sort_by, sort_dir=sort_dir)
+    items = [publication_list_item_from_row(row, latest_run_id=latest_run_id) for row in page_rows]
+    return PublicationListPage(items=items, next_cursor=next_cursor)
+
+
+def _next_cursor(row: Any, *, sort_by: str, sort_dir: str) -> str:
+    return encode_publication_cursor(
+        PublicationCursor(
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            sort_value=row.sort_value,
+            publication_id=int(row[0]),
+            scholar_profile_id=int(row[1]),
+        )
     )
 
 
@@ -65,19 +114,12 @@ async def retry_pdf_for_user(
     scholar_profile_id: int,
     publication_id: int,
 ) -> PublicationListItem | None:
-    item = await get_publication_item_for_user(
+    return await get_publication_item_for_user(
         db_session,
         user_id=user_id,
         scholar_profile_id=scholar_profile_id,
         publication_id=publication_id,
     )
-    if item is None:
-        return None
-    hydrated = await identifier_service.overlay_publication_items_with_display_identifiers(
-        db_session,
-        items=[item],
-    )
-    return hydrated[0] if hydrated else item
 
 
 async def list_unread_for_user(
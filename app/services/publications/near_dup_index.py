@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Publication, PublicationTitleToken
+from app.services.publications.dedup_titles import NearDuplicateCandidate, near_duplicate_candidate
+
+NEAR_DUP_INDEX_BATCH_SIZE = 1000
+NEAR_DUP_TOKEN_MAX_LENGTH = 128
+
+
+async def refresh_title_token_index(
+    db_session: AsyncSession,
+    *,
+    batch_size: int = NEAR_DUP_INDEX_BATCH_SIZE,
+) -> int:
+    """Rebuild token postings for publications created or retitled since they were last indexed."""
+    bounded_batch = max(int(batch_size), 1)
+    refreshed = 0
+    while True:
+        result = await db_session.execute(
+            select(Publication.id, Publication.title_raw)
+            .where(Publication.near_dup_indexed_at.is_(None))
+            .order_by(Publication.id)
+            .limit(bounded_batch)
+        )
+        rows = [(int(publication_id), str(title_raw or "")) for publication_id, title_raw in result.all()]
+        if not rows:
+            return refreshed
+        await _replace_postings(db_session, rows=rows)
+        refreshed += len(rows)
+        if len(rows) < bounded_batch:
+            return refreshed
+
+
+async def mark_for_reindex(db_session: AsyncSession, *, publication_ids: Iterable[int]) -> int:
+    """Clear ``near_dup_indexed_at`` so the next sweep re-indexes these publications and treats them as changed."""
+    scoped_ids = sorted({int(publication_id) for publication_id in publication_ids})
+    if not scoped_ids:
+        return 0
+    await db_session.execute(
+        update(Publication)
+        .where(Publication.id.in_(scoped_ids))
+        .values(near_dup_indexed_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    return len(scoped_ids)
+
+
+async def load_changed_neighbourhood(
+    db_session: AsyncSession,
+    *,
+    changed_since: datetime,
+) -> tuple[list[NearDuplicateCandidate], set[int]]:
+    """Load publications indexed after ``changed_since`` plus every publication sharing a token with them.
+
+    Returns the candidates and the ids of the changed publications among them.
+    """
+    changed_ids_query = select(Publication.id).where(Publication.near_dup_indexed_at > changed_since)
+    changed_tokens = (
+        select(PublicationTitleToken.token)
+        .where(PublicationTitleToken.publication_id.in_(changed_ids_query))
+        .distinct()
+        .scalar_subquery()
+    )
+    neighbour_ids = select(PublicationTitleToken.publication_id).where(PublicationTitleToken.token.in_(changed_tokens))
+    result = await db_session.execute(
+        select(
+            Publication.id,
+            Publication.title_raw,
+            Publication.year,
+            Publication.citation_count,
+            Publication.near_dup_indexed_at,
+        ).where(Publication.id.in_(neighbour_ids))
+    )
+    candidates: list[NearDuplicateCandidate] = []
+    changed_ids: set[int] = set()
+    for publication_id, title_raw, year, citation_count, indexed_at in result.all():
+        candidate = near_duplicate_candidate(
+            publication_id=int(publication_id),
+            title=str(title_raw or ""),
+            year=year,
+            citation_count=int(citation_count or 0),
+        )
+        if candidate is None:
+            continue
+        candidates.append(candidate)
+        if indexed_at is not None and indexed_at > changed_since:
+            changed_ids.add(candidate.publication_id)
+    candidates.sort(key=lambda item: item.publication_id)
+    return candidates, changed_ids
+
+
+async def _replace_postings(db_session: AsyncSession, *, rows: list[tuple[int, str]]) -> None:
+    publication_ids = [publication_id for publication_id, _ in rows]
+    await db_session.execute(
+        delete(PublicationTitleToken).where(PublicationTitleToken.publication_id.in_(publication_ids))
+    )
+    postings = [
+        {"publication_id": publication_id, "token": token}
+        for publication_id, title in rows
+        for token in sorted(_index_tokens(publication_id=publication_id, title=title))
+    ]
+    if postings:
+        await db_session.execute(insert(PublicationTitleToken), postings)
+    await db_session.execute(
+        update(Publication)
+        .where(Publication.id.in_(publication_ids))
+        .values(near_dup_indexed_at=datetime.now(UTC))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _index_tokens(*, publication_id: int, title: str) -> frozenset[str]:
+    candidate = near_duplicate_candidate(publication_id=publication_id, title=title, year=None, citation_count=0)
+    if candidate is None:
+        return frozenset()
+    return frozenset(token for token in candidate.tokens if len(token) <= NEAR_DUP_TOKEN_MAX_LENGTH)
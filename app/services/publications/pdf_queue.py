@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import (
+    Publication,
     PublicationPdfJob,
+    ScholarProfile,
+    ScholarPublication,
     User,
 )
 from app.services.publications.pdf_queue_common import (
@@ -231,6 +234,43 @@ async def _enqueue_rows(
 # ---------------------------------------------------------------------------
 
 
+async def count_auto_retry_due_pdf_jobs_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+) -> int:
+    """Count the user's failed PDF jobs whose auto-retry interval has passed.
+
+    Retries become due with time alone, without a data version bump, so list ETags
+    include this count to let a due retry reach the enqueue step on the next poll.
+    """
+    now = utcnow()
+    first_retry_cutoff = now - timedelta(seconds=_auto_retry_first_interval_seconds())
+    retry_cutoff = now - timedelta(seconds=_auto_retry_interval_seconds())
+    user_publication_ids = (
+        select(ScholarPublication.publication_id)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .where(ScholarProfile.user_id == user_id)
+    )
+    result = await db_session.execute(
+        select(func.count())
+        .select_from(PublicationPdfJob)
+        .join(Publication, Publication.id == PublicationPdfJob.publication_id)
+        .where(
+            PublicationPdfJob.publication_id.in_(user_publication_ids),
+            PublicationPdfJob.status == PDF_STATUS_FAILED,
+            PublicationPdfJob.attempt_count < _auto_retry_max_attempts(),
+            Publication.pdf_url.is_(None),
+            or_(
+                PublicationPdfJob.last_attempt_at.is_(None),
+                and_(PublicationPdfJob.attempt_count <= 1, PublicationPdfJob.last_attempt_at <= first_retry_cutoff),
+                and_(PublicationPdfJob.attempt_count > 1, PublicationPdfJob.last_attempt_at <= retry_cutoff),
+            ),
+        )
+    )
+    return int(result.scalar_one())
+
+
 async def enqueue_missing_pdf_jobs(
     db_session: AsyncSession,
     *,
@@ -165,6 +165,9 @@ def _tracked_queue_select_base(*, status: str | None) -> Select[tuple]:
             PublicationPdfJob.last_attempt_at,
             PublicationPdfJob.resolved_at,
             PublicationPdfJob.updated_at,
+            Publication.display_identifier_kind,
+            Publication.display_identifier_value,
+            Publication.display_identifier_confidence,
         )
         .join(Publication, Publication.id == PublicationPdfJob.publication_id)
         .outerjoin(User, User.id == PublicationPdfJob.last_requested_by_user_id)
@@ -200,6 +203,9 @@ def _untracked_queue_select_base() -> Select[tuple]:
             literal(None),
             literal(None),
             Publication.updated_at,
+            Publication.display_identifier_kind,
+            Publication.display_identifier_value,
+            Publication.display_identifier_confidence,
         )
         .outerjoin(PublicationPdfJob, PublicationPdfJob.publication_id == Publication.id)
         .where(Publication.pdf_url.is_(None))
@@ -286,18 +292,12 @@ def _queue_item_from_row(row: Any) -> PdfQueueListItem:
         last_attempt_at=row[11],
         resolved_at=row[12],
         updated_at=row[13],
-    )
-
-
-async def _hydrated_queue_items(
-    db_session: AsyncSession,
-    *,
-    rows: list[Any],
-) -> list[PdfQueueListItem]:
-    items = [_queue_item_from_row(row) for row in rows]
-    return await identifier_service.overlay_pdf_queue_items_with_display_identifiers(
-        db_session,
-        items=items,
+        display_identifier=identifier_service.display_identifier_from_stored(
+            kind=row[14],
+            value=row[15],
+            confidence_score=row[16],
+            pdf_url=row[2],
+        ),
     )
 
 
@@ -331,7 +331,7 @@ async def list_pdf_queue_items(
                 offset=bounded_offset,
             )
         )
-        return await _hydrated_queue_items(db_session, rows=list(result.all()))
+        return [_queue_item_from_row(row) for row in result.all()]
     if normalized_status is None:
         result = await db_session.execute(
             _all_queue_select(
@@ -339,7 +339,7 @@ async def list_pdf_queue_items(
                 offset=bounded_offset,
             )
         )
-        return await _hydrated_queue_items(db_session, rows=list(result.all()))
+        return [_queue_item_from_row(row) for row in result.all()]
     result = await db_session.execute(
         _tracked_queue_select(
             limit=bounded_limit,
@@ -347,7 +347,7 @@ async def list_pdf_queue_items(
             status=normalized_status,
         )
     )
-    return await _hydrated_queue_items(db_session, rows=list(result.all()))
+    return [_queue_item_from_row(row) for row in result.all()]
 
 
 async def count_pdf_queue_items(
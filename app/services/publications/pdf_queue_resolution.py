@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
+
+from sqlalchemy import select
 
 from app.db.background_session import background_session
 from app.db.models import Publication, PublicationPdfJob
@@ -10,10 +12,10 @@ from app.logging_utils import structured_log
 from app.services.publication_identifiers import application as identifier_service
 from app.services.publications.pdf_queue_common import (
     PDF_STATUS_FAILED,
+    PDF_STATUS_QUEUED,
     PDF_STATUS_RESOLVED,
     PDF_STATUS_RUNNING,
     event_row,
-    queued_job,
     utcnow,
 )
 from app.services.publications.pdf_resolution_pipeline import (
@@ -30,44 +32,90 @@ PDF_EVENT_ATTEMPT_STARTED = "attempt_started"
 PDF_EVENT_RESOLVED = "resolved"
 PDF_EVENT_FAILED = "failed"
 
-_BUDGET_COOLDOWN_MINUTES = 15
-
 logger = logging.getLogger(__name__)
 _scheduled_tasks: set[asyncio.Task[None]] = set()
-_budget_cooldown_until: datetime | None = None
 
 
-def is_budget_cooldown_active() -> bool:
-    return _budget_cooldown_until is not None and datetime.now(UTC) < _budget_cooldown_until
+@dataclass
+class _ResolutionBatch:
+    """Rows of one scheduled resolution task; workers claim their queue jobs in chunks."""
 
+    rows_by_id: dict[int, PublicationListItem]
+    arxiv_lookup_allowed: bool = True
+    budget_exhausted: bool = False
 
-def _enter_budget_cooldown() -> None:
-    global _budget_cooldown_until
-    _budget_cooldown_until = datetime.now(UTC) + timedelta(minutes=_BUDGET_COOLDOWN_MINUTES)
+    def pending_ids(self) -> list[int]:
+        return sorted(self.rows_by_id)
 
+    def take(self, publication_ids: list[int]) -> list[PublicationListItem]:
+        return [self.rows_by_id.pop(publication_id) for publication_id in publication_ids]
 
-async def _mark_attempt_started(
+    def disable_arxiv(self) -> None:
+        if not self.arxiv_lookup_allowed:
+            return
+        self.arxiv_lookup_allowed = False
+        structured_log(
+            logger,
+            "warning",
+            "pdf_queue.arxiv_batch_disabled",
+            detail="arXiv temporarily disabled for remaining batch after rate limit",
+        )
+
+    def stop_for_budget(self) -> None:
+        if self.budget_exhausted:
+            return
+        self.budget_exhausted = True
+        structured_log(
+            logger,
+            "warning",
+            "pdf_queue.budget_exhausted",
+            detail="Stopping PDF resolution batch — OpenAlex daily budget exhausted",
+        )
+
+
+async def _jobs_by_publication_id(db_session, publication_ids: list[int]) -> dict[int, PublicationPdfJob]:
+    result = await db_session.execute(
+        select(PublicationPdfJob).where(PublicationPdfJob.publication_id.in_(publication_ids))
+    )
+    return {job.publication_id: job for job in result.scalars()}
+
+
+async def _claim_queued_jobs(
     *,
-    publication_id: int,
+    publication_ids: list[int],
     user_id: int,
-) -> None:
+    limit: int,
+) -> list[int]:
+    """Move up to ``limit`` queued jobs to running, skipping rows another worker has locked."""
+    if not publication_ids:
+        return []
     async with background_session() as db_session:
-        job = await db_session.get(PublicationPdfJob, publication_id)
-        if job is None:
-            job = queued_job(publication_id=publication_id, user_id=user_id)
-            db_session.add(job)
-        job.status = PDF_STATUS_RUNNING
-        job.last_attempt_at = utcnow()
-        job.attempt_count = int(job.attempt_count or 0) + 1
-        db_session.add(
-            event_row(
-                publication_id=publication_id,
-                user_id=user_id,
-                event_type=PDF_EVENT_ATTEMPT_STARTED,
-                status=PDF_STATUS_RUNNING,
+        result = await db_session.execute(
+            select(PublicationPdfJob)
+            .where(
+                PublicationPdfJob.publication_id.in_(publication_ids),
+                PublicationPdfJob.status == PDF_STATUS_QUEUED,
             )
+            .order_by(PublicationPdfJob.queued_at.asc(), PublicationPdfJob.publication_id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
+        jobs = list(result.scalars())
+        now = utcnow()
+        for job in jobs:
+            job.status = PDF_STATUS_RUNNING
+            job.last_attempt_at = now
+            job.attempt_count = int(job.attempt_count or 0) + 1
+            db_session.add(
+                event_row(
+                    publication_id=job.publication_id,
+                    user_id=user_id,
+                    event_type=PDF_EVENT_ATTEMPT_STARTED,
+                    status=PDF_STATUS_RUNNING,
+                )
+            )
         await db_session.commit()
+    return [int(job.publication_id) for job in jobs]
 
 
 def _failed_outcome(
@@ -131,63 +179,85 @@ def _result_event(outcome: OaResolutionOutcome) -> tuple[str, str]:
     return PDF_EVENT_FAILED, PDF_STATUS_FAILED
 
 
-async def _persist_outcome(
+async def _persist_outcomes(
     *,
-    publication_id: int,
     user_id: int,
-    outcome: OaResolutionOutcome,
+    outcomes: list[OaResolutionOutcome],
 ) -> None:
+    if not outcomes:
+        return
+    publication_ids = [outcome.publication_id for outcome in outcomes]
     async with background_session() as db_session:
-        publication = await db_session.get(Publication, publication_id)
-        job = await db_session.get(PublicationPdfJob, publication_id)
-        if publication is None or job is None:
-            return
-        _apply_publication_update(publication, pdf_url=outcome.pdf_url)
-        await identifier_service.sync_identifiers_for_publication_resolution(
-            db_session,
-            publication=publication,
-            source=outcome.source,
-        )
-        _apply_job_outcome(job, outcome=outcome)
-        event_type, status = _result_event(outcome)
-        db_session.add(
-            event_row(
-                publication_id=publication_id,
-                user_id=user_id,
-                event_type=event_type,
-                status=status,
+        result = await db_session.execute(select(Publication).where(Publication.id.in_(publication_ids)))
+        publications = {publication.id: publication for publication in result.scalars()}
+        jobs = await _jobs_by_publication_id(db_session, publication_ids)
+        for outcome in outcomes:
+            publication = publications.get(outcome.publication_id)
+            job = jobs.get(outcome.publication_id)
+            if publication is None or job is None:
+                continue
+            _apply_publication_update(publication, pdf_url=outcome.pdf_url)
+            await identifier_service.sync_identifiers_for_publication_resolution(
+                db_session,
+                publication=publication,
                 source=outcome.source,
-                failure_reason=outcome.failure_reason,
-                message=outcome.failure_reason,
             )
-        )
+            _apply_job_outcome(job, outcome=outcome)
+            event_type, status = _result_event(outcome)
+            db_session.add(
+                event_row(
+                    publication_id=outcome.publication_id,
+                    user_id=user_id,
+                    event_type=event_type,
+                    status=status,
+                    source=outcome.source,
+                    failure_reason=outcome.failure_reason,
+                    message=outcome.failure_reason,
+                )
+            )
         await db_session.commit()
 
 
-async def _resolve_publication_row(
+async def _persist_outcomes_safely(
     *,
     user_id: int,
+    outcomes: list[OaResolutionOutcome],
+) -> None:
+    try:
+        await _persist_outcomes(user_id=user_id, outcomes=outcomes)
+        return
+    except Exception:
+        structured_log(logger, "exception", "pdf_queue.persist_batch_failed", outcome_count=len(outcomes))
+    # Retry row by row so one bad row does not leave the whole chunk stuck in "running".
+    for outcome in outcomes:
+        try:
+            await _persist_outcomes(user_id=user_id, outcomes=[outcome])
+        except Exception:
+            structured_log(
+                logger,
+                "exception",
+                "pdf_queue.row_fail_persist_error",
+                publication_id=outcome.publication_id,
+            )
+
+
+async def _resolve_publication_row(
+    *,
     request_email: str | None,
     row: PublicationListItem,
     openalex_api_key: str | None = None,
     allow_arxiv_lookup: bool = True,
-) -> bool:
+) -> tuple[OaResolutionOutcome, bool]:
     from app.services.openalex.client import OpenAlexBudgetExhaustedError
 
-    await _mark_attempt_started(publication_id=row.publication_id, user_id=user_id)
     try:
-        outcome, arxiv_rate_limited = await _fetch_outcome_for_row(
+        return await _fetch_outcome_for_row(
             row=row,
             request_email=request_email,
             openalex_api_key=openalex_api_key,
             allow_arxiv_lookup=allow_arxiv_lookup,
         )
     except OpenAlexBudgetExhaustedError:
-        await _persist_outcome(
-            publication_id=row.publication_id,
-            user_id=user_id,
-            outcome=_failed_outcome(row=row),
-        )
         raise
     except Exception as exc:  # pragma: no cover - defensive network boundary
         structured_log(
@@ -197,14 +267,71 @@ async def _resolve_publication_row(
             publication_id=row.publication_id,
             error=str(exc),
         )
-        outcome = _failed_outcome(row=row)
-        arxiv_rate_limited = False
-    await _persist_outcome(
-        publication_id=row.publication_id,
-        user_id=user_id,
-        outcome=outcome,
-    )
-    return bool(arxiv_rate_limited)
+        return _failed_outcome(row=row), False
+
+
+async def _resolve_claimed_row(
+    *,
+    batch: _ResolutionBatch,
+    request_email: str | None,
+    row: PublicationListItem,
+    openalex_api_key: str | None,
+) -> OaResolutionOutcome:
+    from app.services.openalex.client import OpenAlexBudgetExhaustedError
+
+    try:
+        outcome, arxiv_rate_limited = await _resolve_publication_row(
+            request_email=request_email,
+            row=row,
+            openalex_api_key=openalex_api_key,
+            allow_arxiv_lookup=batch.arxiv_lookup_allowed,
+        )
+    except OpenAlexBudgetExhaustedError:
+        batch.stop_for_budget()
+        return _failed_outcome(row=row)
+    if arxiv_rate_limited:
+        batch.disable_arxiv()
+    return outcome
+
+
+async def _claim_chunk(
+    *,
+    batch: _ResolutionBatch,
+    user_id: int,
+    size: int,
+) -> list[PublicationListItem]:
+    if batch.budget_exhausted:
+        return []
+    try:
+        claimed_ids = await _claim_queued_jobs(publication_ids=batch.pending_ids(), user_id=user_id, limit=size)
+    except Exception:
+        structured_log(logger, "exception", "pdf_queue.claim_failed", pending_count=len(batch.rows_by_id))
+        return []
+    return batch.take(claimed_ids)
+
+
+async def _resolution_worker(
+    *,
+    batch: _ResolutionBatch,
+    user_id: int,
+    request_email: str | None,
+    openalex_api_key: str | None,
+) -> None:
+    claim_size = max(int(settings.pdf_queue_claim_batch_size), 1)
+    while chunk := await _claim_chunk(batch=batch, user_id=user_id, size=claim_size):
+        # Rows in a chunk resolve concurrently; per-provider slots cap the outbound load.
+        outcomes = await asyncio.gather(
+            *(
+                _resolve_claimed_row(
+                    batch=batch,
+                    request_email=request_email,
+                    row=row,
+                    openalex_api_key=openalex_api_key,
+                )
+                for row in chunk
+            )
+        )
+        await _persist_outcomes_safely(user_id=user_id, outcomes=list(outcomes))
 
 
 async def _run_resolution_task(
@@ -213,7 +340,6 @@ async def _run_resolution_task(
     request_email: str | None,
     rows: list[PublicationListItem],
 ) -> None:
-    from app.services.openalex.client import OpenAlexBudgetExhaustedError
     from app.services.settings import application as user_settings_service
 
     openalex_api_key: str | None = None
@@ -224,54 +350,20 @@ async def _run_resolution_task(
     except Exception:
         openalex_api_key = settings.openalex_api_key
 
-    arxiv_lookup_allowed = True
-    for row in rows:
-        try:
-            arxiv_rate_limited = await _resolve_publication_row(
+    batch = _ResolutionBatch(rows_by_id={int(row.publication_id): row for row in rows})
+    claim_size = max(int(settings.pdf_queue_claim_batch_size), 1)
+    worker_count = min(max(int(settings.pdf_queue_workers), 1), -(-len(batch.rows_by_id) // claim_size))
+    await asyncio.gather(
+        *(
+            _resolution_worker(
+                batch=batch,
                 user_id=user_id,
                 request_email=request_email,
-                row=row,
                 openalex_api_key=openalex_api_key,
-                allow_arxiv_lookup=arxiv_lookup_allowed,
-            )
-            if arxiv_rate_limited and arxiv_lookup_allowed:
-                arxiv_lookup_allowed = False
-                structured_log(
-                    logger,
-                    "warning",
-                    "pdf_queue.arxiv_batch_disabled",
-                    detail="arXiv temporarily disabled for remaining batch after rate limit",
-                )
-        except OpenAlexBudgetExhaustedError:
-            _enter_budget_cooldown()
-            structured_log(
-                logger,
-                "warning",
-                "pdf_queue.budget_exhausted",
-                detail="Stopping PDF resolution batch — OpenAlex daily budget exhausted",
-                cooldown_minutes=_BUDGET_COOLDOWN_MINUTES,
-            )
-            break
-        except Exception:
-            structured_log(
-                logger,
-                "exception",
-                "pdf_queue.row_failed",
-                publication_id=row.publication_id,
             )
-            try:
-                await _persist_outcome(
-                    publication_id=row.publication_id,
-                    user_id=user_id,
-                    outcome=_failed_outcome(row=row),
-                )
-            except Exception:
-                structured_log(
-                    logger,
-                    "exception",
-                    "pdf_queue.row_fail_persist_error",
-                    publication_id=row.publication_id,
-                )
+            for _ in range(worker_count)
+        )
+    )
 
 
 def _register_task(task: asyncio.Task[None]) -> None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from typing import Any
 
@@ -9,6 +11,11 @@ from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.arxiv.guards import arxiv_skip_reason_for_item
 from app.services.openalex.client import OpenAlexBudgetExhaustedError
 from app.services.publications.types import PublicationListItem
+from app.services.rate_control import (
+    PROVIDER_ARXIV,
+    PROVIDER_OPENALEX,
+    get_provider_controller,
+)
 from app.services.unpaywall.application import OaResolutionOutcome, resolve_publication_oa_outcomes
 from app.settings import settings
 
@@ -22,6 +29,9 @@ class PipelineOutcome:
     arxiv_rate_limited: bool = False
 
 
+_ProviderCall = Callable[[], Coroutine[Any, Any, OaResolutionOutcome | None]]
+
+
 async def resolve_publication_pdf_outcome_for_row(
     *,
     row: PublicationListItem,
@@ -29,6 +39,13 @@ async def resolve_publication_pdf_outcome_for_row(
     openalex_api_key: str | None = None,
     allow_arxiv_lookup: bool = True,
 ) -> PipelineOutcome:
+    if settings.pdf_resolution_hedge_enabled:
+        return await _resolve_hedged(
+            row=row,
+            request_email=request_email,
+            openalex_api_key=openalex_api_key,
+            allow_arxiv_lookup=allow_arxiv_lookup,
+        )
     # 1. OpenAlex OA — raises OpenAlexBudgetExhaustedError if budget is gone
     openalex_outcome = await _openalex_outcome(row, request_email=request_email, openalex_api_key=openalex_api_key)
     if openalex_outcome and openalex_outcome.pdf_url:
@@ -54,6 +71,93 @@ async def resolve_publication_pdf_outcome_for_row(
     return PipelineOutcome(oa_outcome, None, arxiv_rate_limited=arxiv_rate_limited)
 
 
+async def _resolve_hedged(
+    *,
+    row: PublicationListItem,
+    request_email: str | None,
+    openalex_api_key: str | None,
+    allow_arxiv_lookup: bool,
+) -> PipelineOutcome:
+    """Run providers in priority order, starting the next one early once the hedge delay passes.
+
+    The hedge delay is measured from the start of the most recently launched provider, and
+    a provider that finishes without a PDF starts the next one immediately. The first
+    ``pdf_url`` wins and still-running providers are cancelled; when several finish
+    together the higher-priority provider wins. Without a PDF, the Unpaywall outcome is
+    returned as in sequential mode.
+    """
+    providers: list[tuple[str, _ProviderCall]] = [
+        (
+            "openalex",
+            lambda: _openalex_outcome(row, request_email=request_email, openalex_api_key=openalex_api_key),
+        ),
+        ("arxiv", lambda: _arxiv_outcome(row, request_email=request_email, allow_lookup=allow_arxiv_lookup)),
+        ("unpaywall", lambda: _oa_outcome(row=row, request_email=request_email)),
+    ]
+    hedge_delay = max(float(settings.pdf_resolution_hedge_delay_seconds), 0.0)
+    running: dict[asyncio.Task[OaResolutionOutcome | None], int] = {}
+    finished: dict[int, OaResolutionOutcome | None] = {}
+    arxiv_rate_limited = False
+    loop = asyncio.get_running_loop()
+    hedge_at = 0.0
+
+    def _launch_next() -> None:
+        nonlocal hedge_at
+        priority = len(running) + len(finished)
+        if priority < len(providers):
+            running[asyncio.create_task(providers[priority][1]())] = priority
+            hedge_at = loop.time() + hedge_delay
+
+    _launch_next()
+    try:
+        while running:
+            has_more = len(running) + len(finished) < len(providers)
+            done, _ = await asyncio.wait(
+                running,
+                timeout=max(hedge_at - loop.time(), 0.0) if has_more else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                structured_log(
+                    logger,
+                    "debug",
+                    "pdf_resolution.hedge_started",
+                    publication_id=int(row.publication_id),
+                    provider=providers[len(running) + len(finished)][0],
+                )
+                _launch_next()
+                continue
+            for task in sorted(done, key=lambda item: running[item]):
+                priority = running.pop(task)
+                try:
+                    finished[priority] = task.result()
+                except ArxivRateLimitError:
+                    arxiv_rate_limited = True
+                    finished[priority] = None
+                    structured_log(
+                        logger, "warning", "pdf_resolution.arxiv_rate_limited", publication_id=int(row.publication_id)
+                    )
+            winner = next(
+                (finished[priority] for priority in sorted(finished) if _has_pdf(finished[priority])),
+                None,
+            )
+            if winner is not None:
+                return PipelineOutcome(winner, None, arxiv_rate_limited=arxiv_rate_limited)
+            # Each provider that came back empty hands over to the next one without waiting.
+            for _ in done:
+                _launch_next()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    return PipelineOutcome(finished.get(len(providers) - 1), None, arxiv_rate_limited=arxiv_rate_limited)
+
+
+def _has_pdf(outcome: OaResolutionOutcome | None) -> bool:
+    return outcome is not None and bool(outcome.pdf_url)
+
+
 async def _openalex_outcome(
     row: PublicationListItem,
     request_email: str | None,
@@ -74,8 +178,20 @@ async def _openalex_outcome(
 
     api_key = openalex_api_key or settings.openalex_api_key
     client = OpenAlexClient(api_key=api_key, mailto=request_email or settings.crossref_api_mailto)
+    controller = get_provider_controller(PROVIDER_OPENALEX)
     try:
-        openalex_works = await client.get_works_by_filter({"title.search": safe_title}, limit=5)
+        async with controller.concurrency_slot():
+            if controller.is_open():
+                # The budget ran out (or the circuit tripped) while this row waited for a slot.
+                structured_log(
+                    logger,
+                    "info",
+                    "pdf_resolution.openalex_skipped",
+                    publication_id=int(row.publication_id),
+                    skip_reason="openalex_paused",
+                )
+                return None
+            openalex_works = await client.get_works_by_filter({"title.search": safe_title}, limit=5)
         match = find_best_match(
             target_title=row.title,
             target_year=row.year,
@@ -129,7 +245,8 @@ async def _arxiv_outcome(
         return None
 
     try:
-        arxiv_id = await discover_arxiv_id_for_publication(item=row, request_email=request_email)
+        async with get_provider_controller(PROVIDER_ARXIV).concurrency_slot():
+            arxiv_id = await discover_arxiv_id_for_publication(item=row, request_email=request_email)
         if arxiv_id:
             pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
             return OaResolutionOutcome(
@@ -152,5 +269,6 @@ async def _oa_outcome(
     row: PublicationListItem,
     request_email: str | None,
 ) -> OaResolutionOutcome | None:
+    # resolve_publication_oa_outcomes holds an Unpaywall concurrency slot per item.
     outcomes = await resolve_publication_oa_outcomes([row], request_email=request_email)
     return outcomes.get(row.publication_id)
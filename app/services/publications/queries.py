@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Select, case, func, select
+from sqlalchemy import ColumnElement, Select, and_, case, func, literal, or_, select, tuple_
 from sqlalchemy import false as sa_false
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,8 @@ from app.db.models import (
     ScholarProfile,
     ScholarPublication,
 )
+from app.services.publication_identifiers.application import display_identifier_from_stored
+from app.services.publications.cursors import PublicationCursor
 from app.services.publications.modes import MODE_LATEST, MODE_UNREAD
 from app.services.publications.pdf_queue_common import (
     PDF_STATUS_FAILED,
@@ -22,6 +24,11 @@ from app.services.publications.pdf_queue_common import (
     PDF_STATUS_RESOLVED,
     PDF_STATUS_RUNNING,
 )
+from app.services.publications.search import (
+    SORT_RELEVANCE,
+    publication_search_filter,
+    publication_search_rank,
+)
 from app.services.publications.types import PublicationListItem, UnreadPublicationItem
 
 
@@ -43,7 +50,9 @@ def _pdf_status_sort_rank():
     )
 
 
-def _sort_column(sort_by: str):
+def _sort_column(sort_by: str, *, search: str | None = None):
+    if sort_by == SORT_RELEVANCE and search:
+        return publication_search_rank(search)
     sort_columns = {
         "first_seen": ScholarPublication.created_at,
         "title": Publication.title_raw,
@@ -55,6 +64,23 @@ def _sort_column(sort_by: str):
     return sort_columns.get(sort_by, ScholarPublication.created_at)
 
 
+def _keyset_predicate(sort_col, *, sort_dir: str, cursor: PublicationCursor) -> ColumnElement[bool]:
+    # Rows strictly after the cursor in ``ORDER BY sort_col, Publication.id DESC, ScholarProfile.id DESC``.
+    # Postgres sorts NULLs as the largest value: first when descending, last when ascending.
+    after_tie = tuple_(Publication.id, ScholarProfile.id) < tuple_(
+        literal(cursor.publication_id),
+        literal(cursor.scholar_profile_id),
+    )
+    value = cursor.sort_value
+    if sort_dir == "desc":
+        if value is None:
+            return or_(and_(sort_col.is_(None), after_tie), sort_col.is_not(None))
+        return or_(sort_col < value, and_(sort_col == value, after_tie))
+    if value is None:
+        return and_(sort_col.is_(None), after_tie)
+    return or_(sort_col > value, and_(sort_col == value, after_tie), sort_col.is_(None))
+
+
 async def get_latest_run_id_for_user(
     db_session: AsyncSession,
     *,
@@ -92,8 +118,15 @@ def publications_query(
     sort_by: str = "first_seen",
     sort_dir: str = "desc",
     snapshot_before: datetime | None = None,
+    cursor: PublicationCursor | None = None,
 ) -> Select[tuple]:
+    """Build the publications list query.
+
+    Rows carry a trailing ``sort_value`` column for cursor construction. With
+    ``cursor`` the page starts after that row (keyset) and ``offset`` is ignored.
+    """
     scholar_label = ScholarProfile.display_name
+    sort_col = _sort_column(sort_by, search=search)
     stmt = (
         select(
             Publication.id,
@@ -110,6 +143,10 @@ def publications_query(
             ScholarPublication.is_favorite,
             ScholarPublication.first_seen_run_id,
             ScholarPublication.created_at,
+            Publication.display_identifier_kind,
+            Publication.display_identifier_value,
+            Publication.display_identifier_confidence,
+            sort_col.label("sort_value"),
         )
         .join(ScholarPublication, ScholarPublication.publication_id == Publication.id)
         .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
@@ -117,13 +154,7 @@ def publications_query(
         .where(ScholarProfile.user_id == user_id)
     )
     if search:
-        safe_search = search.replace("%", r"\%").replace("_", r"\_")
-        pat = f"%{safe_search}%"
-        stmt = stmt.where(
-            Publication.title_raw.ilike(pat)
-            | ScholarProfile.display_name.ilike(pat)
-            | Publication.venue_text.ilike(pat)
-        )
+        stmt = stmt.where(publication_search_filter(search))
     if scholar_profile_id is not None:
         stmt = stmt.where(ScholarProfile.id == scholar_profile_id)
     if favorite_only:
@@ -137,11 +168,14 @@ def publications_query(
     if snapshot_before is not None:
         stmt = stmt.where(ScholarPublication.created_at <= snapshot_before)
 
-    sort_col = _sort_column(sort_by)
     order = sort_col.desc() if sort_dir == "desc" else sort_col.asc()
-    stmt = stmt.order_by(order, Publication.id.desc())
+    stmt = stmt.order_by(order, Publication.id.desc(), ScholarProfile.id.desc())
 
-    if limit is not None:
+    if cursor is not None:
+        stmt = stmt.where(_keyset_predicate(sort_col, sort_dir=sort_dir, cursor=cursor))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+    elif limit is not None:
         stmt = stmt.offset(max(int(offset), 0)).limit(limit)
 
     return stmt
@@ -169,6 +203,9 @@ def publication_query_for_user(
             ScholarPublication.is_favorite,
             ScholarPublication.first_seen_run_id,
             ScholarPublication.created_at,
+            Publication.display_identifier_kind,
+            Publication.display_identifier_value,
+            Publication.display_identifier_confidence,
         )
         .join(ScholarPublication, ScholarPublication.publication_id == Publication.id)
         .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
@@ -222,6 +259,10 @@ def publication_list_item_from_row(
         is_favorite,
         first_seen_run_id,
         created_at,
+        display_identifier_kind,
+        display_identifier_value,
+        display_identifier_confidence,
+        *_,
     ) = row
     return PublicationListItem(
         publication_id=int(publication_id),
@@ -237,6 +278,13 @@ def publication_list_item_from_row(
         is_favorite=bool(is_favorite),
         first_seen_at=created_at,
         is_new_in_latest_run=(latest_run_id is not None and int(first_seen_run_id or 0) == latest_run_id),
+        display_identifier=display_identifier_from_stored(
+            kind=display_identifier_kind,
+            value=display_identifier_value,
+            confidence_score=display_identifier_confidence,
+            pub_url=pub_url,
+            pdf_url=pdf_url,
+        ),
     )
 
 
@@ -256,6 +304,7 @@ def unread_item_from_row(row: Any) -> UnreadPublicationItem:
         _is_favorite,
         _first_seen_run_id,
         _created_at,
+        *_,
     ) = row
     return UnreadPublicationItem(
         publication_id=int(publication_id),
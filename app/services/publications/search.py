@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, Float, cast, func, literal, literal_column, or_, select
+from sqlalchemy.orm import aliased
+
+from app.db.models import Publication, ScholarProfile
+
+SORT_RELEVANCE = "relevance"
+SEARCH_TEXT_CONFIG = "english"
+# Trigram word similarity is noise (and unindexable) for very short terms.
+SEARCH_FUZZY_MIN_LENGTH = 4
+
+
+def resolve_publication_sort(sort_by: str, *, search: str | None) -> str:
+    """Relevance only orders a searched list; without a term it falls back to ``first_seen``."""
+    if sort_by == SORT_RELEVANCE and not search:
+        return "first_seen"
+    return sort_by
+
+
+def _search_tsquery(search: str):
+    return func.websearch_to_tsquery(literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig"), search)
+
+
+def _substring_pattern(search: str) -> str:
+    safe_search = search.replace("%", r"\%").replace("_", r"\_")
+    return f"%{safe_search}%"
+
+
+def publication_search_filter(search: str) -> ColumnElement[bool]:
+    """Match ``search`` against title/venue (full-text, substring, fuzzy) or the scholar name.
+
+    Publication matches are resolved in a subquery so Postgres can combine the
+    ``search_vector`` GIN index and the trigram indexes instead of testing every
+    row of the user's library.
+    """
+    pattern = _substring_pattern(search)
+    matched = aliased(Publication)
+    publication_matches = [
+        matched.search_vector.bool_op("@@")(_search_tsquery(search)),
+        matched.title_raw.ilike(pattern),
+        matched.venue_text.ilike(pattern),
+    ]
+    if len(search) >= SEARCH_FUZZY_MIN_LENGTH:
+        publication_matches.append(literal(search).bool_op("<%")(matched.title_raw))
+    matching_ids = select(matched.id).where(or_(*publication_matches))
+    return or_(Publication.id.in_(matching_ids), ScholarProfile.display_name.ilike(pattern))
+
+
+def publication_search_rank(search: str):
+    return cast(
+        func.ts_rank_cd(Publication.search_vector, _search_tsquery(search))
+        + func.word_similarity(search, Publication.title_raw),
+        Float,
+    )
@@ -28,6 +28,12 @@ class PublicationListItem:
     display_identifier: DisplayIdentifier | None = None
 
 
+@dataclass(frozen=True)
+class PublicationListPage:
+    items: list[PublicationListItem]
+    next_cursor: str | None = None
+
+
 @dataclass(frozen=True)
 class UnreadPublicationItem:
     publication_id: int
@@ -39,3 +45,11 @@ class UnreadPublicationItem:
     venue_text: str | None
     pub_url: str | None
     pdf_url: str | None
+
+
+@dataclass(frozen=True)
+class PublicationCounters:
+    total_count: int = 0
+    unread_count: int = 0
+    favorite_count: int = 0
+    favorite_unread_count: int = 0
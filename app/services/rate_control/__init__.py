@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from app.services.rate_control.controller import (
+    ProviderCircuitOpenError,
+    ProviderRateController,
+    ProviderRateSnapshot,
+    parse_retry_after,
+)
+from app.services.rate_control.registry import (
+    PROVIDER_ARXIV,
+    PROVIDER_CROSSREF,
+    PROVIDER_OPENALEX,
+    PROVIDER_PDF_LANDING,
+    PROVIDER_UNPAYWALL,
+    get_provider_controller,
+    provider_rate_snapshots,
+)
+
+__all__ = [
+    "PROVIDER_ARXIV",
+    "PROVIDER_CROSSREF",
+    "PROVIDER_OPENALEX",
+    "PROVIDER_PDF_LANDING",
+    "PROVIDER_UNPAYWALL",
+    "ProviderCircuitOpenError",
+    "ProviderRateController",
+    "ProviderRateSnapshot",
+    "get_provider_controller",
+    "parse_retry_after",
+    "provider_rate_snapshots",
+]
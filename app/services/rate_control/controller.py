@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app.logging_utils import structured_log
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Multiplicative decrease factors; rate limits back off harder than plain errors.
+_RATE_LIMIT_DECREASE = 0.5
+_ERROR_DECREASE = 0.8
+# Additive increase per healthy response, as a fraction of the configured base rate.
+_ADDITIVE_INCREASE_FRACTION = 0.1
+_LATENCY_EWMA_WEIGHT = 0.2
+_MAX_OPEN_BACKOFF_MULTIPLIER = 16
+
+
+class ProviderCircuitOpenError(Exception):
+    """Raised when a provider's circuit is open and requests are being shed."""
+
+    def __init__(self, provider: str, retry_after_seconds: float) -> None:
+        super().__init__(f"{provider} circuit open; retry in {retry_after_seconds:.1f}s")
+        self.provider = provider
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True)
+class ProviderRateSnapshot:
+    provider: str
+    circuit_state: str
+    interval_seconds: float
+    min_interval_seconds: float
+    max_interval_seconds: float
+    concurrency_limit: int
+    max_concurrency: int
+    in_flight: int
+    consecutive_failures: int
+    circuit_retry_after_seconds: float
+    latency_ewma_seconds: float | None
+    request_count: int
+    success_count: int
+    rate_limited_count: int
+    error_count: int
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    """Return the delay in seconds from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    raw = (value or "").strip()
+    if not raw:
+        return None
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - (now or datetime.now(UTC))).total_seconds(), 0.0)
+
+
+class ProviderCall:
+    """Per-request handle; callers report the HTTP response, exceptions count as errors."""
+
+    def __init__(self) -> None:
+        self.status_code: int | None = None
+        self.retry_after_seconds: float | None = None
+
+    def observe_status(self, status_code: int, *, retry_after_seconds: float | None = None) -> None:
+        self.status_code = int(status_code)
+        self.retry_after_seconds = retry_after_seconds
+
+    def observe_response(self, response: httpx.Response) -> None:
+        self.observe_status(
+            response.status_code,
+            retry_after_seconds=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+
+class ProviderRateController:
+    """Adaptive (AIMD) pacing, concurrency and circuit breaking for one external provider.
+
+    Healthy, fast responses raise the request rate additively and grow the concurrency
+    limit; 429s and errors cut both multiplicatively. The rate stays between the
+    configured base rate scaled by ``PROVIDER_RATE_MAX_SPEEDUP`` and
+    ``PROVIDER_RATE_MAX_SLOWDOWN``. A 429 also pauses every request for the response's
+    ``Retry-After``, or otherwise for ``rate_limit_backoff_seconds`` doubling per
+    consecutive 429 up to ``max_rate_limit_backoff_seconds``. Consecutive failures open
+    the circuit, after which a single probe request decides whether it closes again.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        base_interval_seconds: float,
+        max_concurrency: int,
+        burst: int = 1,
+        rate_limit_backoff_seconds: float = 0.0,
+        max_rate_limit_backoff_seconds: float = 0.0,
+    ) -> None:
+        self.provider = provider
+        base_interval = max(float(base_interval_seconds), 0.0)
+        speedup = max(float(settings.provider_rate_max_speedup), 1.0)
+        slowdown = max(float(settings.provider_rate_max_slowdown), 1.0)
+        self.min_interval_seconds = base_interval / speedup
+        self.max_interval_seconds = base_interval * slowdown
+        self._base_rate = 1.0 / base_interval if base_interval > 0 else 0.0
+        self._interval = base_interval
+        self._burst = float(max(int(burst), 1))
+        self._tokens = self._burst
+        self._tokens_updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._rate_limit_backoff = max(float(rate_limit_backoff_seconds), 0.0)
+        self._max_rate_limit_backoff = max(float(max_rate_limit_backoff_seconds), self._rate_limit_backoff)
+        self._consecutive_rate_limits = 0
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self._concurrency = float(self.max_concurrency)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._circuit_state = CIRCUIT_CLOSED
+        self._open_until = 0.0
+        self._suspended_until = 0.0
+        self._open_count = 0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._latency_ewma: float | None = None
+        self._request_count = 0
+        self._success_count = 0
+        self._rate_limited_count = 0
+        self._error_count = 0
+
+    # -- pacing ---------------------------------------------------------------
+
+    def _pacing_delay(self) -> float:
+        # Reservation token bucket: tokens may go negative, which queues later callers.
+        now = time.monotonic()
+        if self._interval <= 0:
+            return max(self._paused_until - now, 0.0)
+        self._tokens = min(self._burst, self._tokens + (now - self._tokens_updated_at) / self._interval)
+        self._tokens_updated_at = now
+        self._tokens -= 1.0
+        delay = max(-self._tokens * self._interval, 0.0)
+        return max(delay, self._paused_until - now)
+
+    # -- concurrency ----------------------------------------------------------
+
+    def _concurrency_limit(self) -> int:
+        return max(int(self._concurrency), 1)
+
+    async def _acquire_concurrency(self) -> None:
+        while self._in_flight >= self._concurrency_limit():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # A wake-up handed to a cancelled waiter must pass on to the next one.
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def _wake_waiters(self) -> None:
+        free_slots = self._concurrency_limit() - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    def _release_concurrency(self) -> None:
+        self._in_flight = max(self._in_flight - 1, 0)
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def concurrency_slot(self) -> AsyncIterator[None]:
+        """Hold one adaptive concurrency slot, e.g. for a multi-request resolution step."""
+        await self._acquire_concurrency()
+        try:
+            yield
+        finally:
+            self._release_concurrency()
+
+    # -- circuit --------------------------------------------------------------
+
+    def _check_circuit(self) -> bool:
+        """Raise while the circuit is open; return True when this call is the half-open probe."""
+        now = time.monotonic()
+        if self._circuit_state == CIRCUIT_OPEN:
+            if now < self._open_until:
+                raise ProviderCircuitOpenError(self.provider, self._open_until - now)
+            self._circuit_state = CIRCUIT_HALF_OPEN
+            self._probe_in_flight = False
+        if self._circuit_state == CIRCUIT_HALF_OPEN:
+            if self._probe_in_flight:
+                raise ProviderCircuitOpenError(self.provider, max(self._interval, 1.0))
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def _open_circuit(self) -> None:
+        self._open_count += 1
+        multiplier = min(2 ** (self._open_count - 1), _MAX_OPEN_BACKOFF_MULTIPLIER)
+        open_seconds = max(float(settings.provider_circuit_open_seconds), 0.0) * multiplier
+        self._circuit_state = CIRCUIT_OPEN
+        # A late failure from an in-flight request must not shorten a running suspension.
+        self._open_until = max(self._open_until, time.monotonic() + open_seconds)
+        self._probe_in_flight = False
+        structured_log(
+            logger,
+            "warning",
+            "provider_rate.circuit_opened",
+            provider=self.provider,
+            open_seconds=open_seconds,
+            consecutive_failures=self._consecutive_failures,
+        )
+
+    def _close_circuit(self) -> None:
+        if self._circuit_state != CIRCUIT_CLOSED:
+            structured_log(logger, "info", "provider_rate.circuit_closed", provider=self.provider)
+        self._circuit_state = CIRCUIT_CLOSED
+        self._open_count = 0
+        self._probe_in_flight = False
+
+    def suspend(self, seconds: float, *, reason: str) -> None:
+        """Open the circuit for a fixed ``seconds``, e.g. once a daily quota is spent."""
+        self._circuit_state = CIRCUIT_OPEN
+        self._suspended_until = max(self._suspended_until, time.monotonic() + max(float(seconds), 0.0))
+        self._open_until = max(self._open_until, self._suspended_until)
+        self._probe_in_flight = False
+        structured_log(
+            logger,
+            "warning",
+            "provider_rate.suspended",
+            provider=self.provider,
+            suspend_seconds=float(seconds),
+            reason=reason,
+        )
+
+    def is_open(self) -> bool:
+        """Whether requests are currently being shed; a due half-open probe counts as closed."""
+        return self._circuit_state == CIRCUIT_OPEN and time.monotonic() < self._open_until
+
+    def is_suspended(self) -> bool:
+        """Whether a ``suspend()`` is running; unlike ``is_open()``, failure-opened circuits do not count."""
+        return time.monotonic() < self._suspended_until
+
+    # -- feedback -------------------------------------------------------------
+
+    def _set_rate(self, rate: float) -> None:
+        if self._base_rate <= 0:
+            return
+        min_rate = 1.0 / self.max_interval_seconds
+        max_rate = 1.0 / self.min_interval_seconds
+        self._interval = 1.0 / min(max(rate, min_rate), max_rate)
+
+    def _current_rate(self) -> float:
+        return 1.0 / self._interval if self._interval > 0 else 0.0
+
+    def record_success(self, *, latency_seconds: float | None = None) -> None:
+        self._success_count += 1
+        self._consecutive_failures = 0
+        self._consecutive_rate_limits = 0
+        if self._circuit_state != CIRCUIT_CLOSED:
+            self._close_circuit()
+        if latency_seconds is not None:
+            latency = max(float(latency_seconds), 0.0)
+            self._latency_ewma = (
+                latency
+                if self._latency_ewma is None
+                else (1 - _LATENCY_EWMA_WEIGHT) * self._latency_ewma + _LATENCY_EWMA_WEIGHT * latency
+            )
+            if latency > max(float(settings.provider_latency_target_seconds), 0.0):
+                # Slow but successful: hold the current rate rather than push harder.
+                return
+        self._set_rate(self._current_rate() + self._base_rate * _ADDITIVE_INCREASE_FRACTION)
+        self._concurrency = min(self._concurrency + 1.0 / self._concurrency, float(self.max_concurrency))
+
+    def _record_failure(self, *, decrease: float) -> None:
+        self._consecutive_failures += 1
+        self._set_rate(self._current_rate() * decrease)
+        self._concurrency = max(self._concurrency * decrease, 1.0)
+        threshold = max(int(settings.provider_circuit_failure_threshold), 1)
+        if self._circuit_state == CIRCUIT_HALF_OPEN or self._consecutive_failures >= threshold:
+            self._open_circuit()
+
+    def _rate_limit_pause(self) -> float:
+        if self._rate_limit_backoff <= 0:
+            return self._interval
+        backoff = self._rate_limit_backoff * (2 ** (self._consecutive_rate_limits - 1))
+        return max(min(backoff, self._max_rate_limit_backoff), self._interval)
+
+    def record_rate_limited(self, *, retry_after_seconds: float | None = None) -> None:
+        self._rate_limited_count += 1
+        self._consecutive_rate_limits += 1
+        pause = retry_after_seconds if retry_after_seconds is not None else self._rate_limit_pause()
+        self._paused_until = max(self._paused_until, time.monotonic() + max(float(pause), 0.0))
+        self._record_failure(decrease=_RATE_LIMIT_DECREASE)
+
+    def record_error(self) -> None:
+        self._error_count += 1
+        self._record_failure(decrease=_ERROR_DECREASE)
+
+    def _record_call(self, call: ProviderCall, *, latency_seconds: float, failed: bool) -> None:
+        status = call.status_code
+        if failed or (status is not None and status >= 500 and status != 503):
+            self.record_error()
+        elif status in {429, 503}:
+            self.record_rate_limited(retry_after_seconds=call.retry_after_seconds)
+        else:
+            self.record_success(latency_seconds=latency_seconds)
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[ProviderCall]:
+        """Pace one outbound request and feed its outcome back into the controller."""
+        is_probe = self._check_circuit()
+        delay = self._pacing_delay()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            if is_probe:
+                self._probe_in_flight = False
+            raise
+        self._request_count += 1
+        call = ProviderCall()
+        started_at = time.monotonic()
+        try:
+            yield call
+        except asyncio.CancelledError:
+            if is_probe:
+                self._probe_in_flight = False
+            raise
+        except Exception:
+            self._record_call(call, latency_seconds=time.monotonic() - started_at, failed=True)
+            raise
+        self._record_call(call, latency_seconds=time.monotonic() - started_at, failed=False)
+
+    def snapshot(self) -> ProviderRateSnapshot:
+        retry_after = max(self._open_until - time.monotonic(), 0.0) if self._circuit_state == CIRCUIT_OPEN else 0.0
+        return ProviderRateSnapshot(
+            provider=self.provider,
+            circuit_state=self._circuit_state,
+            interval_seconds=self._interval,
+            min_interval_seconds=self.min_interval_seconds,
+            max_interval_seconds=self.max_interval_seconds,
+            concurrency_limit=self._concurrency_limit(),
+            max_concurrency=self.max_concurrency,
+            in_flight=self._in_flight,
+            consecutive_failures=self._consecutive_failures,
+            circuit_retry_after_seconds=retry_after,
+            latency_ewma_seconds=self._latency_ewma,
+            request_count=self._request_count,
+            success_count=self._success_count,
+            rate_limited_count=self._rate_limited_count,
+            error_count=self._error_count,
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from app.services.rate_control.controller import ProviderRateController, ProviderRateSnapshot
+from app.settings import settings
+
+PROVIDER_OPENALEX = "openalex"
+PROVIDER_ARXIV = "arxiv"
+PROVIDER_UNPAYWALL = "unpaywall"
+PROVIDER_CROSSREF = "crossref"
+PROVIDER_PDF_LANDING = "pdf_landing"
+PROVIDERS = (PROVIDER_OPENALEX, PROVIDER_ARXIV, PROVIDER_UNPAYWALL, PROVIDER_CROSSREF, PROVIDER_PDF_LANDING)
+
+_controllers: dict[str, ProviderRateController] = {}
+
+
+def _build_controller(provider: str) -> ProviderRateController:
+    if provider == PROVIDER_OPENALEX:
+        return ProviderRateController(
+            provider,
+            base_interval_seconds=settings.openalex_min_interval_seconds,
+            max_concurrency=settings.pdf_provider_openalex_concurrency,
+            rate_limit_backoff_seconds=settings.openalex_rate_limit_backoff_seconds,
+            max_rate_limit_backoff_seconds=settings.openalex_rate_limit_max_backoff_seconds,
+        )
+    if provider == PROVIDER_ARXIV:
+        # The cross-process DB limiter still spaces arXiv slots at the base interval; this
+        # controller adds the adaptive per-process interval and circuit on top of it.
+        return ProviderRateController(
+            provider,
+            base_interval_seconds=settings.arxiv_min_interval_seconds,
+            max_concurrency=settings.pdf_provider_arxiv_concurrency,
+            rate_limit_backoff_seconds=settings.arxiv_rate_limit_cooldown_seconds,
+            max_rate_limit_backoff_seconds=settings.arxiv_rate_limit_cooldown_seconds,
+        )
+    if provider == PROVIDER_UNPAYWALL:
+        return ProviderRateController(
+            provider,
+            base_interval_seconds=settings.unpaywall_min_interval_seconds,
+            max_concurrency=settings.pdf_provider_unpaywall_concurrency,
+            burst=settings.unpaywall_rate_burst,
+        )
+    if provider == PROVIDER_CROSSREF:
+        return ProviderRateController(
+            provider,
+            base_interval_seconds=settings.crossref_min_interval_seconds,
+            max_concurrency=settings.pdf_provider_crossref_concurrency,
+        )
+    if provider == PROVIDER_PDF_LANDING:
+        # Publisher landing-page and candidate fetches found via Unpaywall. They are only paced;
+        # their concurrency follows the Unpaywall resolutions that trigger them.
+        return ProviderRateController(
+            provider,
+            base_interval_seconds=settings.unpaywall_pdf_discovery_min_interval_seconds,
+            max_concurrency=1,
+        )
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+def get_provider_controller(provider: str) -> ProviderRateController:
+    controller = _controllers.get(provider)
+    if controller is None:
+        controller = _build_controller(provider)
+        _controllers[provider] = controller
+    return controller
+
+
+def provider_rate_snapshots() -> list[ProviderRateSnapshot]:
+    return [get_provider_controller(provider).snapshot() for provider in PROVIDERS]
+
+
+def reset_provider_controllers_for_tests() -> None:
+    _controllers.clear()
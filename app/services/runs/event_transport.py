@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from typing import Any
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.logging_utils import structured_log
+from app.services.runs.events import RunEvent, RunEventPublisher, run_events
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+RUN_EVENTS_CHANNEL = "scholarr_run_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more; larger events go by reference.
+_NOTIFY_PAYLOAD_LIMIT_BYTES = 7000
+_PAYLOAD_RETENTION_SECONDS = 3600.0
+_RECONNECT_INTERVAL_SECONDS = 5.0
+_SEND_BATCH_MAX_EVENTS = 100
+_OUTBOX_MAX_EVENTS = 10_000
+
+# Expired reference rows are pruned by the same statement that stores a new one.
+_STORE_PAYLOAD_SQL = """
+WITH expired AS (
+    DELETE FROM run_event_payloads
+    WHERE created_at < now() - make_interval(secs => $1)
+)
+INSERT INTO run_event_payloads (run_id, event_type, data)
+VALUES ($2, $3, $4::jsonb)
+RETURNING id
+"""
+_LOAD_PAYLOAD_SQL = "SELECT data::text FROM run_event_payloads WHERE id = $1"
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class PostgresRunEventTransport:
+    """Relays run events between processes over Postgres ``LISTEN/NOTIFY``.
+
+    One dedicated connection both listens and notifies. ``send`` only queues the event; a
+    sender task drains the queue and issues the notifications in batches, so publishers
+    never wait on a database round trip. Notifications are delivered to every listening
+    process, this one included, in commit order; a single consumer task hands them to the
+    publisher so events stored by reference keep their position.
+
+    NOTIFY is not durable: notifications other processes send while this listener is
+    reconnecting are lost. Events this process could not send are delivered locally
+    instead, and ``runs.event_transport_reconnected`` logs how long the gap lasted.
+    Clients recover the missed state from the run itself once the stream resumes.
+    """
+
+    def __init__(self, *, publisher: RunEventPublisher, dsn: str) -> None:
+        self._publisher = publisher
+        self._dsn = dsn
+        self._connection: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._inbox: asyncio.Queue[str] = asyncio.Queue()
+        self._outbox: asyncio.Queue[tuple[int, RunEvent]] = asyncio.Queue(maxsize=_OUTBOX_MAX_EVENTS)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._disconnected_at: float | None = None
+
+    async def start(self) -> None:
+        await self._ensure_connection()
+        self._tasks = [
+            asyncio.create_task(self._consume(), name="run-events-consume"),
+            asyncio.create_task(self._send_pending(), name="run-events-send"),
+            asyncio.create_task(self._watch_connection(), name="run-events-watch"),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._deliver_locally(self._take_pending(limit=self._outbox.qsize()))
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                await self._connection.close()
+            self._connection = None
+
+    async def send(self, run_id: int, event: RunEvent) -> None:
+        # Raises ``asyncio.QueueFull`` when the sender has fallen far behind; the publisher
+        # then delivers the event locally.
+        self._outbox.put_nowait((int(run_id), event))
+
+    async def _send_pending(self) -> None:
+        while True:
+            first = await self._outbox.get()
+            batch = [first, *self._take_pending(limit=_SEND_BATCH_MAX_EVENTS - 1)]
+            try:
+                await self._notify(batch)
+            except Exception as exc:
+                structured_log(
+                    logger,
+                    "warning",
+                    "runs.event_transport_send_failed",
+                    event_count=len(batch),
+                    error=str(exc),
+                )
+                self._deliver_locally(batch)
+
+    def _take_pending(self, *, limit: int) -> list[tuple[int, RunEvent]]:
+        pending: list[tuple[int, RunEvent]] = []
+        while len(pending) < limit and not self._outbox.empty():
+            pending.append(self._outbox.get_nowait())
+        return pending
+
+    def _deliver_locally(self, events: list[tuple[int, RunEvent]]) -> None:
+        for run_id, event in events:
+            self._publisher.deliver(run_id, event)
+
+    async def _notify(self, events: list[tuple[int, RunEvent]]) -> None:
+        """Send ``events`` in order, storing oversized payloads by reference first."""
+        async with self._lock:
+            connection = await self._ensure_connection()
+            payloads: list[tuple[str, str]] = []
+            for run_id, event in events:
+                message: dict[str, Any] = {"r": run_id, "i": event.event_id, "t": event.event_type, "d": event.data}
+                payload = json.dumps(message, separators=(",", ":"))
+                if len(payload.encode("utf-8")) > _NOTIFY_PAYLOAD_LIMIT_BYTES:
+                    reference = await connection.fetchval(
+                        _STORE_PAYLOAD_SQL,
+                        _PAYLOAD_RETENTION_SECONDS,
+                        run_id,
+                        event.event_type,
+                        json.dumps(event.data),
+                    )
+                    payload = json.dumps({"r": run_id, "i": event.event_id, "t": event.event_type, "ref": reference})
+                payloads.append((RUN_EVENTS_CHANNEL, payload))
+            await connection.executemany("SELECT pg_notify($1, $2)", payloads)
+
+    async def _ensure_connection(self) -> asyncpg.Connection:
+        if self._connection is not None and not self._connection.is_closed():
+            return self._connection
+        if self._connection is not None and self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        connection = await asyncpg.connect(self._dsn)
+        await connection.add_listener(RUN_EVENTS_CHANNEL, self._on_notification)
+        self._connection = connection
+        if self._disconnected_at is None:
+            structured_log(logger, "info", "runs.event_transport_connected", channel=RUN_EVENTS_CHANNEL)
+        else:
+            # Notifications sent by other processes during this gap were not received.
+            structured_log(
+                logger,
+                "warning",
+                "runs.event_transport_reconnected",
+                channel=RUN_EVENTS_CHANNEL,
+                gap_seconds=round(time.monotonic() - self._disconnected_at, 3),
+            )
+            self._disconnected_at = None
+        return connection
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        self._inbox.put_nowait(payload)
+
+    async def _consume(self) -> None:
+        while True:
+            payload = await self._inbox.get()
+            try:
+                await self._deliver(payload)
+            except Exception as exc:
+                structured_log(logger, "warning", "runs.event_transport_delivery_failed", error=str(exc))
+
+    async def _deliver(self, payload: str) -> None:
+        message = json.loads(payload)
+        data = message.get("d")
+        if "ref" in message:
+            async with self._lock:
+                connection = await self._ensure_connection()
+                raw = await connection.fetchval(_LOAD_PAYLOAD_SQL, int(message["ref"]))
+            if raw is None:
+                structured_log(logger, "warning", "runs.event_payload_missing", reference=message["ref"])
+                return
+            data = json.loads(raw)
+        self._publisher.deliver(
+            int(message["r"]),
+            RunEvent(event_id=str(message["i"]), event_type=str(message["t"]), data=data or {}),
+        )
+
+    async def _watch_connection(self) -> None:
+        # Reconnects (and re-LISTENs) after the connection drops; events this process sends
+        # meanwhile fall back to local delivery in ``_send_pending``.
+        while True:
+            await asyncio.sleep(_RECONNECT_INTERVAL_SECONDS)
+            try:
+                async with self._lock:
+                    await self._ensure_connection()
+            except Exception as exc:
+                structured_log(logger, "warning", "runs.event_transport_reconnect_failed", error=str(exc))
+
+
+_transport: PostgresRunEventTransport | None = None
+
+
+async def start_run_event_transport() -> None:
+    """Attach the configured transport to ``run_events``; the ``memory`` backend needs none."""
+    global _transport
+    backend = (settings.run_events_backend or "").strip().lower()
+    if backend == "memory":
+        return
+    if backend != "postgres":
+        structured_log(
+            logger,
+            "warning",
+            "runs.event_backend_invalid_fallback",
+            run_events_backend=settings.run_events_backend,
+            fallback_backend="memory",
+        )
+        return
+    transport = PostgresRunEventTransport(publisher=run_events, dsn=_asyncpg_dsn(settings.database_url))
+    try:
+        await transport.start()
+    except Exception as exc:
+        structured_log(logger, "error", "runs.event_transport_start_failed", error=str(exc))
+        return
+    _transport = transport
+    run_events.set_transport(transport)
+
+
+async def stop_run_event_transport() -> None:
+    global _transport
+    if _transport is None:
+        return
+    run_events.set_transport(None)
+    await _transport.stop()
+    _transport = None
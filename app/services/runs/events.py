@@ -1,26 +1,142 @@
 import asyncio
+import itertools
 import json
 import logging
+import uuid
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Protocol
 
 from app.logging_utils import structured_log
+from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
-_SUBSCRIBER_QUEUE_MAXSIZE = 256
+_MAX_PENDING_BATCH_ITEMS = 256
+_MAX_REPLAY_RUNS = 64
+# Sent once per stream so browsers reconnect quickly after a dropped connection.
+_STREAM_RETRY_MILLISECONDS = 1000
+# High-rate types sent as "<type>_batch" events, in this order within a flush.
+_BATCHED_EVENT_TYPES = ("publication_discovered", "identifier_updated")
+# Snapshot types where only the latest event in a flush matters.
+_MERGED_EVENT_TYPES = frozenset({"scholar_progress"})
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    event_id: str
+    event_type: str
+    data: dict[str, Any]
+
+
+class RunEventTransport(Protocol):
+    async def send(self, run_id: int, event: RunEvent) -> None: ...
+
+
+class RunEventSubscription:
+    """Per-subscriber buffer that coalesces events between stream flushes.
+
+    Batched event types accumulate into one batch per flush, merged types keep only their
+    latest event, and everything else passes through in order. When a batch outgrows
+    ``_MAX_PENDING_BATCH_ITEMS`` its oldest items are dropped and counted, and the next
+    flush leads with a ``run_summary`` snapshot instead of disconnecting the subscriber.
+    """
+
+    def __init__(self, run_id: int) -> None:
+        self.run_id = run_id
+        self.last_event_id: str | None = None
+        self._batches: dict[str, list[dict[str, Any]]] = {}
+        self._merged: dict[str, RunEvent] = {}
+        self._passthrough: list[RunEvent] = []
+        self._skipped: dict[str, int] = {}
+        self._new_publication_count: int | None = None
+        self._ready = asyncio.Event()
+
+    def add(self, event: RunEvent) -> None:
+        self.last_event_id = event.event_id
+        if event.event_type == "publication_discovered":
+            count = event.data.get("new_publication_count")
+            if isinstance(count, int):
+                self._new_publication_count = max(count, self._new_publication_count or 0)
+        if event.event_type in _BATCHED_EVENT_TYPES:
+            batch = self._batches.setdefault(event.event_type, [])
+            batch.append(event.data)
+            if len(batch) > _MAX_PENDING_BATCH_ITEMS:
+                del batch[0]
+                self._skipped[event.event_type] = self._skipped.get(event.event_type, 0) + 1
+        elif event.event_type in _MERGED_EVENT_TYPES:
+            self._merged[event.event_type] = event
+        else:
+            self._passthrough.append(event)
+        self._ready.set()
+
+    async def wait(self) -> None:
+        await self._ready.wait()
+
+    def drain(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return pending messages as ``(event_type, data)`` pairs and reset the buffer."""
+        messages: list[tuple[str, dict[str, Any]]] = []
+        if self._skipped:
+            structured_log(
+                logger,
+                "info",
+                "runs.event_subscriber_degraded",
+                run_id=self.run_id,
+                skipped=dict(self._skipped),
+            )
+            messages.append(
+                (
+                    "run_summary",
+                    {"skipped": dict(self._skipped), "new_publication_count": self._new_publication_count},
+                )
+            )
+        for event_type in _BATCHED_EVENT_TYPES:
+            items = self._batches.get(event_type)
+            if items:
+                messages.append((f"{event_type}_batch", {"items": items}))
+        messages.extend((event.event_type, event.data) for event in self._merged.values())
+        messages.extend((event.event_type, event.data) for event in self._passthrough)
+        self._batches = {}
+        self._merged = {}
+        self._passthrough = []
+        self._skipped = {}
+        self._ready.clear()
+        return messages
 
 
 class RunEventPublisher:
-    def __init__(self) -> None:
-        # Maps run_id to a set of subscriber queues
-        self._subscribers: dict[int, set[asyncio.Queue]] = {}
-
-    def subscribe(self, run_id: int) -> asyncio.Queue:
-        if run_id not in self._subscribers:
-            self._subscribers[run_id] = set()
-        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_MAXSIZE)
-        self._subscribers[run_id].add(queue)
+    """Fans run events out to local stream subscribers and keeps a bounded replay buffer per run.
+
+    Without a transport, published events are delivered in-process. With one (see
+    ``PostgresRunEventTransport``), events are sent through it and come back via ``deliver``
+    on every process, including this one.
+    """
+
+    def __init__(self, *, replay_size: int = 512) -> None:
+        self._subscribers: dict[int, set[RunEventSubscription]] = {}
+        self._replay: OrderedDict[int, deque[RunEvent]] = OrderedDict()
+        self._replay_size = max(int(replay_size), 1)
+        self._node_id = uuid.uuid4().hex[:12]
+        self._sequence = itertools.count(1)
+        self._transport: RunEventTransport | None = None
+
+    def set_transport(self, transport: RunEventTransport | None) -> None:
+        self._transport = transport
+
+    def subscribe(
+        self,
+        run_id: int,
+        *,
+        last_event_id: str | None = None,
+    ) -> tuple[RunEventSubscription, list[RunEvent]]:
+        """Register a subscriber and return the buffered events it missed after ``last_event_id``.
+
+        An id that is no longer buffered replays the whole buffer: duplicates are preferred
+        over gaps.
+        """
+        subscription = RunEventSubscription(run_id)
+        self._subscribers.setdefault(run_id, set()).add(subscription)
         structured_log(
             logger,
             "debug",
@@ -28,53 +144,98 @@ class RunEventPublisher:
             run_id=run_id,
             subscriber_count=len(self._subscribers[run_id]),
         )
-        return queue
+        if last_event_id is None:
+            return subscription, []
+        buffered = list(self._replay.get(run_id, ()))
+        for index, event in enumerate(buffered):
+            if event.event_id == last_event_id:
+                return subscription, buffered[index + 1 :]
+        return subscription, buffered
 
-    def unsubscribe(self, run_id: int, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, run_id: int, subscription: RunEventSubscription) -> None:
         if run_id in self._subscribers:
-            self._subscribers[run_id].discard(queue)
+            self._subscribers[run_id].discard(subscription)
             if not self._subscribers[run_id]:
                 self._subscribers.pop(run_id, None)
 
     async def publish(self, run_id: int, event_type: str, data: dict[str, Any]) -> None:
-        if run_id not in self._subscribers:
+        event = RunEvent(event_id=f"{self._node_id}-{next(self._sequence)}", event_type=event_type, data=data)
+        if self._transport is None:
+            self.deliver(run_id, event)
             return
+        try:
+            await self._transport.send(run_id, event)
+        except Exception as exc:
+            # Local subscribers still get the event when the bus is unavailable.
+            structured_log(
+                logger,
+                "warning",
+                "runs.event_transport_send_failed",
+                run_id=run_id,
+                event_type=event_type,
+                error=str(exc),
+            )
+            self.deliver(run_id, event)
 
-        message = {"type": event_type, "data": data}
-
-        # Fan-out to all active subscribers for this run
-        for queue in list(self._subscribers[run_id]):
-            try:
-                queue.put_nowait(message)
-            except asyncio.QueueFull:
-                structured_log(
-                    logger,
-                    "warning",
-                    "runs.event_subscriber_queue_full",
-                    run_id=run_id,
-                )
-                self._subscribers[run_id].discard(queue)
+    def deliver(self, run_id: int, event: RunEvent) -> None:
+        self._remember(run_id, event)
+        for subscription in list(self._subscribers.get(run_id, ())):
+            subscription.add(event)
 
     async def publish_run_complete(self, run_id: int) -> None:
         await self.publish(run_id, "run_complete", {})
 
+    def _remember(self, run_id: int, event: RunEvent) -> None:
+        buffer = self._replay.get(run_id)
+        if buffer is None:
+            buffer = deque(maxlen=self._replay_size)
+            self._replay[run_id] = buffer
+            while len(self._replay) > _MAX_REPLAY_RUNS:
+                self._replay.popitem(last=False)
+        else:
+            self._replay.move_to_end(run_id)
+        buffer.append(event)
+
+
+run_events = RunEventPublisher(replay_size=settings.run_events_replay_buffer_size)
+
 
-run_events = RunEventPublisher()
+def _format_flush(messages: list[tuple[str, dict[str, Any]]], *, last_event_id: str | None) -> str:
+    # Server-Sent Events format: "event: <type>\ndata: <json>\n\n". Only the final message
+    # of a flush carries an id, so a client cut off mid-flush resumes before the whole flush:
+    # duplicates rather than gaps.
+    chunks = []
+    for index, (event_type, data) in enumerate(messages):
+        id_line = f"id: {last_event_id}\n" if last_event_id and index == len(messages) - 1 else ""
+        data_str = "{}" if event_type == "run_complete" else json.dumps(data)
+        chunks.append(f"{id_line}event: {event_type}\ndata: {data_str}\n\n")
+    return "".join(chunks)
 
 
-async def event_generator(run_id: int) -> AsyncGenerator[str, None]:
-    queue = run_events.subscribe(run_id)
+async def event_generator(
+    run_id: int,
+    *,
+    last_event_id: str | None = None,
+    coalesce_window_seconds: float | None = None,
+) -> AsyncGenerator[str, None]:
+    window = (
+        settings.run_events_coalesce_window_ms / 1000.0 if coalesce_window_seconds is None else coalesce_window_seconds
+    )
+    subscription, backlog = run_events.subscribe(run_id, last_event_id=last_event_id)
+    for event in backlog:
+        subscription.add(event)
     try:
+        yield f"retry: {_STREAM_RETRY_MILLISECONDS}\n\n"
         while True:
-            # Wait for a new event
-            message = await queue.get()
-            event_type = message["type"]
-            if event_type == "run_complete":
-                yield f"event: {event_type}\ndata: {{}}\n\n"
+            await subscription.wait()
+            if window > 0:
+                await asyncio.sleep(window)
+            messages = subscription.drain()
+            if not messages:
+                continue
+            yield _format_flush(messages, last_event_id=subscription.last_event_id)
+            if any(event_type == "run_complete" for event_type, _ in messages):
                 break
-            # Server-Sent Events format: "event: <type>\ndata: <json>\n\n"
-            data_str = json.dumps(message["data"])
-            yield f"event: {event_type}\ndata: {data_str}\n\n"
     except asyncio.CancelledError:
         structured_log(
             logger,
@@ -84,4 +245,4 @@ async def event_generator(run_id: int) -> AsyncGenerator[str, None]:
         )
         raise
     finally:
-        run_events.unsubscribe(run_id, queue)
+        run_events.unsubscribe(run_id, subscription)
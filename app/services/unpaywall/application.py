@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
@@ -9,11 +10,12 @@ from urllib.parse import unquote
 from app.logging_utils import structured_log
 from app.services.crossref.application import discover_doi_for_publication
 from app.services.doi.normalize import normalize_doi
+from app.services.rate_control import PROVIDER_CROSSREF, PROVIDER_UNPAYWALL, get_provider_controller
+from app.services.unpaywall.cache import get_cached_payload, set_cached_payload
 from app.services.unpaywall.pdf_discovery import (
     looks_like_pdf_url,
     resolve_pdf_from_landing_page,
 )
-from app.services.unpaywall.rate_limit import wait_for_unpaywall_slot
 from app.settings import settings
 
 if TYPE_CHECKING:
@@ -40,6 +42,27 @@ class OaResolutionOutcome:
     used_crossref: bool
 
 
+class _CrossrefBudget:
+    """Per-request cap on Crossref lookups shared by concurrently resolving items.
+
+    A slot is reserved right before a lookup and refunded when the lookup finds
+    no DOI, matching the sequential rule that only productive lookups count.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(int(limit), 0)
+        self._used = 0
+
+    def try_acquire(self) -> bool:
+        if self._used >= self.limit:
+            return False
+        self._used += 1
+        return True
+
+    def refund(self) -> None:
+        self._used = max(self._used - 1, 0)
+
+
 def _extract_doi_candidate(text: str | None) -> str | None:
     if not text:
         return None
@@ -167,18 +190,38 @@ async def _fetch_unpaywall_payload_by_doi(
     doi: str,
     email: str,
 ) -> dict | None:
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
+    cached = get_cached_payload(doi)
+    if cached is not None:
+        structured_log(logger, "debug", "unpaywall.payload_cache_hit", negative=cached.payload is None)
+        return cached.payload
     headers = {"User-Agent": f"scholar-scraper/1.0 (mailto:{email})"}
-    response = await client.get(
-        UNPAYWALL_URL_TEMPLATE.format(doi=doi),
-        params={"email": email},
-        headers=headers,
-    )
+    async with get_provider_controller(PROVIDER_UNPAYWALL).request() as call:
+        response = await client.get(
+            UNPAYWALL_URL_TEMPLATE.format(doi=doi),
+            params={"email": email},
+            headers=headers,
+        )
+        call.observe_response(response)
+    max_entries = max(int(settings.unpaywall_cache_max_entries), 0)
+    if response.status_code == 404:
+        set_cached_payload(
+            doi,
+            None,
+            ttl_seconds=max(float(settings.unpaywall_negative_cache_ttl_seconds), 0.0),
+            max_entries=max_entries,
+        )
+        return None
     if response.status_code != 200:
         return None
     payload = response.json()
     if not isinstance(payload, dict):
         return None
+    set_cached_payload(
+        doi,
+        payload,
+        ttl_seconds=max(float(settings.unpaywall_cache_ttl_seconds), 0.0),
+        max_entries=max_entries,
+    )
     return payload
 
 
@@ -192,7 +235,7 @@ async def _resolve_item_payload(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref_budget: _CrossrefBudget,
 ) -> tuple[dict | None, bool, str | None]:
     doi = _publication_doi(item)
     payload: dict | None = None
@@ -200,13 +243,16 @@ async def _resolve_item_payload(
         payload = await _fetch_unpaywall_payload_by_doi(client=client, doi=doi, email=email)
         if payload is not None and _has_direct_payload_pdf(payload):
             return payload, False, doi
-    if not allow_crossref or not settings.crossref_enabled:
+    if not settings.crossref_enabled or not crossref_budget.try_acquire():
         return payload, False, doi
-    crossref_doi = await discover_doi_for_publication(
-        item=item,
-        max_rows=settings.crossref_max_rows,
-        email=email,
-    )
+    async with get_provider_controller(PROVIDER_CROSSREF).concurrency_slot():
+        crossref_doi = await discover_doi_for_publication(
+            item=item,
+            max_rows=settings.crossref_max_rows,
+            email=email,
+        )
+    if crossref_doi is None:
+        crossref_budget.refund()
     if crossref_doi is None or crossref_doi == doi:
         return payload, crossref_doi is not None, doi or crossref_doi
     crossref_payload = await _fetch_unpaywall_payload_by_doi(
@@ -295,13 +341,13 @@ async def _resolve_outcome_for_item(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref_budget: _CrossrefBudget,
 ) -> OaResolutionOutcome:
     payload, used_crossref, resolved_doi = await _resolve_item_payload(
         client=client,
         item=item,
         email=email,
-        allow_crossref=allow_crossref,
+        crossref_budget=crossref_budget,
     )
     if not isinstance(payload, dict):
         return _outcome_with_failure(
@@ -332,14 +378,14 @@ async def _safe_outcome_for_item(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref_budget: _CrossrefBudget,
 ) -> OaResolutionOutcome:
     try:
         return await _resolve_outcome_for_item(
             client=client,
             item=item,
             email=email,
-            allow_crossref=allow_crossref,
+            crossref_budget=crossref_budget,
         )
     except Exception as exc:  # pragma: no cover - defensive network boundary
         structured_log(
@@ -348,7 +394,7 @@ async def _safe_outcome_for_item(
         return _outcome_with_failure(
             item=item,
             failure_reason=FAILURE_RESOLUTION_EXCEPTION,
-            used_crossref=allow_crossref and settings.crossref_enabled,
+            used_crossref=crossref_budget.limit > 0 and settings.crossref_enabled,
         )
 
 
@@ -358,21 +404,22 @@ async def _resolve_outcomes_with_client(
     targets: list[PublicationListItem],
     email: str,
 ) -> dict[int, OaResolutionOutcome]:
-    outcomes: dict[int, OaResolutionOutcome] = {}
-    crossref_budget = _crossref_budget_value()
-    crossref_lookups = 0
-    for item in targets:
-        allow_crossref = crossref_budget > 0 and crossref_lookups < crossref_budget
-        outcome = await _safe_outcome_for_item(
-            client=client,
-            item=item,
-            email=email,
-            allow_crossref=allow_crossref,
-        )
-        if outcome.used_crossref:
-            crossref_lookups += 1
-        outcomes[item.publication_id] = outcome
-    return outcomes
+    # Items resolve concurrently up to the Unpaywall controller's adaptive concurrency limit,
+    # which also paces each Unpaywall request.
+    crossref_budget = _CrossrefBudget(_crossref_budget_value())
+    controller = get_provider_controller(PROVIDER_UNPAYWALL)
+
+    async def _bounded(item: PublicationListItem) -> OaResolutionOutcome:
+        async with controller.concurrency_slot():
+            return await _safe_outcome_for_item(
+                client=client,
+                item=item,
+                email=email,
+                crossref_budget=crossref_budget,
+            )
+
+    results = await asyncio.gather(*(_bounded(item) for item in targets))
+    return {item.publication_id: outcome for item, outcome in zip(targets, results, strict=True)}
 
 
 async def resolve_publication_oa_metadata(
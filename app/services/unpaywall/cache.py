@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.ttl_cache import TtlLruCache
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    # ``payload`` is None for a negative entry (Unpaywall answered 404 for the DOI).
+    payload: dict | None
+
+
+@dataclass(frozen=True)
+class CachedLandingResult:
+    # ``pdf_url`` is None for a negative entry (the crawl found no PDF).
+    pdf_url: str | None
+
+
+_ENTRIES: TtlLruCache[str, CachedPayload] = TtlLruCache()
+_LANDING_ENTRIES: TtlLruCache[str, CachedLandingResult] = TtlLruCache()
+
+
+def _cache_key(doi: str) -> str:
+    return doi.strip().lower()
+
+
+def get_cached_payload(doi: str) -> CachedPayload | None:
+    return _ENTRIES.get(_cache_key(doi))
+
+
+def set_cached_payload(
+    doi: str,
+    payload: dict | None,
+    *,
+    ttl_seconds: float,
+    max_entries: int,
+) -> None:
+    _ENTRIES.set(_cache_key(doi), CachedPayload(payload=payload), ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+
+def clear_unpaywall_cache() -> None:
+    _ENTRIES.clear()
+
+
+def get_cached_landing_result(page_url: str) -> CachedLandingResult | None:
+    return _LANDING_ENTRIES.get(page_url.strip())
+
+
+def set_cached_landing_result(
+    page_url: str,
+    pdf_url: str | None,
+    *,
+    ttl_seconds: float,
+    max_entries: int,
+) -> None:
+    _LANDING_ENTRIES.set(
+        page_url.strip(),
+        CachedLandingResult(pdf_url=pdf_url),
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+    )
+
+
+def clear_landing_cache() -> None:
+    _LANDING_ENTRIES.clear()
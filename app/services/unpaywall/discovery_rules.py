@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlparse, urlunparse
+
+_MAX_DOMAINS = 1024
+# A learned rule is dropped after this many consecutive lookups where it did not yield a PDF.
+_MAX_CONSECUTIVE_MISSES = 3
+
+
+@dataclass(frozen=True)
+class PathRewrite:
+    """Replace one path segment, e.g. ``/doi/abs/...`` -> ``/doi/pdf/...``."""
+
+    index: int
+    source: str
+    target: str
+
+
+@dataclass
+class DomainRule:
+    rewrite: PathRewrite | None = None
+    candidate_rank: int | None = None
+    misses: int = 0
+
+
+_RULES: OrderedDict[str, DomainRule] = OrderedDict()
+
+
+def _domain(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def _segments(path: str) -> list[str]:
+    return path.split("/")
+
+
+def derive_path_rewrite(page_url: str, pdf_url: str) -> PathRewrite | None:
+    """Return the single-segment rewrite turning ``page_url`` into ``pdf_url``, if there is one."""
+    page = urlparse(page_url)
+    pdf = urlparse(pdf_url)
+    if _domain(page_url) != _domain(pdf_url) or page.query or pdf.query:
+        return None
+    page_segments = _segments(page.path)
+    pdf_segments = _segments(pdf.path)
+    if len(page_segments) != len(pdf_segments):
+        return None
+    differing = [index for index, (a, b) in enumerate(zip(page_segments, pdf_segments, strict=True)) if a != b]
+    if len(differing) != 1:
+        return None
+    index = differing[0]
+    # Only structural segments make reusable rules; a differing leaf is an article-specific id.
+    if index == len(page_segments) - 1:
+        return None
+    return PathRewrite(index=index, source=page_segments[index], target=pdf_segments[index])
+
+
+def apply_path_rewrite(page_url: str, rewrite: PathRewrite) -> str | None:
+    parsed = urlparse(page_url)
+    segments = _segments(parsed.path)
+    if rewrite.index >= len(segments) or segments[rewrite.index] != rewrite.source:
+        return None
+    segments[rewrite.index] = rewrite.target
+    return urlunparse(parsed._replace(path="/".join(segments), query="", fragment=""))
+
+
+def rule_for_url(url: str) -> DomainRule | None:
+    domain = _domain(url)
+    rule = _RULES.get(domain)
+    if rule is not None:
+        _RULES.move_to_end(domain)
+    return rule
+
+
+def learn_rule(*, page_url: str, pdf_url: str, candidate_rank: int | None) -> None:
+    domain = _domain(page_url)
+    if not domain:
+        return
+    rule = _RULES.get(domain) or DomainRule()
+    rewrite = derive_path_rewrite(page_url, pdf_url)
+    if rewrite is not None:
+        rule.rewrite = rewrite
+    if candidate_rank is not None:
+        rule.candidate_rank = candidate_rank
+    rule.misses = 0
+    _RULES[domain] = rule
+    _RULES.move_to_end(domain)
+    while len(_RULES) > _MAX_DOMAINS:
+        _RULES.popitem(last=False)
+
+
+def record_rule_miss(url: str) -> None:
+    domain = _domain(url)
+    rule = _RULES.get(domain)
+    if rule is None:
+        return
+    rule.misses += 1
+    if rule.misses >= _MAX_CONSECUTIVE_MISSES:
+        _RULES.pop(domain, None)
+
+
+def clear_discovery_rules() -> None:
+    _RULES.clear()
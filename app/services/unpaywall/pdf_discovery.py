@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import logging
 import re
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
-from app.services.unpaywall.rate_limit import wait_for_unpaywall_slot
+import httpx
+
+from app.logging_utils import structured_log
+from app.services.rate_control import PROVIDER_PDF_LANDING, ProviderCircuitOpenError, get_provider_controller
+from app.services.unpaywall.cache import get_cached_landing_result, set_cached_landing_result
+from app.services.unpaywall.discovery_rules import (
+    DomainRule,
+    apply_path_rewrite,
+    learn_rule,
+    record_rule_miss,
+    rule_for_url,
+)
 from app.settings import settings
 
+logger = logging.getLogger(__name__)
+
 PDF_MIME = "application/pdf"
+PDF_MAGIC = b"%PDF-"
 URL_RE = re.compile(r"https?://[^\s\"'<>]+", re.I)
+_PROBE_SNIFF_BYTES = 4096
 
 
 class _LandingPdfParser(HTMLParser):
@@ -102,27 +118,88 @@ def _candidate_sort_key(candidate: str) -> tuple[int, str]:
     return (2, lowered)
 
 
+def _content_type(response) -> str:
+    return str(response.headers.get("content-type") or "").lower()
+
+
 def _is_html_response(response) -> bool:
-    content_type = str(response.headers.get("content-type") or "").lower()
+    content_type = _content_type(response)
     return "text/html" in content_type or "application/xhtml+xml" in content_type
 
 
+async def _read_capped_bytes(response, *, limit: int) -> bytes:
+    # Stop pulling from the socket once the cap is reached; the stream context closes the rest.
+    chunks: list[bytes] = []
+    total = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return b"".join(chunks)[:limit]
+
+
 async def _fetch_page_html(client, *, page_url: str) -> str | None:
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
-    response = await client.get(page_url, follow_redirects=True)
-    if response.status_code != 200 or not _is_html_response(response):
+    limit = max(int(settings.unpaywall_pdf_discovery_max_html_bytes), 0)
+    async with (
+        get_provider_controller(PROVIDER_PDF_LANDING).request() as call,
+        client.stream("GET", page_url, follow_redirects=True) as response,
+    ):
+        call.observe_response(response)
+        if response.status_code != 200 or not _is_html_response(response):
+            return None
+        body = await _read_capped_bytes(response, limit=limit) if limit > 0 else b""
+        encoding = response.charset_encoding or "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+async def _head_says_pdf(client, *, candidate_url: str) -> bool | None:
+    """Classify a candidate from a HEAD response, or ``None`` when HEAD is inconclusive."""
+    try:
+        async with get_provider_controller(PROVIDER_PDF_LANDING).request() as call:
+            response = await client.head(candidate_url, follow_redirects=True)
+            call.observe_response(response)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        # Many publishers reject HEAD (403/405) while serving GET normally.
         return None
-    text = response.text or ""
-    return text[: max(int(settings.unpaywall_pdf_discovery_max_html_bytes), 0)]
+    content_type = _content_type(response)
+    if PDF_MIME in content_type:
+        return True
+    if _is_html_response(response):
+        return False
+    return None
+
+
+async def _streamed_get_says_pdf(client, *, candidate_url: str) -> bool:
+    async with (
+        get_provider_controller(PROVIDER_PDF_LANDING).request() as call,
+        client.stream("GET", candidate_url, follow_redirects=True) as response,
+    ):
+        call.observe_response(response)
+        if response.status_code != 200:
+            return False
+        content_type = _content_type(response)
+        if PDF_MIME in content_type:
+            return True
+        if _is_html_response(response):
+            return False
+        # Generic types such as application/octet-stream: sniff the PDF magic bytes.
+        head = await _read_capped_bytes(response, limit=_PROBE_SNIFF_BYTES)
+    return head.lstrip().startswith(PDF_MAGIC)
 
 
 async def _candidate_is_pdf(client, *, candidate_url: str) -> bool:
     if looks_like_pdf_url(candidate_url):
         return True
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
-    response = await client.get(candidate_url, follow_redirects=True)
-    content_type = str(response.headers.get("content-type") or "").lower()
-    return response.status_code == 200 and PDF_MIME in content_type
+    head_result = await _head_says_pdf(client, candidate_url=candidate_url)
+    if head_result is not None:
+        return head_result
+    return await _streamed_get_says_pdf(client, candidate_url=candidate_url)
 
 
 def _candidate_limit() -> int:
@@ -140,17 +217,91 @@ async def _resolve_pdf_from_candidate_page(client, *, candidate_url: str) -> str
     return None
 
 
-async def resolve_pdf_from_landing_page(client, *, page_url: str) -> str | None:
-    if not settings.unpaywall_pdf_discovery_enabled:
+def _ranked_candidates(candidates: list[str], *, preferred_rank: int | None) -> list[tuple[int, str]]:
+    ranked = list(enumerate(candidates))
+    if preferred_rank is not None and 0 < preferred_rank < len(ranked):
+        ranked.insert(0, ranked.pop(preferred_rank))
+    return ranked[: _candidate_limit()]
+
+
+async def _pdf_from_learned_rewrite(client, *, page_url: str, rule: DomainRule | None) -> str | None:
+    if rule is None or rule.rewrite is None:
         return None
+    rewritten = apply_path_rewrite(page_url, rule.rewrite)
+    if rewritten is None or rewritten == page_url:
+        return None
+    if await _candidate_is_pdf(client, candidate_url=rewritten):
+        return rewritten
+    record_rule_miss(page_url)
+    return None
+
+
+async def _crawl_landing_page(
+    client,
+    *,
+    page_url: str,
+    rule: DomainRule | None,
+) -> tuple[bool, str | None, int | None]:
+    """Return ``(crawled, pdf_url, candidate_rank)``; ``crawled`` is False when the page was unreadable."""
     html = await _fetch_page_html(client, page_url=page_url)
     if not html:
-        return None
+        return False, None, None
     candidates = _normalized_candidate_urls(page_url=page_url, html=html)
-    for candidate in candidates[: _candidate_limit()]:
+    preferred_rank = rule.candidate_rank if rule is not None else None
+    for rank, candidate in _ranked_candidates(candidates, preferred_rank=preferred_rank):
         if await _candidate_is_pdf(client, candidate_url=candidate):
-            return candidate
+            return True, candidate, rank
         nested_pdf = await _resolve_pdf_from_candidate_page(client, candidate_url=candidate)
         if nested_pdf:
-            return nested_pdf
-    return None
+            return True, nested_pdf, rank
+    return True, None, None
+
+
+def _cache_landing_result(page_url: str, pdf_url: str | None) -> None:
+    ttl_seconds = (
+        settings.unpaywall_pdf_discovery_cache_ttl_seconds
+        if pdf_url
+        else settings.unpaywall_pdf_discovery_negative_cache_ttl_seconds
+    )
+    set_cached_landing_result(
+        page_url,
+        pdf_url,
+        ttl_seconds=max(float(ttl_seconds), 0.0),
+        max_entries=max(int(settings.unpaywall_pdf_discovery_cache_max_entries), 0),
+    )
+
+
+async def resolve_pdf_from_landing_page(client, *, page_url: str) -> str | None:
+    if not settings.unpaywall_pdf_discovery_enabled:
+        return None
+    cached = get_cached_landing_result(page_url)
+    if cached is not None:
+        return cached.pdf_url
+    try:
+        return await _discover_pdf_from_landing_page(client, page_url=page_url)
+    except ProviderCircuitOpenError as exc:
+        # Publisher fetches keep failing; skip the crawl without caching a miss.
+        structured_log(
+            logger,
+            "info",
+            "unpaywall.landing_crawl_skipped",
+            landing_url=page_url,
+            retry_after_seconds=exc.retry_after_seconds,
+        )
+        return None
+
+
+async def _discover_pdf_from_landing_page(client, *, page_url: str) -> str | None:
+    rule = rule_for_url(page_url)
+    rewritten_pdf = await _pdf_from_learned_rewrite(client, page_url=page_url, rule=rule)
+    if rewritten_pdf:
+        learn_rule(page_url=page_url, pdf_url=rewritten_pdf, candidate_rank=None)
+        _cache_landing_result(page_url, rewritten_pdf)
+        return rewritten_pdf
+    crawled, pdf_url, rank = await _crawl_landing_page(client, page_url=page_url, rule=rule)
+    if not crawled:
+        return None
+    if pdf_url:
+        learn_rule(page_url=page_url, pdf_url=pdf_url, candidate_rank=rank)
+    _cache_landing_result(page_url, pdf_url)
+    return pdf_url
@@ -6,7 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import User
+from app.db.models import User, UserDataVersion
 
 EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
@@ -43,6 +43,12 @@ async def get_user_by_email(db_session: AsyncSession, email: str) -> User | None
     return result.scalar_one_or_none()
 
 
+async def get_user_data_version(db_session: AsyncSession, *, user_id: int) -> int:
+    """Return the trigger-maintained version of the user's list data (0 before the first change)."""
+    result = await db_session.execute(select(UserDataVersion.version).where(UserDataVersion.user_id == user_id))
+    return int(result.scalar_one_or_none() or 0)
+
+
 async def list_users(db_session: AsyncSession) -> list[User]:
     result = await db_session.execute(select(User).order_by(User.email.asc()))
     return list(result.scalars().all())
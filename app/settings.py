@@ -188,6 +188,17 @@ class Settings:
     )
     scheduler_queue_batch_size: int = _env_int("SCHEDULER_QUEUE_BATCH_SIZE", 10)
     scheduler_pdf_queue_batch_size: int = _env_int("SCHEDULER_PDF_QUEUE_BATCH_SIZE", 15)
+    scheduler_identifier_dedup_interval_seconds: float = _env_float(
+        "SCHEDULER_IDENTIFIER_DEDUP_INTERVAL_SECONDS",
+        3600.0,
+    )
+    scheduler_publication_counters_reconcile_interval_seconds: float = _env_float(
+        "SCHEDULER_PUBLICATION_COUNTERS_RECONCILE_INTERVAL_SECONDS",
+        86400.0,
+    )
+    run_events_backend: str = _env_str("RUN_EVENTS_BACKEND", "memory")
+    run_events_replay_buffer_size: int = _env_int("RUN_EVENTS_REPLAY_BUFFER_SIZE", 512)
+    run_events_coalesce_window_ms: int = _env_int("RUN_EVENTS_COALESCE_WINDOW_MS", 250)
     frontend_enabled: bool = _env_bool("FRONTEND_ENABLED", True)
     frontend_dist_dir: str = _env_str("FRONTEND_DIST_DIR", "/app/frontend/dist")
     scholar_image_upload_dir: str = _env_str(
@@ -248,6 +259,10 @@ class Settings:
     unpaywall_min_interval_seconds: float = _env_float("UNPAYWALL_MIN_INTERVAL_SECONDS", 0.6)
     unpaywall_max_items_per_request: int = _env_int("UNPAYWALL_MAX_ITEMS_PER_REQUEST", 20)
     unpaywall_retry_cooldown_seconds: int = _env_int("UNPAYWALL_RETRY_COOLDOWN_SECONDS", 1800)
+    unpaywall_rate_burst: int = _env_int("UNPAYWALL_RATE_BURST", 3)
+    unpaywall_cache_ttl_seconds: float = _env_float("UNPAYWALL_CACHE_TTL_SECONDS", 86_400.0)
+    unpaywall_negative_cache_ttl_seconds: float = _env_float("UNPAYWALL_NEGATIVE_CACHE_TTL_SECONDS", 21_600.0)
+    unpaywall_cache_max_entries: int = _env_int("UNPAYWALL_CACHE_MAX_ENTRIES", 4096)
     pdf_auto_retry_interval_seconds: int = _env_int(
         "PDF_AUTO_RETRY_INTERVAL_SECONDS",
         86_400,
@@ -257,9 +272,30 @@ class Settings:
         86_400,
     )
     pdf_auto_retry_max_attempts: int = _env_int("PDF_AUTO_RETRY_MAX_ATTEMPTS", 2)
+    pdf_resolution_hedge_enabled: bool = _env_bool("PDF_RESOLUTION_HEDGE_ENABLED", False)
+    pdf_resolution_hedge_delay_seconds: float = _env_float("PDF_RESOLUTION_HEDGE_DELAY_SECONDS", 2.0)
+    pdf_queue_workers: int = _env_int("PDF_QUEUE_WORKERS", 2)
+    pdf_queue_claim_batch_size: int = _env_int("PDF_QUEUE_CLAIM_BATCH_SIZE", 5)
+    pdf_provider_openalex_concurrency: int = _env_int("PDF_PROVIDER_OPENALEX_CONCURRENCY", 4)
+    pdf_provider_arxiv_concurrency: int = _env_int("PDF_PROVIDER_ARXIV_CONCURRENCY", 1)
+    pdf_provider_unpaywall_concurrency: int = _env_int("PDF_PROVIDER_UNPAYWALL_CONCURRENCY", 4)
+    pdf_provider_crossref_concurrency: int = _env_int("PDF_PROVIDER_CROSSREF_CONCURRENCY", 2)
+    provider_rate_max_speedup: float = _env_float("PROVIDER_RATE_MAX_SPEEDUP", 2.0)
+    provider_rate_max_slowdown: float = _env_float("PROVIDER_RATE_MAX_SLOWDOWN", 16.0)
+    provider_latency_target_seconds: float = _env_float("PROVIDER_LATENCY_TARGET_SECONDS", 5.0)
+    provider_circuit_failure_threshold: int = _env_int("PROVIDER_CIRCUIT_FAILURE_THRESHOLD", 5)
+    provider_circuit_open_seconds: float = _env_float("PROVIDER_CIRCUIT_OPEN_SECONDS", 60.0)
     unpaywall_pdf_discovery_enabled: bool = _env_bool("UNPAYWALL_PDF_DISCOVERY_ENABLED", True)
     unpaywall_pdf_discovery_max_candidates: int = _env_int("UNPAYWALL_PDF_DISCOVERY_MAX_CANDIDATES", 5)
     unpaywall_pdf_discovery_max_html_bytes: int = _env_int("UNPAYWALL_PDF_DISCOVERY_MAX_HTML_BYTES", 500_000)
+    unpaywall_pdf_discovery_min_interval_seconds: float = _env_float(
+        "UNPAYWALL_PDF_DISCOVERY_MIN_INTERVAL_SECONDS", 0.6
+    )
+    unpaywall_pdf_discovery_cache_ttl_seconds: float = _env_float("UNPAYWALL_PDF_DISCOVERY_CACHE_TTL_SECONDS", 86_400.0)
+    unpaywall_pdf_discovery_negative_cache_ttl_seconds: float = _env_float(
+        "UNPAYWALL_PDF_DISCOVERY_NEGATIVE_CACHE_TTL_SECONDS", 21_600.0
+    )
+    unpaywall_pdf_discovery_cache_max_entries: int = _env_int("UNPAYWALL_PDF_DISCOVERY_CACHE_MAX_ENTRIES", 4096)
     arxiv_enabled: bool = _env_bool("ARXIV_ENABLED", True)
     arxiv_timeout_seconds: float = _env_float("ARXIV_TIMEOUT_SECONDS", 3.0)
     arxiv_min_interval_seconds: float = _env_float("ARXIV_MIN_INTERVAL_SECONDS", 4.0)
@@ -267,14 +303,24 @@ class Settings:
     arxiv_default_max_results: int = _env_int("ARXIV_DEFAULT_MAX_RESULTS", 3)
     arxiv_cache_ttl_seconds: float = _env_float("ARXIV_CACHE_TTL_SECONDS", 900.0)
     arxiv_cache_max_entries: int = _env_int("ARXIV_CACHE_MAX_ENTRIES", 512)
+    arxiv_memory_cache_max_entries: int = _env_int("ARXIV_MEMORY_CACHE_MAX_ENTRIES", 256)
+    arxiv_cache_prune_interval_seconds: float = _env_float("ARXIV_CACHE_PRUNE_INTERVAL_SECONDS", 300.0)
     arxiv_mailto: str = _env_str("ARXIV_MAILTO", "")
+    arxiv_batch_max_publications: int = _env_int("ARXIV_BATCH_MAX_PUBLICATIONS", 8)
+    arxiv_batch_max_query_chars: int = _env_int("ARXIV_BATCH_MAX_QUERY_CHARS", 1000)
     crossref_enabled: bool = _env_bool("CROSSREF_ENABLED", True)
     crossref_max_rows: int = _env_int("CROSSREF_MAX_ROWS", 10)
     crossref_timeout_seconds: float = _env_float("CROSSREF_TIMEOUT_SECONDS", 8.0)
     crossref_min_interval_seconds: float = _env_float("CROSSREF_MIN_INTERVAL_SECONDS", 0.6)
     crossref_max_lookups_per_request: int = _env_int("CROSSREF_MAX_LOOKUPS_PER_REQUEST", 8)
+    crossref_cache_ttl_seconds: float = _env_float("CROSSREF_CACHE_TTL_SECONDS", 3600.0)
+    crossref_cache_max_entries: int = _env_int("CROSSREF_CACHE_MAX_ENTRIES", 1024)
 
     openalex_api_key: str | None = os.getenv("OPENALEX_API_KEY")
+    openalex_min_interval_seconds: float = _env_float("OPENALEX_MIN_INTERVAL_SECONDS", 0.1)
+    openalex_enrichment_prefetch_chunks: int = _env_int("OPENALEX_ENRICHMENT_PREFETCH_CHUNKS", 2)
+    openalex_rate_limit_backoff_seconds: float = _env_float("OPENALEX_RATE_LIMIT_BACKOFF_SECONDS", 5.0)
+    openalex_rate_limit_max_backoff_seconds: float = _env_float("OPENALEX_RATE_LIMIT_MAX_BACKOFF_SECONDS", 60.0)
     database_reserved_api_connections: int = _env_int("DATABASE_RESERVED_API_CONNECTIONS", 3)
 
     crossref_api_token: str | None = os.getenv("CROSSREF_API_TOKEN")
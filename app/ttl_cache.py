@@ -0,0 +1,58 @@
+"""Bounded in-process cache with per-entry expiry and least-recently-used eviction."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class TtlLruCache[K, V]:
+    """Keeps at most ``max_entries`` values; expired entries are dropped when read.
+
+    Deadlines default to ``time.monotonic()``; callers that track expiry on another clock
+    pass ``now`` on every call.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, *, now: float | None = None) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= _now(now):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        now: float | None = None,
+    ) -> None:
+        if ttl_seconds <= 0 or max_entries <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (value, _now(now) + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _now(now: float | None) -> float:
+    return time.monotonic() if now is None else now
@@ -116,6 +116,7 @@ export interface TriggerPublicationNearDuplicateRepairPayload {
   min_shared_tokens?: number;
   max_year_delta?: number;
   max_clusters?: number;
+  scope?: "incremental" | "full";
   selected_cluster_keys?: string[];
   requested_by?: string;
   confirmation_text?: string;
@@ -7,7 +7,8 @@ export type PublicationSortBy =
   | "year"
   | "citations"
   | "scholar"
-  | "pdf_status";
+  | "pdf_status"
+  | "relevance";
 
 export interface DisplayIdentifier {
   kind: string;
@@ -53,6 +54,7 @@ export interface PublicationsResult {
   snapshot: string;
   has_next: boolean;
   has_prev: boolean;
+  next_cursor?: string | null;
   publications: PublicationItem[];
 }
 
@@ -66,6 +68,7 @@ export interface PublicationsQuery {
   page?: number;
   pageSize?: number;
   snapshot?: string;
+  cursor?: string;
 }
 
 export interface PublicationSelection {
@@ -103,6 +106,9 @@ export async function listPublications(query: PublicationsQuery = {}): Promise<P
   if (query.snapshot && query.snapshot.trim().length > 0) {
     params.set("snapshot", query.snapshot.trim());
   }
+  if (query.cursor && query.cursor.trim().length > 0) {
+    params.set("cursor", query.cursor.trim());
+  }
 
   const suffix = params.toString();
   const response = await apiRequest<PublicationsResult>(
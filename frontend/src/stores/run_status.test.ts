@@ -339,39 +339,64 @@ describe("run status store", () => {
     expect(store.latestRun?.new_publication_count).toBe(5);
   });
 
-  it("applies identifier_updated SSE events to live publications", () => {
+  it("applies batched discovery and identifier SSE events to live publications", () => {
     const previousEventSource = (globalThis as any).EventSource;
     FakeEventSource.instances = [];
     (globalThis as any).EventSource = FakeEventSource as any;
     try {
       const store = useRunStatusStore();
-      store.setLatestRun(buildRun({ id: 314, status: "running", end_dt: null }));
+      store.setLatestRun(buildRun({ id: 314, status: "running", new_publication_count: 0, end_dt: null }));
 
       const stream = FakeEventSource.instances[0];
       expect(stream).toBeDefined();
-      stream.emit("publication_discovered", {
-        publication_id: 22,
-        scholar_profile_id: 7,
-        scholar_label: "Ada Lovelace",
-        title: "Optimization Notes",
-        pub_url: null,
-        first_seen_at: "2026-02-26T10:00:00Z",
+      stream.emit("publication_discovered_batch", {
+        items: [
+          {
+            publication_id: 21,
+            scholar_profile_id: 7,
+            scholar_label: "Ada Lovelace",
+            title: "Analytical Engine Notes",
+            pub_url: null,
+            first_seen_at: "2026-02-26T09:59:00Z",
+            new_publication_count: 1,
+          },
+          {
+            publication_id: 22,
+            scholar_profile_id: 7,
+            scholar_label: "Ada Lovelace",
+            title: "Optimization Notes",
+            pub_url: null,
+            first_seen_at: "2026-02-26T10:00:00Z",
+            new_publication_count: 2,
+          },
+        ],
       });
-      expect(store.livePublications).toHaveLength(1);
+      expect(store.livePublications.map((item) => item.publication_id)).toEqual([22, 21]);
       expect(store.livePublications[0].display_identifier).toBeNull();
-
-      stream.emit("identifier_updated", {
-        publication_id: 22,
-        display_identifier: {
-          kind: "doi",
-          value: "10.1000/xyz",
-          label: "DOI: 10.1000/xyz",
-          url: "https://doi.org/10.1000/xyz",
-          confidence_score: 0.95,
-        },
+      expect(store.latestRun?.new_publication_count).toBe(2);
+
+      stream.emit("identifier_updated_batch", {
+        items: [
+          {
+            publication_id: 22,
+            display_identifier: {
+              kind: "doi",
+              value: "10.1000/xyz",
+              label: "DOI: 10.1000/xyz",
+              url: "https://doi.org/10.1000/xyz",
+              confidence_score: 0.95,
+            },
+          },
+        ],
       });
       expect(store.livePublications[0].display_identifier?.kind).toBe("doi");
       expect(store.livePublications[0].display_identifier?.value).toBe("10.1000/xyz");
+
+      stream.emit("run_summary", {
+        skipped: { publication_discovered: 40 },
+        new_publication_count: 42,
+      });
+      expect(store.latestRun?.new_publication_count).toBe(42);
     } finally {
       (globalThis as any).EventSource = previousEventSource;
     }
@@ -88,6 +88,17 @@ function parsePublicationCount(value: unknown, fallback: number): number {
   return fallback;
 }
 
+function parseBatchItems(value: unknown): Array<Record<string, unknown>> {
+  if (!value || typeof value !== "object") {
+    return [];
+  }
+  const items = (value as Record<string, unknown>).items;
+  if (!Array.isArray(items)) {
+    return [];
+  }
+  return items.filter((item): item is Record<string, unknown> => item !== null && typeof item === "object");
+}
+
 function parseDisplayIdentifier(value: unknown): StreamDisplayIdentifier {
   if (!value || typeof value !== "object") {
     return null;
@@ -260,56 +271,78 @@ export const useRunStatusStore = defineStore("runStatus", {
         this.livePublications = [];
         this.scholarProgress = null;
         eventSource = new EventSource(`/api/v1/runs/${targetRunId}/stream`);
-        eventSource.addEventListener("publication_discovered", (e) => {
+        const applyDiscovered = (data: any): void => {
+          if (this.latestRun && this.latestRun.id === targetRunId) {
+            const baseline = parsePublicationCount(this.latestRun.new_publication_count, 0);
+            const payloadCount = parsePublicationCount(data?.new_publication_count, baseline + 1);
+            this.latestRun.new_publication_count = Math.max(baseline, payloadCount);
+          }
+          this.livePublications.unshift({
+            publication_id: data.publication_id,
+            scholar_profile_id: data.scholar_profile_id,
+            scholar_label: data.scholar_label,
+            title: data.title,
+            pub_url: data.pub_url,
+            first_seen_at: data.first_seen_at,
+            year: null,
+            citation_count: 0,
+            venue_text: null,
+            display_identifier: null,
+            pdf_url: null,
+            pdf_status: "untracked",
+            pdf_attempt_count: 0,
+            pdf_failure_reason: null,
+            pdf_failure_detail: null,
+            is_read: false,
+            is_favorite: false,
+            is_new_in_latest_run: true,
+          });
+          if (this.livePublications.length > 50) {
+            this.livePublications.pop();
+          }
+        };
+        const applyIdentifierUpdate = (data: any): void => {
+          const publicationId = parseRunId(data?.publication_id);
+          const displayIdentifier = parseDisplayIdentifier(data?.display_identifier);
+          if (publicationId === null || displayIdentifier === null) {
+            return;
+          }
+          this.livePublications = withUpdatedDisplayIdentifier(
+            this.livePublications,
+            {
+              publicationId,
+              displayIdentifier,
+            },
+          );
+        };
+        eventSource.addEventListener("publication_discovered_batch", (e) => {
           try {
-            const data = JSON.parse(e.data);
-            if (this.latestRun && this.latestRun.id === targetRunId) {
-              const baseline = parsePublicationCount(this.latestRun.new_publication_count, 0);
-              const payloadCount = parsePublicationCount(data?.new_publication_count, baseline + 1);
-              this.latestRun.new_publication_count = Math.max(baseline, payloadCount);
+            for (const item of parseBatchItems(JSON.parse(e.data))) {
+              applyDiscovered(item);
             }
-            this.livePublications.unshift({
-              publication_id: data.publication_id,
-              scholar_profile_id: data.scholar_profile_id,
-              scholar_label: data.scholar_label,
-              title: data.title,
-              pub_url: data.pub_url,
-              first_seen_at: data.first_seen_at,
-              year: null,
-              citation_count: 0,
-              venue_text: null,
-              display_identifier: null,
-              pdf_url: null,
-              pdf_status: "untracked",
-              pdf_attempt_count: 0,
-              pdf_failure_reason: null,
-              pdf_failure_detail: null,
-              is_read: false,
-              is_favorite: false,
-              is_new_in_latest_run: true,
-            });
-            if (this.livePublications.length > 50) {
-              this.livePublications.pop();
+          } catch (err) {
+            console.error("Failed to parse SSE event", err);
+          }
+        });
+        eventSource.addEventListener("identifier_updated_batch", (e) => {
+          try {
+            for (const item of parseBatchItems(JSON.parse(e.data))) {
+              applyIdentifierUpdate(item);
             }
           } catch (err) {
             console.error("Failed to parse SSE event", err);
           }
         });
-        eventSource.addEventListener("identifier_updated", (e) => {
+        eventSource.addEventListener("run_summary", (e) => {
+          // Sent when the server skipped events for this stream; the summary carries the
+          // authoritative counter, and skipped discoveries are simply absent from the live list.
           try {
             const data = JSON.parse(e.data);
-            const publicationId = parseRunId(data?.publication_id);
-            const displayIdentifier = parseDisplayIdentifier(data?.display_identifier);
-            if (publicationId === null || displayIdentifier === null) {
-              return;
+            if (this.latestRun && this.latestRun.id === targetRunId) {
+              const baseline = parsePublicationCount(this.latestRun.new_publication_count, 0);
+              const summaryCount = parsePublicationCount(data?.new_publication_count, baseline);
+              this.latestRun.new_publication_count = Math.max(baseline, summaryCount);
             }
-            this.livePublications = withUpdatedDisplayIdentifier(
-              this.livePublications,
-              {
-                publicationId,
-                displayIdentifier,
-              },
-            );
           } catch (err) {
             console.error("Failed to parse SSE event", err);
           }
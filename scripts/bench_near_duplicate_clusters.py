@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import time
+
+from app.services.publications import dedup
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark near-duplicate candidate generation on a synthetic title corpus (no DB access)."
+    )
+    parser.add_argument("--titles", type=int, default=100_000, help="Number of synthetic titles.")
+    parser.add_argument("--vocabulary", type=int, default=50_000, help="Number of distinct rare tokens.")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1, help="Share of titles that are perturbed copies.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--with-baseline",
+        action="store_true",
+        help="Also run the full posting-list union and compare clusters (slow above ~20k titles).",
+    )
+    return parser
+
+
+def _synthetic_corpus(*, titles: int, vocabulary: int, duplicate_rate: float, seed: int) -> list:
+    rng = random.Random(seed)
+    common = ["learning", "network", "analysis", "deep", "neural", "model", "data", "system", "based", "study"]
+    rare = [f"w{index}" for index in range(max(vocabulary, 1))]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(rare))))
+    words_by_title: list[list[str]] = []
+    for _ in range(max(titles, 1)):
+        if words_by_title and rng.random() < duplicate_rate:
+            words = list(rng.choice(words_by_title))
+            if rng.random() < 0.5:
+                words.append(rng.choice(rare))
+            elif len(words) > 3:
+                words.pop(rng.randrange(len(words)))
+        else:
+            words = rng.sample(common, rng.randint(1, 3)) + rng.choices(
+                rare, cum_weights=cum_weights, k=rng.randint(3, 9)
+            )
+        words_by_title.append(words)
+    candidates = [
+        dedup._candidate_from_row(
+            publication_id=index + 1,
+            title=" ".join(words),
+            year=rng.choice([None, 2018, 2019, 2020, 2021, 2022]),
+            citation_count=0,
+        )
+        for index, words in enumerate(words_by_title)
+    ]
+    return [candidate for candidate in candidates if candidate is not None]
+
+
+def _baseline_groups(candidates: list, *, thresholds: dict) -> tuple[list[list[int]], int]:
+    # The previous strategy: compare each title with every title sharing any token.
+    by_id = {candidate.publication_id: candidate for candidate in candidates}
+    token_index = dedup._candidate_token_index(candidates)
+    parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
+    checked = 0
+    for candidate in candidates:
+        peers: set[int] = set()
+        for token in candidate.tokens:
+            peers.update(token_index[token])
+        for peer_id in peers:
+            if peer_id <= candidate.publication_id:
+                continue
+            checked += 1
+            if dedup._is_near_duplicate_pair(candidate, by_id[peer_id], **thresholds):
+                dedup._union(parent, candidate.publication_id, peer_id)
+    groups = dedup._grouped_candidates(candidates, parent)
+    return _group_ids(groups), checked
+
+
+def _group_ids(groups: list) -> list[list[int]]:
+    return sorted([member.publication_id for member in group] for group in groups)
+
+
+def _posting_pair_volume(candidates: list) -> int:
+    # Upper bound on pairs the posting-list union would touch, without materializing them.
+    return sum(len(members) * (len(members) - 1) // 2 for members in dedup._candidate_token_index(candidates).values())
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    thresholds = {
+        "similarity_threshold": dedup.NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD,
+        "min_shared_tokens": dedup.NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS,
+        "max_year_delta": dedup.NEAR_DUP_DEFAULT_MAX_YEAR_DELTA,
+    }
+    candidates = _synthetic_corpus(
+        titles=args.titles,
+        vocabulary=args.vocabulary,
+        duplicate_rate=args.duplicate_rate,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    groups = dedup._cluster_candidate_groups(candidates, **thresholds)
+    elapsed = time.perf_counter() - started
+    checked = sum(
+        1
+        for _ in dedup._candidate_pairs(
+            candidates,
+            similarity_threshold=thresholds["similarity_threshold"],
+            min_shared_tokens=thresholds["min_shared_tokens"],
+        )
+    )
+    report: dict[str, object] = {
+        "titles": len(candidates),
+        "posting_pair_volume": _posting_pair_volume(candidates),
+        "prefix_filter_pairs_checked": checked,
+        "prefix_filter_seconds": round(elapsed, 3),
+        "clusters": len(groups),
+    }
+    if args.with_baseline:
+        started = time.perf_counter()
+        baseline_groups, baseline_checked = _baseline_groups(candidates, thresholds=thresholds)
+        report["baseline_pairs_checked"] = baseline_checked
+        report["baseline_seconds"] = round(time.perf_counter() - started, 3)
+        report["clusters_match"] = baseline_groups == _group_ids(groups)
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from dataclasses import replace
+
+import httpx
+from sqlalchemy import event
+
+from app.db.session import get_engine
+from app.services.arxiv import rate_limit
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure the per-request DB overhead of the global arXiv limiter (no network I/O)."
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Number of limiter passes to run.")
+    parser.add_argument("--fetch-ms", type=float, default=0.0, help="Simulated fetch latency in milliseconds.")
+    return parser
+
+
+async def _run(*, requests: int, fetch_ms: float) -> dict:
+    # Pacing is disabled so the measurement isolates limiter bookkeeping from the configured interval.
+    rate_limit.settings = replace(rate_limit.settings, arxiv_min_interval_seconds=0.0)
+    statement_count = 0
+
+    def _count_statement(*args, **kwargs) -> None:
+        nonlocal statement_count
+        statement_count += 1
+
+    async def _fetch() -> httpx.Response:
+        if fetch_ms > 0:
+            await asyncio.sleep(fetch_ms / 1000.0)
+        return httpx.Response(200, text="ok")
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _count_statement)
+    overheads_ms: list[float] = []
+    try:
+        for _ in range(max(requests, 1)):
+            started = time.perf_counter()
+            await rate_limit.run_with_global_arxiv_limit(fetch=_fetch, source_path="benchmark")
+            overheads_ms.append((time.perf_counter() - started) * 1000.0 - fetch_ms)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count_statement)
+        await get_engine().dispose()
+    ordered = sorted(overheads_ms)
+    return {
+        "requests": len(overheads_ms),
+        "db_statements_per_request": statement_count / len(overheads_ms),
+        "overhead_ms_mean": round(statistics.fmean(ordered), 3),
+        "overhead_ms_p50": round(ordered[len(ordered) // 2], 3),
+        "overhead_ms_p95": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 3),
+    }
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    report = asyncio.run(_run(requests=args.requests, fetch_ms=args.fetch_ms))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
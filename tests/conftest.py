@@ -14,6 +14,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from alembic import command
 from app.auth.deps import get_login_rate_limiter
 from app.db.session import close_engine
+from app.services.arxiv.cache import clear_memory_cache
+from app.services.rate_control.registry import reset_provider_controllers_for_tests
 from app.settings import settings
 
 RESET_SQL = text(
@@ -167,6 +169,20 @@ def reset_rate_limiter_state() -> Iterator[None]:
     limiter.clear_all()
 
 
+@pytest.fixture(autouse=True)
+def reset_provider_rate_controllers() -> Iterator[None]:
+    reset_provider_controllers_for_tests()
+    yield
+    reset_provider_controllers_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def reset_arxiv_memory_cache() -> Iterator[None]:
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
 @pytest.fixture(autouse=True)
 async def reset_app_engine() -> AsyncIterator[None]:
     await close_engine()
@@ -183,6 +183,33 @@ async def test_api_admin_scholar_http_settings_endpoints(db_session: AsyncSessio
         object.__setattr__(settings, "scholar_http_cookie", previous_cookie)
 
 
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_admin_provider_rate_control_endpoint(db_session: AsyncSession) -> None:
+    await insert_user(db_session, email="api-admin-rates@example.com", password="admin-password", is_admin=True)
+    await insert_user(db_session, email="api-member-rates@example.com", password="member-password")
+    client = TestClient(app)
+    login_user(client, email="api-admin-rates@example.com", password="admin-password")
+    headers = api_csrf_headers(client)
+
+    response = client.get("/api/v1/admin/providers/rate-control")
+    assert response.status_code == 200
+    providers = response.json()["data"]["providers"]
+    assert [provider["provider"] for provider in providers] == [
+        "openalex",
+        "arxiv",
+        "unpaywall",
+        "crossref",
+        "pdf_landing",
+    ]
+    assert all(provider["circuit_state"] == "closed" for provider in providers)
+
+    client.post("/api/v1/auth/logout", headers=headers)
+    login_user(client, email="api-member-rates@example.com", password="member-password")
+    assert client.get("/api/v1/admin/providers/rate-control").status_code == 403
+
+
 @pytest.mark.integration
 @pytest.mark.db
 @pytest.mark.asyncio
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
+from app.services.publications import pdf_queue
 from tests.integration.helpers import (
     api_csrf_headers,
     insert_user,
@@ -261,6 +264,91 @@ async def test_api_publications_list_supports_pagination(db_session: AsyncSessio
     assert len(second_data["publications"]) == 1
 
 
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_list_supports_cursor_pagination(db_session: AsyncSession) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-cursor@example.com",
+        password="api-password",
+    )
+    scholar_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, :scholar_id, :display_name, true)
+            RETURNING id
+            """
+        ),
+        {
+            "user_id": user_id,
+            "scholar_id": "cursorScholar01",
+            "display_name": "Cursor Scholar",
+        },
+    )
+    scholar_profile_id = int(scholar_result.scalar_one())
+
+    for index, year in enumerate([2020, None, 2020, 2018, None]):
+        created = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count, year)
+                VALUES (:fingerprint, :title_raw, :title_normalized, 1, :year)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id + 900 + index):064x}",
+                "title_raw": f"Cursor Paper {index}",
+                "title_normalized": f"cursor paper {index}",
+                "year": year,
+            },
+        )
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+                VALUES (:scholar_profile_id, :publication_id, false, false)
+                """
+            ),
+            {"scholar_profile_id": scholar_profile_id, "publication_id": int(created.scalar_one())},
+        )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-cursor@example.com", password="api-password")
+
+    for sort_dir in ("asc", "desc"):
+        expected = client.get(f"/api/v1/publications?mode=all&sort_by=year&sort_dir={sort_dir}&page_size=5")
+        expected_ids = [item["publication_id"] for item in expected.json()["data"]["publications"]]
+        assert len(expected_ids) == 5
+
+        seen_ids: list[int] = []
+        params = {"mode": "all", "sort_by": "year", "sort_dir": sort_dir, "page_size": 2}
+        response = client.get("/api/v1/publications", params=params)
+        while True:
+            assert response.status_code == 200
+            data = response.json()["data"]
+            seen_ids.extend(item["publication_id"] for item in data["publications"])
+            if not data["has_next"]:
+                assert data["next_cursor"] is None
+                break
+            response = client.get(
+                "/api/v1/publications",
+                params={**params, "snapshot": data["snapshot"], "cursor": data["next_cursor"]},
+            )
+        assert seen_ids == expected_ids
+
+    first_cursor = client.get("/api/v1/publications?mode=all&sort_by=year&page_size=2").json()["data"]["next_cursor"]
+    mismatched = client.get(
+        "/api/v1/publications",
+        params={"mode": "all", "sort_by": "title", "page_size": 2, "cursor": first_cursor},
+    )
+    assert mismatched.status_code == 400
+    assert mismatched.json()["error"]["code"] == "invalid_cursor"
+
+
 @pytest.mark.integration
 @pytest.mark.db
 @pytest.mark.asyncio
@@ -329,6 +417,73 @@ async def test_api_publications_search_pagination_uses_filtered_total_count(
     assert all("alpha" in str(item["title"]).lower() for item in data["publications"])
 
 
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_search_matches_stems_and_sorts_by_relevance(
+    db_session: AsyncSession,
+) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-search-rank@example.com",
+        password="api-password",
+    )
+    scholar_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, :scholar_id, :display_name, true)
+            RETURNING id
+            """
+        ),
+        {
+            "user_id": user_id,
+            "scholar_id": "searchRankScholar01",
+            "display_name": "Search Rank Scholar",
+        },
+    )
+    scholar_profile_id = int(scholar_result.scalar_one())
+    titles = ["Learning on graphs in biology", "Graph neural networks for molecules", "Protein folding at scale"]
+    for index, title in enumerate(titles):
+        created = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+                VALUES (:fingerprint, :title_raw, :title_normalized, 1)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id + 950 + index):064x}",
+                "title_raw": title,
+                "title_normalized": title.lower(),
+            },
+        )
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+                VALUES (:scholar_profile_id, :publication_id, false, false)
+                """
+            ),
+            {"scholar_profile_id": scholar_profile_id, "publication_id": int(created.scalar_one())},
+        )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-search-rank@example.com", password="api-password")
+
+    # "graphs" stems to "graph", so the full-text match finds both titles; the exact word ranks first.
+    response = client.get("/api/v1/publications?mode=all&search=graphs&sort_by=relevance")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert int(data["total_count"]) == 2
+    assert [item["title"] for item in data["publications"]] == [
+        "Learning on graphs in biology",
+        "Graph neural networks for molecules",
+    ]
+
+
 @pytest.mark.integration
 @pytest.mark.db
 @pytest.mark.asyncio
@@ -571,3 +726,160 @@ async def test_api_publications_favorite_toggle_and_filter(db_session: AsyncSess
         },
     )
     assert bool(favorite_state_result.scalar_one()) is False
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_list_answers_not_modified_until_data_changes(db_session: AsyncSession) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-etag@example.com",
+        password="api-password",
+    )
+    scholar_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, 'etagScholar01', 'ETag Scholar', true)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    scholar_profile_id = int(scholar_result.scalar_one())
+    publication_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count, pdf_url)
+            VALUES (:fingerprint, 'Cached Paper', 'cached paper', 1, 'https://example.org/cached.pdf')
+            RETURNING id
+            """
+        ),
+        {"fingerprint": f"{(user_id + 301):064x}"},
+    )
+    publication_id = int(publication_result.scalar_one())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+            VALUES (:scholar_profile_id, :publication_id, false, false)
+            """
+        ),
+        {"scholar_profile_id": scholar_profile_id, "publication_id": publication_id},
+    )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-etag@example.com", password="api-password")
+
+    first = client.get("/api/v1/publications?mode=all")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    unchanged = client.get("/api/v1/publications?mode=all", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+
+    other_query = client.get("/api/v1/publications?mode=unread", headers={"If-None-Match": etag})
+    assert other_query.status_code == 200
+
+    favorite_response = client.post(
+        f"/api/v1/publications/{publication_id}/favorite",
+        json={"scholar_profile_id": scholar_profile_id, "is_favorite": True},
+        headers=api_csrf_headers(client),
+    )
+    assert favorite_response.status_code == 200
+
+    changed = client.get("/api/v1/publications?mode=all", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["data"]["publications"][0]["is_favorite"] is True
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_list_tag_changes_when_pdf_retry_becomes_due(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-etag-retry@example.com",
+        password="api-password",
+    )
+    scholar_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, 'etagRetry0001', 'Retry Scholar', true)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    scholar_profile_id = int(scholar_result.scalar_one())
+    publication_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+            VALUES (:fingerprint, 'Retry Paper', 'retry paper', 1)
+            RETURNING id
+            """
+        ),
+        {"fingerprint": f"{(user_id + 401):064x}"},
+    )
+    publication_id = int(publication_result.scalar_one())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+            VALUES (:scholar_profile_id, :publication_id, false, false)
+            """
+        ),
+        {"scholar_profile_id": scholar_profile_id, "publication_id": publication_id},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO publication_pdf_jobs (publication_id, status, attempt_count, last_attempt_at)
+            VALUES (:publication_id, 'failed', 1, now() - interval '10 minutes')
+            """
+        ),
+        {"publication_id": publication_id},
+    )
+    await db_session.commit()
+    scheduled: list[int] = []
+    monkeypatch.setattr(
+        pdf_queue,
+        "schedule_rows",
+        lambda *, user_id, request_email, rows: scheduled.extend(row.publication_id for row in rows),
+    )
+    monkeypatch.setattr(
+        pdf_queue,
+        "settings",
+        replace(pdf_queue.settings, pdf_auto_retry_first_interval_seconds=3600, pdf_auto_retry_max_attempts=3),
+    )
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-etag-retry@example.com", password="api-password")
+
+    first = client.get("/api/v1/publications?mode=all")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert scheduled == []
+    assert client.get("/api/v1/publications?mode=all", headers={"If-None-Match": etag}).status_code == 304
+
+    # The retry interval passing is not a data change, but it must still reach the enqueue step.
+    monkeypatch.setattr(
+        pdf_queue,
+        "settings",
+        replace(pdf_queue.settings, pdf_auto_retry_first_interval_seconds=60, pdf_auto_retry_max_attempts=3),
+    )
+    due = client.get("/api/v1/publications?mode=all", headers={"If-None-Match": etag})
+    assert due.status_code == 200
+    assert due.headers["etag"] != etag
+    assert scheduled == [publication_id]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 from pathlib import Path
 
 import pytest
@@ -371,6 +373,19 @@ async def test_api_scholar_import_export_round_trip(
     assert len(export_payload["scholars"]) == 1
     assert len(export_payload["publications"]) == 1
 
+    stream_response = client.get("/api/v1/scholars/export/stream?format=json")
+    assert stream_response.status_code == 200
+    assert stream_response.headers["content-disposition"].endswith('.json"')
+    streamed_payload = stream_response.json()
+    assert streamed_payload["scholars"] == export_payload["scholars"]
+    assert streamed_payload["publications"] == export_payload["publications"]
+
+    ndjson_response = client.get("/api/v1/scholars/export/stream?compress=true")
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"] == "application/gzip"
+    ndjson_lines = gzip.decompress(ndjson_response.content).decode("utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in ndjson_lines] == ["header", "scholar", "publication"]
+
     import_response = client.post(
         "/api/v1/scholars/import",
         json={
@@ -4,7 +4,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.dbops import run_publication_link_repair
+from app.services.dbops import run_publication_link_repair, run_publication_near_duplicate_repair
 from tests.integration.helpers import insert_user
 
 
@@ -247,3 +247,41 @@ async def test_publication_link_repair_apply_clears_links_and_can_gc_orphans(
         scholar_profile_id=scholar_profile_id,
         publication_id=publication_id,
     )
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_near_duplicate_apply_keeps_unmerged_clusters_in_incremental_scope(
+    db_session: AsyncSession,
+) -> None:
+    titles = [
+        "Adam: a method for stochastic optimization",
+        "Adam: a method for stochastic optimization.",
+        "Attention is all you need for sequence transduction",
+        "Attention is all you need for sequence transduction.",
+    ]
+    for index, title in enumerate(titles):
+        await _insert_publication(
+            db_session,
+            fingerprint=f"{index + 1:064x}",
+            title_raw=title,
+            title_normalized=title.lower(),
+            citation_count=10 - index,
+        )
+    await db_session.commit()
+
+    scan = await run_publication_near_duplicate_repair(db_session, dry_run=True)
+    assert int(scan["summary"]["candidate_cluster_count"]) == 2
+    first_key, second_key = (str(cluster["cluster_key"]) for cluster in scan["clusters"])
+
+    applied = await run_publication_near_duplicate_repair(
+        db_session,
+        dry_run=False,
+        selected_cluster_keys=[first_key],
+    )
+    assert int(applied["summary"]["merged_publications"]) == 1
+
+    rescan = await run_publication_near_duplicate_repair(db_session, dry_run=True)
+    assert rescan["scope"]["scope"] == "incremental"
+    assert [str(cluster["cluster_key"]) for cluster in rescan["clusters"]] == [second_key]
@@ -21,7 +21,7 @@ EXPECTED_TABLES = {
 }
 
 EXPECTED_ENUMS = {"run_status", "run_trigger_type"}
-EXPECTED_REVISION = "20260226_0024"
+EXPECTED_REVISION = "20261019_0030"
 
 
 @pytest.mark.integration
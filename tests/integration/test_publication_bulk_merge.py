@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.publications.dedup import merge_duplicate_publications
+from tests.integration.helpers import insert_user
+
+
+async def _insert_scholar_profile(db_session: AsyncSession, *, user_id: int, scholar_id: str) -> int:
+    result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, :scholar_id, :scholar_id, true)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id, "scholar_id": scholar_id},
+    )
+    return int(result.scalar_one())
+
+
+async def _insert_publication(
+    db_session: AsyncSession,
+    *,
+    fingerprint: str,
+    title_raw: str,
+    citation_count: int,
+    year: int | None = None,
+    venue_text: str | None = None,
+    cluster_id: str | None = None,
+) -> int:
+    result = await db_session.execute(
+        text(
+            """
+            INSERT INTO publications (
+                fingerprint_sha256, title_raw, title_normalized, citation_count, year, venue_text, cluster_id
+            )
+            VALUES (:fingerprint, :title_raw, :title_raw, :citation_count, :year, :venue_text, :cluster_id)
+            RETURNING id
+            """
+        ),
+        {
+            "fingerprint": fingerprint,
+            "title_raw": title_raw,
+            "citation_count": citation_count,
+            "year": year,
+            "venue_text": venue_text,
+            "cluster_id": cluster_id,
+        },
+    )
+    return int(result.scalar_one())
+
+
+async def _link(db_session: AsyncSession, *, scholar_profile_id: int, publication_id: int, is_favorite: bool) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+            VALUES (:scholar_profile_id, :publication_id, false, :is_favorite)
+            """
+        ),
+        {"scholar_profile_id": scholar_profile_id, "publication_id": publication_id, "is_favorite": is_favorite},
+    )
+
+
+async def _add_identifier(
+    db_session: AsyncSession,
+    *,
+    publication_id: int,
+    value: str,
+    confidence_score: float,
+    evidence_url: str | None = None,
+) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO publication_identifiers (
+                publication_id, kind, value_raw, value_normalized, source, confidence_score, evidence_url
+            )
+            VALUES (:publication_id, 'doi', :value_raw, :value_normalized, 'test', :confidence_score, :evidence_url)
+            """
+        ),
+        {
+            "publication_id": publication_id,
+            "value_raw": value,
+            "value_normalized": value,
+            "confidence_score": confidence_score,
+            "evidence_url": evidence_url,
+        },
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_bulk_merge_coalesces_metadata_links_and_identifiers(db_session: AsyncSession) -> None:
+    user_id = await insert_user(db_session, email="bulk-merge@example.com", password="api-password")
+    scholar_a = await _insert_scholar_profile(db_session, user_id=user_id, scholar_id="bulkMergeA01")
+    scholar_b = await _insert_scholar_profile(db_session, user_id=user_id, scholar_id="bulkMergeB01")
+    winner = await _insert_publication(db_session, fingerprint="f" * 64, title_raw="Graph nets", citation_count=3)
+    dup_one = await _insert_publication(
+        db_session,
+        fingerprint="e" * 64,
+        title_raw="Graph nets for relational reasoning",
+        citation_count=9,
+        year=2018,
+        venue_text="NeurIPS",
+        cluster_id="cluster-1",
+    )
+    dup_two = await _insert_publication(db_session, fingerprint="d" * 64, title_raw="Graph nets", citation_count=1)
+    await _link(db_session, scholar_profile_id=scholar_a, publication_id=winner, is_favorite=False)
+    await _link(db_session, scholar_profile_id=scholar_a, publication_id=dup_one, is_favorite=True)
+    await _link(db_session, scholar_profile_id=scholar_b, publication_id=dup_one, is_favorite=True)
+    await _link(db_session, scholar_profile_id=scholar_b, publication_id=dup_two, is_favorite=False)
+    await _add_identifier(db_session, publication_id=winner, value="10.1/shared", confidence_score=0.4)
+    await _add_identifier(
+        db_session,
+        publication_id=dup_one,
+        value="10.1/shared",
+        confidence_score=0.9,
+        evidence_url="https://example.org/evidence",
+    )
+    await _add_identifier(db_session, publication_id=dup_one, value="10.1/dup-only", confidence_score=0.7)
+    await _add_identifier(db_session, publication_id=dup_two, value="10.1/dup-only", confidence_score=0.8)
+    await db_session.commit()
+
+    merged = await merge_duplicate_publications(db_session, merges={dup_one: winner, dup_two: dup_one})
+    await db_session.commit()
+
+    assert merged == 2
+    publications = (
+        await db_session.execute(
+            text("SELECT id, title_raw, citation_count, year, venue_text, cluster_id FROM publications ORDER BY id")
+        )
+    ).all()
+    assert publications == [(winner, "Graph nets for relational reasoning", 9, 2018, "NeurIPS", "cluster-1")]
+    links = (
+        await db_session.execute(
+            text(
+                """
+                SELECT scholar_profile_id, publication_id, is_favorite
+                FROM scholar_publications
+                ORDER BY scholar_profile_id
+                """
+            )
+        )
+    ).all()
+    assert links == [(scholar_a, winner, False), (scholar_b, winner, True)]
+    identifiers = (
+        await db_session.execute(
+            text(
+                """
+                SELECT publication_id, value_normalized, confidence_score, evidence_url
+                FROM publication_identifiers
+                ORDER BY value_normalized
+                """
+            )
+        )
+    ).all()
+    assert identifiers == [
+        (winner, "10.1/dup-only", 0.8, None),
+        (winner, "10.1/shared", 0.9, "https://example.org/evidence"),
+    ]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.publications.counters import get_publication_counters, reconcile_publication_counters
+from app.services.publications.types import PublicationCounters
+from tests.integration.helpers import insert_user
+
+
+async def _insert_scholar_profile(db_session: AsyncSession, *, user_id: int, scholar_id: str) -> int:
+    result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, :scholar_id, :scholar_id, true)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id, "scholar_id": scholar_id},
+    )
+    return int(result.scalar_one())
+
+
+async def _insert_publication(db_session: AsyncSession, *, fingerprint: str, title: str) -> int:
+    result = await db_session.execute(
+        text(
+            """
+            INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+            VALUES (:fingerprint, :title, :title, 0)
+            RETURNING id
+            """
+        ),
+        {"fingerprint": fingerprint, "title": title},
+    )
+    return int(result.scalar_one())
+
+
+async def _link(db_session: AsyncSession, *, scholar_profile_id: int, publication_id: int, is_favorite: bool) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, is_favorite)
+            VALUES (:scholar_profile_id, :publication_id, false, :is_favorite)
+            """
+        ),
+        {"scholar_profile_id": scholar_profile_id, "publication_id": publication_id, "is_favorite": is_favorite},
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_publication_counters_follow_link_changes_with_distinct_user_counts(db_session: AsyncSession) -> None:
+    user_id = await insert_user(db_session, email="counters@example.com", password="api-password")
+    scholar_a = await _insert_scholar_profile(db_session, user_id=user_id, scholar_id="countersA001")
+    scholar_b = await _insert_scholar_profile(db_session, user_id=user_id, scholar_id="countersB001")
+    shared = await _insert_publication(db_session, fingerprint="a" * 64, title="Shared paper")
+    solo = await _insert_publication(db_session, fingerprint="b" * 64, title="Solo paper")
+    await _link(db_session, scholar_profile_id=scholar_a, publication_id=shared, is_favorite=True)
+    await _link(db_session, scholar_profile_id=scholar_b, publication_id=shared, is_favorite=False)
+    await _link(db_session, scholar_profile_id=scholar_b, publication_id=solo, is_favorite=False)
+    await db_session.commit()
+
+    assert await get_publication_counters(db_session, user_id=user_id) == PublicationCounters(
+        total_count=2, unread_count=2, favorite_count=1, favorite_unread_count=1
+    )
+    assert await get_publication_counters(
+        db_session, user_id=user_id, scholar_profile_id=scholar_b
+    ) == PublicationCounters(total_count=2, unread_count=2, favorite_count=0, favorite_unread_count=0)
+
+    # Reading one of the two links keeps the shared publication unread for the user.
+    await db_session.execute(
+        text("UPDATE scholar_publications SET is_read = true WHERE scholar_profile_id = :sid"),
+        {"sid": scholar_b},
+    )
+    await db_session.commit()
+    assert await get_publication_counters(db_session, user_id=user_id) == PublicationCounters(
+        total_count=2, unread_count=1, favorite_count=1, favorite_unread_count=1
+    )
+
+    await db_session.execute(text("DELETE FROM scholar_profiles WHERE id = :sid"), {"sid": scholar_a})
+    await db_session.commit()
+    assert await get_publication_counters(db_session, user_id=user_id) == PublicationCounters(
+        total_count=2, unread_count=0, favorite_count=0, favorite_unread_count=0
+    )
+
+    await db_session.execute(
+        text("UPDATE user_publication_counters SET total_count = 99 WHERE user_id = :uid"),
+        {"uid": user_id},
+    )
+    await db_session.commit()
+    assert await reconcile_publication_counters(db_session, user_id=user_id) == 1
+    await db_session.commit()
+    assert (await get_publication_counters(db_session, user_id=user_id)).total_count == 2
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import gc
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import select
@@ -11,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import ArxivQueryCacheEntry
 from app.services.arxiv.cache import (
     build_query_fingerprint,
+    clear_memory_cache,
     get_cached_feed,
     run_with_inflight_dedupe,
     set_cached_feed,
@@ -65,7 +68,6 @@ async def test_cache_entry_expires_and_is_deleted(db_session: AsyncSession) -> N
         query_fingerprint=query_fingerprint,
         feed=_sample_feed(),
         ttl_seconds=5.0,
-        max_entries=16,
         now_utc=now_utc,
     )
 
@@ -131,3 +133,70 @@ async def test_inflight_owner_failure_without_joiner_has_no_unretrieved_exceptio
         loop.set_exception_handler(previous_handler)
 
     assert "Future exception was never retrieved" not in " | ".join(messages)
+
+
+class _RecordingSession:
+    def __init__(self, opened: list[str]) -> None:
+        self._opened = opened
+
+    async def __aenter__(self) -> _RecordingSession:
+        self._opened.append("session")
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+    def begin(self):
+        return contextlib.nullcontext()
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+    def add(self, instance) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_serves_hits_without_touching_the_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: list[str] = []
+    monkeypatch.setattr(
+        "app.services.arxiv.cache.get_session_factory",
+        lambda: lambda: _RecordingSession(opened),
+    )
+    query_fingerprint = build_query_fingerprint(params={"search_query": "ti:memory", "start": 0})
+    now_utc = datetime(2026, 2, 26, 12, 0, tzinfo=UTC)
+
+    await set_cached_feed(query_fingerprint=query_fingerprint, feed=_sample_feed(), ttl_seconds=5.0, now_utc=now_utc)
+    assert opened == ["session"]
+
+    hit = await get_cached_feed(query_fingerprint=query_fingerprint, now_utc=now_utc + timedelta(seconds=2))
+    assert hit is not None
+    assert hit.entries[0].arxiv_id == "1234.5678"
+    assert opened == ["session"]
+
+    # Expired memory entries fall through to the database tier.
+    miss = await get_cached_feed(query_fingerprint=query_fingerprint, now_utc=now_utc + timedelta(seconds=8))
+    assert miss is None
+    assert opened == ["session", "session"]
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    from dataclasses import replace
+
+    from app.services.arxiv import cache as cache_module
+
+    opened: list[str] = []
+    monkeypatch.setattr(cache_module, "get_session_factory", lambda: lambda: _RecordingSession(opened))
+    monkeypatch.setattr(cache_module, "settings", replace(cache_module.settings, arxiv_memory_cache_max_entries=2))
+    clear_memory_cache()
+    now_utc = datetime(2026, 2, 26, 12, 0, tzinfo=UTC)
+    for key in ("a", "b", "c"):
+        await set_cached_feed(query_fingerprint=key, feed=_sample_feed(), ttl_seconds=60.0, now_utc=now_utc)
+    opened.clear()
+
+    assert await get_cached_feed(query_fingerprint="c", now_utc=now_utc) is not None
+    assert await get_cached_feed(query_fingerprint="b", now_utc=now_utc) is not None
+    assert opened == []
+    assert await get_cached_feed(query_fingerprint="a", now_utc=now_utc) is None
+    assert opened == ["session"]
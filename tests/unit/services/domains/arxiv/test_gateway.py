@@ -6,6 +6,7 @@ import pytest
 
 from app.services.arxiv import application as arxiv_application
 from app.services.arxiv import gateway as arxiv_gateway
+from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.arxiv.types import ArxivEntry, ArxivFeed, ArxivOpenSearchMeta
 from app.settings import settings
 
@@ -126,3 +127,148 @@ def test_build_arxiv_query_normalizes_noisy_mojibake_title() -> None:
     clean = "Graph Neural Networks Survey"
 
     assert arxiv_gateway.build_arxiv_query(noisy, None) == arxiv_gateway.build_arxiv_query(clean, None)
+
+
+def _batch_item(publication_id: int, title: str, scholar_label: str = "Ada Lovelace") -> Any:
+    from types import SimpleNamespace
+
+    return SimpleNamespace(publication_id=publication_id, title=title, scholar_label=scholar_label)
+
+
+def _entry(arxiv_id: str, title: str, authors: list[str]) -> ArxivEntry:
+    return ArxivEntry(
+        entry_id_url=f"https://arxiv.org/abs/{arxiv_id}",
+        arxiv_id=arxiv_id,
+        title=title,
+        summary="",
+        published=None,
+        updated=None,
+        authors=authors,
+    )
+
+
+@pytest.mark.asyncio
+async def test_http_gateway_batches_titles_into_or_query_and_maps_entries_back() -> None:
+    class FakeClient:
+        def __init__(self) -> None:
+            self.calls: list[dict] = []
+
+        async def search(self, **kwargs):
+            self.calls.append(kwargs)
+            return ArxivFeed(
+                entries=[
+                    _entry("2401.00002v1", "Sparse Graph Transformers at Scale", ["Ada Lovelace"]),
+                    _entry("2401.00003v1", "Unrelated Paper About Compilers", ["Grace Hopper"]),
+                    _entry("2401.00001v2", "Neural Representation Learning for Graph Signals", ["A. Lovelace"]),
+                ]
+            )
+
+    fake_client = FakeClient()
+    gateway = arxiv_gateway.HttpArxivGateway(client=fake_client)  # type: ignore[arg-type]
+    result = await gateway.discover_arxiv_ids_for_publications(
+        items=[
+            _batch_item(1, "Neural Representation Learning for Graph Signals"),
+            _batch_item(2, "Sparse Graph Transformers at Scale"),
+            _batch_item(3, "Quantum Error Correction Thresholds Revisited"),
+            _batch_item(4, "AI 2024"),
+        ]
+    )
+
+    assert result.arxiv_ids == {1: "2401.00001v2", 2: "2401.00002v1", 3: None, 4: None}
+    assert result.rate_limited is False
+    assert len(fake_client.calls) == 1
+    query = fake_client.calls[0]["query"]
+    assert query == (
+        '(ti:"Neural Representation Learning for Graph Signals" AND au:"lovelace") OR '
+        '(ti:"Sparse Graph Transformers at Scale" AND au:"lovelace") OR '
+        '(ti:"Quantum Error Correction Thresholds Revisited" AND au:"lovelace")'
+    )
+    assert fake_client.calls[0]["max_results"] == 3 * settings.arxiv_default_max_results
+
+
+@pytest.mark.asyncio
+async def test_http_gateway_rejects_batched_entry_with_wrong_author() -> None:
+    class FakeClient:
+        async def search(self, **kwargs):
+            return ArxivFeed(entries=[_entry("2401.00001v1", "Sparse Graph Transformers at Scale", ["Grace Hopper"])])
+
+    gateway = arxiv_gateway.HttpArxivGateway(client=FakeClient())  # type: ignore[arg-type]
+    result = await gateway.discover_arxiv_ids_for_publications(
+        items=[_batch_item(1, "Sparse Graph Transformers at Scale")]
+    )
+    assert result.arxiv_ids == {1: None}
+
+
+@pytest.mark.asyncio
+async def test_http_gateway_keeps_earlier_batch_matches_when_a_later_batch_is_rate_limited() -> None:
+    class FakeClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def search(self, **kwargs):
+            self.calls += 1
+            if self.calls > 1:
+                raise ArxivRateLimitError("arXiv rate limit hit (429)")
+            return ArxivFeed(entries=[_entry("2401.00001v1", "Sparse Graph Transformers at Scale", ["Ada Lovelace"])])
+
+    previous_batch_size = settings.arxiv_batch_max_publications
+    object.__setattr__(settings, "arxiv_batch_max_publications", 1)
+    try:
+        gateway = arxiv_gateway.HttpArxivGateway(client=FakeClient())  # type: ignore[arg-type]
+        result = await gateway.discover_arxiv_ids_for_publications(
+            items=[
+                _batch_item(1, "Sparse Graph Transformers at Scale"),
+                _batch_item(2, "Quantum Error Correction Thresholds Revisited"),
+            ]
+        )
+    finally:
+        object.__setattr__(settings, "arxiv_batch_max_publications", previous_batch_size)
+
+    assert result.rate_limited is True
+    assert result.arxiv_ids == {1: "2401.00001v1", 2: None}
+
+
+@pytest.mark.asyncio
+async def test_http_gateway_checks_should_stop_between_batches() -> None:
+    class FakeClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def search(self, **kwargs):
+            self.calls += 1
+            return ArxivFeed(entries=[_entry("2401.00001v1", "Sparse Graph Transformers at Scale", ["Ada Lovelace"])])
+
+    async def _stop() -> bool:
+        return True
+
+    fake_client = FakeClient()
+    previous_batch_size = settings.arxiv_batch_max_publications
+    object.__setattr__(settings, "arxiv_batch_max_publications", 1)
+    try:
+        gateway = arxiv_gateway.HttpArxivGateway(client=fake_client)  # type: ignore[arg-type]
+        result = await gateway.discover_arxiv_ids_for_publications(
+            items=[
+                _batch_item(1, "Sparse Graph Transformers at Scale"),
+                _batch_item(2, "Quantum Error Correction Thresholds Revisited"),
+            ],
+            should_stop=_stop,
+        )
+    finally:
+        object.__setattr__(settings, "arxiv_batch_max_publications", previous_batch_size)
+
+    assert fake_client.calls == 1
+    assert result.rate_limited is False
+    assert result.arxiv_ids == {1: "2401.00001v1", 2: None}
+
+
+def test_plan_clause_batches_respects_clause_and_length_caps() -> None:
+    clauses = arxiv_gateway._batch_clauses(
+        [_batch_item(index, f"Distinct Paper Title Number {word}") for index, word in enumerate("abcdefg")]
+    )
+    by_count = arxiv_gateway._plan_clause_batches(clauses, max_publications=3, max_query_chars=10_000)
+    assert [len(batch) for batch in by_count] == [3, 3, 1]
+
+    clause_chars = len(clauses[0].query) + 2
+    by_length = arxiv_gateway._plan_clause_batches(clauses, max_publications=10, max_query_chars=clause_chars * 2 + 4)
+    assert [len(batch) for batch in by_length] == [2, 2, 2, 1]
+    assert all(len(arxiv_gateway.combined_arxiv_query(batch)) <= clause_chars * 2 + 4 for batch in by_length)
@@ -12,6 +12,7 @@ from app.db.models import ArxivRuntimeState
 from app.services.arxiv.constants import ARXIV_RUNTIME_STATE_KEY
 from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.arxiv.rate_limit import get_arxiv_cooldown_status, run_with_global_arxiv_limit
+from app.services.rate_control import PROVIDER_ARXIV, get_provider_controller
 from app.settings import settings
 
 
@@ -165,3 +166,75 @@ async def test_get_arxiv_cooldown_status_reads_active_cooldown(db_session: Async
     assert status.is_active is True
     assert status.cooldown_until is not None
     assert int(status.remaining_seconds) == 45
+
+
+@pytest.mark.asyncio
+async def test_arxiv_rate_limit_uses_one_statement_and_no_db_during_fetch(
+    db_session: AsyncSession,
+    patch_session_factory,
+) -> None:
+    from sqlalchemy import event
+
+    statements: list[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _record_statement)
+    previous_interval = settings.arxiv_min_interval_seconds
+    object.__setattr__(settings, "arxiv_min_interval_seconds", 0.0)
+    statements_during_fetch: list[int] = []
+    try:
+
+        async def _fetch() -> httpx.Response:
+            statements_during_fetch.append(len(statements))
+            await asyncio.sleep(0.05)
+            statements_during_fetch.append(len(statements))
+            return httpx.Response(200, text="ok")
+
+        await run_with_global_arxiv_limit(fetch=_fetch, source_path="search")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record_statement)
+        object.__setattr__(settings, "arxiv_min_interval_seconds", previous_interval)
+
+    # One slot reservation per successful request; nothing touches the DB while the fetch runs.
+    assert len(statements) == 1
+    assert "RETURNING next_allowed_at" in statements[0]
+    assert statements_during_fetch == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_arxiv_rate_limit_sheds_requests_while_controller_circuit_is_open() -> None:
+    get_provider_controller(PROVIDER_ARXIV).suspend(60.0, reason="test")
+    called = {"count": 0}
+
+    async def _fetch() -> httpx.Response:
+        called["count"] += 1
+        return httpx.Response(200, text="ok")
+
+    with pytest.raises(ArxivRateLimitError):
+        await run_with_global_arxiv_limit(fetch=_fetch)
+    assert called["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_arxiv_rate_limit_honours_retry_after_on_429(db_session: AsyncSession, patch_session_factory) -> None:
+    previous_interval = settings.arxiv_min_interval_seconds
+    previous_cooldown = settings.arxiv_rate_limit_cooldown_seconds
+    object.__setattr__(settings, "arxiv_min_interval_seconds", 0.0)
+    object.__setattr__(settings, "arxiv_rate_limit_cooldown_seconds", 5.0)
+    try:
+
+        async def _fetch() -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": "120"}, text="rate limited")
+
+        with pytest.raises(ArxivRateLimitError):
+            await run_with_global_arxiv_limit(fetch=_fetch)
+    finally:
+        object.__setattr__(settings, "arxiv_min_interval_seconds", previous_interval)
+        object.__setattr__(settings, "arxiv_rate_limit_cooldown_seconds", previous_cooldown)
+
+    status = await get_arxiv_cooldown_status()
+    assert status.remaining_seconds > 100.0
+    assert get_provider_controller(PROVIDER_ARXIV).snapshot().rate_limited_count == 1
@@ -1,5 +1,5 @@
-from app.services.openalex.matching import find_best_match
-from app.services.openalex.types import OpenAlexWork
+from app.services.openalex.matching import find_best_match, find_best_matches
+from app.services.openalex.types import OpenAlexMatchTarget, OpenAlexWork
 
 
 def test_find_best_match_exact_title():
@@ -61,3 +61,51 @@ def test_find_best_match_author_tiebreaker():
     match = find_best_match("A popular title", 2020, "A Einstein, J Doe", [cand1, cand2])
     assert match is not None
     assert match.openalex_id == "W2"
+
+
+def test_find_best_matches_agrees_with_find_best_match():
+    candidates = [
+        OpenAlexWork.from_api_dict({"id": "W1", "title": "The exact same title", "publication_year": 2018}),
+        OpenAlexWork.from_api_dict({"id": "W2", "title": "The exact same title", "publication_year": 2020}),
+        OpenAlexWork.from_api_dict({"id": "W3", "title": "Fuzzier Title: A Study on OpenAlex"}),
+        OpenAlexWork.from_api_dict(
+            {
+                "id": "W4",
+                "title": "A popular title",
+                "publication_year": 2020,
+                "authorships": [{"author": {"display_name": "Smith, J"}}],
+            }
+        ),
+        OpenAlexWork.from_api_dict(
+            {
+                "id": "W5",
+                "title": "A popular title",
+                "publication_year": 2020,
+                "authorships": [{"author": {"display_name": "Doe, J"}}],
+            }
+        ),
+        OpenAlexWork.from_api_dict({"id": "W6", "title": None}),
+        OpenAlexWork.from_api_dict({"id": "W7", "title": "!!!"}),
+    ]
+    targets = [
+        OpenAlexMatchTarget(title="The exact same title", year=2020, authors="Author A"),
+        OpenAlexMatchTarget(title="The exact same titles", year=None, authors=None),
+        OpenAlexMatchTarget(title="Fuzzier Title A Study on OpenAlex", year=2021, authors="Author B"),
+        OpenAlexMatchTarget(title="A popular title", year=2020, authors="A Einstein, J Doe"),
+        OpenAlexMatchTarget(title="Dogs with logs", year=2020, authors="Author A"),
+        OpenAlexMatchTarget(title="???", year=None, authors=None),
+        OpenAlexMatchTarget(title=None, year=None, authors=None),
+    ]
+
+    batched = find_best_matches(targets, candidates)
+
+    expected = [find_best_match(t.title or "", t.year, t.authors, candidates) for t in targets]
+    assert [m.openalex_id if m else None for m in batched] == [m.openalex_id if m else None for m in expected]
+    assert [m.openalex_id if m else None for m in batched] == ["W2", "W1", "W3", "W5", None, None, None]
+
+
+def test_find_best_matches_without_candidates():
+    targets = [OpenAlexMatchTarget(title="Anything", year=None, authors=None)]
+
+    assert find_best_matches(targets, []) == [None]
+    assert find_best_matches([], [OpenAlexWork.from_api_dict({"id": "W1", "title": "Anything"})]) == []
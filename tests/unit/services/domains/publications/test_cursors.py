@@ -0,0 +1,75 @@
+"""Unit tests for publications keyset cursors."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.publications.cursors import (
+    InvalidPublicationCursorError,
+    PublicationCursor,
+    decode_publication_cursor,
+    encode_publication_cursor,
+)
+from app.services.publications.queries import publications_query
+
+
+@pytest.mark.parametrize(
+    ("sort_by", "sort_value"),
+    [
+        ("first_seen", datetime(2026, 3, 1, 12, 30, tzinfo=UTC)),
+        ("title", "Attention is all you need"),
+        ("year", None),
+        ("citations", 42),
+        ("pdf_status", 4),
+        ("relevance", 0.4375),
+    ],
+)
+def test_cursor_round_trips(sort_by: str, sort_value: object) -> None:
+    cursor = PublicationCursor(
+        sort_by=sort_by,
+        sort_dir="asc",
+        sort_value=sort_value,
+        publication_id=11,
+        scholar_profile_id=3,
+    )
+
+    token = encode_publication_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_publication_cursor(token, sort_by=sort_by, sort_dir="asc") == cursor
+
+
+def test_cursor_rejects_other_sort_and_garbage() -> None:
+    token = encode_publication_cursor(
+        PublicationCursor(sort_by="year", sort_dir="desc", sort_value=2020, publication_id=1, scholar_profile_id=1)
+    )
+
+    with pytest.raises(InvalidPublicationCursorError):
+        decode_publication_cursor(token, sort_by="year", sort_dir="asc")
+    with pytest.raises(InvalidPublicationCursorError):
+        decode_publication_cursor("not-a-cursor", sort_by="year", sort_dir="desc")
+
+
+def test_cursor_query_replaces_offset_with_keyset_predicate() -> None:
+    cursor = PublicationCursor(sort_by="year", sort_dir="desc", sort_value=None, publication_id=9, scholar_profile_id=2)
+
+    stmt = publications_query(
+        user_id=1,
+        mode="all",
+        latest_run_id=None,
+        scholar_profile_id=None,
+        favorite_only=False,
+        limit=20,
+        offset=400,
+        sort_by="year",
+        sort_dir="desc",
+        cursor=cursor,
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "OFFSET" not in sql
+    assert "publications.year IS NULL AND (publications.id, scholar_profiles.id) < (9, 2)" in sql
+    assert "OR publications.year IS NOT NULL" in sql
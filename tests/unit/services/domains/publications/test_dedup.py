@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+import random
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.db.models import ScholarPublication
+from app.services.publications import bulk_merge, near_dup_index
 from app.services.publications import dedup as dedup_service
 from app.services.publications.dedup import (
     NearDuplicateCluster,
@@ -15,9 +16,10 @@ from app.services.publications.dedup import (
     find_identifier_duplicate_pairs,
     find_near_duplicate_clusters,
     merge_duplicate_publication,
-    merge_near_duplicate_cluster,
+    merge_near_duplicate_clusters,
     sweep_identifier_duplicates,
 )
+from app.services.publications.dedup_titles import near_duplicate_candidate
 
 
 def _make_result(rows: list) -> MagicMock:
@@ -58,103 +60,88 @@ async def test_find_identifier_duplicate_pairs_returns_empty_when_no_duplicates(
 
 
 @pytest.mark.asyncio
-async def test_merge_duplicate_publication_migrates_links_and_identifiers() -> None:
+async def test_find_identifier_duplicate_pairs_scoped_probes_only_given_publications() -> None:
     session = AsyncMock()
-    winner = SimpleNamespace(
-        year=2014,
-        citation_count=10,
-        author_text=None,
-        venue_text=None,
-        pub_url=None,
-        pdf_url=None,
-        cluster_id=None,
-        canonical_title_hash=None,
-        title_raw="winner",
-        title_normalized="winner",
-    )
-    dup = SimpleNamespace(
-        year=2015,
-        citation_count=11,
-        author_text="a",
-        venue_text="v",
-        pub_url="https://example.org",
-        pdf_url="https://example.org/a.pdf",
-        cluster_id="x",
-        canonical_title_hash="hash",
-        title_raw="dup",
-        title_normalized="dup",
-    )
+    session.execute = AsyncMock(return_value=_make_result([(3, 8)]))
 
-    with (
-        patch(
-            "app.services.publications.dedup._load_publication",
-            new=AsyncMock(side_effect=[winner, dup]),
-        ),
-        patch(
-            "app.services.publications.dedup._migrate_scholar_links",
-            new=AsyncMock(),
-        ) as mock_links,
-        patch(
-            "app.services.publications.dedup._migrate_identifiers",
-            new=AsyncMock(),
-        ) as mock_identifiers,
-    ):
-        await merge_duplicate_publication(session, winner_id=1, dup_id=2)
+    pairs = await find_identifier_duplicate_pairs(session, publication_ids={8, 5})
 
-    assert session.execute.await_count == 1
-    mock_links.assert_awaited_once_with(session, winner_id=1, dup_id=2)
-    mock_identifiers.assert_awaited_once_with(session, winner_id=1, dup_id=2)
+    assert pairs == [(3, 8)]
+    statement = session.execute.await_args.args[0]
+    compiled = statement.compile(compile_kwargs={"literal_binds": True})
+    assert "pi1.publication_id IN (5, 8)" in str(compiled)
 
 
 @pytest.mark.asyncio
-async def test_merge_duplicate_publication_rejects_missing_publications() -> None:
+async def test_find_identifier_duplicate_pairs_scoped_to_nothing_skips_query() -> None:
     session = AsyncMock()
 
-    with (
-        patch(
-            "app.services.publications.dedup._load_publication",
-            new=AsyncMock(side_effect=[None, None]),
-        ),
-        pytest.raises(ValueError),
-    ):
+    assert await find_identifier_duplicate_pairs(session, publication_ids=set()) == []
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_merge_duplicate_publication_delegates_to_bulk_merge() -> None:
+    session = AsyncMock()
+
+    with patch(
+        "app.services.publications.bulk_merge.merge_publications",
+        new=AsyncMock(return_value=1),
+    ) as mock_bulk:
         await merge_duplicate_publication(session, winner_id=1, dup_id=2)
 
+    mock_bulk.assert_awaited_once_with(session, merges={2: 1})
+
 
 @pytest.mark.asyncio
-async def test_migrate_scholar_links_moves_orphans() -> None:
-    dup_link = MagicMock(spec=ScholarPublication)
-    dup_link.scholar_profile_id = 99
-    dup_link.publication_id = 2
+async def test_merge_duplicate_publication_rejects_missing_publications() -> None:
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=_make_result([(1, "Winner")]))
 
-    session = _session_with_execute_sequence(
-        results=[
-            [dup_link],
-            [],
-        ]
-    )
+    with pytest.raises(ValueError):
+        await merge_duplicate_publication(session, winner_id=1, dup_id=2)
 
-    await dedup_service._migrate_scholar_links(session, winner_id=1, dup_id=2)
+    session.execute.assert_awaited_once()
 
-    assert dup_link.publication_id == 1
-    session.delete.assert_not_awaited()
 
+def test_resolve_merge_mapping_follows_chains() -> None:
+    assert bulk_merge.resolve_merge_mapping({3: 2, 2: 1, 5: 4}) == {3: 1, 2: 1, 5: 4}
 
-@pytest.mark.asyncio
-async def test_migrate_scholar_links_drops_conflicts() -> None:
-    dup_link = MagicMock(spec=ScholarPublication)
-    dup_link.scholar_profile_id = 88
-    dup_link.publication_id = 2
 
-    session = _session_with_execute_sequence(
-        results=[
-            [dup_link],
-            [(88,)],
-        ]
-    )
+@pytest.mark.parametrize("merges", [{1: 1}, {1: 2, 2: 1}])
+def test_resolve_merge_mapping_rejects_self_merges_and_cycles(merges: dict[int, int]) -> None:
+    with pytest.raises(ValueError):
+        bulk_merge.resolve_merge_mapping(merges)
 
-    await dedup_service._migrate_scholar_links(session, winner_id=1, dup_id=2)
 
-    session.delete.assert_awaited_once_with(dup_link)
+@pytest.mark.asyncio
+async def test_merge_publications_uses_fixed_statement_count() -> None:
+    titles = [(1, "Deep learning"), (2, "Deep learning: a survey of methods"), (3, "Deep learning")]
+    titles += [(publication_id, f"Graph networks {publication_id}") for publication_id in range(10, 60)]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_make_result(titles))
+    session.identity_map.values.return_value = []
+    merges = {2: 1, 3: 1} | {publication_id: 10 for publication_id in range(11, 60)}
+
+    merged = await bulk_merge.merge_publications(session, merges=merges)
+
+    assert merged == 51
+    assert session.execute.await_count == 14
+    map_params = session.execute.await_args_list[2].args[1]
+    assert map_params["dup_ids"][:2] == [2, 3]
+    assert map_params["winner_ids"][:2] == [1, 1]
+    title_updates = session.execute.await_args_list[12].args[1]
+    assert title_updates == [
+        {
+            "winner_id": 1,
+            "title_raw": "Deep learning: a survey of methods",
+            "title_normalized": "deeplearningasurveyofmethods",
+        },
+    ]
+
+
+def test_identifier_merge_mapping_merges_chains_into_lowest_id() -> None:
+    assert dedup_service._identifier_merge_mapping([(2, 3), (1, 2), (1, 2), (7, 9)]) == {2: 1, 3: 1, 9: 7}
 
 
 @pytest.mark.asyncio
@@ -178,15 +165,15 @@ async def test_sweep_returns_merge_count() -> None:
             new=AsyncMock(return_value=[(1, 2), (3, 4)]),
         ),
         patch(
-            "app.services.publications.dedup.merge_duplicate_publication",
-            new=AsyncMock(),
+            "app.services.publications.dedup.merge_duplicate_publications",
+            new=AsyncMock(return_value=2),
         ) as mock_merge,
     ):
         session = AsyncMock()
         count = await sweep_identifier_duplicates(session)
 
     assert count == 2
-    assert mock_merge.await_count == 2
+    mock_merge.assert_awaited_once_with(session, merges={2: 1, 4: 3})
     session.flush.assert_awaited_once()
 
 
@@ -198,26 +185,26 @@ async def test_sweep_merges_each_dup_only_once() -> None:
             new=AsyncMock(return_value=[(1, 2), (1, 2)]),
         ),
         patch(
-            "app.services.publications.dedup.merge_duplicate_publication",
-            new=AsyncMock(),
+            "app.services.publications.dedup.merge_duplicate_publications",
+            new=AsyncMock(return_value=1),
         ) as mock_merge,
     ):
         session = AsyncMock()
         count = await sweep_identifier_duplicates(session)
 
     assert count == 1
-    assert mock_merge.await_count == 1
+    mock_merge.assert_awaited_once_with(session, merges={2: 1})
 
 
 @pytest.mark.asyncio
 async def test_find_near_duplicate_clusters_groups_similar_titles() -> None:
-    first = dedup_service._candidate_from_row(
+    first = near_duplicate_candidate(
         publication_id=10,
         title="Adam: A method for stochastic optimization",
         year=2014,
         citation_count=100,
     )
-    second = dedup_service._candidate_from_row(
+    second = near_duplicate_candidate(
         publication_id=11,
         title="â€ œAdam: A method for stochastic optimization, â€ 3rd Int. Conf. Learn. Represent.",
         year=2015,
@@ -226,9 +213,15 @@ async def test_find_near_duplicate_clusters_groups_similar_titles() -> None:
     assert first is not None
     assert second is not None
 
-    with patch(
-        "app.services.publications.dedup._load_near_duplicate_candidates",
-        new=AsyncMock(return_value=[first, second]),
+    with (
+        patch(
+            "app.services.publications.near_dup_index.refresh_title_token_index",
+            new=AsyncMock(return_value=0),
+        ),
+        patch(
+            "app.services.publications.dedup._load_near_duplicate_candidates",
+            new=AsyncMock(return_value=[first, second]),
+        ),
     ):
         clusters = await find_near_duplicate_clusters(AsyncMock())
 
@@ -239,13 +232,13 @@ async def test_find_near_duplicate_clusters_groups_similar_titles() -> None:
 
 @pytest.mark.asyncio
 async def test_find_near_duplicate_clusters_skips_unrelated_titles() -> None:
-    first = dedup_service._candidate_from_row(
+    first = near_duplicate_candidate(
         publication_id=21,
         title="Adam optimizer",
         year=2014,
         citation_count=10,
     )
-    second = dedup_service._candidate_from_row(
+    second = near_duplicate_candidate(
         publication_id=22,
         title="Diffusion models in vision",
         year=2022,
@@ -254,9 +247,15 @@ async def test_find_near_duplicate_clusters_skips_unrelated_titles() -> None:
     assert first is not None
     assert second is not None
 
-    with patch(
-        "app.services.publications.dedup._load_near_duplicate_candidates",
-        new=AsyncMock(return_value=[first, second]),
+    with (
+        patch(
+            "app.services.publications.near_dup_index.refresh_title_token_index",
+            new=AsyncMock(return_value=0),
+        ),
+        patch(
+            "app.services.publications.dedup._load_near_duplicate_candidates",
+            new=AsyncMock(return_value=[first, second]),
+        ),
     ):
         clusters = await find_near_duplicate_clusters(AsyncMock())
 
@@ -264,23 +263,158 @@ async def test_find_near_duplicate_clusters_skips_unrelated_titles() -> None:
 
 
 @pytest.mark.asyncio
-async def test_merge_near_duplicate_cluster_merges_non_winner_members() -> None:
-    cluster = NearDuplicateCluster(
-        cluster_key="abc",
-        winner_publication_id=5,
-        similarity_score=1.0,
-        members=(
-            NearDuplicateMember(publication_id=5, title="Winner", year=2014, citation_count=10),
-            NearDuplicateMember(publication_id=6, title="Dup", year=2014, citation_count=3),
-            NearDuplicateMember(publication_id=7, title="Dup2", year=2014, citation_count=1),
-        ),
+async def test_find_near_duplicate_clusters_incremental_keeps_groups_with_changed_members() -> None:
+    titles = {
+        30: "Deep residual learning for image recognition",
+        31: "Deep residual learning for image recognition (preprint)",
+        40: "Attention is all you need in neural machine translation",
+        41: "Attention is all you need in neural machine translation.",
+    }
+    candidates = [
+        near_duplicate_candidate(publication_id=pid, title=title, year=2016, citation_count=1)
+        for pid, title in titles.items()
+    ]
+    assert all(candidate is not None for candidate in candidates)
+
+    with (
+        patch(
+            "app.services.publications.near_dup_index.refresh_title_token_index",
+            new=AsyncMock(return_value=1),
+        ) as mock_refresh,
+        patch(
+            "app.services.publications.near_dup_index.load_changed_neighbourhood",
+            new=AsyncMock(return_value=(candidates, {31})),
+        ) as mock_neighbourhood,
+        patch(
+            "app.services.publications.dedup._load_near_duplicate_candidates",
+            new=AsyncMock(),
+        ) as mock_full_scan,
+    ):
+        session = AsyncMock()
+        clusters = await find_near_duplicate_clusters(session, changed_since=datetime(2026, 1, 1, tzinfo=UTC))
+
+    mock_refresh.assert_awaited_once_with(session)
+    mock_neighbourhood.assert_awaited_once()
+    mock_full_scan.assert_not_awaited()
+    assert [sorted(member.publication_id for member in cluster.members) for cluster in clusters] == [[30, 31]]
+
+
+@pytest.mark.asyncio
+async def test_refresh_title_token_index_rebuilds_dirty_postings() -> None:
+    session = _session_with_execute_sequence(
+        results=[
+            [(7, "Adam: A method for stochastic optimization"), (8, "")],
+            [],
+            [],
+            [],
+        ]
+    )
+
+    refreshed = await near_dup_index.refresh_title_token_index(session, batch_size=10)
+
+    assert refreshed == 2
+    assert session.execute.await_count == 4
+    postings = session.execute.await_args_list[2].args[1]
+    assert {row["token"] for row in postings} == {"adam", "stochastic", "optimization"}
+    assert {row["publication_id"] for row in postings} == {7}
+
+
+def _brute_force_groups(candidates: list, **thresholds) -> list[list[int]]:
+    parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
+    for index, left in enumerate(candidates):
+        for right in candidates[index + 1 :]:
+            if left.tokens & right.tokens and dedup_service._is_near_duplicate_pair(left, right, **thresholds):
+                dedup_service._union(parent, left.publication_id, right.publication_id)
+    groups = dedup_service._grouped_candidates(candidates, parent)
+    return sorted([member.publication_id for member in group] for group in groups)
+
+
+@pytest.mark.parametrize(
+    ("similarity_threshold", "min_shared_tokens", "max_year_delta"),
+    [(0.78, 3, 1), (0.5, 1, 5), (0.95, 2, 0)],
+)
+def test_cluster_candidate_groups_matches_brute_force(
+    similarity_threshold: float,
+    min_shared_tokens: int,
+    max_year_delta: int,
+) -> None:
+    rng = random.Random(7)
+    common = ["learning", "network", "analysis", "deep", "neural"]
+    vocabulary = common + [f"term{index:03d}" for index in range(150)]
+    titles: list[list[str]] = []
+    for _ in range(400):
+        if titles and rng.random() < 0.35:
+            words = list(rng.choice(titles))
+            if rng.random() < 0.5:
+                words.append(rng.choice(vocabulary))
+            elif len(words) > 1:
+                words.pop(rng.randrange(len(words)))
+        else:
+            words = rng.sample(common, 2) + rng.sample(vocabulary, rng.randint(1, 9))
+        titles.append(words)
+    candidates = [
+        near_duplicate_candidate(
+            publication_id=index + 1,
+            title=" ".join(words),
+            year=rng.choice([None, 2019, 2020, 2021, 2024]),
+            citation_count=0,
+        )
+        for index, words in enumerate(titles)
+    ]
+    corpus = [candidate for candidate in candidates if candidate is not None]
+    thresholds = {
+        "similarity_threshold": similarity_threshold,
+        "min_shared_tokens": min_shared_tokens,
+        "max_year_delta": max_year_delta,
+    }
+
+    groups = dedup_service._cluster_candidate_groups(corpus, **thresholds)
+    checked_pairs = sum(
+        1
+        for _ in dedup_service._candidate_pairs(
+            corpus,
+            similarity_threshold=similarity_threshold,
+            min_shared_tokens=min_shared_tokens,
+        )
     )
 
+    assert sorted([member.publication_id for member in group] for group in groups) == _brute_force_groups(
+        corpus, **thresholds
+    )
+    assert groups
+    assert checked_pairs < len(corpus) * (len(corpus) - 1) // 2
+
+
+@pytest.mark.asyncio
+async def test_merge_near_duplicate_clusters_merges_non_winner_members_in_one_pass() -> None:
+    clusters = [
+        NearDuplicateCluster(
+            cluster_key="abc",
+            winner_publication_id=5,
+            similarity_score=1.0,
+            members=(
+                NearDuplicateMember(publication_id=5, title="Winner", year=2014, citation_count=10),
+                NearDuplicateMember(publication_id=6, title="Dup", year=2014, citation_count=3),
+                NearDuplicateMember(publication_id=7, title="Dup2", year=2014, citation_count=1),
+            ),
+        ),
+        NearDuplicateCluster(
+            cluster_key="def",
+            winner_publication_id=8,
+            similarity_score=1.0,
+            members=(
+                NearDuplicateMember(publication_id=8, title="Other", year=2020, citation_count=4),
+                NearDuplicateMember(publication_id=9, title="Other dup", year=2020, citation_count=2),
+            ),
+        ),
+    ]
+
+    session = AsyncMock()
     with patch(
-        "app.services.publications.dedup.merge_duplicate_publication",
-        new=AsyncMock(),
+        "app.services.publications.dedup.merge_duplicate_publications",
+        new=AsyncMock(return_value=3),
     ) as mock_merge:
-        merged = await merge_near_duplicate_cluster(AsyncMock(), cluster=cluster)
+        merged = await merge_near_duplicate_clusters(session, clusters=clusters)
 
-    assert merged == 2
-    assert mock_merge.await_count == 2
+    assert merged == 3
+    mock_merge.assert_awaited_once_with(session, merges={6: 5, 7: 5, 9: 8})
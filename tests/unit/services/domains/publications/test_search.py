@@ -0,0 +1,51 @@
+"""Unit tests for the publications search predicate and relevance sort."""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.publications.queries import publications_query
+from app.services.publications.search import resolve_publication_sort
+
+
+def _compiled_list_query(*, search: str | None, sort_by: str) -> str:
+    stmt = publications_query(
+        user_id=1,
+        mode="all",
+        latest_run_id=None,
+        scholar_profile_id=None,
+        favorite_only=False,
+        limit=20,
+        search=search,
+        sort_by=sort_by,
+    )
+    return str(stmt.compile(dialect=postgresql.dialect(paramstyle="named"), compile_kwargs={"literal_binds": True}))
+
+
+def test_search_filter_uses_indexed_publication_subquery() -> None:
+    sql = _compiled_list_query(search="graph networks", sort_by="first_seen")
+
+    assert "publications.id IN (SELECT publications_1.id" in sql
+    assert "publications_1.search_vector @@ websearch_to_tsquery('english'::regconfig, 'graph networks')" in sql
+    assert "'graph networks' <% publications_1.title_raw" in sql
+    assert "scholar_profiles.display_name ILIKE '%graph networks%'" in sql
+
+
+def test_short_search_terms_skip_fuzzy_matching() -> None:
+    sql = _compiled_list_query(search="gnn", sort_by="first_seen")
+
+    assert "<%" not in sql
+    assert "publications_1.title_raw ILIKE '%gnn%'" in sql
+
+
+def test_relevance_sort_ranks_by_text_match() -> None:
+    sql = _compiled_list_query(search="graph", sort_by="relevance")
+
+    assert "ORDER BY CAST(ts_rank_cd(publications.search_vector" in sql
+    assert "word_similarity('graph', publications.title_raw)" in sql
+
+
+def test_relevance_sort_without_search_falls_back_to_first_seen() -> None:
+    assert resolve_publication_sort("relevance", search=None) == "first_seen"
+    assert resolve_publication_sort("relevance", search="graph") == "relevance"
+    assert resolve_publication_sort("year", search=None) == "year"
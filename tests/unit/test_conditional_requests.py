@@ -0,0 +1,47 @@
+from starlette.requests import Request
+
+from app.api.conditional import data_version_etag, etag_matches, not_modified_response
+
+
+def _request(query: str = "", *, if_none_match: str | None = None, path: str = "/api/v1/publications") -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode("latin-1"))]
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers})
+
+
+def test_data_version_etag_is_stable_across_query_parameter_order() -> None:
+    first = data_version_etag(_request("mode=unread&page=2"), user_id=1, data_version=7)
+    second = data_version_etag(_request("page=2&mode=unread"), user_id=1, data_version=7)
+
+    assert first == second
+    assert first.startswith('W/"')
+
+
+def test_data_version_etag_changes_with_version_user_query_and_extra() -> None:
+    base = data_version_etag(_request("page=1"), user_id=1, data_version=7)
+
+    assert data_version_etag(_request("page=1"), user_id=1, data_version=8) != base
+    assert data_version_etag(_request("page=1"), user_id=2, data_version=7) != base
+    assert data_version_etag(_request("page=2"), user_id=1, data_version=7) != base
+    assert data_version_etag(_request("page=1", path="/api/v1/runs"), user_id=1, data_version=7) != base
+    assert data_version_etag(_request("page=1"), user_id=1, data_version=7, extra={"cooldown": 30}) != base
+
+
+def test_etag_matches_uses_weak_comparison_and_lists() -> None:
+    etag = data_version_etag(_request(), user_id=1, data_version=3)
+    strong = etag.removeprefix("W/")
+
+    assert etag_matches(_request(if_none_match=etag), etag)
+    assert etag_matches(_request(if_none_match=strong), etag)
+    assert etag_matches(_request(if_none_match=f'"other", {etag}'), etag)
+    assert etag_matches(_request(if_none_match="*"), etag)
+    assert not etag_matches(_request(if_none_match='W/"other"'), etag)
+    assert not etag_matches(_request(), etag)
+
+
+def test_not_modified_response_has_no_body_and_repeats_the_tag() -> None:
+    response = not_modified_response('W/"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
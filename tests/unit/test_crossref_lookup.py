@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import httpx
 import pytest
 
 from app.services.crossref import application as crossref_app
@@ -101,3 +102,113 @@ async def test_crossref_relaxed_fallback_allows_author_mismatch_for_strong_title
         email=None,
     )
     assert doi == "10.1000/author-fallback"
+
+
+@pytest.mark.asyncio
+async def test_crossref_client_sends_projection_rows_cap_and_date_filter() -> None:
+    from app.services.crossref import client as crossref_client
+
+    captured: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        items = [{"DOI": f"10.1000/{index}"} for index in range(5)]
+        return httpx.Response(200, json={"message": {"items": [*items, "not-a-dict"]}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        items = await crossref_client.CrossrefClient(http_client=http_client).search_works(
+            query="induction pluripotent stem cells",
+            author="Shinya Yamanaka",
+            date_range=("2006-01-01", "2008-12-31"),
+            rows=3,
+            email="user@example.com",
+        )
+
+    assert [item["DOI"] for item in items] == ["10.1000/0", "10.1000/1", "10.1000/2"]
+    params = captured[0].url.params
+    assert params["query.bibliographic"] == "induction pluripotent stem cells"
+    assert params["query.author"] == "Shinya Yamanaka"
+    assert params["filter"] == "from-pub-date:2006-01-01,until-pub-date:2008-12-31"
+    assert params["select"] == "DOI,title,issued,score,author"
+    assert params["rows"] == "3"
+    assert params["mailto"] == "user@example.com"
+    assert "mailto:user@example.com" in captured[0].headers["User-Agent"]
+
+
+@pytest.mark.asyncio
+async def test_crossref_client_deadline_covers_rate_controller_backoff() -> None:
+    from app.services.crossref import client as crossref_client
+    from app.services.rate_control import PROVIDER_CROSSREF, get_provider_controller
+
+    get_provider_controller(PROVIDER_CROSSREF).record_rate_limited(retry_after_seconds=60.0)
+    captured: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(200, json={"message": {"items": []}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        with pytest.raises(crossref_client.CrossrefClientError, match="timed out"):
+            await crossref_client.CrossrefClient(http_client=http_client).search_works(
+                query="induction pluripotent stem cells",
+                author=None,
+                date_range=None,
+                rows=3,
+                email=None,
+                timeout_seconds=0.5,
+            )
+
+    assert captured == []
+
+
+@pytest.mark.asyncio
+async def test_crossref_fetch_items_caches_results_by_normalized_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.crossref import cache as crossref_cache
+
+    crossref_cache.clear_crossref_cache()
+    calls: list[dict] = []
+
+    async def _fake_search_works(self, **kwargs):
+        _ = self
+        calls.append(kwargs)
+        return [{"DOI": "10.1000/cached"}]
+
+    monkeypatch.setattr(crossref_app.CrossrefClient, "search_works", _fake_search_works)
+
+    first = await crossref_app._fetch_items(
+        query="Stem Cells  Induction", author="Shinya Yamanaka", date_range=None, max_rows=10, email=None
+    )
+    second = await crossref_app._fetch_items(
+        query="stem cells induction", author="shinya yamanaka", date_range=None, max_rows=10, email=None
+    )
+    other_range = await crossref_app._fetch_items(
+        query="stem cells induction",
+        author="shinya yamanaka",
+        date_range=("2007-01-01", "2007-12-31"),
+        max_rows=10,
+        email=None,
+    )
+
+    assert first == second == other_range == [{"DOI": "10.1000/cached"}]
+    assert len(calls) == 2
+    crossref_cache.clear_crossref_cache()
+
+
+@pytest.mark.asyncio
+async def test_crossref_fetch_items_does_not_cache_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.crossref import cache as crossref_cache
+
+    crossref_cache.clear_crossref_cache()
+    calls = {"count": 0}
+
+    async def _failing_search_works(self, **kwargs):
+        _ = (self, kwargs)
+        calls["count"] += 1
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(crossref_app.CrossrefClient, "search_works", _failing_search_works)
+
+    for _ in range(2):
+        assert await crossref_app._fetch_items(query="q", author=None, date_range=None, max_rows=5, email=None) == []
+
+    assert calls["count"] == 2
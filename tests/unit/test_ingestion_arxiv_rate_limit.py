@@ -10,40 +10,128 @@ from app.services.ingestion.enrichment import EnrichmentRunner
 from app.services.publication_identifiers import application as identifier_service
 
 
+async def _not_canceled(db_session, *, run_id) -> bool:
+    _ = (db_session, run_id)
+    return False
+
+
 @pytest.mark.asyncio
 async def test_discover_identifiers_for_enrichment_disables_arxiv_on_rate_limit(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     runner = EnrichmentRunner()
-    publication = SimpleNamespace(id=11, author_text="Ada Lovelace")
-    calls = {"sync": 0}
+    publications = [SimpleNamespace(id=11, author_text="Ada Lovelace"), SimpleNamespace(id=12, author_text=None)]
+    calls: dict[str, list] = {"prepared": [], "arxiv_batches": [], "published": []}
 
-    async def _raise_rate_limit(db_session, *, publication, scholar_label):
-        _ = (db_session, publication, scholar_label)
+    async def _prepare(db_session, *, publication, scholar_label):
+        _ = (db_session, scholar_label)
+        calls["prepared"].append(publication.id)
+        return SimpleNamespace(publication_id=publication.id)
+
+    async def _raise_rate_limit(db_session, *, items, should_stop=None):
+        _ = (db_session, should_stop)
+        calls["arxiv_batches"].append([item.publication_id for item in items])
         raise ArxivRateLimitError("arXiv rate limit hit (429) — stopping batch")
 
+    async def _publish(db_session, *, run_id, publication_id) -> None:
+        _ = (db_session, run_id)
+        calls["published"].append(publication_id)
+
+    monkeypatch.setattr(identifier_service, "prepare_identifier_discovery", _prepare)
+    monkeypatch.setattr(identifier_service, "discover_arxiv_identifiers", _raise_rate_limit)
+    monkeypatch.setattr(runner, "_publish_identifier_update_event", _publish)
+    monkeypatch.setattr(runner, "run_is_canceled", _not_canceled)
+
+    result = await runner._discover_identifiers_for_enrichment(
+        cast(Any, object()),
+        publications=cast(Any, publications),
+        run_id=321,
+        allow_arxiv_lookup=True,
+    )
+
+    assert result == (True, False)
+    assert calls["prepared"] == [11, 12]
+    # Both eligible publications share one batched arXiv discovery call.
+    assert calls["arxiv_batches"] == [[11, 12]]
+    assert calls["published"] == [11, 12]
+
+
+@pytest.mark.asyncio
+async def test_discover_identifiers_for_enrichment_only_syncs_fields_when_arxiv_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runner = EnrichmentRunner()
+    publication = SimpleNamespace(id=11, author_text="Ada Lovelace")
+    calls = {"sync": 0, "arxiv_items": None}
+
+    async def _fail_prepare(*args, **kwargs):
+        raise AssertionError("Crossref/arXiv discovery should be skipped while arXiv is disabled.")
+
     async def _sync_fields(db_session, *, publication):
         _ = (db_session, publication)
         calls["sync"] += 1
 
-    monkeypatch.setattr(
-        identifier_service,
-        "discover_and_sync_identifiers_for_publication",
-        _raise_rate_limit,
-    )
-    monkeypatch.setattr(identifier_service, "sync_identifiers_for_publication_fields", _sync_fields)
+    async def _discover_arxiv(db_session, *, items, should_stop=None):
+        _ = (db_session, should_stop)
+        calls["arxiv_items"] = items
 
     async def _publish_noop(*args, **kwargs) -> None:
         _ = (args, kwargs)
 
+    monkeypatch.setattr(identifier_service, "prepare_identifier_discovery", _fail_prepare)
+    monkeypatch.setattr(identifier_service, "sync_identifiers_for_publication_fields", _sync_fields)
+    monkeypatch.setattr(identifier_service, "discover_arxiv_identifiers", _discover_arxiv)
     monkeypatch.setattr(runner, "_publish_identifier_update_event", _publish_noop)
+    monkeypatch.setattr(runner, "run_is_canceled", _not_canceled)
 
     result = await runner._discover_identifiers_for_enrichment(
         cast(Any, object()),
-        publication=cast(Any, publication),
+        publications=cast(Any, [publication]),
         run_id=321,
-        allow_arxiv_lookup=True,
+        allow_arxiv_lookup=False,
     )
 
-    assert result is False
+    assert result == (True, False)
     assert calls["sync"] == 1
+    assert calls["arxiv_items"] == []
+
+
+@pytest.mark.asyncio
+async def test_discover_identifiers_for_enrichment_stops_when_run_is_canceled_mid_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runner = EnrichmentRunner()
+    publications = [SimpleNamespace(id=11, author_text=None), SimpleNamespace(id=12, author_text=None)]
+    calls: dict[str, list] = {"prepared": [], "published": []}
+
+    async def _prepare(db_session, *, publication, scholar_label):
+        _ = (db_session, scholar_label)
+        calls["prepared"].append(publication.id)
+        return SimpleNamespace(publication_id=publication.id)
+
+    async def _canceled_after_first(db_session, *, run_id) -> bool:
+        _ = (db_session, run_id)
+        return bool(calls["prepared"])
+
+    async def _fail_discover(*args, **kwargs):
+        raise AssertionError("arXiv discovery should not start after the run is canceled.")
+
+    async def _publish(db_session, *, run_id, publication_id) -> None:
+        _ = (db_session, run_id)
+        calls["published"].append(publication_id)
+
+    monkeypatch.setattr(identifier_service, "prepare_identifier_discovery", _prepare)
+    monkeypatch.setattr(identifier_service, "discover_arxiv_identifiers", _fail_discover)
+    monkeypatch.setattr(runner, "_publish_identifier_update_event", _publish)
+    monkeypatch.setattr(runner, "run_is_canceled", _canceled_after_first)
+
+    result = await runner._discover_identifiers_for_enrichment(
+        cast(Any, object()),
+        publications=cast(Any, publications),
+        run_id=321,
+        allow_arxiv_lookup=True,
+    )
+
+    assert result == (False, True)
+    assert calls["prepared"] == [11]
+    assert calls["published"] == []
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import httpx
+import pytest
+
+from app.services.ingestion import enrichment as enrichment_module
+from app.services.ingestion.enrichment import EnrichmentRunner
+from app.services.openalex.client import (
+    OpenAlexBudgetExhaustedError,
+    OpenAlexCircuitOpenError,
+    OpenAlexClient,
+    OpenAlexRateLimitError,
+)
+from app.services.rate_control import PROVIDER_OPENALEX, get_provider_controller
+from app.settings import settings
+
+
+def _runner_with_publications(
+    monkeypatch: pytest.MonkeyPatch,
+    titles: list[str],
+) -> tuple[EnrichmentRunner, list[str]]:
+    runner = EnrichmentRunner()
+    publications = [SimpleNamespace(id=index, title_raw=title) for index, title in enumerate(titles)]
+    processed: list[str] = []
+
+    async def _load(db_session, *, run_id):
+        _ = (db_session, run_id)
+        return 1, publications
+
+    async def _not_canceled(db_session, *, run_id):
+        _ = (db_session, run_id)
+        return False
+
+    async def _enrich_batch(db_session, *, batch, run_id, openalex_works, now, arxiv_lookup_allowed):
+        _ = (db_session, run_id, openalex_works, now)
+        processed.extend(p.title_raw for p in batch)
+        return True, arxiv_lookup_allowed
+
+    async def _noop(*args, **kwargs) -> None:
+        _ = (args, kwargs)
+
+    monkeypatch.setattr(runner, "_load_unenriched_publications", _load)
+    monkeypatch.setattr(runner, "run_is_canceled", _not_canceled)
+    monkeypatch.setattr(runner, "_enrich_batch", _enrich_batch)
+    monkeypatch.setattr(runner, "_flush_and_sweep_duplicates", _noop)
+    # One title per chunk so every publication becomes its own fetch.
+    monkeypatch.setattr(enrichment_module, "_chunk_titles_by_url_length", lambda titles: [[t] for t in titles])
+    return runner, processed
+
+
+@pytest.mark.asyncio
+async def test_enrichment_prefetches_chunks_but_matches_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner, processed = _runner_with_publications(monkeypatch, ["first", "second", "third"])
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fetch(self, filters, limit=50):
+        nonlocal in_flight, max_in_flight
+        _ = (self, limit)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later chunks finish first; results must still be applied in chunk order.
+        await asyncio.sleep({"first": 0.03, "second": 0.02, "third": 0.01}[filters["title.search"]])
+        in_flight -= 1
+        return []
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    assert processed == ["first", "second", "third"]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_enrichment_retries_rate_limited_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner, processed = _runner_with_publications(monkeypatch, ["only"])
+    calls = {"count": 0}
+
+    async def _fetch(self, filters, limit=50):
+        _ = (self, filters, limit)
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise OpenAlexRateLimitError("slow down")
+        return []
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    assert calls["count"] == 2
+    assert processed == ["only"]
+
+
+@pytest.mark.asyncio
+async def test_enrichment_stops_and_cancels_prefetch_on_budget_exhaustion(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner, processed = _runner_with_publications(monkeypatch, ["first", "second", "third"])
+    canceled: list[str] = []
+
+    async def _fetch(self, filters, limit=50):
+        _ = (self, limit)
+        title = filters["title.search"]
+        if title == "first":
+            raise OpenAlexBudgetExhaustedError("budget gone")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            canceled.append(title)
+            raise
+        return []
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    assert processed == []
+    assert sorted(canceled) == ["second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_enrichment_does_not_retry_while_openalex_circuit_is_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner, processed = _runner_with_publications(monkeypatch, ["only"])
+    calls = {"count": 0}
+
+    async def _fetch(self, filters, limit=50):
+        _ = (self, filters, limit)
+        calls["count"] += 1
+        raise OpenAlexCircuitOpenError("openalex circuit open")
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    assert calls["count"] == 1
+    assert processed == []
+
+
+@pytest.mark.asyncio
+async def test_enrichment_pass_still_runs_when_openalex_circuit_opened_on_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    controller = get_provider_controller(PROVIDER_OPENALEX)
+    for _ in range(max(int(settings.provider_circuit_failure_threshold), 1)):
+        controller.record_error()
+    assert controller.is_open()
+    runner, _ = _runner_with_publications(monkeypatch, ["only"])
+    calls = {"count": 0}
+
+    async def _fetch(self, filters, limit=50):
+        _ = (self, filters, limit)
+        calls["count"] += 1
+        return []
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    # Transient errors are not a budget suspension, so the pass is not skipped up front.
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_exhausted_response_suspends_openalex_controller(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _get(self, url, *, params, headers):
+        _ = (self, url, params, headers)
+        return httpx.Response(429, headers={"X-RateLimit-Remaining-USD": "0"})
+
+    monkeypatch.setattr(OpenAlexClient, "_get", _get)
+
+    with pytest.raises(OpenAlexBudgetExhaustedError):
+        await OpenAlexClient().get_works_by_filter({"title.search": "anything"})
+
+    assert get_provider_controller(PROVIDER_OPENALEX).is_suspended()
+    runner, processed = _runner_with_publications(monkeypatch, ["only"])
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+    assert processed == []
+
+
+@pytest.mark.asyncio
+async def test_enrichment_sweeps_identifier_duplicates_only_for_enriched_publications(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runner, processed = _runner_with_publications(monkeypatch, ["first", "second", "third"])
+    swept: list[set[int]] = []
+
+    async def _fetch(self, filters, limit=50):
+        _ = (self, limit)
+        if filters["title.search"] == "second":
+            raise RuntimeError("upstream failure")
+        return []
+
+    async def _sweep(db_session, *, run_id, publication_ids):
+        _ = (db_session, run_id)
+        swept.append(set(publication_ids))
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _fetch)
+    monkeypatch.setattr(runner, "_flush_and_sweep_duplicates", _sweep)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=1)
+
+    assert processed == ["first", "third"]
+    assert swept == [{0, 2}]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from app.services.portability.constants import EXPORT_SCHEMA_VERSION
+from app.services.portability.exporting import gzip_chunks, stream_user_data_json, stream_user_data_ndjson
+
+SCHOLAR_ROWS = [
+    ("scholarA0001", "Ada", True, None),
+    ("scholarB0002", "Grace", False, "https://example.org/grace.png"),
+]
+PUBLICATION_ROWS = [
+    ("scholarA0001", "c-1", "a" * 64, "Paper one", 2020, 4, "A. Author", "Venue", None, None, True),
+    ("scholarA0001", None, "b" * 64, "Paper two", None, None, None, None, None, None, False),
+    ("scholarB0002", None, "c" * 64, "Paper three", 2021, 1, None, None, None, "https://x/p.pdf", False),
+]
+
+
+class _StreamResult:
+    def __init__(self, rows: list[tuple], batch_size: int) -> None:
+        self._rows = rows
+        self._batch_size = batch_size
+
+    async def partitions(self) -> AsyncIterator[list[tuple]]:
+        for start in range(0, len(self._rows), self._batch_size):
+            yield self._rows[start : start + self._batch_size]
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.yield_per: list[int] = []
+
+    async def stream(self, query: Any) -> _StreamResult:
+        batch_size = query.get_execution_options()["yield_per"]
+        self.yield_per.append(batch_size)
+        is_publication_query = len(query.selected_columns) > len(SCHOLAR_ROWS[0])
+        return _StreamResult(PUBLICATION_ROWS if is_publication_query else SCHOLAR_ROWS, batch_size)
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_stream_user_data_ndjson_emits_header_then_typed_lines_in_batches() -> None:
+    session = _FakeSession()
+
+    body = await _collect(stream_user_data_ndjson(session, user_id=1, batch_size=2))  # type: ignore[arg-type]
+
+    lines = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+    assert lines[0]["type"] == "header"
+    assert lines[0]["schema_version"] == EXPORT_SCHEMA_VERSION
+    assert [line["type"] for line in lines[1:]] == ["scholar"] * 2 + ["publication"] * 3
+    assert lines[1]["scholar_id"] == "scholarA0001"
+    assert lines[4]["citation_count"] == 0
+    assert session.yield_per == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_user_data_json_matches_the_import_document_shape() -> None:
+    body = await _collect(stream_user_data_json(_FakeSession(), user_id=1, batch_size=2))  # type: ignore[arg-type]
+
+    document = json.loads(body)
+    assert document["schema_version"] == EXPORT_SCHEMA_VERSION
+    assert [item["scholar_id"] for item in document["scholars"]] == ["scholarA0001", "scholarB0002"]
+    assert [item["title"] for item in document["publications"]] == ["Paper one", "Paper two", "Paper three"]
+    assert document["publications"][0]["is_read"] is True
+
+
+@pytest.mark.asyncio
+async def test_gzip_chunks_round_trips_a_streamed_export() -> None:
+    plain = await _collect(stream_user_data_ndjson(_FakeSession(), user_id=1))  # type: ignore[arg-type]
+    compressed = await _collect(
+        gzip_chunks(stream_user_data_ndjson(_FakeSession(), user_id=1))  # type: ignore[arg-type]
+    )
+
+    # exported_at is second-resolution; compare everything after the header line.
+    assert gzip.decompress(compressed).split(b"\n", 1)[1] == plain.split(b"\n", 1)[1]
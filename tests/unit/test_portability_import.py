@@ -3,11 +3,14 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import MagicMock
 
+from app.services.ingestion.fingerprints import normalize_title
 from app.services.portability.publication_import import (
+    ImportResolver,
     _build_imported_publication_input,
     _initialize_import_counters,
     _update_link_counters,
 )
+from app.services.portability.types import StagedPublication
 
 
 def _mock_profile(scholar_id: str = "ABC123DEF456") -> Any:
@@ -120,3 +123,84 @@ class TestUpdateLinkCounters:
         _update_link_counters(counters=counters, link_created=False, link_updated=False)
         assert counters["links_created"] == 0
         assert counters["links_updated"] == 0
+
+
+def _existing(publication_id: int, *, title: str, fingerprint: str, cluster_id: str | None = None) -> StagedPublication:
+    return StagedPublication(
+        slot=publication_id,
+        publication_id=publication_id,
+        cluster_id=cluster_id,
+        fingerprint_sha256=fingerprint,
+        title_raw=title,
+        title_normalized=normalize_title(title),
+        year=None,
+        citation_count=0,
+        author_text=None,
+        venue_text=None,
+        pub_url=None,
+        pdf_url=None,
+    )
+
+
+def _payload(title: str, **overrides: Any) -> Any:
+    item = {"scholar_id": "ABC123DEF456", "title": title, **overrides}
+    result = _build_imported_publication_input(item=item, scholar_map=_scholar_map())
+    assert result is not None
+    return result
+
+
+def _counters() -> dict[str, int]:
+    counters: dict[str, int] = {}
+    _initialize_import_counters(counters)
+    return counters
+
+
+class TestImportResolver:
+    def test_cluster_match_takes_precedence_over_fingerprint(self) -> None:
+        by_cluster = _existing(10, title="clustered", fingerprint="a" * 64, cluster_id="c-1")
+        by_fingerprint = _existing(11, title="fingerprinted", fingerprint="b" * 64)
+        resolver = ImportResolver(candidates=[by_cluster, by_fingerprint], links={})
+        counters = _counters()
+
+        resolver.apply(_payload("clustered", cluster_id="c-1", fingerprint_sha256="b" * 64), counters=counters)
+
+        assert counters["publications_created"] == 0
+        assert resolver.link_writes == {(1, 10): False}
+
+    def test_title_match_uses_lowest_linked_publication(self) -> None:
+        first = _existing(20, title="deep learning", fingerprint="c" * 64)
+        second = _existing(21, title="deep learning", fingerprint="d" * 64)
+        resolver = ImportResolver(candidates=[second, first], links={(1, 21): False, (1, 20): False})
+        counters = _counters()
+
+        resolver.apply(_payload("Deep Learning", is_read=True), counters=counters)
+
+        assert counters == {
+            "publications_created": 0,
+            "publications_updated": 1,
+            "links_created": 0,
+            "links_updated": 1,
+        }
+        assert resolver.link_writes == {(1, 20): True}
+        assert resolver.publications[20].dirty is True
+        assert resolver.publications[20].reindex is True
+
+    def test_repeated_rows_reuse_the_staged_publication_and_count_like_row_by_row(self) -> None:
+        resolver = ImportResolver(candidates=[], links={})
+        counters = _counters()
+
+        resolver.apply(_payload("New Paper", citation_count=1), counters=counters)
+        resolver.apply(_payload("New Paper", citation_count=5, is_read=True), counters=counters)
+        resolver.apply(_payload("new paper", year=2020), counters=counters)
+
+        assert counters == {
+            "publications_created": 1,
+            "publications_updated": 2,
+            "links_created": 1,
+            "links_updated": 2,
+        }
+        staged = resolver.publications[-1]
+        assert staged.publication_id is None
+        assert staged.citation_count == 0
+        assert staged.year == 2020
+        assert resolver.link_writes == {(1, -1): False}
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from app.services.rate_control import controller as controller_module
+from app.services.rate_control import registry
+from app.services.rate_control.controller import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    ProviderCall,
+    ProviderCircuitOpenError,
+    ProviderRateController,
+    parse_retry_after,
+)
+
+
+@pytest.fixture(autouse=True)
+def _controller_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        controller_module,
+        "settings",
+        replace(
+            controller_module.settings,
+            provider_rate_max_speedup=2.0,
+            provider_rate_max_slowdown=8.0,
+            provider_latency_target_seconds=1.0,
+            provider_circuit_failure_threshold=3,
+            provider_circuit_open_seconds=30.0,
+        ),
+    )
+
+
+def test_rate_backs_off_multiplicatively_and_recovers_additively() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=1.0, max_concurrency=4)
+
+    controller.record_rate_limited(retry_after_seconds=0.0)
+    assert controller.snapshot().interval_seconds == pytest.approx(2.0)
+    assert controller.snapshot().concurrency_limit == 2
+
+    controller.record_success(latency_seconds=0.1)
+    assert controller.snapshot().interval_seconds == pytest.approx(1 / 0.6)
+
+    for _ in range(50):
+        controller.record_success(latency_seconds=0.1)
+    snapshot = controller.snapshot()
+    assert snapshot.interval_seconds == pytest.approx(0.5)  # capped at base / max speedup
+    assert snapshot.concurrency_limit == 4
+
+
+def test_slow_responses_hold_the_rate() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=1.0, max_concurrency=1)
+
+    controller.record_success(latency_seconds=5.0)
+
+    snapshot = controller.snapshot()
+    assert snapshot.interval_seconds == pytest.approx(1.0)
+    assert snapshot.latency_ewma_seconds == pytest.approx(5.0)
+
+
+def test_rate_never_drops_below_max_slowdown() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=1.0, max_concurrency=1)
+
+    for _ in range(2):
+        controller.record_rate_limited(retry_after_seconds=0.0)
+        controller.record_success()
+    for _ in range(2):
+        controller.record_rate_limited(retry_after_seconds=0.0)
+
+    assert controller.snapshot().interval_seconds <= 8.0
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_failures_and_closes_on_probe() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=0.0, max_concurrency=2)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            async with controller.request():
+                raise RuntimeError("boom")
+
+    assert controller.snapshot().circuit_state == CIRCUIT_OPEN
+    assert controller.is_open()
+    assert not controller.is_suspended()
+    with pytest.raises(ProviderCircuitOpenError):
+        async with controller.request():
+            pass
+
+    controller._open_until = time.monotonic() - 1
+    async with controller.request() as call:
+        assert controller.snapshot().circuit_state == CIRCUIT_HALF_OPEN
+        with pytest.raises(ProviderCircuitOpenError):
+            async with controller.request():
+                pass
+        call.observe_status(200)
+
+    snapshot = controller.snapshot()
+    assert snapshot.circuit_state == CIRCUIT_CLOSED
+    assert snapshot.error_count == 3
+    assert snapshot.success_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_paces_to_interval_after_burst(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(controller_module.asyncio, "sleep", _fake_sleep)
+    controller = ProviderRateController("test", base_interval_seconds=1.0, max_concurrency=1, burst=2)
+
+    for _ in range(3):
+        async with controller.request() as call:
+            call.observe_status(404)
+
+    assert len(sleeps) == 1
+    assert 0.4 < sleeps[0] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_slot_caps_in_flight_work() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=0.0, max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _work() -> None:
+        nonlocal in_flight, max_in_flight
+        async with controller.concurrency_slot():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(_work() for _ in range(6)))
+
+    assert max_in_flight == 2
+    assert controller.snapshot().in_flight == 0
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+    assert parse_retry_after("7", now=now) == pytest.approx(7.0)
+    assert parse_retry_after("Mon, 19 Oct 2026 12:00:30 GMT", now=now) == pytest.approx(30.0)
+    assert parse_retry_after("Mon, 19 Oct 2026 11:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon", now=now) is None
+    assert parse_retry_after(None, now=now) is None
+
+
+def test_observe_response_records_retry_after_header() -> None:
+    call = ProviderCall()
+
+    call.observe_response(httpx.Response(429, headers={"Retry-After": "12"}))
+
+    assert call.status_code == 429
+    assert call.retry_after_seconds == pytest.approx(12.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_pauses_for_retry_after() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=0.0, max_concurrency=1)
+
+    async with controller.request() as call:
+        call.observe_response(httpx.Response(429, headers={"Retry-After": "20"}))
+
+    assert controller._paused_until - time.monotonic() == pytest.approx(20.0, abs=1.0)
+    assert controller.snapshot().rate_limited_count == 1
+
+
+def test_rate_limit_backoff_doubles_until_cap_and_resets_on_success() -> None:
+    controller = ProviderRateController(
+        "test",
+        base_interval_seconds=0.0,
+        max_concurrency=1,
+        rate_limit_backoff_seconds=5.0,
+        max_rate_limit_backoff_seconds=30.0,
+    )
+    pauses: list[float] = []
+    for _ in range(4):
+        controller.record_rate_limited()
+        pauses.append(controller._paused_until - time.monotonic())
+        controller._paused_until = 0.0
+
+    assert pauses == pytest.approx([5.0, 10.0, 20.0, 30.0], abs=0.5)
+    controller.record_success()
+    controller.record_rate_limited()
+    assert controller._paused_until - time.monotonic() == pytest.approx(5.0, abs=0.5)
+
+
+@pytest.mark.asyncio
+async def test_suspend_sheds_requests_until_it_expires() -> None:
+    controller = ProviderRateController("test", base_interval_seconds=0.0, max_concurrency=1)
+
+    controller.suspend(900.0, reason="budget_exhausted")
+
+    assert controller.is_open()
+    assert controller.is_suspended()
+    with pytest.raises(ProviderCircuitOpenError):
+        async with controller.request():
+            pass
+    controller._open_until = time.monotonic() - 1
+    assert not controller.is_open()
+
+
+def test_registry_exposes_snapshots_for_all_providers() -> None:
+    snapshots = registry.provider_rate_snapshots()
+
+    assert [snapshot.provider for snapshot in snapshots] == list(registry.PROVIDERS)
+    assert registry.get_provider_controller(registry.PROVIDER_CROSSREF) is registry.get_provider_controller(
+        registry.PROVIDER_CROSSREF
+    )
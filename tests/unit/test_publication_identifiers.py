@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Publication, PublicationIdentifier
@@ -46,6 +46,32 @@ def test_derive_display_identifier_uses_pmcid_when_present() -> None:
     assert display.value == "PMC2175868"
 
 
+def test_display_identifier_from_stored_builds_label_and_url() -> None:
+    display = identifier_service.display_identifier_from_stored(
+        kind="arxiv",
+        value="1504.08025",
+        confidence_score=0.9,
+        pub_url="https://pubmed.ncbi.nlm.nih.gov/12345678/",
+    )
+    assert display is not None
+    assert display.kind == "arxiv"
+    assert display.label == "arXiv: 1504.08025"
+    assert display.url == "https://arxiv.org/abs/1504.08025"
+    assert display.confidence_score == 0.9
+
+
+def test_display_identifier_from_stored_falls_back_to_urls() -> None:
+    display = identifier_service.display_identifier_from_stored(
+        kind=None,
+        value=None,
+        confidence_score=None,
+        pub_url="https://pubmed.ncbi.nlm.nih.gov/12345678/",
+    )
+    assert display is not None
+    assert display.kind == "pmid"
+    assert display.value == "12345678"
+
+
 def test_normalize_arxiv_id_handles_urls() -> None:
     from app.services.publication_identifiers.normalize import normalize_arxiv_id
 
@@ -215,6 +241,52 @@ async def test_discover_and_sync_calls_arxiv_when_item_is_eligible(
     assert identifier.value_normalized == "2501.00001v2"
 
 
+@pytest.mark.asyncio
+async def test_stored_display_identifier_tracks_identifier_rows(db_session: AsyncSession) -> None:
+    publication = _publication(title="Stored display identifier")
+    db_session.add(publication)
+    await db_session.flush()
+    publication_id = int(publication.id)
+    db_session.add_all(
+        [
+            PublicationIdentifier(
+                publication_id=publication_id,
+                kind=IdentifierKind.ARXIV.value,
+                value_raw="2501.00001",
+                value_normalized="2501.00001",
+                source="test",
+                confidence_score=0.98,
+            ),
+            PublicationIdentifier(
+                publication_id=publication_id,
+                kind=IdentifierKind.DOI.value,
+                value_raw="10.1000/stored",
+                value_normalized="10.1000/stored",
+                source="test",
+                confidence_score=0.6,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    display = await identifier_service.display_identifier_for_publication_id(
+        db_session,
+        publication_id=publication_id,
+    )
+    assert display is not None
+    assert (display.kind, display.value) == ("doi", "10.1000/stored")
+
+    await db_session.execute(
+        delete(PublicationIdentifier).where(PublicationIdentifier.kind == IdentifierKind.DOI.value)
+    )
+    display = await identifier_service.display_identifier_for_publication_id(
+        db_session,
+        publication_id=publication_id,
+    )
+    assert display is not None
+    assert (display.kind, display.value) == ("arxiv", "2501.00001")
+
+
 @pytest.mark.asyncio
 async def test_discover_arxiv_id_returns_none_if_no_title() -> None:
     item = UnreadPublicationItem(
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.models import PublicationPdfJob
-from app.services.publications import pdf_queue, pdf_queue_resolution
+from app.db.models import Publication, PublicationPdfJob
+from app.services.publications import pdf_queue, pdf_queue_resolution, pdf_resolution_pipeline
 from app.services.publications.pdf_resolution_pipeline import PipelineOutcome
+from app.services.rate_control import PROVIDER_OPENALEX, get_provider_controller
 from app.services.unpaywall.application import OaResolutionOutcome
 
 
@@ -186,83 +191,192 @@ async def test_fetch_outcome_for_row_returns_failed_outcome_when_pipeline_return
     assert arxiv_rate_limited is True
 
 
+def _outcome(row, *, pdf_url: str | None = "https://fallback.example/test.pdf") -> OaResolutionOutcome:
+    return OaResolutionOutcome(
+        publication_id=row.publication_id,
+        doi=None,
+        pdf_url=pdf_url,
+        failure_reason=None if pdf_url else "no_pdf_found",
+        source="unpaywall" if pdf_url else None,
+        used_crossref=False,
+    )
+
+
+def _rows(count: int) -> list[Any]:
+    first = _row()
+    return [SimpleNamespace(**{**first.__dict__, "publication_id": index}) for index in range(1, count + 1)]
+
+
+def _patch_queue_io(monkeypatch: pytest.MonkeyPatch, *, workers: int, claim_batch_size: int) -> dict[str, list]:
+    captured: dict[str, list] = {"started": [], "persisted": []}
+
+    @contextlib.asynccontextmanager
+    async def _raise_background_session_error():
+        raise RuntimeError("skip user settings lookup in test")
+        yield  # pragma: no cover
+
+    async def _capture_claimed(*, publication_ids: list[int], user_id: int, limit: int) -> list[int]:
+        claimed = list(publication_ids)[:limit]
+        if claimed:
+            captured["started"].append((user_id, claimed))
+        return claimed
+
+    async def _capture_persisted(*, user_id: int, outcomes: list[OaResolutionOutcome]) -> None:
+        captured["persisted"].append((user_id, [outcome.publication_id for outcome in outcomes]))
+
+    monkeypatch.setattr(pdf_queue_resolution, "background_session", _raise_background_session_error)
+    monkeypatch.setattr(pdf_queue_resolution, "_claim_queued_jobs", _capture_claimed)
+    monkeypatch.setattr(pdf_queue_resolution, "_persist_outcomes", _capture_persisted)
+    monkeypatch.setattr(
+        pdf_queue_resolution,
+        "settings",
+        replace(pdf_queue_resolution.settings, pdf_queue_workers=workers, pdf_queue_claim_batch_size=claim_batch_size),
+    )
+    return captured
+
+
 @pytest.mark.asyncio
-async def test_resolve_publication_row_persists_outcome_and_returns_rate_limit_flag(
+async def test_run_resolution_task_marks_and_persists_claimed_chunks_in_batches(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    captured: list[tuple[int, int, OaResolutionOutcome]] = []
-
-    async def _noop_mark_attempt_started(*, publication_id: int, user_id: int) -> None:
-        return None
+    captured = _patch_queue_io(monkeypatch, workers=2, claim_batch_size=2)
+    in_flight = 0
+    max_in_flight = 0
 
     async def _fake_fetch(*, row, request_email=None, openalex_api_key=None, allow_arxiv_lookup=True):
-        assert allow_arxiv_lookup is True
-        return (
-            OaResolutionOutcome(
-                publication_id=row.publication_id,
-                doi=None,
-                pdf_url="https://fallback.example/test.pdf",
-                failure_reason=None,
-                source="unpaywall",
-                used_crossref=False,
-            ),
-            True,
-        )
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _outcome(row), False
 
-    async def _capture_persist_outcome(*, publication_id: int, user_id: int, outcome: OaResolutionOutcome) -> None:
-        captured.append((publication_id, user_id, outcome))
-
-    monkeypatch.setattr(pdf_queue_resolution, "_mark_attempt_started", _noop_mark_attempt_started)
     monkeypatch.setattr(pdf_queue_resolution, "_fetch_outcome_for_row", _fake_fetch)
-    monkeypatch.setattr(pdf_queue_resolution, "_persist_outcome", _capture_persist_outcome)
 
-    rate_limited = await pdf_queue_resolution._resolve_publication_row(
-        user_id=42,
-        request_email="user@example.com",
-        row=_row(),
-        openalex_api_key="key",
-    )
+    await pdf_queue_resolution._run_resolution_task(user_id=42, request_email="user@example.com", rows=_rows(5))
 
-    assert len(captured) == 1
-    publication_id, user_id, outcome = captured[0]
-    assert publication_id == 1
-    assert user_id == 42
-    assert outcome.pdf_url == "https://fallback.example/test.pdf"
-    assert rate_limited is True
+    assert sorted(captured["started"]) == [(42, [1, 2]), (42, [3, 4]), (42, [5])]
+    assert sorted(captured["persisted"]) == [(42, [1, 2]), (42, [3, 4]), (42, [5])]
+    assert max_in_flight == 4
 
 
 @pytest.mark.asyncio
 async def test_run_resolution_task_disables_arxiv_for_remaining_batch(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    _patch_queue_io(monkeypatch, workers=1, claim_batch_size=1)
     calls: list[tuple[int, bool]] = []
-    first = _row()
-    second: Any = SimpleNamespace(**{**first.__dict__, "publication_id": 2})
-
-    @contextlib.asynccontextmanager
-    async def _raise_background_session_error():
-        raise RuntimeError("skip user settings lookup in test")
-        yield  # pragma: no cover
 
-    async def _fake_resolve_publication_row(
-        *,
-        user_id: int,
-        request_email: str | None,
-        row,
-        openalex_api_key=None,
-        allow_arxiv_lookup=True,
-    ):
-        _ = (user_id, request_email, openalex_api_key)
+    async def _fake_fetch(*, row, request_email=None, openalex_api_key=None, allow_arxiv_lookup=True):
         calls.append((int(row.publication_id), bool(allow_arxiv_lookup)))
-        return row.publication_id == 1
+        return _outcome(row), row.publication_id == 1
 
-    monkeypatch.setattr(pdf_queue_resolution, "background_session", _raise_background_session_error)
-    monkeypatch.setattr(pdf_queue_resolution, "_resolve_publication_row", _fake_resolve_publication_row)
+    monkeypatch.setattr(pdf_queue_resolution, "_fetch_outcome_for_row", _fake_fetch)
+
+    await pdf_queue_resolution._run_resolution_task(user_id=42, request_email="user@example.com", rows=_rows(2))
 
-    await pdf_queue_resolution._run_resolution_task(
+    assert calls == [(1, True), (2, False)]
+
+
+@pytest.mark.asyncio
+async def test_run_resolution_task_stops_claiming_after_budget_exhaustion(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.openalex.client import OpenAlexBudgetExhaustedError
+
+    captured = _patch_queue_io(monkeypatch, workers=1, claim_batch_size=2)
+
+    async def _fake_fetch(*, row, request_email=None, openalex_api_key=None, allow_arxiv_lookup=True):
+        if row.publication_id == 2:
+            raise OpenAlexBudgetExhaustedError("budget gone")
+        return _outcome(row), False
+
+    monkeypatch.setattr(pdf_queue_resolution, "_fetch_outcome_for_row", _fake_fetch)
+
+    await pdf_queue_resolution._run_resolution_task(user_id=42, request_email="user@example.com", rows=_rows(5))
+
+    # The exhausted chunk is still persisted (row 2 as failed); later chunks are never claimed.
+    assert captured["started"] == [(42, [1, 2])]
+    assert captured["persisted"] == [(42, [1, 2])]
+
+
+@pytest.mark.asyncio
+async def test_claim_queued_jobs_hands_each_queued_job_to_one_worker(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publications = [
+        Publication(
+            fingerprint_sha256=f"{index:064x}",
+            title_raw=f"Claim target {index}",
+            title_normalized=f"claim target {index}",
+            citation_count=0,
+        )
+        for index in range(1, 5)
+    ]
+    db_session.add_all(publications)
+    await db_session.flush()
+    publication_ids = [int(publication.id) for publication in publications]
+    db_session.add_all(
+        PublicationPdfJob(
+            publication_id=publication_id,
+            status=pdf_queue.PDF_STATUS_RUNNING
+            if publication_id == publication_ids[-1]
+            else pdf_queue.PDF_STATUS_QUEUED,
+            attempt_count=0,
+        )
+        for publication_id in publication_ids
+    )
+    await db_session.commit()
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    monkeypatch.setattr("app.db.background_session.get_session_factory", lambda: factory)
+
+    first, second = await asyncio.gather(
+        pdf_queue_resolution._claim_queued_jobs(publication_ids=publication_ids, user_id=None, limit=2),
+        pdf_queue_resolution._claim_queued_jobs(publication_ids=publication_ids, user_id=None, limit=2),
+    )
+
+    assert not set(first) & set(second)
+    assert sorted(first + second) == publication_ids[:3]
+    result = await db_session.execute(
+        select(PublicationPdfJob.status, PublicationPdfJob.attempt_count)
+        .where(PublicationPdfJob.publication_id.in_(publication_ids[:3]))
+        .execution_options(populate_existing=True)
+    )
+    assert set(result.all()) == {(pdf_queue.PDF_STATUS_RUNNING, 1)}
+
+
+@pytest.mark.asyncio
+async def test_openalex_lookup_is_skipped_while_openalex_is_paused(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.openalex.client import OpenAlexClient
+
+    async def _unexpected_fetch(self, *args, **kwargs):
+        raise AssertionError("OpenAlex must not be called while paused")
+
+    monkeypatch.setattr(OpenAlexClient, "get_works_by_filter", _unexpected_fetch)
+    get_provider_controller(PROVIDER_OPENALEX).suspend(60.0, reason="budget_exhausted")
+
+    outcome = await pdf_resolution_pipeline._openalex_outcome(_row(), request_email="user@example.com")
+
+    assert outcome is None
+
+
+@pytest.mark.asyncio
+async def test_persist_outcomes_safely_falls_back_to_rows_when_batch_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    persisted: list[list[int]] = []
+
+    async def _flaky_persist(*, user_id: int, outcomes: list[OaResolutionOutcome]) -> None:
+        if len(outcomes) > 1:
+            raise RuntimeError("batch failed")
+        persisted.append([outcome.publication_id for outcome in outcomes])
+
+    monkeypatch.setattr(pdf_queue_resolution, "_persist_outcomes", _flaky_persist)
+
+    await pdf_queue_resolution._persist_outcomes_safely(
         user_id=42,
-        request_email="user@example.com",
-        rows=[first, second],
+        outcomes=[_outcome(row) for row in _rows(3)],
     )
 
-    assert calls == [(1, True), (2, False)]
+    assert persisted == [[1], [2], [3]]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
 from datetime import UTC, datetime
 from types import SimpleNamespace
 from typing import Any
@@ -209,3 +211,155 @@ async def test_arxiv_outcome_calls_arxiv_when_eligible(
     assert outcome is not None
     assert outcome.source == "arxiv"
     assert outcome.pdf_url == "https://arxiv.org/pdf/1234.5678.pdf"
+
+
+def _enable_hedging(monkeypatch: pytest.MonkeyPatch, *, delay_seconds: float) -> None:
+    monkeypatch.setattr(
+        pipeline,
+        "settings",
+        replace(pipeline.settings, pdf_resolution_hedge_enabled=True, pdf_resolution_hedge_delay_seconds=delay_seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_hedged_pipeline_starts_next_provider_when_primary_is_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    _enable_hedging(monkeypatch, delay_seconds=0.01)
+    canceled: list[str] = []
+
+    async def _slow_openalex(row, request_email: str | None = None, openalex_api_key: str | None = None):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            canceled.append("openalex")
+            raise
+        return None
+
+    async def _fast_arxiv(row, *, request_email: str | None = None, allow_lookup: bool = True):
+        return _api_outcome(pdf_url="https://arxiv.org/pdf/1234.5678.pdf", source="arxiv")
+
+    async def _fail_oa(*, row, request_email):
+        raise AssertionError("Unpaywall should not start before arXiv has had its hedge window.")
+
+    monkeypatch.setattr(pipeline, "_openalex_outcome", _slow_openalex)
+    monkeypatch.setattr(pipeline, "_arxiv_outcome", _fast_arxiv)
+    monkeypatch.setattr(pipeline, "_oa_outcome", _fail_oa)
+
+    result = await pipeline.resolve_publication_pdf_outcome_for_row(row=_row(), request_email="user@example.com")
+
+    assert result.outcome is not None
+    assert result.outcome.source == "arxiv"
+    assert canceled == ["openalex"]
+
+
+@pytest.mark.asyncio
+async def test_hedged_pipeline_starts_next_provider_as_soon_as_one_comes_back_empty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _enable_hedging(monkeypatch, delay_seconds=0.2)
+    loop = asyncio.get_running_loop()
+    started: dict[str, float] = {}
+
+    async def _slow_openalex(row, request_email: str | None = None, openalex_api_key: str | None = None):
+        started["openalex"] = loop.time()
+        await asyncio.sleep(10)
+        return None
+
+    async def _empty_arxiv(row, *, request_email: str | None = None, allow_lookup: bool = True):
+        started["arxiv"] = loop.time()
+        return None
+
+    async def _oa(*, row, request_email):
+        started["unpaywall"] = loop.time()
+        return _oa_fallback_outcome(pdf_url="https://oa.example.org/found.pdf")
+
+    monkeypatch.setattr(pipeline, "_openalex_outcome", _slow_openalex)
+    monkeypatch.setattr(pipeline, "_arxiv_outcome", _empty_arxiv)
+    monkeypatch.setattr(pipeline, "_oa_outcome", _oa)
+
+    result = await pipeline.resolve_publication_pdf_outcome_for_row(row=_row(), request_email="user@example.com")
+
+    assert result.outcome is not None
+    assert result.outcome.pdf_url == "https://oa.example.org/found.pdf"
+    # arXiv waits one hedge delay after OpenAlex started; Unpaywall does not wait another one.
+    assert 0.15 <= started["arxiv"] - started["openalex"] < 0.4
+    assert started["unpaywall"] - started["arxiv"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_hedged_pipeline_breaks_ties_by_provider_priority(monkeypatch: pytest.MonkeyPatch) -> None:
+    _enable_hedging(monkeypatch, delay_seconds=0.0)
+    release = asyncio.Event()
+
+    async def _openalex(row, request_email: str | None = None, openalex_api_key: str | None = None):
+        await release.wait()
+        return _api_outcome(pdf_url="https://oa.example.org/found.pdf", source="openalex")
+
+    async def _arxiv(row, *, request_email: str | None = None, allow_lookup: bool = True):
+        await release.wait()
+        return _api_outcome(pdf_url="https://arxiv.org/pdf/1234.5678.pdf", source="arxiv")
+
+    async def _oa(*, row, request_email):
+        # Releases OpenAlex and arXiv so both complete in the same event-loop pass.
+        release.set()
+        return _oa_fallback_outcome(pdf_url=None)
+
+    monkeypatch.setattr(pipeline, "_openalex_outcome", _openalex)
+    monkeypatch.setattr(pipeline, "_arxiv_outcome", _arxiv)
+    monkeypatch.setattr(pipeline, "_oa_outcome", _oa)
+
+    result = await pipeline.resolve_publication_pdf_outcome_for_row(row=_row(), request_email="user@example.com")
+
+    assert result.outcome is not None
+    assert result.outcome.source == "openalex"
+
+
+@pytest.mark.asyncio
+async def test_hedged_pipeline_keeps_arxiv_rate_limit_and_unpaywall_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    _enable_hedging(monkeypatch, delay_seconds=0.0)
+
+    async def _openalex(row, request_email: str | None = None, openalex_api_key: str | None = None):
+        return None
+
+    async def _raise_rate_limit(row, *, request_email: str | None = None, allow_lookup: bool = True):
+        raise ArxivRateLimitError("arXiv rate limit hit (429)")
+
+    async def _oa(*, row, request_email):
+        await asyncio.sleep(0.01)
+        return _oa_fallback_outcome(pdf_url=None)
+
+    monkeypatch.setattr(pipeline, "_openalex_outcome", _openalex)
+    monkeypatch.setattr(pipeline, "_arxiv_outcome", _raise_rate_limit)
+    monkeypatch.setattr(pipeline, "_oa_outcome", _oa)
+
+    result = await pipeline.resolve_publication_pdf_outcome_for_row(row=_row(), request_email="user@example.com")
+
+    assert result.arxiv_rate_limited is True
+    assert result.outcome is not None
+    assert result.outcome.failure_reason == "no_pdf_found"
+
+
+@pytest.mark.asyncio
+async def test_hedged_pipeline_propagates_openalex_budget_exhaustion(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.openalex.client import OpenAlexBudgetExhaustedError
+
+    _enable_hedging(monkeypatch, delay_seconds=0.0)
+    canceled: list[str] = []
+
+    async def _openalex(row, request_email: str | None = None, openalex_api_key: str | None = None):
+        await asyncio.sleep(0.01)
+        raise OpenAlexBudgetExhaustedError("budget gone")
+
+    async def _slow(*args, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            canceled.append("slow")
+            raise
+
+    monkeypatch.setattr(pipeline, "_openalex_outcome", _openalex)
+    monkeypatch.setattr(pipeline, "_arxiv_outcome", _slow)
+    monkeypatch.setattr(pipeline, "_oa_outcome", _slow)
+
+    with pytest.raises(OpenAlexBudgetExhaustedError):
+        await pipeline.resolve_publication_pdf_outcome_for_row(row=_row(), request_email="user@example.com")
+    assert canceled == ["slow", "slow"]
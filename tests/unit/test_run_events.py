@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+
+import pytest
+
+from app.services.runs import events as events_module
+from app.services.runs.event_transport import _NOTIFY_PAYLOAD_LIMIT_BYTES, PostgresRunEventTransport
+from app.services.runs.events import RunEvent, RunEventPublisher
+
+
+class _LoopbackTransport:
+    def __init__(self, publisher: RunEventPublisher) -> None:
+        self.publisher = publisher
+        self.sent: list[tuple[int, RunEvent]] = []
+
+    async def send(self, run_id: int, event: RunEvent) -> None:
+        self.sent.append((run_id, event))
+        self.publisher.deliver(run_id, event)
+
+
+class _FailingTransport:
+    async def send(self, run_id: int, event: RunEvent) -> None:
+        raise ConnectionError("bus down")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_replays_events_after_last_event_id() -> None:
+    publisher = RunEventPublisher(replay_size=8)
+    for index in range(3):
+        await publisher.publish(7, "progress", {"n": index})
+    first_id = publisher.subscribe(7, last_event_id="unknown")[1][0].event_id
+
+    _, backlog = publisher.subscribe(7, last_event_id=first_id)
+
+    assert [event.data["n"] for event in backlog] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_unknown_last_event_id_replays_whole_buffer() -> None:
+    publisher = RunEventPublisher(replay_size=2)
+    for index in range(3):
+        await publisher.publish(7, "progress", {"n": index})
+
+    _, backlog = publisher.subscribe(7, last_event_id="evicted")
+
+    assert [event.data["n"] for event in backlog] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_batches_discoveries_and_merges_progress_within_a_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publisher = RunEventPublisher(replay_size=16)
+    monkeypatch.setattr(events_module, "run_events", publisher)
+    stream = events_module.event_generator(9, coalesce_window_seconds=0)
+    assert await stream.__anext__() == "retry: 1000\n\n"
+
+    for index in range(3):
+        await publisher.publish(9, "publication_discovered", {"publication_id": index})
+        await publisher.publish(9, "scholar_progress", {"visited": index})
+    await publisher.publish(9, "identifier_updated", {"publication_id": 0})
+    await publisher.publish_run_complete(9)
+    chunks = [chunk async for chunk in stream]
+
+    messages = chunks[0].strip().split("\n\n")
+    assert [message.split("\n")[0] for message in messages] == [
+        "event: publication_discovered_batch",
+        "event: identifier_updated_batch",
+        "event: scholar_progress",
+        f"id: {publisher._replay[9][-1].event_id}",
+    ]
+    assert json.loads(messages[0].split("data: ")[1]) == {"items": [{"publication_id": n} for n in range(3)]}
+    assert json.loads(messages[2].split("data: ")[1]) == {"visited": 2}
+    assert 9 not in publisher._subscribers
+
+
+def test_backpressure_degrades_to_summary_instead_of_dropping_subscriber(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(events_module, "_MAX_PENDING_BATCH_ITEMS", 2)
+    publisher = RunEventPublisher()
+    subscription, _ = publisher.subscribe(4)
+
+    for index in range(5):
+        publisher.deliver(
+            4,
+            RunEvent(
+                event_id=f"n-{index}",
+                event_type="publication_discovered",
+                data={"publication_id": index, "new_publication_count": index + 1},
+            ),
+        )
+    messages = subscription.drain()
+
+    assert messages[0] == ("run_summary", {"skipped": {"publication_discovered": 3}, "new_publication_count": 5})
+    assert messages[1] == (
+        "publication_discovered_batch",
+        {
+            "items": [
+                {"publication_id": 3, "new_publication_count": 4},
+                {"publication_id": 4, "new_publication_count": 5},
+            ]
+        },
+    )
+    assert subscription in publisher._subscribers[4]
+    assert subscription.drain() == []
+
+
+@pytest.mark.asyncio
+async def test_transport_round_trip_delivers_to_local_subscribers() -> None:
+    publisher = RunEventPublisher()
+    transport = _LoopbackTransport(publisher)
+    publisher.set_transport(transport)
+    subscription, _ = publisher.subscribe(3)
+
+    await publisher.publish(3, "run_complete", {})
+
+    assert [event.event_type for _, event in transport.sent] == ["run_complete"]
+    assert subscription.drain() == [("run_complete", {})]
+
+
+@pytest.mark.asyncio
+async def test_send_failure_falls_back_to_local_delivery() -> None:
+    publisher = RunEventPublisher()
+    publisher.set_transport(_FailingTransport())
+    subscription, _ = publisher.subscribe(3)
+
+    await publisher.publish(3, "progress", {"n": 1})
+
+    assert subscription.drain() == [("progress", {"n": 1})]
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.notified: list[str] = []
+        self.stored: dict[int, str] = {}
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def fetchval(self, query: str, *args: object) -> object:
+        if query.lstrip().startswith("WITH"):
+            reference = len(self.stored) + 1
+            self.stored[reference] = str(args[-1])
+            return reference
+        return self.stored.get(int(args[0]))  # type: ignore[call-overload]
+
+    async def executemany(self, query: str, args: list[tuple[str, str]]) -> None:
+        self.notified.extend(payload for _channel, payload in args)
+
+
+class _BrokenConnection(_FakeConnection):
+    async def executemany(self, query: str, args: list[tuple[str, str]]) -> None:
+        raise ConnectionError("connection lost")
+
+
+@pytest.mark.asyncio
+async def test_postgres_transport_sends_large_events_by_reference() -> None:
+    publisher = RunEventPublisher()
+    transport = PostgresRunEventTransport(publisher=publisher, dsn="postgresql://unused")
+    connection = _FakeConnection()
+    transport._connection = connection  # type: ignore[assignment]
+    subscription, _ = publisher.subscribe(5)
+    large = {"title": "x" * (_NOTIFY_PAYLOAD_LIMIT_BYTES + 1)}
+
+    await transport.send(5, RunEvent(event_id="n-1", event_type="small", data={"n": 1}))
+    await transport.send(5, RunEvent(event_id="n-2", event_type="large", data=large))
+    await transport._notify(transport._take_pending(limit=10))
+    for payload in connection.notified:
+        await transport._deliver(payload)
+
+    assert "ref" in json.loads(connection.notified[1])
+    assert subscription.drain() == [("small", {"n": 1}), ("large", large)]
+    assert subscription.last_event_id == "n-2"
+
+
+@pytest.mark.asyncio
+async def test_postgres_transport_send_queues_without_touching_the_connection() -> None:
+    transport = PostgresRunEventTransport(publisher=RunEventPublisher(), dsn="postgresql://unused")
+
+    await transport.send(5, RunEvent(event_id="n-1", event_type="small", data={"n": 1}))
+
+    assert transport._connection is None
+    assert transport._outbox.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_postgres_transport_delivers_locally_when_notify_fails() -> None:
+    publisher = RunEventPublisher()
+    transport = PostgresRunEventTransport(publisher=publisher, dsn="postgresql://unused")
+    transport._connection = _BrokenConnection()  # type: ignore[assignment]
+    subscription, _ = publisher.subscribe(5)
+    sender = asyncio.create_task(transport._send_pending())
+    try:
+        await transport.send(5, RunEvent(event_id="n-1", event_type="progress", data={"n": 1}))
+        await transport.send(5, RunEvent(event_id="n-2", event_type="progress", data={"n": 2}))
+        await asyncio.wait_for(subscription.wait(), timeout=1.0)
+    finally:
+        sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sender
+
+    assert subscription.drain() == [("progress", {"n": 1}), ("progress", {"n": 2})]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.ingestion import scheduler as scheduler_module
+from app.settings import settings
+
+
+def _scheduler() -> scheduler_module.SchedulerService:
+    return scheduler_module.SchedulerService(
+        enabled=False,
+        tick_seconds=60,
+        network_error_retries=0,
+        retry_backoff_seconds=0.0,
+        max_pages_per_scholar=1,
+        page_size=20,
+        continuation_queue_enabled=False,
+        continuation_base_delay_seconds=60,
+        continuation_max_delay_seconds=600,
+        continuation_max_attempts=3,
+        queue_batch_size=1,
+    )
+
+
+def test_maintenance_job_waits_one_interval_after_start(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 1_000.0}
+    monkeypatch.setattr(scheduler_module.time, "monotonic", lambda: clock["now"])
+    scheduler = _scheduler()
+
+    assert scheduler._maintenance_due("identifier_dedup", interval_seconds=300.0) is False
+    clock["now"] += 299.0
+    assert scheduler._maintenance_due("identifier_dedup", interval_seconds=300.0) is False
+    clock["now"] += 1.0
+    assert scheduler._maintenance_due("identifier_dedup", interval_seconds=300.0) is True
+    assert scheduler._maintenance_due("identifier_dedup", interval_seconds=300.0) is False
+    assert scheduler._maintenance_due("publication_counters_reconcile", interval_seconds=0.0) is False
+
+
+@pytest.mark.asyncio
+async def test_maintenance_job_is_skipped_while_another_replica_holds_its_lock(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    monkeypatch.setattr(scheduler_module, "get_session_factory", lambda: factory)
+    monkeypatch.setattr(scheduler_module.SchedulerService, "_maintenance_due", lambda self, job, **kwargs: True)
+    calls: list[str] = []
+
+    async def _run() -> int:
+        calls.append("ran")
+        return 1
+
+    scheduler = _scheduler()
+    interval = settings.scheduler_identifier_dedup_interval_seconds
+    async with scheduler_module._maintenance_lock(scheduler_module._JOB_IDENTIFIER_DEDUP) as acquired:
+        assert acquired is True
+        skipped = await scheduler._run_maintenance_job(
+            scheduler_module._JOB_IDENTIFIER_DEDUP, interval_seconds=interval, run=_run
+        )
+    ran = await scheduler._run_maintenance_job(
+        scheduler_module._JOB_IDENTIFIER_DEDUP, interval_seconds=interval, run=_run
+    )
+
+    assert skipped == 0
+    assert ran == 1
+    assert calls == ["ran"]
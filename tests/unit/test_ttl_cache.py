@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from app.ttl_cache import TtlLruCache
+
+
+def test_ttl_lru_cache_expires_entries_at_their_deadline() -> None:
+    cache: TtlLruCache[str, int] = TtlLruCache()
+    cache.set("a", 1, ttl_seconds=10.0, max_entries=4, now=100.0)
+
+    assert cache.get("a", now=109.9) == 1
+    assert cache.get("a", now=110.0) is None
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_evicts_least_recently_used_entry() -> None:
+    cache: TtlLruCache[str, int] = TtlLruCache()
+    for index, key in enumerate(("a", "b")):
+        cache.set(key, index, ttl_seconds=60.0, max_entries=2, now=0.0)
+
+    assert cache.get("a", now=1.0) == 0
+    cache.set("c", 2, ttl_seconds=60.0, max_entries=2, now=1.0)
+
+    assert cache.get("b", now=1.0) is None
+    assert cache.get("a", now=1.0) == 0
+    assert cache.get("c", now=1.0) == 2
+
+
+def test_ttl_lru_cache_drops_entry_when_caching_is_disabled() -> None:
+    cache: TtlLruCache[str, int] = TtlLruCache()
+    cache.set("a", 1, ttl_seconds=60.0, max_entries=2)
+
+    cache.set("a", 2, ttl_seconds=0.0, max_entries=2)
+
+    assert cache.get("a") is None
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
+import httpx
 import pytest
 
-from app.services.unpaywall import pdf_discovery
+from app.services.rate_control import PROVIDER_PDF_LANDING, get_provider_controller
+from app.services.rate_control import registry as rate_control_registry
+from app.services.unpaywall import cache as unpaywall_cache
+from app.services.unpaywall import discovery_rules, pdf_discovery
+
+
+@pytest.fixture(autouse=True)
+def _reset_discovery_state() -> None:
+    unpaywall_cache.clear_landing_cache()
+    discovery_rules.clear_discovery_rules()
 
 
 def test_looks_like_pdf_url_detects_path_and_query_variants() -> None:
@@ -50,45 +62,171 @@ def test_normalized_candidate_urls_extracts_plain_text_urls() -> None:
     assert "http://www.mext.go.jp/component/english/file.pdf" in candidates
 
 
-class _FakeResponse:
-    def __init__(self, *, status_code: int, content_type: str, text: str) -> None:
-        self.status_code = status_code
-        self.headers = {"content-type": content_type}
-        self.text = text
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
 
-class _FakeClient:
-    def __init__(self, pages: dict[str, _FakeResponse]) -> None:
-        self._pages = pages
-
-    async def get(self, url: str, follow_redirects: bool = True):
-        return self._pages[url]
+@pytest.fixture
+def _no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        rate_control_registry,
+        "settings",
+        replace(rate_control_registry.settings, unpaywall_pdf_discovery_min_interval_seconds=0.0),
+    )
 
 
 @pytest.mark.asyncio
-async def test_resolve_pdf_from_landing_page_follows_one_hop_html_candidate(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    async def _skip_wait(*args, **kwargs):
-        return None
-
-    monkeypatch.setattr(pdf_discovery, "wait_for_unpaywall_slot", _skip_wait)
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_resolve_pdf_from_landing_page_follows_one_hop_html_candidate() -> None:
     landing_url = "https://example.org/article"
     hop_url = "https://example.org/doi/full/abc"
     pdf_url = "https://downloads.example.org/archive/paper.pdf"
-    client = _FakeClient(
-        {
-            landing_url: _FakeResponse(
-                status_code=200,
-                content_type="text/html",
-                text=f'<html><body><a href="{hop_url}">View article</a></body></html>',
-            ),
-            hop_url: _FakeResponse(
-                status_code=200,
-                content_type="text/html",
-                text=f"<html><body>Download here: {pdf_url}</body></html>",
-            ),
-        }
-    )
-    resolved = await pdf_discovery.resolve_pdf_from_landing_page(client, page_url=landing_url)
+    pages = {
+        landing_url: f'<html><body><a href="{hop_url}">View article</a></body></html>',
+        hop_url: f"<html><body>Download here: {pdf_url}</body></html>",
+    }
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=pages[str(request.url)])
+
+    async with _mock_client(_handler) as client:
+        resolved = await pdf_discovery.resolve_pdf_from_landing_page(client, page_url=landing_url)
     assert resolved == pdf_url
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_candidate_is_pdf_trusts_head_content_type_without_get() -> None:
+    methods: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200, headers={"content-type": "application/pdf"})
+
+    async with _mock_client(_handler) as client:
+        assert await pdf_discovery._candidate_is_pdf(client, candidate_url="https://example.org/download/42")
+    assert methods == ["HEAD"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_candidate_is_pdf_falls_back_to_streamed_get_and_stops_early() -> None:
+    yielded: list[int] = []
+
+    async def _body():
+        yield b"%PDF-1.7\n"
+        for index in range(1000):
+            yielded.append(index)
+            yield b"x" * 1024
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, headers={"content-type": "application/octet-stream"}, content=_body())
+
+    async with _mock_client(_handler) as client:
+        assert await pdf_discovery._candidate_is_pdf(client, candidate_url="https://example.org/download/42")
+    assert len(yielded) < 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_fetch_page_html_caps_streamed_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        pdf_discovery,
+        "settings",
+        replace(pdf_discovery.settings, unpaywall_pdf_discovery_max_html_bytes=2048),
+    )
+    yielded: list[int] = []
+
+    async def _body():
+        for index in range(1000):
+            yielded.append(index)
+            yield b"<p>" + b"a" * 1021
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, content=_body())
+
+    async with _mock_client(_handler) as client:
+        html = await pdf_discovery._fetch_page_html(client, page_url="https://example.org/article")
+    assert html is not None
+    assert len(html) == 2048
+    assert len(yielded) == 2
+
+
+def test_derive_path_rewrite_learns_structural_segment_swap() -> None:
+    rewrite = discovery_rules.derive_path_rewrite(
+        "https://pub.example.org/doi/abs/10.1000/abc",
+        "https://pub.example.org/doi/pdf/10.1000/abc",
+    )
+    assert rewrite == discovery_rules.PathRewrite(index=2, source="abs", target="pdf")
+    assert (
+        discovery_rules.apply_path_rewrite("https://pub.example.org/doi/abs/10.2000/xyz?af=R", rewrite)
+        == "https://pub.example.org/doi/pdf/10.2000/xyz"
+    )
+    # Article-specific leaf changes and cross-host links are not reusable rules.
+    assert discovery_rules.derive_path_rewrite("https://a.org/x/1", "https://a.org/x/1-file") is None
+    assert discovery_rules.derive_path_rewrite("https://a.org/abs/1", "https://cdn.a.org/pdf/1") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_resolve_pdf_from_landing_page_reuses_learned_domain_rewrite() -> None:
+    requested: list[tuple[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        requested.append((request.method, url))
+        if "/doi/pdf/" in url:
+            return httpx.Response(200, headers={"content-type": "application/pdf"})
+        doi_path = url.split("/doi/abs/", 1)[1]
+        html = f'<a href="/doi/pdf/{doi_path}">PDF</a>'
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=html)
+
+    async with _mock_client(_handler) as client:
+        first = await pdf_discovery.resolve_pdf_from_landing_page(
+            client, page_url="https://pub.example.org/doi/abs/10.1000/one"
+        )
+        requested.clear()
+        second = await pdf_discovery.resolve_pdf_from_landing_page(
+            client, page_url="https://pub.example.org/doi/abs/10.1000/two"
+        )
+
+    assert first == "https://pub.example.org/doi/pdf/10.1000/one"
+    assert second == "https://pub.example.org/doi/pdf/10.1000/two"
+    # The learned rewrite is probed directly; the landing page is never fetched.
+    assert requested == [("HEAD", "https://pub.example.org/doi/pdf/10.1000/two")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_no_rate_limit")
+async def test_resolve_pdf_from_landing_page_caches_negative_results() -> None:
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, headers={"content-type": "text/html"}, text="<p>No full text</p>")
+
+    async with _mock_client(_handler) as client:
+        for _ in range(2):
+            resolved = await pdf_discovery.resolve_pdf_from_landing_page(client, page_url="https://example.org/a")
+            assert resolved is None
+
+    assert requested == ["https://example.org/a"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_pdf_from_landing_page_skips_crawl_while_landing_circuit_is_open() -> None:
+    get_provider_controller(PROVIDER_PDF_LANDING).suspend(60.0, reason="test")
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, headers={"content-type": "text/html"}, text="<html></html>")
+
+    async with _mock_client(_handler) as client:
+        resolved = await pdf_discovery.resolve_pdf_from_landing_page(client, page_url="https://example.org/paused")
+
+    assert resolved is None
+    assert requested == []
+    assert unpaywall_cache.get_cached_landing_result("https://example.org/paused") is None
@@ -7,7 +7,14 @@ import pytest
 
 from app.services.publication_identifiers.types import DisplayIdentifier
 from app.services.publications.types import PublicationListItem
+from app.services.rate_control import registry as rate_control_registry
 from app.services.unpaywall import application as unpaywall_app
+from app.services.unpaywall import cache as unpaywall_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_unpaywall_state() -> None:
+    unpaywall_cache.clear_unpaywall_cache()
 
 
 class _DummyAsyncClient:
@@ -140,3 +147,87 @@ async def test_unpaywall_preserves_crossref_doi_when_unpaywall_has_no_record(
     assert outcome.pdf_url is None
     assert outcome.failure_reason == unpaywall_app.FAILURE_NO_RECORD
     assert outcome.used_crossref is True
+
+
+class _StatusResponse:
+    def __init__(self, status_code: int, payload: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _CountingClient:
+    def __init__(self, responses: dict[str, _StatusResponse]) -> None:
+        self.responses = responses
+        self.requested: list[str] = []
+
+    async def get(self, url: str, **_kwargs):
+        self.requested.append(url)
+        return self.responses[url]
+
+
+@pytest.mark.asyncio
+async def test_unpaywall_payload_cache_serves_repeat_dois_without_refetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(unpaywall_app, "settings", replace(unpaywall_app.settings, unpaywall_min_interval_seconds=0.0))
+    found_url = unpaywall_app.UNPAYWALL_URL_TEMPLATE.format(doi="10.1/found")
+    missing_url = unpaywall_app.UNPAYWALL_URL_TEMPLATE.format(doi="10.1/missing")
+    error_url = unpaywall_app.UNPAYWALL_URL_TEMPLATE.format(doi="10.1/error")
+    client = _CountingClient(
+        {
+            found_url: _StatusResponse(200, {"doi": "10.1/found"}),
+            missing_url: _StatusResponse(404),
+            error_url: _StatusResponse(503),
+        }
+    )
+
+    for _ in range(2):
+        for doi in ("10.1/found", "10.1/missing", "10.1/error"):
+            await unpaywall_app._fetch_unpaywall_payload_by_doi(client=client, doi=doi, email="user@example.com")
+
+    # 200s and 404s are cached; transient errors are retried.
+    assert client.requested == [found_url, missing_url, error_url, error_url]
+
+
+@pytest.mark.asyncio
+async def test_unpaywall_resolves_items_concurrently_and_keeps_target_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    monkeypatch.setattr(
+        rate_control_registry,
+        "settings",
+        replace(rate_control_registry.settings, pdf_provider_unpaywall_concurrency=2),
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_resolve_item_payload(*, item, **_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - item.publication_id))
+        in_flight -= 1
+        return None, False, f"10.1/{item.publication_id}"
+
+    monkeypatch.setattr(unpaywall_app, "_resolve_item_payload", _fake_resolve_item_payload)
+    monkeypatch.setattr("httpx.AsyncClient", _DummyAsyncClient)
+
+    outcomes = await unpaywall_app.resolve_publication_oa_outcomes(
+        [_item(index) for index in range(1, 5)],
+        request_email="user@example.com",
+    )
+
+    assert list(outcomes) == [1, 2, 3, 4]
+    assert all(outcome.publication_id == key for key, outcome in outcomes.items())
+    assert max_in_flight == 2
+
+
+def test_crossref_budget_refunds_unproductive_lookups() -> None:
+    budget = unpaywall_app._CrossrefBudget(1)
+
+    assert budget.try_acquire() is True
+    assert budget.try_acquire() is False
+    budget.refund()
+    assert budget.try_acquire() is True